@@ -0,0 +1,103 @@
+# coding: utf-8
+"""
+Benchmark of the batch endpoint against the same number of single requests.
+
+The script sends a number of EDIFACT payloads (by default the MSCONS sample of the test suite,
+optionally inflated by repeating all of its messages) to the REST API running in process and
+compares the throughput of:
+
+- single: one /parse-string request per payload, sent one after another
+- batch: one /parse-batch request with all payloads, parsed concurrently on the warm parser pool
+
+Both paths are measured end to end, including the request handling and the serialization of
+the results. The throughput is reported in payloads per second.
+
+Usage (from the project root):
+    PYTHONPATH=src python scripts/benchmark_batch.py --payloads 200 --rounds 3
+    PARSER_POOL_SIZE=4 PYTHONPATH=src python scripts/benchmark_batch.py --repeat-messages 50
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+import orjson
+from fastapi.testclient import TestClient
+
+from benchmark_serialization import DEFAULT_SAMPLE_FILE, inflate_interchange
+from ediparse.infrastructure.parser_pool import get_default_parser_pool
+from ediparse.main import app
+
+
+def send_single_requests(client: TestClient, payloads: list[str]) -> None:
+    """
+    Parses the payloads with one /parse-string request each.
+
+    Args:
+        client (TestClient): The client of the REST API
+        payloads (list[str]): The EDIFACT payloads to parse
+    """
+    for payload in payloads:
+        response = client.post(
+            "/parse-string?limit_mode=false", content=payload.encode("utf-8"), headers={"Content-Type": "text/plain"}
+        )
+        response.raise_for_status()
+
+
+def send_batch_request(client: TestClient, payloads: list[str]) -> None:
+    """
+    Parses the payloads with a single /parse-batch request.
+
+    Args:
+        client (TestClient): The client of the REST API
+        payloads (list[str]): The EDIFACT payloads to parse
+    """
+    body = b"".join(orjson.dumps(payload) + b"\n" for payload in payloads)
+    response = client.post(
+        "/parse-batch?limit_mode=false", content=body, headers={"Content-Type": "application/x-ndjson"}
+    )
+    response.raise_for_status()
+    failed_lines = [line for line in response.iter_lines() if line and '"status_code":200' not in line]
+    if failed_lines:
+        raise RuntimeError(f"{len(failed_lines)} payloads of the batch failed, e.g.: {failed_lines[0][:200]}")
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argument_parser.add_argument("--file", type=Path, default=DEFAULT_SAMPLE_FILE,
+                                 help="The EDIFACT message to send (default: the MSCONS sample of the test suite)")
+    argument_parser.add_argument("--repeat-messages", type=int, default=1,
+                                 help="How many times the messages of the interchange are repeated (default: 1)")
+    argument_parser.add_argument("--payloads", type=int, default=100,
+                                 help="The number of payloads per round (default: 100)")
+    argument_parser.add_argument("--rounds", type=int, default=3,
+                                 help="The number of measured rounds per path (default: 3)")
+    args = argument_parser.parse_args()
+
+    edifact_text = inflate_interchange(args.file.read_text(encoding="utf-8"), args.repeat_messages)
+    payloads = [edifact_text] * args.payloads
+    print(f"Sending {args.payloads} payloads of {len(edifact_text)} characters each "
+          f"(parser pool size: {get_default_parser_pool().size})")
+
+    with TestClient(app) as client:
+        # Warm up both paths once, so that imports and caches do not distort the first round
+        send_single_requests(client, payloads[:1])
+        send_batch_request(client, payloads[:1])
+
+        baseline_throughput = None
+        for name, send in (("single", send_single_requests), ("batch", send_batch_request)):
+            durations = []
+            for _ in range(args.rounds):
+                start = time.perf_counter()
+                send(client, payloads)
+                durations.append(time.perf_counter() - start)
+            duration = statistics.median(durations)
+            throughput = args.payloads / duration
+            baseline_throughput = baseline_throughput or throughput
+            print(f"{name:>8}: {duration * 1000:9.2f} ms  {throughput:9.1f} payloads/s"
+                  f"  x{throughput / baseline_throughput:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
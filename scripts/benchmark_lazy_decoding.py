@@ -0,0 +1,94 @@
+# coding: utf-8
+"""
+Benchmark of the lazy decoding of the parser against the eager parsing of EDIFACT interchanges.
+
+The script parses an MSCONS interchange (by default the MSCONS sample of the test suite),
+inflated by repeating all of its messages, and compares the median durations of:
+
+- the eager parsing (EdifactParser()),
+- the lazy parsing (EdifactParser(lazy_decoding=True)), which only determines the segment types
+  and defers the tokenizing and the conversion of the segments until their fields are read,
+- the lazy parsing followed by reading one field of every message (the document number of the
+  BGM segment), which is the typical access pattern of routing or filtering use cases, and
+- the eager and the lazy parsing followed by the JSON serialization (to_json_bytes), which
+  decodes all lazy segments, i.e. the worst case of the lazy decoding.
+
+Usage (from the project root):
+    PYTHONPATH=src python scripts/benchmark_lazy_decoding.py --repeat-messages 500 --rounds 5
+"""
+
+import argparse
+import gc
+import logging
+import statistics
+import time
+from pathlib import Path
+from typing import Callable
+
+from benchmark_serialization import DEFAULT_SAMPLE_FILE, inflate_interchange
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+
+
+def measure_cases(cases: dict[str, Callable[[], object]], rounds: int) -> dict[str, float]:
+    """
+    Measures the median durations of the parsing cases.
+
+    The rounds of the cases are interleaved and each measurement starts with a collected heap,
+    so that the garbage collection of one case does not distort the durations of another one.
+
+    Args:
+        cases (dict[str, Callable[[], object]]): The parsing functions to measure by their names
+        rounds (int): The number of measured rounds per case
+
+    Returns:
+        dict[str, float]: The median durations in seconds by the names of the cases
+    """
+    durations: dict[str, list[float]] = {name: [] for name in cases}
+    for _ in range(rounds):
+        for name, parse in cases.items():
+            gc.collect()
+            start = time.perf_counter()
+            parse()
+            durations[name].append(time.perf_counter() - start)
+    return {name: statistics.median(case_durations) for name, case_durations in durations.items()}
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argument_parser.add_argument("--file", type=Path, default=DEFAULT_SAMPLE_FILE,
+                                 help="The MSCONS message to parse (default: the MSCONS sample of the test suite)")
+    argument_parser.add_argument("--repeat-messages", type=int, default=500,
+                                 help="How many times the messages of the interchange are repeated (default: 500)")
+    argument_parser.add_argument("--rounds", type=int, default=5,
+                                 help="The number of measured rounds per case (default: 5)")
+    args = argument_parser.parse_args()
+    # The parser logs a warning for every segment without a handler, which would dominate the measurement
+    logging.disable(logging.WARNING)
+
+    edifact_text = inflate_interchange(args.file.read_text(encoding="utf-8"), args.repeat_messages)
+    eager_parser = EdifactParser()
+    lazy_parser = EdifactParser(lazy_decoding=True)
+    print(f"Parsing {edifact_text.count(chr(39))} segments ({len(edifact_text)} characters)")
+
+    def read_document_numbers() -> list[str]:
+        interchange = lazy_parser.parse(edifact_text)
+        return [
+            message.bgm_beginn_der_nachricht.dokumenten_nachrichten_identifikation.dokumentennummer
+            for message in interchange.unh_unt_nachrichten
+        ]
+
+    cases: dict[str, Callable[[], object]] = {
+        "eager": lambda: eager_parser.parse(edifact_text),
+        "lazy": lambda: lazy_parser.parse(edifact_text),
+        "lazy + one field per message": read_document_numbers,
+        "eager + to_json_bytes": lambda: eager_parser.parse(edifact_text).to_json_bytes(),
+        "lazy + to_json_bytes": lambda: lazy_parser.parse(edifact_text).to_json_bytes(),
+    }
+
+    print(f"{'case':>30}  {'duration':>10}")
+    for name, duration in measure_cases(cases, args.rounds).items():
+        print(f"{name:>30}  {duration * 1000:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# coding: utf-8
+"""
+Benchmark of the MessagePack output format against the JSON output of parsed EDIFACT interchanges.
+
+The script parses an MSCONS interchange (by default the MSCONS sample of the test suite),
+inflated by repeating all of its messages, and compares the JSON output of the REST API
+(to_json_bytes, to_compact_json_bytes) with the MessagePack payloads (encode_interchange), each
+in the full and the compact representation (with and without short keys), regarding:
+
+- the payload size,
+- the encoding duration,
+- the decoding duration into plain Python objects (orjson.loads / msgpack.unpackb), and
+- the decoding duration of the MessagePack payload back into the EdifactInterchange model
+  (decode_interchange) per MessagePack representation, which is not possible for the JSON output
+  as it omits the message types.
+
+Requires the optional msgpack package (pip install 'EDIParse[msgpack]').
+
+Usage (from the project root):
+    PYTHONPATH=src python scripts/benchmark_msgpack.py --repeat-messages 2000 --rounds 5
+"""
+
+import argparse
+import logging
+from pathlib import Path
+from typing import Callable
+
+import msgpack
+import orjson
+
+from benchmark_serialization import DEFAULT_SAMPLE_FILE, inflate_interchange, measure
+from ediparse.infrastructure.libs.edifactparser.exporters import (
+    decode_interchange, encode_interchange, to_compact_json_bytes
+)
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange
+
+
+def measure_decoding(decode: Callable[[], object], rounds: int) -> float:
+    """
+    Measures the median duration of a decoding function.
+
+    Args:
+        decode (Callable[[], object]): The decoding function to measure
+        rounds (int): The number of measured rounds
+
+    Returns:
+        float: The median duration in seconds
+    """
+    duration, _ = measure(lambda: decode() and b"", rounds)
+    return duration
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argument_parser.add_argument("--file", type=Path, default=DEFAULT_SAMPLE_FILE,
+                                 help="The MSCONS message to parse (default: the MSCONS sample of the test suite)")
+    argument_parser.add_argument("--repeat-messages", type=int, default=1000,
+                                 help="How many times the messages of the interchange are repeated (default: 1000)")
+    argument_parser.add_argument("--rounds", type=int, default=5,
+                                 help="The number of measured rounds per format (default: 5)")
+    args = argument_parser.parse_args()
+    # The parser logs a warning for every segment without a handler, which would dominate the measurement
+    logging.disable(logging.WARNING)
+
+    edifact_text = inflate_interchange(args.file.read_text(encoding="utf-8"), args.repeat_messages)
+    interchange: EdifactInterchange = EdifactParser().parse(edifact_text)
+    print(f"Parsed {edifact_text.count(chr(39))} segments ({len(edifact_text)} characters)")
+
+    encoders: dict[str, Callable[[], bytes]] = {
+        "json": lambda: interchange.to_json_bytes(),
+        "compact json": lambda: to_compact_json_bytes(interchange),
+        "short keys json": lambda: to_compact_json_bytes(interchange, short_keys=True),
+        "msgpack": lambda: encode_interchange(interchange),
+        "compact msgpack": lambda: encode_interchange(interchange, compact=True),
+        "short keys msgpack": lambda: encode_interchange(interchange, compact=True, short_keys=True),
+    }
+
+    print(f"{'format':>18}  {'size':>12}  {'encode':>10}  {'decode':>10}  {'decode_interchange':>18}")
+    for name, encode in encoders.items():
+        encode_duration, size = measure(encode, args.rounds)
+        payload = encode()
+        if "msgpack" in name:
+            decode_duration = measure_decoding(lambda: msgpack.unpackb(payload, raw=False), args.rounds)
+            decode_model = f"{measure_decoding(lambda: decode_interchange(payload), args.rounds) * 1000:16.2f}ms"
+        else:
+            decode_duration = measure_decoding(lambda: orjson.loads(payload), args.rounds)
+            decode_model = f"{'-':>18}"
+        print(f"{name:>18}  {size:>12}  {encode_duration * 1000:8.2f}ms  {decode_duration * 1000:8.2f}ms  "
+              f"{decode_model}")
+
+
+if __name__ == "__main__":
+    main()
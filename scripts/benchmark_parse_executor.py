@@ -0,0 +1,125 @@
+# coding: utf-8
+"""
+Scaling benchmark of the parse executor backends across numbers of workers.
+
+The script submits a number of EDIFACT payloads (by default the MSCONS sample of the test suite,
+optionally inflated by repeating all of its messages) to a ParseExecutor at once and measures the
+throughput of parsing and rendering them (see render_interchange) on each backend:
+
+- inline: one payload after another in the calling thread
+- thread: on the warm parsers of a ParserPool with 1 to N threads (bound to one core by the GIL)
+- process: on 1 to N warm worker processes
+
+The worker processes are started before the measured rounds (see ParseExecutor.warm_up()). The
+throughput is reported in payloads per second, with the speedup relative to the inline backend.
+
+Usage (from the project root):
+    PYTHONPATH=src python scripts/benchmark_parse_executor.py --payloads 64 --max-workers 8
+    PYTHONPATH=src python scripts/benchmark_parse_executor.py --repeat-messages 50 --output-format compact_json
+"""
+
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import wait
+from pathlib import Path
+
+from benchmark_serialization import DEFAULT_SAMPLE_FILE, inflate_interchange
+from ediparse.infrastructure.parse_executor import ParseExecutor, ParseExecutorBackend, ParseOutputFormat
+from ediparse.infrastructure.parser_pool import ParserPool
+
+
+def get_worker_counts(max_workers: int) -> list[int]:
+    """
+    Returns the numbers of workers to measure, i.e. the powers of two up to max_workers and max_workers itself.
+
+    Args:
+        max_workers (int): The largest number of workers
+
+    Returns:
+        list[int]: The ascending numbers of workers
+    """
+    worker_counts = []
+    worker_count = 1
+    while worker_count < max_workers:
+        worker_counts.append(worker_count)
+        worker_count *= 2
+    return worker_counts + [max_workers]
+
+
+def measure_throughput(
+        parse_executor: ParseExecutor,
+        payloads: list[str],
+        output_format: ParseOutputFormat,
+        rounds: int
+) -> float:
+    """
+    Measures the throughput of the executor parsing all payloads submitted at once.
+
+    Args:
+        parse_executor (ParseExecutor): The executor to measure
+        payloads (list[str]): The EDIFACT payloads to parse
+        output_format (ParseOutputFormat): The format the interchanges are rendered in
+        rounds (int): The number of measured rounds, of which the median is taken
+
+    Returns:
+        float: The throughput in payloads per second
+    """
+    # Warm up once, so that imports and caches do not distort the first round
+    parse_executor.submit(payloads[0], output_format=output_format).result()
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        futures = [parse_executor.submit(payload, output_format=output_format) for payload in payloads]
+        wait(futures)
+        durations.append(time.perf_counter() - start)
+        for future in futures:
+            future.result()
+    return len(payloads) / statistics.median(durations)
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argument_parser.add_argument("--file", type=Path, default=DEFAULT_SAMPLE_FILE,
+                                 help="The EDIFACT message to parse (default: the MSCONS sample of the test suite)")
+    argument_parser.add_argument("--repeat-messages", type=int, default=1,
+                                 help="How many times the messages of the interchange are repeated (default: 1)")
+    argument_parser.add_argument("--payloads", type=int, default=64,
+                                 help="The number of payloads per round (default: 64)")
+    argument_parser.add_argument("--rounds", type=int, default=3,
+                                 help="The number of measured rounds per configuration (default: 3)")
+    argument_parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1,
+                                 help="The largest number of workers to measure (default: the number of CPUs)")
+    argument_parser.add_argument("--output-format", type=ParseOutputFormat, default=ParseOutputFormat.JSON,
+                                 choices=list(ParseOutputFormat),
+                                 help="The format the interchanges are rendered in (default: json)")
+    args = argument_parser.parse_args()
+
+    edifact_text = inflate_interchange(args.file.read_text(encoding="utf-8"), args.repeat_messages)
+    payloads = [edifact_text] * args.payloads
+    print(f"Parsing {args.payloads} payloads of {len(edifact_text)} characters each "
+          f"(rendered as {args.output_format}, {os.cpu_count()} CPUs)")
+
+    baseline_throughput = measure_throughput(
+        ParseExecutor(ParseExecutorBackend.INLINE), payloads, args.output_format, args.rounds
+    )
+    print(f"{'inline':>8} {1:>3} workers: {baseline_throughput:9.1f} payloads/s  x{1:5.2f}")
+
+    for backend in (ParseExecutorBackend.THREAD, ParseExecutorBackend.PROCESS):
+        for worker_count in get_worker_counts(args.max_workers):
+            parser_pool = ParserPool(size=worker_count) if backend == ParseExecutorBackend.THREAD else None
+            parse_executor = ParseExecutor(backend, max_workers=worker_count, parser_pool=parser_pool)
+            try:
+                parse_executor.warm_up()
+                throughput = measure_throughput(parse_executor, payloads, args.output_format, args.rounds)
+            finally:
+                parse_executor.shutdown()
+                if parser_pool is not None:
+                    parser_pool.shutdown()
+            print(f"{backend.value:>8} {worker_count:>3} workers: {throughput:9.1f} payloads/s"
+                  f"  x{throughput / baseline_throughput:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# coding: utf-8
+"""
+Benchmark of the JSON serialization of parsed EDIFACT interchanges.
+
+The script parses an MSCONS interchange (by default the MSCONS sample of the test suite),
+inflated by repeating all of its messages, and measures how long the different
+serialization paths take to produce the response body:
+
+- json: Starlette's JSONResponse path, i.e. json.dumps(interchange.model_dump())
+- orjson: orjson.dumps(interchange.model_dump())
+- model_dump_json: interchange.model_dump_json()
+- to_json_bytes: interchange.to_json_bytes(), used by the PydanticJSONResponse
+- compact: the compact representation without empty values (compact=true)
+- compact_short_keys: the compact representation with short keys (compact=true&short_keys=true)
+
+Besides the duration, the size of each output is reported relative to the to_json_bytes output.
+
+Usage (from the project root):
+    PYTHONPATH=src python scripts/benchmark_serialization.py --repeat-messages 2000 --rounds 5
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Callable
+
+import orjson
+
+from ediparse.infrastructure.libs.edifactparser.exporters import to_compact_json_bytes
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange
+
+DEFAULT_SAMPLE_FILE = (
+    Path(__file__).resolve().parent.parent / "tests" / "samples" / "mscons-message-example-request.txt"
+)
+
+
+def inflate_interchange(edifact_text: str, repeat_messages: int) -> str:
+    """
+    Inflates an interchange by repeating all of its messages (UNH...UNT).
+
+    Args:
+        edifact_text (str): The interchange to inflate
+        repeat_messages (int): How many times the messages are repeated
+
+    Returns:
+        str: The inflated interchange
+    """
+    messages_start = edifact_text.index("UNH+")
+    messages_end = edifact_text.index("UNZ+")
+    return (
+        edifact_text[:messages_start]
+        + edifact_text[messages_start:messages_end] * repeat_messages
+        + edifact_text[messages_end:]
+    )
+
+
+def measure(serialize: Callable[[], bytes], rounds: int) -> tuple[float, int]:
+    """
+    Measures the median duration of a serialization function.
+
+    Args:
+        serialize (Callable[[], bytes]): The serialization function to measure
+        rounds (int): The number of measured rounds
+
+    Returns:
+        tuple[float, int]: The median duration in seconds and the size of the output in bytes
+    """
+    durations = []
+    output = b""
+    for _ in range(rounds):
+        start = time.perf_counter()
+        output = serialize()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations), len(output)
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argument_parser.add_argument("--file", type=Path, default=DEFAULT_SAMPLE_FILE,
+                                 help="The MSCONS message to parse (default: the MSCONS sample of the test suite)")
+    argument_parser.add_argument("--repeat-messages", type=int, default=1000,
+                                 help="How many times the messages of the interchange are repeated (default: 1000)")
+    argument_parser.add_argument("--rounds", type=int, default=5,
+                                 help="The number of measured rounds per serialization path (default: 5)")
+    args = argument_parser.parse_args()
+
+    edifact_text = inflate_interchange(args.file.read_text(encoding="utf-8"), args.repeat_messages)
+    interchange: EdifactInterchange = EdifactParser().parse(edifact_text)
+    print(f"Parsed {edifact_text.count(chr(39))} segments ({len(edifact_text)} characters)")
+
+    serialization_paths: dict[str, Callable[[], bytes]] = {
+        "json": lambda: json.dumps(
+            interchange.model_dump(), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8"),
+        "orjson": lambda: orjson.dumps(interchange.model_dump()),
+        "model_dump_json": lambda: interchange.model_dump_json().encode("utf-8"),
+        "to_json_bytes": lambda: interchange.to_json_bytes(),
+        "compact": lambda: to_compact_json_bytes(interchange),
+        "compact_short_keys": lambda: to_compact_json_bytes(interchange, short_keys=True),
+    }
+
+    baseline_duration = None
+    full_size = len(interchange.to_json_bytes())
+    for name, serialize in serialization_paths.items():
+        duration, size = measure(serialize, args.rounds)
+        baseline_duration = baseline_duration or duration
+        print(f"{name:>18}: {duration * 1000:9.2f} ms  {size:>12} bytes ({size / full_size:6.1%})"
+              f"  x{baseline_duration / duration:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
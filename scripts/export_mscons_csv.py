@@ -0,0 +1,41 @@
+# coding: utf-8
+"""
+Command line tool exporting the measurements of an MSCONS interchange as CSV.
+
+The rows are extracted from the raw segments and written while the file is scanned, without
+building the parsed model (see the csv_exporter of the EDIFACT parser library for the columns).
+
+Usage (from the project root):
+    PYTHONPATH=src python scripts/export_mscons_csv.py mscons.txt --output measurements.csv
+    PYTHONPATH=src python scripts/export_mscons_csv.py mscons.txt --delimiter ";" > measurements.csv
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from ediparse.infrastructure.libs.edifactparser.exporters import write_measurement_csv
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argument_parser.add_argument("file", type=Path, help="The MSCONS interchange to export")
+    argument_parser.add_argument("--output", type=Path, default=None,
+                                 help="The CSV file to write (default: standard output)")
+    argument_parser.add_argument("--delimiter", default=",", help="The CSV field delimiter (default: ',')")
+    argument_parser.add_argument("--encoding", default="utf-8",
+                                 help="The encoding of the MSCONS interchange (default: utf-8)")
+    args = argument_parser.parse_args()
+
+    edifact_text = args.file.read_text(encoding=args.encoding)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as output:
+            amount_of_rows = write_measurement_csv(edifact_text, output, delimiter=args.delimiter)
+    else:
+        sys.stdout.reconfigure(newline="")
+        amount_of_rows = write_measurement_csv(edifact_text, sys.stdout, delimiter=args.delimiter)
+    print(f"Exported {amount_of_rows} measurements", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# coding: utf-8
+"""
+Generates the documentation of the short aliases used by the compact payload mode.
+
+The short aliases are derived from the field names of the segment and segment group models
+(see the compact_serializer of the EDIFACT parser library), so the documentation has to be
+regenerated whenever a model changes.
+
+Usage (from the project root):
+    PYTHONPATH=src python scripts/generate_short_alias_docs.py
+    PYTHONPATH=src python scripts/generate_short_alias_docs.py --output docs/compact-short-aliases.md
+"""
+
+import argparse
+from pathlib import Path
+
+from ediparse.infrastructure.libs.edifactparser.exporters import get_short_aliases, iter_model_classes
+
+DEFAULT_OUTPUT_FILE = Path(__file__).resolve().parent.parent / "docs" / "compact-short-aliases.md"
+
+INTRODUCTION = """# Short aliases of the compact payload mode
+
+<!-- Generated by scripts/generate_short_alias_docs.py, do not edit manually. -->
+
+If the parse endpoints are called with `compact=true&short_keys=true`, empty values are omitted
+and the field names of all segment and segment group models are replaced by the short aliases
+listed below. The aliases are unique per model and derived from the field names:
+
+- Segment group fields keep their group prefix, e.g. `sg10_...` becomes `sg10`.
+- Fields named after a segment keep the segment tag followed by the initials of the remaining
+  words, e.g. `dtm_zeitangaben` becomes `dtmz`.
+- All other fields use the initials of their words, e.g. `nachrichten_referenznummer` becomes `nr`.
+- If an alias is already taken by a preceding field of the same model, longer prefixes of the
+  words are used.
+"""
+
+
+def render_alias_docs() -> str:
+    """
+    Renders the Markdown documentation of the short aliases of all models.
+
+    Returns:
+        str: The Markdown document
+    """
+    lines = [INTRODUCTION]
+    for model_class in iter_model_classes():
+        lines.append(f"## {model_class.__name__}\n")
+        lines.append("| Field | Short alias |")
+        lines.append("|-------|-------------|")
+        for field_name, alias in get_short_aliases(model_class).items():
+            if model_class.model_fields[field_name].exclude:
+                continue
+            lines.append(f"| `{field_name}` | `{alias}` |")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argument_parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_FILE,
+                                 help="The Markdown file to write (default: docs/compact-short-aliases.md)")
+    args = argument_parser.parse_args()
+
+    args.output.write_text(render_alias_docs(), encoding="utf-8")
+    print(f"Written {args.output}")
+
+
+if __name__ == "__main__":
+    main()
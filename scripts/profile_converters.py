@@ -0,0 +1,102 @@
+# coding: utf-8
+"""
+Command line tool finding the slowest segment converters on a corpus of EDIFACT interchanges.
+
+The interchanges are parsed with the built-in parser observers (see parser_observer of the EDIFACT
+parser library): the ConverterTimingObserver records the durations of handling the segments per
+converter, the SegmentTypeCounter counts the segments per segment type. The converters are listed
+by their total duration, together with their share of the handling time, the mean duration per
+segment and the bucket holding the median segment.
+
+Usage (from the project root):
+    PYTHONPATH=src python scripts/profile_converters.py tests/samples
+    PYTHONPATH=src python scripts/profile_converters.py corpus/*.txt --rounds 5 --top 10
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Iterator
+
+from ediparse.infrastructure.libs.edifactparser.exceptions import EdifactParserException
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.utils import ConverterTimingObserver, SegmentTypeCounter
+from ediparse.infrastructure.libs.edifactparser.utils.parser_observer import ConverterTiming
+
+
+def iter_files(paths: list[Path]) -> Iterator[Path]:
+    """
+    Lists the files of the corpus, the .txt and .edi files of directories included.
+
+    Args:
+        paths (list[Path]): The files and directories of the corpus
+
+    Returns:
+        Iterator[Path]: The files of the corpus
+    """
+    for path in paths:
+        if path.is_dir():
+            yield from sorted(file for file in path.rglob("*") if file.suffix.lower() in (".txt", ".edi"))
+        else:
+            yield path
+
+
+def get_median_bucket(timing: ConverterTiming, buckets: tuple[float, ...]) -> str:
+    """
+    Returns the upper bound of the bucket holding the median segment of a converter.
+
+    Args:
+        timing (ConverterTiming): The histogram of the converter
+        buckets (tuple[float, ...]): The upper bounds of the histogram buckets in seconds
+
+    Returns:
+        str: The upper bound in microseconds, e.g. '<= 25 µs'
+    """
+    cumulative_count = 0
+    for index, bucket_count in enumerate(timing.bucket_counts):
+        cumulative_count += bucket_count
+        if cumulative_count * 2 >= timing.count:
+            if index == len(buckets):
+                return f"> {buckets[-1] * 1e6:g} µs"
+            return f"<= {buckets[index] * 1e6:g} µs"
+    return "-"
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argument_parser.add_argument("paths", type=Path, nargs="+",
+                                 help="The interchanges to parse, directories are searched for .txt and .edi files")
+    argument_parser.add_argument("--rounds", type=int, default=1,
+                                 help="How many times each interchange is parsed (default: 1)")
+    argument_parser.add_argument("--top", type=int, default=0,
+                                 help="The number of listed converters (default: 0, i.e. all of them)")
+    argument_parser.add_argument("--encoding", default="utf-8",
+                                 help="The encoding of the interchanges (default: utf-8)")
+    args = argument_parser.parse_args()
+
+    converter_timings = ConverterTimingObserver()
+    segment_counter = SegmentTypeCounter()
+    parser = EdifactParser(observers=[converter_timings, segment_counter])
+    amount_of_files = 0
+    for file in iter_files(args.paths):
+        edifact_text = file.read_text(encoding=args.encoding)
+        try:
+            for _ in range(args.rounds):
+                parser.parse(edifact_text)
+            amount_of_files += 1
+        except EdifactParserException as ex:
+            print(f"Skipped {file}: {ex}", file=sys.stderr)
+
+    timings = converter_timings.timings
+    total_seconds = sum(timing.total_seconds for timing in timings.values()) or 1.0
+    print(f"Parsed {amount_of_files} files with {segment_counter.messages} messages "
+          f"and {sum(segment_counter.counts.values())} segments")
+    print(f"{'converter':<36} {'segments':>10} {'total ms':>10} {'share':>7} {'mean µs':>9}  median")
+    for name, timing in list(timings.items())[:args.top or None]:
+        print(f"{name:<36} {timing.count:>10} {timing.total_seconds * 1000:>10.2f} "
+              f"{timing.total_seconds / total_seconds:>7.1%} {timing.total_seconds / timing.count * 1e6:>9.2f}  "
+              f"{get_median_bucket(timing, converter_timings.buckets)}")
+
+
+if __name__ == "__main__":
+    main()
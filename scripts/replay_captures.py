@@ -0,0 +1,130 @@
+# coding: utf-8
+"""
+Command line tool replaying the parsing runs captured by the capture spool against the current parser build.
+
+Each captured input (see parse_capture) is parsed and rendered with its captured options by the parser
+service, as the server would. The best duration of the rounds, the slowest stage and a digest of the
+rendered output are listed next to the duration recorded in production. The results can be saved and
+compared with the results of another parser build, e.g. before and after a change: replays whose
+output differs from the saved one are marked, and the tool exits with status 1 if there are any.
+
+Usage (from the project root):
+    PYTHONPATH=src python scripts/replay_captures.py captures/ --rounds 3 --save baseline.json
+    git checkout my-branch
+    PYTHONPATH=src python scripts/replay_captures.py captures/ --rounds 3 --compare baseline.json
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from ediparse.application.services import ParserService
+from ediparse.infrastructure.libs.edifactparser.utils import StageTimings
+from ediparse.infrastructure.parse_capture import CAPTURE_FILE_NAME, INPUT_FILE_NAME, iter_capture_directories
+from ediparse.infrastructure.parse_executor import ParseOutputFormat
+from ediparse.infrastructure.parse_result_cache import PARSER_VERSION
+
+
+def replay(parser_service: ParserService, capture_directory: Path, rounds: int) -> dict[str, Any]:
+    """
+    Parses and renders a captured input with its captured options.
+
+    Args:
+        parser_service (ParserService): The parser service of the current build
+        capture_directory (Path): The directory of the capture
+        rounds (int): How many times the input is parsed
+
+    Returns:
+        dict[str, Any]: The recorded and the best replayed duration, the slowest stage of the best round,
+            the digest of the output and the error, if parsing has failed
+    """
+    metadata = json.loads((capture_directory / CAPTURE_FILE_NAME).read_text(encoding="utf-8"))
+    edifact_text = (capture_directory / INPUT_FILE_NAME).read_text(encoding="utf-8")
+    options = metadata["options"]
+    result = {"recorded_seconds": metadata["parse_seconds"], "seconds": None, "slowest_stage": None,
+              "output_sha256": None, "error": None}
+    for _ in range(rounds):
+        stage_timings = StageTimings()
+        start = time.perf_counter()
+        try:
+            content = parser_service.render_message(
+                message_content=edifact_text,
+                max_lines_to_parse=options["max_lines_to_parse"],
+                output_format=ParseOutputFormat(options["output_format"]),
+                short_keys=options["short_keys"],
+                stage_timings=stage_timings
+            )
+        except Exception as ex:
+            result["error"] = f"{type(ex).__name__}: {ex}"
+            return result
+        seconds = time.perf_counter() - start
+        if result["seconds"] is None or seconds < result["seconds"]:
+            result["seconds"] = seconds
+            result["slowest_stage"] = max(stage_timings.items(), key=lambda item: item[1].seconds)[0]
+        result["output_sha256"] = hashlib.sha256(content).hexdigest()
+    return result
+
+
+def get_comparison(result: dict[str, Any], baseline: Optional[dict[str, Any]]) -> str:
+    """
+    Compares a replay with the replay of the same capture by another build.
+
+    Args:
+        result (dict[str, Any]): The replay of the current build
+        baseline (Optional[dict[str, Any]]): The replay of the other build, None if it has not replayed the capture
+
+    Returns:
+        str: The ratio of the durations and whether the outputs are the same, e.g. 'x0.85 same'
+    """
+    if baseline is None:
+        return "new"
+    if result["output_sha256"] != baseline["output_sha256"] or result["error"] != baseline["error"]:
+        return "DIFFERENT"
+    if result["seconds"] is None or not baseline["seconds"]:
+        return "same"
+    return f"x{result['seconds'] / baseline['seconds']:.2f} same"
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    argument_parser.add_argument("capture_dir", type=Path, help="The capture directory (see PARSE_CAPTURE_DIR)")
+    argument_parser.add_argument("--rounds", type=int, default=1,
+                                 help="How many times each input is parsed, the best round counts (default: 1)")
+    argument_parser.add_argument("--save", type=Path, help="The file the results are saved to")
+    argument_parser.add_argument("--compare", type=Path, help="The file with the saved results of another build")
+    args = argument_parser.parse_args()
+
+    baselines = {}
+    if args.compare:
+        saved = json.loads(args.compare.read_text(encoding="utf-8"))
+        baselines = saved["results"]
+        print(f"Comparing parser {PARSER_VERSION} with parser {saved['parser_version']}")
+
+    parser_service = ParserService()
+    results = {}
+    amount_of_differences = 0
+    print(f"{'capture':<36} {'recorded s':>10} {'replay s':>10} {'slowest stage':<16} comparison")
+    for capture_directory in sorted(iter_capture_directories(args.capture_dir)):
+        result = results[capture_directory.name] = replay(parser_service, capture_directory, args.rounds)
+        comparison = get_comparison(result, baselines.get(capture_directory.name)) if args.compare else "-"
+        amount_of_differences += comparison == "DIFFERENT"
+        replay_seconds = f"{result['seconds']:.3f}" if result["seconds"] is not None else "failed"
+        print(f"{capture_directory.name:<36} {result['recorded_seconds']:>10.3f} {replay_seconds:>10} "
+              f"{result['slowest_stage'] or '-':<16} {comparison}")
+        if result["error"]:
+            print(f"    {result['error']}", file=sys.stderr)
+
+    if args.save:
+        args.save.write_text(json.dumps({"parser_version": PARSER_VERSION, "results": results}, indent=2),
+                             encoding="utf-8")
+    if amount_of_differences:
+        print(f"{amount_of_differences} replays differ in their output", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,6 @@ The API supports various EDIFACT message types used in the energy sector (DE/AT/
 and includes example request bodies to demonstrate the expected format.
 """
 
-from typing import Dict, List  # noqa: F401
 import importlib
 import pkgutil
 
@@ -37,7 +36,7 @@ from fastapi import (  # noqa: F401
 
 from ediparse.adapters.inbound.rest.models.extra_models import TokenModel  # noqa: F401
 from pydantic import Field, StrictBool, StrictBytes, StrictStr
-from typing import Any, Dict, Tuple, Union
+from typing import List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
 
@@ -48,6 +47,45 @@ for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
     importlib.import_module(name)
 
 
+@router.post(
+    "/download-measurements-csv",
+    responses={
+        201: {"model": str, "description": "Created"},
+        400: {"description": "Bad request"},
+        401: {"description": "Unauthorized"},
+        403: {"description": "Forbidden"},
+        413: {"description": "Content too large"},
+    },
+    tags=["EDIFACT Parser"],
+    summary="Trigger the process to export the measurements of the provided EDIFACT-MSCONS messages from a file and "
+            "download them as a CSV file.",
+    response_model_by_alias=True,
+)
+async def download_measurements_csv(
+    body: Annotated[
+        Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
+        Field(description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.")
+    ] = Body(
+        None,
+        description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.",
+        media_type="application/octet-stream"
+    ),
+    content_encoding: Annotated[
+        Optional[StrictStr],
+        Field(description="The content encoding of the uploaded file. Gzip files and zip archives are also detected "
+                          "from their content.")
+    ] = Header(
+        None,
+        description="The content encoding of the uploaded file. Gzip files and zip archives are also detected from "
+                    "their content.",
+        alias="Content-Encoding"
+    ),
+) -> str:
+    if not BaseEDIFACTParserApi.subclasses:
+        raise HTTPException(status_code=500, detail="Not implemented")
+    return await BaseEDIFACTParserApi.subclasses[0]().download_measurements_csv(body, content_encoding)
+
+
 @router.post(
     "/download-parsed-file",
     responses={
@@ -55,17 +93,84 @@ for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
         400: {"description": "Bad request"},
         401: {"description": "Unauthorized"},
         403: {"description": "Forbidden"},
+        413: {"description": "Content too large"},
     },
     tags=["EDIFACT Parser"],
-    summary="Trigger the process to parse the provided EDIFACT messages (e.g., APERAK, MSCONS, etc.) from a file and download the result as a JSON file.",
+    summary="Trigger the process to parse the provided EDIFACT messages (e.g., APERAK, MSCONS, etc.) from a file and "
+            "download the result as a JSON file.",
     response_model_by_alias=True,
 )
 async def download_parsed_file(
-    body: Annotated[Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]], Field(description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.")] = Body(None, description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.", media_type="application/octet-stream"),
+    body: Annotated[
+        Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
+        Field(description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.")
+    ] = Body(
+        None,
+        description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.",
+        media_type="application/octet-stream"
+    ),
+    stream: Annotated[
+        StrictBool,
+        Field(description="If set to true, the result is streamed, writing each message as soon as it has been parsed.")
+    ] = Query(
+        False,
+        description="If set to true, the result is streamed, writing each message as soon as it has been parsed.",
+        alias="stream"
+    ),
+    accept: Annotated[
+        Optional[StrictStr],
+        Field(description="The accepted media types. If application/x-ndjson is accepted, the result is streamed as "
+                          "newline-delimited JSON.")
+    ] = Header(
+        None,
+        description="The accepted media types. If application/x-ndjson is accepted, the result is streamed as "
+                    "newline-delimited JSON.",
+        alias="Accept"
+    ),
+    granularity: Annotated[
+        StrictStr,
+        Field(description="What a single NDJSON line represents: a message (message) or an MSCONS measurement "
+                          "(measurement).")
+    ] = Query(
+        "message",
+        description="What a single NDJSON line represents: a message (message) or an MSCONS measurement (measurement).",
+        alias="granularity"
+    ),
+    compact: Annotated[
+        StrictBool,
+        Field(description="If set to true, empty values (null, empty lists and empty objects) are omitted from the "
+                          "result.")
+    ] = Query(
+        False,
+        description="If set to true, empty values (null, empty lists and empty objects) are omitted from the result.",
+        alias="compact"
+    ),
+    short_keys: Annotated[
+        StrictBool,
+        Field(description="If set to true (together with compact), the field names are replaced by their documented "
+                          "short aliases.")
+    ] = Query(
+        False,
+        description="If set to true (together with compact), the field names are replaced by their documented short "
+                    "aliases.",
+        alias="short_keys"
+    ),
+    content_encoding: Annotated[
+        Optional[StrictStr],
+        Field(description="The content encoding of the uploaded file. Gzip files and zip archives are also detected "
+                          "from their content.")
+    ] = Header(
+        None,
+        description="The content encoding of the uploaded file. Gzip files and zip archives are also detected from "
+                    "their content.",
+        alias="Content-Encoding"
+    ),
 ) -> object:
     if not BaseEDIFACTParserApi.subclasses:
         raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseEDIFACTParserApi.subclasses[0]().download_parsed_file(body)
+    return await BaseEDIFACTParserApi.subclasses[0]().download_parsed_file(
+        body, stream, accept, granularity, compact, short_keys, content_encoding
+    )
 
 
 @router.post(
@@ -75,15 +180,18 @@ async def download_parsed_file(
         400: {"description": "Bad request"},
         401: {"description": "Unauthorized"},
         403: {"description": "Forbidden"},
+        413: {"description": "Content too large"},
     },
     tags=["EDIFACT Parser"],
-    summary="Trigger the process to parse the provided EDIFACT messages (e.g., APERAK, MSCONS, etc.) in string format and download the result as a JSON file.",
+    summary="Trigger the process to parse the provided EDIFACT messages (e.g., APERAK, MSCONS, etc.) in string format "
+            "and download the result as a JSON file.",
     response_model_by_alias=True,
 )
 async def download_parsed_string_input(
     body: Annotated[
         StrictStr,
-        Field(description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) in plain text format.")] = Body(
+        Field(description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) in plain text format.")
+    ] = Body(
         None,
         description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) in plain text format.",
         media_type="text/plain",
@@ -168,10 +276,272 @@ UNZ+1+121234567ABC7D'"""
             ),
         }
     ),
+    compact: Annotated[
+        StrictBool,
+        Field(description="If set to true, empty values (null, empty lists and empty objects) are omitted from the "
+                          "result.")
+    ] = Query(
+        False,
+        description="If set to true, empty values (null, empty lists and empty objects) are omitted from the result.",
+        alias="compact"
+    ),
+    short_keys: Annotated[
+        StrictBool,
+        Field(description="If set to true (together with compact), the field names are replaced by their documented "
+                          "short aliases.")
+    ] = Query(
+        False,
+        description="If set to true (together with compact), the field names are replaced by their documented short "
+                    "aliases.",
+        alias="short_keys"
+    ),
 ) -> object:
     if not BaseEDIFACTParserApi.subclasses:
         raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseEDIFACTParserApi.subclasses[0]().download_parsed_string_input(body)
+    return await BaseEDIFACTParserApi.subclasses[0]().download_parsed_string_input(body, compact, short_keys)
+
+
+@router.post(
+    "/jobs",
+    responses={
+        202: {"model": object, "description": "Accepted"},
+        400: {"description": "Bad request"},
+        401: {"description": "Unauthorized"},
+        403: {"description": "Forbidden"},
+        503: {"description": "Service unavailable"},
+    },
+    tags=["EDIFACT Parser"],
+    summary="Create an asynchronous job parsing the provided EDIFACT messages (e.g., APERAK, MSCONS, etc.) from a "
+            "(large) file.",
+    response_model_by_alias=True,
+    status_code=202,
+)
+async def create_job(
+    limit_mode: Annotated[
+        StrictBool,
+        Field(description="If set to true, enables a parsing limit for the maximum number of lines. By default, the "
+                          "limit is 2442 lines.")
+    ] = Query(
+        True,
+        description="If set to true, enables a parsing limit for the maximum number of lines. By default, the limit "
+                    "is 2442 lines.",
+        alias="limit_mode"
+    ),
+    body: Annotated[
+        Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
+        Field(description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.")
+    ] = Body(
+        None,
+        description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.",
+        media_type="application/octet-stream"
+    ),
+    compact: Annotated[
+        StrictBool,
+        Field(description="If set to true, empty values (null, empty lists and empty objects) are omitted from the "
+                          "result.")
+    ] = Query(
+        False,
+        description="If set to true, empty values (null, empty lists and empty objects) are omitted from the result.",
+        alias="compact"
+    ),
+    short_keys: Annotated[
+        StrictBool,
+        Field(description="If set to true (together with compact), the field names are replaced by their documented "
+                          "short aliases.")
+    ] = Query(
+        False,
+        description="If set to true (together with compact), the field names are replaced by their documented short "
+                    "aliases.",
+        alias="short_keys"
+    ),
+    content_encoding: Annotated[
+        Optional[StrictStr],
+        Field(description="The content encoding of the uploaded file. Gzip files and zip archives are also detected "
+                          "from their content.")
+    ] = Header(
+        None,
+        description="The content encoding of the uploaded file. Gzip files and zip archives are also detected from "
+                    "their content.",
+        alias="Content-Encoding"
+    ),
+) -> object:
+    if not BaseEDIFACTParserApi.subclasses:
+        raise HTTPException(status_code=500, detail="Not implemented")
+    return await BaseEDIFACTParserApi.subclasses[0]().create_job(
+        limit_mode, body, compact, short_keys, content_encoding
+    )
+
+
+@router.get(
+    "/jobs/{job_id}",
+    responses={
+        200: {"model": object, "description": "OK"},
+        401: {"description": "Unauthorized"},
+        403: {"description": "Forbidden"},
+        404: {"description": "Not found"},
+    },
+    tags=["EDIFACT Parser"],
+    summary="Get the status and progress of an asynchronous parsing job.",
+    response_model_by_alias=True,
+)
+async def get_job(
+    job_id: Annotated[StrictStr, Field(description="The id of the job.")] = Path(..., description="The id of the job."),
+) -> object:
+    if not BaseEDIFACTParserApi.subclasses:
+        raise HTTPException(status_code=500, detail="Not implemented")
+    return await BaseEDIFACTParserApi.subclasses[0]().get_job(job_id)
+
+
+@router.get(
+    "/jobs/{job_id}/result",
+    responses={
+        200: {"model": object, "description": "OK"},
+        400: {"description": "Bad request"},
+        401: {"description": "Unauthorized"},
+        403: {"description": "Forbidden"},
+        404: {"description": "Not found"},
+        409: {"description": "Conflict"},
+        413: {"description": "Content too large"},
+    },
+    tags=["EDIFACT Parser"],
+    summary="Get the result of an asynchronous parsing job as JSON file.",
+    response_model_by_alias=True,
+)
+async def get_job_result(
+    job_id: Annotated[StrictStr, Field(description="The id of the job.")] = Path(..., description="The id of the job."),
+) -> object:
+    if not BaseEDIFACTParserApi.subclasses:
+        raise HTTPException(status_code=500, detail="Not implemented")
+    return await BaseEDIFACTParserApi.subclasses[0]().get_job_result(job_id)
+
+
+@router.post(
+    "/parse-archive",
+    responses={
+        200: {"model": object, "description": "OK"},
+        400: {"description": "Bad request"},
+        401: {"description": "Unauthorized"},
+        403: {"description": "Forbidden"},
+    },
+    tags=["EDIFACT Parser"],
+    summary="Trigger the process to parse the EDIFACT messages (e.g., APERAK, MSCONS, etc.) of the files of a "
+            "provided zip or tar archive concurrently and stream back the outcome of each file.",
+    response_model_by_alias=True,
+)
+async def parse_archive(
+    limit_mode: Annotated[
+        StrictBool,
+        Field(description="If set to true, enables a parsing limit for the maximum number of lines per file. By "
+                          "default, the limit is 2442 lines.")
+    ] = Query(
+        True,
+        description="If set to true, enables a parsing limit for the maximum number of lines per file. By default, "
+                    "the limit is 2442 lines.",
+        alias="limit_mode"
+    ),
+    body: Annotated[
+        Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
+        Field(description="The zip or tar archive (optionally compressed with gzip, bzip2 or xz) containing the raw "
+                          "EDIFACT-specific messages (e.g., APERAK, MSCONS, etc.) as files.")
+    ] = Body(
+        None,
+        description="The zip or tar archive (optionally compressed with gzip, bzip2 or xz) containing the raw "
+                    "EDIFACT-specific messages (e.g., APERAK, MSCONS, etc.) as files.",
+        media_type="application/octet-stream"
+    ),
+    accept: Annotated[
+        Optional[StrictStr],
+        Field(description="The accepted media types. If application/zip is accepted, the results are returned as zip "
+                          "archive, otherwise as newline-delimited JSON.")
+    ] = Header(
+        None,
+        description="The accepted media types. If application/zip is accepted, the results are returned as zip "
+                    "archive, otherwise as newline-delimited JSON.",
+        alias="Accept"
+    ),
+    compact: Annotated[
+        StrictBool,
+        Field(description="If set to true, empty values (null, empty lists and empty objects) are omitted from the "
+                          "results.")
+    ] = Query(
+        False,
+        description="If set to true, empty values (null, empty lists and empty objects) are omitted from the results.",
+        alias="compact"
+    ),
+    short_keys: Annotated[
+        StrictBool,
+        Field(description="If set to true (together with compact), the field names are replaced by their documented "
+                          "short aliases.")
+    ] = Query(
+        False,
+        description="If set to true (together with compact), the field names are replaced by their documented short "
+                    "aliases.",
+        alias="short_keys"
+    ),
+) -> object:
+    if not BaseEDIFACTParserApi.subclasses:
+        raise HTTPException(status_code=500, detail="Not implemented")
+    return await BaseEDIFACTParserApi.subclasses[0]().parse_archive(limit_mode, body, accept, compact, short_keys)
+
+
+@router.post(
+    "/parse-batch",
+    responses={
+        200: {"model": object, "description": "OK"},
+        400: {"description": "Bad request"},
+        401: {"description": "Unauthorized"},
+        403: {"description": "Forbidden"},
+        413: {"description": "Content too large"},
+    },
+    tags=["EDIFACT Parser"],
+    summary="Trigger the process to parse a batch of provided EDIFACT messages (e.g., APERAK, MSCONS, etc.) "
+            "concurrently and stream back the outcome of each of them as NDJSON.",
+    response_model_by_alias=True,
+)
+async def parse_batch(
+    limit_mode: Annotated[
+        StrictBool,
+        Field(description="If set to true, enables a parsing limit for the maximum number of lines per payload. By "
+                          "default, the limit is 2442 lines.")
+    ] = Query(
+        True,
+        description="If set to true, enables a parsing limit for the maximum number of lines per payload. By default, "
+                    "the limit is 2442 lines.",
+        alias="limit_mode"
+    ),
+    body: Annotated[
+        Union[List[StrictStr], StrictBytes, StrictStr],
+        Field(description="The raw EDIFACT-specific messages (e.g., APERAK, MSCONS, etc.) as JSON array of strings or "
+                          "as NDJSON with one JSON string per line.")
+    ] = Body(
+        None,
+        description="The raw EDIFACT-specific messages (e.g., APERAK, MSCONS, etc.) as JSON array of strings or as "
+                    "NDJSON with one JSON string per line.",
+        media_type="application/x-ndjson"
+    ),
+    compact: Annotated[
+        StrictBool,
+        Field(description="If set to true, empty values (null, empty lists and empty objects) are omitted from the "
+                          "results.")
+    ] = Query(
+        False,
+        description="If set to true, empty values (null, empty lists and empty objects) are omitted from the results.",
+        alias="compact"
+    ),
+    short_keys: Annotated[
+        StrictBool,
+        Field(description="If set to true (together with compact), the field names are replaced by their documented "
+                          "short aliases.")
+    ] = Query(
+        False,
+        description="If set to true (together with compact), the field names are replaced by their documented short "
+                    "aliases.",
+        alias="short_keys"
+    ),
+) -> object:
+    if not BaseEDIFACTParserApi.subclasses:
+        raise HTTPException(status_code=500, detail="Not implemented")
+    return await BaseEDIFACTParserApi.subclasses[0]().parse_batch(limit_mode, body, compact, short_keys)
 
 
 @router.post(
@@ -181,18 +551,105 @@ UNZ+1+121234567ABC7D'"""
         400: {"description": "Bad request"},
         401: {"description": "Unauthorized"},
         403: {"description": "Forbidden"},
+        406: {"description": "Not acceptable"},
+        413: {"description": "Content too large"},
     },
     tags=["EDIFACT Parser"],
     summary="Trigger the process to parse the provided EDIFACT messages (e.g., APERAK, MSCONS, etc.) from a file.",
     response_model_by_alias=True,
 )
 async def parse_file(
-    limit_mode: Annotated[StrictBool, Field(description="If set to true, enables a parsing limit for the maximum number of lines. By default, the limit is 2442 lines.")] = Query(True, description="If set to true, enables a parsing limit for the maximum number of lines. By default, the limit is 2442 lines.", alias="limit_mode"),
-    body: Annotated[Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]], Field(description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.")] = Body(None, description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.", media_type="application/octet-stream"),
+    limit_mode: Annotated[
+        StrictBool,
+        Field(description="If set to true, enables a parsing limit for the maximum number of lines. By default, the "
+                          "limit is 2442 lines.")
+    ] = Query(
+        True,
+        description="If set to true, enables a parsing limit for the maximum number of lines. By default, the limit "
+                    "is 2442 lines.",
+        alias="limit_mode"
+    ),
+    body: Annotated[
+        Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
+        Field(description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.")
+    ] = Body(
+        None,
+        description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.",
+        media_type="application/octet-stream"
+    ),
+    stream: Annotated[
+        StrictBool,
+        Field(description="If set to true, the result is streamed, writing each message as soon as it has been parsed.")
+    ] = Query(
+        False,
+        description="If set to true, the result is streamed, writing each message as soon as it has been parsed.",
+        alias="stream"
+    ),
+    accept: Annotated[
+        Optional[StrictStr],
+        Field(description="The accepted media types. If application/x-ndjson is accepted, the result is streamed as "
+                          "newline-delimited JSON, if application/msgpack is accepted, the result is returned as "
+                          "MessagePack.")
+    ] = Header(
+        None,
+        description="The accepted media types. If application/x-ndjson is accepted, the result is streamed as "
+                    "newline-delimited JSON, if application/msgpack is accepted, the result is returned as "
+                    "MessagePack.",
+        alias="Accept"
+    ),
+    granularity: Annotated[
+        StrictStr,
+        Field(description="What a single NDJSON line represents: a message (message) or an MSCONS measurement "
+                          "(measurement).")
+    ] = Query(
+        "message",
+        description="What a single NDJSON line represents: a message (message) or an MSCONS measurement (measurement).",
+        alias="granularity"
+    ),
+    compact: Annotated[
+        StrictBool,
+        Field(description="If set to true, empty values (null, empty lists and empty objects) are omitted from the "
+                          "result.")
+    ] = Query(
+        False,
+        description="If set to true, empty values (null, empty lists and empty objects) are omitted from the result.",
+        alias="compact"
+    ),
+    short_keys: Annotated[
+        StrictBool,
+        Field(description="If set to true (together with compact), the field names are replaced by their documented "
+                          "short aliases.")
+    ] = Query(
+        False,
+        description="If set to true (together with compact), the field names are replaced by their documented short "
+                    "aliases.",
+        alias="short_keys"
+    ),
+    content_encoding: Annotated[
+        Optional[StrictStr],
+        Field(description="The content encoding of the uploaded file. Gzip files and zip archives are also detected "
+                          "from their content.")
+    ] = Header(
+        None,
+        description="The content encoding of the uploaded file. Gzip files and zip archives are also detected from "
+                    "their content.",
+        alias="Content-Encoding"
+    ),
+    debug: Annotated[
+        Optional[StrictStr],
+        Field(description="If set to timings, the durations of the parsing stages are returned via the Server-Timing "
+                          "header.")
+    ] = Query(
+        None,
+        description="If set to timings, the durations of the parsing stages are returned via the Server-Timing header.",
+        alias="debug"
+    ),
 ) -> object:
     if not BaseEDIFACTParserApi.subclasses:
         raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseEDIFACTParserApi.subclasses[0]().parse_file(limit_mode, body)
+    return await BaseEDIFACTParserApi.subclasses[0]().parse_file(
+        limit_mode, body, stream, accept, granularity, compact, short_keys, content_encoding, debug
+    )
 
 
 @router.post(
@@ -202,16 +659,29 @@ async def parse_file(
         400: {"description": "Bad request"},
         401: {"description": "Unauthorized"},
         403: {"description": "Forbidden"},
+        406: {"description": "Not acceptable"},
+        413: {"description": "Content too large"},
     },
     tags=["EDIFACT Parser"],
-    summary="Trigger the process to parse the provided EDIFACT messages (e.g., APERAK, MSCONS, etc.) given in string format.",
+    summary="Trigger the process to parse the provided EDIFACT messages (e.g., APERAK, MSCONS, etc.) given in string "
+            "format.",
     response_model_by_alias=True,
 )
 async def parse_string_input(
-    limit_mode: Annotated[StrictBool, Field(description="If set to true, enables a parsing limit for the maximum number of lines. By default, the limit is 2442 lines.")] = Query(True, description="If set to true, enables a parsing limit for the maximum number of lines. By default, the limit is 2442 lines.", alias="limit_mode"),
+    limit_mode: Annotated[
+        StrictBool,
+        Field(description="If set to true, enables a parsing limit for the maximum number of lines. By default, the "
+                          "limit is 2442 lines.")
+    ] = Query(
+        True,
+        description="If set to true, enables a parsing limit for the maximum number of lines. By default, the limit "
+                    "is 2442 lines.",
+        alias="limit_mode"
+    ),
     body: Annotated[
         StrictStr,
-        Field(description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) in plain text format.")] = Body(
+        Field(description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) in plain text format.")
+    ] = Body(
         None,
         description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) in plain text format.",
         media_type="text/plain",
@@ -296,7 +766,47 @@ UNZ+1+121234567ABC7D'"""
             ),
         }
     ),
+    accept: Annotated[
+        Optional[StrictStr],
+        Field(description="The accepted media types. If application/msgpack is accepted, the result is returned as "
+                          "MessagePack.")
+    ] = Header(
+        None,
+        description="The accepted media types. If application/msgpack is accepted, the result is returned as "
+                    "MessagePack.",
+        alias="Accept"
+    ),
+    compact: Annotated[
+        StrictBool,
+        Field(description="If set to true, empty values (null, empty lists and empty objects) are omitted from the "
+                          "result.")
+    ] = Query(
+        False,
+        description="If set to true, empty values (null, empty lists and empty objects) are omitted from the result.",
+        alias="compact"
+    ),
+    short_keys: Annotated[
+        StrictBool,
+        Field(description="If set to true (together with compact), the field names are replaced by their documented "
+                          "short aliases.")
+    ] = Query(
+        False,
+        description="If set to true (together with compact), the field names are replaced by their documented short "
+                    "aliases.",
+        alias="short_keys"
+    ),
+    debug: Annotated[
+        Optional[StrictStr],
+        Field(description="If set to timings, the durations of the parsing stages are returned via the Server-Timing "
+                          "header.")
+    ] = Query(
+        None,
+        description="If set to timings, the durations of the parsing stages are returned via the Server-Timing header.",
+        alias="debug"
+    ),
 ) -> object:
     if not BaseEDIFACTParserApi.subclasses:
         raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseEDIFACTParserApi.subclasses[0]().parse_string_input(limit_mode, body)
+    return await BaseEDIFACTParserApi.subclasses[0]().parse_string_input(
+        limit_mode, body, accept, compact, short_keys, debug
+    )
@@ -5,8 +5,23 @@ Package for API implementation classes.
 This package contains the concrete implementations of the API endpoints
 defined in the apis package. It includes:
 
+- admission_control.py: Admission control bounding the parse requests in flight, refusing them with 429 when full
+- archive_streaming_response.py: Streaming responses writing the outcomes of the files of an archive as NDJSON or zip
+- batch_ndjson_response.py: Streaming response writing the outcomes of a batch parsing run as NDJSON
+- compact_json_response.py: JSON response class rendering the compact representation of models
+- compression_middleware.py: ASGI middleware compressing the responses (gzip or zstd)
+- content_negotiation.py: Content negotiation helpers for the parse endpoints
+- debug_routers.py: Routers for debug endpoints, mounted while the parse profiler is enabled
 - health_check_filters.py: Filters for health check endpoints
 - health_check_routers.py: Routers for health check endpoints
 - lifespan_events.py: Event handlers for application lifecycle events
+- load_sampler.py: Background sampling of the load signals the readiness check answers from
+- msgpack_response.py: Response class rendering interchanges as MessagePack payload
+- ndjson_streaming_response.py: Streaming response writing messages or measurements as NDJSON
 - parse_edifact_specific_message_routers.py: Implementation of EDIFACT parser endpoints
+- parse_metrics.py: In-process metrics of the parse workloads, exposed in the Prometheus text format
+- parse_jobs.py: Task and status rendering of the asynchronous parsing jobs
+- pydantic_json_response.py: JSON response class rendering pydantic models directly to bytes
+- request_body_stream.py: Streamed request bodies of the file endpoints, read chunk by chunk while they are received
+- streaming_json_response.py: Streaming JSON response writing interchanges one message at a time
 """
@@ -0,0 +1,234 @@
+# coding: utf-8
+"""
+Admission control for the parse endpoints.
+
+Without admission control, every request of a burst is handed to the threadpool right away, so
+all requests compete for the same cores and the latency of each of them grows with the burst.
+The AdmissionController defined here bounds the number of requests being processed at once
+(in flight) and lets further requests wait in a bounded FIFO queue until a slot becomes free.
+Requests arriving while the queue is full are refused right away by the AdmissionControlMiddleware
+with status 429 - Too many requests and a Retry-After header, which is estimated from the durations
+of the recently processed requests.
+
+The number of requests in flight and waiting in the queue is exposed via the /health/admission
+endpoint (see health_check_routers), e.g. as signal for autoscaling.
+
+The admission control is configured via the following environment variables:
+
+- ADMISSION_MAX_IN_FLIGHT: The number of requests processed at once (default: twice the number of
+  CPUs, a value of 0 or less disables the admission control)
+- ADMISSION_MAX_QUEUED: The number of requests waiting for a slot (default: 32)
+"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from fastapi import status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+ADMISSION_MAX_IN_FLIGHT = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", str(2 * (os.cpu_count() or 1))))
+ADMISSION_MAX_QUEUED = int(os.getenv("ADMISSION_MAX_QUEUED", "32"))
+
+# The path prefixes of the parse endpoints, the job endpoints are bounded by their own queue
+ADMISSION_PATH_PREFIXES = ("/parse-", "/download-")
+
+# The number of recent request durations the Retry-After estimate is based on
+DURATION_WINDOW_SIZE = 100
+DEFAULT_REQUEST_DURATION_SECONDS = 1.0
+
+_default_admission_controller: Optional["AdmissionController"] = None
+_default_admission_controller_lock = threading.Lock()
+
+
+class AdmissionQueueFullException(Exception):
+    """
+    Exception raised when a request arrives while all slots are taken and the queue is full.
+
+    Attributes:
+        retry_after_seconds (int): The estimated number of seconds until the request would be admitted
+    """
+
+    def __init__(self, retry_after_seconds: int) -> None:
+        """
+        Initializes a new exception with the estimated time until a retry would be admitted.
+
+        Args:
+            retry_after_seconds (int): The estimated number of seconds until the request would be admitted
+        """
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(f"Too many requests, please retry after {retry_after_seconds} seconds.")
+
+
+class AdmissionController:
+    """
+    Bounds the number of requests in flight, letting further requests wait in a bounded FIFO queue.
+
+    The controller is used from the event loop only, so its state is not guarded by a lock.
+
+    Attributes:
+        max_in_flight (int): The number of requests processed at once
+        max_queued (int): The number of requests waiting for a slot
+    """
+
+    def __init__(self, max_in_flight: int = ADMISSION_MAX_IN_FLIGHT, max_queued: int = ADMISSION_MAX_QUEUED) -> None:
+        """
+        Initializes a new admission controller.
+
+        Args:
+            max_in_flight (int): The number of requests processed at once, defaults to ADMISSION_MAX_IN_FLIGHT
+            max_queued (int): The number of requests waiting for a slot, defaults to ADMISSION_MAX_QUEUED
+
+        Raises:
+            ValueError: If no request may be processed at all
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"An admission controller has to admit at least one request, got {max_in_flight}")
+        self.max_in_flight = max_in_flight
+        self.max_queued = max(max_queued, 0)
+        self.__in_flight = 0
+        self.__waiters: deque[asyncio.Future] = deque()
+        self.__durations: deque[float] = deque(maxlen=DURATION_WINDOW_SIZE)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of requests being processed.
+        """
+        return self.__in_flight
+
+    @property
+    def queued(self) -> int:
+        """
+        The number of requests waiting for a slot.
+        """
+        return len(self.__waiters)
+
+    async def acquire(self) -> None:
+        """
+        Waits for a slot, which has to be given back via release(...) once the request has been processed.
+
+        Raises:
+            AdmissionQueueFullException: If all slots are taken and the queue is full
+        """
+        if self.__in_flight < self.max_in_flight and not self.__waiters:
+            self.__in_flight += 1
+            return
+        if len(self.__waiters) >= self.max_queued:
+            raise AdmissionQueueFullException(self.estimate_retry_after_seconds())
+        waiter = asyncio.get_running_loop().create_future()
+        self.__waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in self.__waiters:
+                self.__waiters.remove(waiter)
+            elif not waiter.cancelled():
+                # The slot has been handed over while the request was cancelled, so it is passed on
+                self.release()
+            raise
+
+    def release(self, duration_seconds: Optional[float] = None) -> None:
+        """
+        Gives back the slot of a processed request, handing it over to the longest waiting request.
+
+        Args:
+            duration_seconds (Optional[float]): The duration of the processed request, which is taken into
+                account for the Retry-After estimate, defaults to None
+        """
+        if duration_seconds is not None:
+            self.__durations.append(duration_seconds)
+        while self.__waiters:
+            waiter = self.__waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.__in_flight -= 1
+
+    def estimate_retry_after_seconds(self) -> int:
+        """
+        Estimates the number of seconds until a request arriving now would be admitted.
+
+        All queued requests have to be processed before, by max_in_flight requests at once,
+        each taking the average of the recent request durations.
+
+        Returns:
+            int: The estimated number of seconds, at least 1
+        """
+        average_duration = (
+            sum(self.__durations) / len(self.__durations) if self.__durations else DEFAULT_REQUEST_DURATION_SECONDS
+        )
+        rounds = (len(self.__waiters) + 1) / self.max_in_flight
+        return max(1, math.ceil(rounds * average_duration))
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware admitting the requests of the parse endpoints through an AdmissionController.
+
+    A request holds its slot until its response has been sent completely, including streamed
+    responses. Requests refused by the controller are answered with status 429 - Too many requests.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            admission_controller: AdmissionController = None,
+            path_prefixes: tuple[str, ...] = ADMISSION_PATH_PREFIXES
+    ) -> None:
+        """
+        Initializes the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application
+            admission_controller (AdmissionController): The admission controller to use, defaults to None, in which
+                case the default controller of the application is used (if the admission control is enabled)
+            path_prefixes (tuple[str, ...]): The path prefixes of the admitted endpoints, defaults to
+                ADMISSION_PATH_PREFIXES
+        """
+        self.app = app
+        self.admission_controller = admission_controller or get_default_admission_controller()
+        self.path_prefixes = path_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (self.admission_controller is None or scope["type"] != "http"
+                or not scope["path"].startswith(self.path_prefixes)):
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.admission_controller.acquire()
+        except AdmissionQueueFullException as ex:
+            response = JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"error_message": str(ex)},
+                headers={"Retry-After": str(ex.retry_after_seconds)}
+            )
+            await response(scope, receive, send)
+            return
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.admission_controller.release(time.perf_counter() - start)
+
+
+def get_default_admission_controller() -> Optional[AdmissionController]:
+    """
+    Returns the admission controller shared by the application, creating it on first use.
+
+    Returns:
+        Optional[AdmissionController]: The default admission controller, None if the admission control is disabled
+    """
+    global _default_admission_controller
+    if ADMISSION_MAX_IN_FLIGHT <= 0:
+        return None
+    if _default_admission_controller is None:
+        with _default_admission_controller_lock:
+            if _default_admission_controller is None:
+                _default_admission_controller = AdmissionController()
+    return _default_admission_controller
@@ -0,0 +1,235 @@
+# coding: utf-8
+"""
+Streaming rendering of the outcomes of parsing the files of an archive.
+
+The archive endpoint parses the EDIFACT files of a zip or tar archive and writes the outcome
+of each file as soon as it is available, i.e. in completion order rather than archive order.
+Each outcome is keyed by the name of its file, either as NDJSON line
+
+    {"entry":"2024-01/mscons_1.txt","status_code":200,"result":{...}}
+    {"entry":"2024-01/mscons_2.txt","status_code":400,"error_message":"..."}
+
+or, for clients accepting the media type application/zip, as file of a result archive, which
+contains '<name>.json' with the parsed interchange or '<name>.error.json' with the status code
+and error message of each file. The result archive is written while the files are parsed, so
+neither the NDJSON output nor the result archive is held in memory.
+
+If reading the archive fails after the response has been started (e.g., an entry is corrupt or
+the decompression ratio is exceeded), the error is written as last line without entry name
+(NDJSON) or as '_error.json' (result archive) and the response ends.
+"""
+
+import io
+import zipfile
+from pathlib import PurePosixPath
+from typing import Iterator, Optional
+
+import orjson
+from fastapi import status
+from starlette.responses import StreamingResponse
+
+from ediparse.adapters.inbound.rest.impl.batch_ndjson_response import get_error_status_code, render_result
+from ediparse.adapters.inbound.rest.impl.content_negotiation import accepts_media_type
+from ediparse.adapters.inbound.rest.impl.ndjson_streaming_response import NDJSON_MEDIA_TYPE
+from ediparse.application.usecases.parse_archive_usecase import ArchiveEntryResult
+
+ZIP_MEDIA_TYPE = "application/zip"
+ARCHIVE_ERROR_FILE_NAME = "_error.json"
+
+
+def accepts_zip(accept: Optional[str]) -> bool:
+    """
+    Checks whether the Accept header of a request asks for a zip archive.
+
+    Args:
+        accept (Optional[str]): The value of the Accept header, if any
+
+    Returns:
+        bool: True if application/zip is one of the accepted media types, False otherwise
+    """
+    return accepts_media_type(accept, [ZIP_MEDIA_TYPE])
+
+
+def render_archive_entry_line(outcome: ArchiveEntryResult, compact: bool = False, short_keys: bool = False) -> bytes:
+    """
+    Renders the outcome of a file of an archive as NDJSON line.
+
+    Args:
+        outcome (ArchiveEntryResult): The outcome of the file
+        compact (bool): Whether empty values are omitted from the result, defaults to False
+        short_keys (bool): Whether the field names are replaced by their short aliases in compact mode,
+            defaults to False
+
+    Returns:
+        bytes: The NDJSON line including the trailing line break
+    """
+    if outcome.error is not None:
+        return orjson.dumps({"entry": outcome.name, **_render_error(outcome.error)}) + b"\n"
+    result = render_result(outcome.value, compact, short_keys)
+    return b'{"entry":%s,"status_code":%d,"result":%s}\n' % (orjson.dumps(outcome.name), status.HTTP_200_OK, result)
+
+
+def iter_archive_ndjson_lines(
+        outcomes: Iterator[ArchiveEntryResult],
+        compact: bool = False,
+        short_keys: bool = False
+) -> Iterator[bytes]:
+    """
+    Renders the outcomes of the files of an archive as NDJSON lines.
+
+    Args:
+        outcomes (Iterator[ArchiveEntryResult]): The outcomes of the files
+        compact (bool): Whether empty values are omitted from the results, defaults to False
+        short_keys (bool): Whether the field names are replaced by their short aliases in compact mode,
+            defaults to False
+
+    Returns:
+        Iterator[bytes]: The NDJSON lines, ending with an error line without entry name if reading the archive failed
+    """
+    try:
+        for outcome in outcomes:
+            yield render_archive_entry_line(outcome, compact, short_keys)
+    except Exception as ex:
+        yield orjson.dumps({"entry": None, **_render_error(ex)}) + b"\n"
+
+
+def iter_result_archive_chunks(
+        outcomes: Iterator[ArchiveEntryResult],
+        compact: bool = False,
+        short_keys: bool = False
+) -> Iterator[bytes]:
+    """
+    Writes the outcomes of the files of an archive as zip archive, chunk by chunk.
+
+    Args:
+        outcomes (Iterator[ArchiveEntryResult]): The outcomes of the files
+        compact (bool): Whether empty values are omitted from the results, defaults to False
+        short_keys (bool): Whether the field names are replaced by their short aliases in compact mode,
+            defaults to False
+
+    Returns:
+        Iterator[bytes]: The chunks of the zip archive, each holding the files written since the previous chunk
+    """
+    buffer = _ChunkBuffer()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as result_archive:
+        try:
+            for outcome in outcomes:
+                if outcome.error is not None:
+                    result_archive.writestr(
+                        _get_result_file_name(outcome.name, ".error.json"), orjson.dumps(_render_error(outcome.error))
+                    )
+                else:
+                    result_archive.writestr(
+                        _get_result_file_name(outcome.name, ".json"), render_result(outcome.value, compact, short_keys)
+                    )
+                chunk = buffer.drain()
+                if chunk:
+                    yield chunk
+        except Exception as ex:
+            result_archive.writestr(ARCHIVE_ERROR_FILE_NAME, orjson.dumps(_render_error(ex)))
+    yield buffer.drain()
+
+
+class ArchiveNDJSONStreamingResponse(StreamingResponse):
+    """
+    Streaming response writing the outcomes of the files of an archive as NDJSON lines.
+
+    The outcomes are consumed in a worker thread by Starlette, so reading the archive and
+    waiting for the files being parsed on the parser pool does not block the event loop.
+    """
+
+    def __init__(
+            self,
+            outcomes: Iterator[ArchiveEntryResult],
+            compact: bool = False,
+            short_keys: bool = False,
+            **kwargs
+    ) -> None:
+        """
+        Initializes a new archive NDJSON streaming response for the given outcomes.
+
+        Args:
+            outcomes (Iterator[ArchiveEntryResult]): The outcomes of the files in completion order
+            compact (bool): Whether empty values are omitted from the results, defaults to False
+            short_keys (bool): Whether the field names are replaced by their short aliases in compact mode,
+                defaults to False
+            **kwargs: Further arguments of the StreamingResponse, e.g. status_code or headers
+        """
+        super().__init__(
+            content=iter_archive_ndjson_lines(outcomes, compact, short_keys),
+            media_type=NDJSON_MEDIA_TYPE,
+            **kwargs
+        )
+
+
+class ArchiveZipStreamingResponse(StreamingResponse):
+    """
+    Streaming response writing the outcomes of the files of an archive as result zip archive.
+
+    Like the ArchiveNDJSONStreamingResponse, the outcomes are consumed in a worker thread by Starlette.
+    """
+
+    def __init__(
+            self,
+            outcomes: Iterator[ArchiveEntryResult],
+            compact: bool = False,
+            short_keys: bool = False,
+            **kwargs
+    ) -> None:
+        """
+        Initializes a new result archive streaming response for the given outcomes.
+
+        Args:
+            outcomes (Iterator[ArchiveEntryResult]): The outcomes of the files in completion order
+            compact (bool): Whether empty values are omitted from the results, defaults to False
+            short_keys (bool): Whether the field names are replaced by their short aliases in compact mode,
+                defaults to False
+            **kwargs: Further arguments of the StreamingResponse, e.g. status_code or headers
+        """
+        super().__init__(
+            content=iter_result_archive_chunks(outcomes, compact, short_keys),
+            media_type=ZIP_MEDIA_TYPE,
+            **kwargs
+        )
+
+
+class _ChunkBuffer(io.RawIOBase):
+    """
+    Unseekable write buffer handing out the bytes written since the last drain.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__chunks: list[bytes] = []
+        self.__position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.__chunks.append(bytes(data))
+        self.__position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.__position
+
+    def drain(self) -> bytes:
+        data, self.__chunks = b"".join(self.__chunks), []
+        return data
+
+
+def _render_error(error: BaseException) -> dict:
+    """
+    Renders the status code and error message of a failed file.
+    """
+    return {"status_code": get_error_status_code(error), "error_message": str(error)}
+
+
+def _get_result_file_name(name: str, suffix: str) -> str:
+    """
+    Derives the name of a file of the result archive from the name of the parsed file,
+    dropping absolute and parent directory parts so that the result archive extracts safely.
+    """
+    parts = [part for part in PurePosixPath(name.replace("\\", "/")).parts if part not in ("/", "..")]
+    return "/".join(parts) + suffix
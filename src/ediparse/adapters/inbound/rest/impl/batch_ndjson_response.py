@@ -0,0 +1,98 @@
+# coding: utf-8
+"""
+Streaming NDJSON rendering of the outcomes of a batch parsing run.
+
+The batch endpoint parses several independent EDIFACT payloads and writes one line per payload
+in input order, as soon as the payload and all payloads before it have been parsed. Each line
+carries the position of the payload in the batch and either its parsed interchange or its error:
+
+    {"index":0,"status_code":200,"result":{...}}
+    {"index":1,"status_code":400,"error_message":"..."}
+
+The status code of a failed payload follows the mapping of the single parse endpoints, i.e.
+413 if the memory budget was exceeded and 400 for all other errors.
+"""
+
+from typing import Iterator
+
+import orjson
+from fastapi import status
+from starlette.responses import StreamingResponse
+
+from ediparse.adapters.inbound.rest.impl.ndjson_streaming_response import NDJSON_MEDIA_TYPE, get_error_status_code
+from ediparse.infrastructure.libs.edifactparser.exporters import to_compact_json_bytes
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange
+from ediparse.infrastructure.parser_pool import PoolTaskResult
+
+
+def render_result(parsed_obj: EdifactInterchange, compact: bool = False, short_keys: bool = False) -> bytes:
+    """
+    Renders a parsed interchange as JSON, like the single parse endpoints.
+
+    Args:
+        parsed_obj (EdifactInterchange): The parsed interchange
+        compact (bool): Whether empty values are omitted, defaults to False
+        short_keys (bool): Whether the field names are replaced by their short aliases in compact mode,
+            defaults to False
+
+    Returns:
+        bytes: The UTF-8 encoded JSON representation of the interchange
+    """
+    if compact:
+        return to_compact_json_bytes(parsed_obj, short_keys)
+    return parsed_obj.to_json_bytes()
+
+
+def render_batch_line(outcome: PoolTaskResult, compact: bool = False, short_keys: bool = False) -> bytes:
+    """
+    Renders the outcome of a single payload as NDJSON line.
+
+    Args:
+        outcome (PoolTaskResult): The outcome of the payload
+        compact (bool): Whether empty values are omitted from the result, defaults to False
+        short_keys (bool): Whether the field names are replaced by their short aliases in compact mode,
+            defaults to False
+
+    Returns:
+        bytes: The NDJSON line including the trailing line break
+    """
+    if outcome.error is not None:
+        return orjson.dumps({
+            "index": outcome.index,
+            "status_code": get_error_status_code(outcome.error),
+            "error_message": str(outcome.error)
+        }) + b"\n"
+    result = render_result(outcome.value, compact, short_keys)
+    return b'{"index":%d,"status_code":%d,"result":%s}\n' % (outcome.index, status.HTTP_200_OK, result)
+
+
+class BatchNDJSONStreamingResponse(StreamingResponse):
+    """
+    Streaming response writing the outcomes of a batch parsing run as NDJSON lines.
+
+    The outcomes are consumed in a worker thread by Starlette, so waiting for the payloads
+    being parsed on the parser pool does not block the event loop.
+    """
+
+    def __init__(
+            self,
+            outcomes: Iterator[PoolTaskResult],
+            compact: bool = False,
+            short_keys: bool = False,
+            **kwargs
+    ) -> None:
+        """
+        Initializes a new batch NDJSON streaming response for the given outcomes.
+
+        Args:
+            outcomes (Iterator[PoolTaskResult]): The outcomes of the payloads in input order
+            compact (bool): Whether empty values are omitted from the results, defaults to False
+            short_keys (bool): Whether the field names are replaced by their short aliases in compact mode,
+                defaults to False
+            **kwargs: Further arguments of the StreamingResponse, e.g. status_code or headers
+        """
+        super().__init__(
+            content=(render_batch_line(outcome, compact, short_keys) for outcome in outcomes),
+            media_type=NDJSON_MEDIA_TYPE,
+            **kwargs
+        )
@@ -0,0 +1,57 @@
+# coding: utf-8
+"""
+JSON response class rendering parsed interchanges in their compact representation.
+
+In compact mode, unset fields, empty lists and empty nested models are omitted and the field
+names can optionally be replaced by their documented short aliases (see the compact_serializer
+of the parser library and docs/compact-short-aliases.md).
+"""
+
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+from ediparse.infrastructure.libs.edifactparser.exporters import to_compact_json_bytes
+
+
+class CompactJSONResponse(JSONResponse):
+    """
+    JSON response that renders pydantic models in their compact representation.
+
+    Content already rendered to compact JSON bytes (e.g., by a worker of the ParseExecutor) is sent
+    as it is, all other content (e.g., the error message dictionaries) is rendered with orjson.
+
+    Attributes:
+        short_keys (bool): Whether the field names are replaced by their short aliases
+    """
+
+    def __init__(self, content: Any, short_keys: bool = False, **kwargs) -> None:
+        """
+        Initializes a new compact JSON response.
+
+        Args:
+            content (Any): A pydantic model or any other JSON-compatible content
+            short_keys (bool): Whether the field names are replaced by their short aliases, defaults to False
+            **kwargs: Further arguments of the JSONResponse, e.g. status_code or headers
+        """
+        # The content is rendered by the constructor of the response, so the flag has to be set before
+        self.short_keys = short_keys
+        super().__init__(content=content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        """
+        Renders the content of the response to compact JSON bytes.
+
+        Args:
+            content (Any): A pydantic model, rendered compact JSON bytes or any other JSON-compatible content
+
+        Returns:
+            bytes: The UTF-8 encoded compact JSON representation of the content
+        """
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, BaseModel):
+            return to_compact_json_bytes(content, short_keys=self.short_keys)
+        return orjson.dumps(content)
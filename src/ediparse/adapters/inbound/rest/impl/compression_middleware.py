@@ -0,0 +1,268 @@
+# coding: utf-8
+"""
+Negotiated response compression for the REST API.
+
+The JSON results of the parse endpoints are many times larger than the EDIFACT input, so
+compressing them saves most of the transferred bytes. The CompressionMiddleware defined here
+compresses the response bodies with the best content encoding accepted by the client via the
+Accept-Encoding header:
+
+- zstd: Requires the optional zstandard package (install the 'zstd' extra)
+- gzip: Always available
+
+The compression works in streaming fashion: every chunk of a streamed (chunked) response, e.g.
+an NDJSON line, is compressed and flushed as soon as it arrives, so the client can decode it
+right away. Complete responses smaller than the minimum size are sent uncompressed. Large
+chunks are compressed in a worker thread, so compressing them does not block the event loop.
+
+The middleware is configured via the following environment variables:
+
+- COMPRESSION_MINIMUM_SIZE: The minimum body size in bytes to compress (default: 1024)
+- COMPRESSION_GZIP_LEVEL: The gzip compression level from 1 to 9 (default: 6)
+- COMPRESSION_ZSTD_LEVEL: The zstd compression level from 1 to 22 (default: 3)
+"""
+
+import os
+import zlib
+from typing import Any, Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+GZIP_ENCODING = "gzip"
+ZSTD_ENCODING = "zstd"
+
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+
+# Chunks from this size on are compressed in a worker thread, smaller ones (e.g., NDJSON lines) are
+# compressed right away, since the worker thread round trip would take longer than compressing them
+THREADPOOL_COMPRESSION_SIZE = 64 * 1024
+
+# Responses of these media types are compressed already and passed through unchanged
+COMPRESSED_MEDIA_TYPES = frozenset({"application/zip", "application/gzip"})
+
+
+def is_zstd_available() -> bool:
+    """
+    Checks whether the optional zstandard package is installed.
+
+    Returns:
+        bool: True if responses can be compressed with zstd, False otherwise
+    """
+    try:
+        _import_zstandard()
+    except ImportError:
+        return False
+    return True
+
+
+def select_content_encoding(accept_encoding: Optional[str], zstd_available: bool) -> Optional[str]:
+    """
+    Selects the content encoding of a response from the Accept-Encoding header of the request.
+
+    The supported encoding with the highest quality value is selected, zstd being preferred over
+    gzip for equal quality values. Encodings with a quality value of 0 are refused.
+
+    Args:
+        accept_encoding (Optional[str]): The value of the Accept-Encoding header, if any
+        zstd_available (bool): Whether the zstd encoding is supported
+
+    Returns:
+        Optional[str]: The selected content encoding, None if the response is sent uncompressed
+    """
+    if not accept_encoding:
+        return None
+    qualities: dict[str, float] = {}
+    for coding_range in accept_encoding.split(","):
+        coding, _, parameters = coding_range.partition(";")
+        coding = coding.strip().lower()
+        if coding:
+            qualities[coding] = _parse_quality(parameters)
+
+    supported_encodings = [ZSTD_ENCODING, GZIP_ENCODING] if zstd_available else [GZIP_ENCODING]
+    best_encoding, best_quality = None, 0.0
+    for encoding in supported_encodings:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best_encoding, best_quality = encoding, quality
+    return best_encoding
+
+
+class StreamCompressor:
+    """
+    Incremental compressor of a response body in one of the supported content encodings.
+
+    Each call of compress(...) returns the compressed bytes of all data passed so far, so that
+    every chunk of a streamed response can be decoded by the client as soon as it arrives.
+    """
+
+    def __init__(self, encoding: str, gzip_level: int = COMPRESSION_GZIP_LEVEL,
+                 zstd_level: int = COMPRESSION_ZSTD_LEVEL) -> None:
+        """
+        Initializes a new compressor.
+
+        Args:
+            encoding (str): The content encoding, either 'gzip' or 'zstd'
+            gzip_level (int): The gzip compression level, defaults to COMPRESSION_GZIP_LEVEL
+            zstd_level (int): The zstd compression level, defaults to COMPRESSION_ZSTD_LEVEL
+
+        Raises:
+            ValueError: If the content encoding is not supported
+            ImportError: If zstd is requested but the optional zstandard package is not installed
+        """
+        self.encoding = encoding
+        if encoding == GZIP_ENCODING:
+            self.__compressor: Any = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self.__flush_mode = zlib.Z_SYNC_FLUSH
+            self.__finish_mode = zlib.Z_FINISH
+        elif encoding == ZSTD_ENCODING:
+            zstandard = _import_zstandard()
+            self.__compressor = zstandard.ZstdCompressor(level=zstd_level).compressobj()
+            self.__flush_mode = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            self.__finish_mode = zstandard.COMPRESSOBJ_FLUSH_FINISH
+        else:
+            raise ValueError(f"Unsupported content encoding '{encoding}'.")
+
+    def compress(self, data: bytes, final: bool = False) -> bytes:
+        """
+        Compresses the next part of the body.
+
+        Args:
+            data (bytes): The next part of the body
+            final (bool): Whether this is the last part of the body, defaults to False
+
+        Returns:
+            bytes: The compressed bytes, flushed so that they can be decoded right away
+        """
+        return self.__compressor.compress(data) + self.__compressor.flush(
+            self.__finish_mode if final else self.__flush_mode
+        )
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing the response bodies with the negotiated content encoding.
+
+    Responses that already carry a Content-Encoding header, responses of compressed media types
+    (e.g., zip archives) and complete responses smaller than the minimum size are passed through unchanged.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            minimum_size: int = COMPRESSION_MINIMUM_SIZE,
+            gzip_level: int = COMPRESSION_GZIP_LEVEL,
+            zstd_level: int = COMPRESSION_ZSTD_LEVEL
+    ) -> None:
+        """
+        Initializes the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application
+            minimum_size (int): The minimum body size in bytes to compress, defaults to COMPRESSION_MINIMUM_SIZE
+            gzip_level (int): The gzip compression level, defaults to COMPRESSION_GZIP_LEVEL
+            zstd_level (int): The zstd compression level, defaults to COMPRESSION_ZSTD_LEVEL
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+        self.zstd_available = is_zstd_available()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = select_content_encoding(Headers(scope=scope).get("accept-encoding"), self.zstd_available)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(send, StreamCompressor(encoding, self.gzip_level, self.zstd_level),
+                                          self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """
+    Send wrapper compressing the body messages of a single response.
+    """
+
+    def __init__(self, send: Send, compressor: StreamCompressor, minimum_size: int) -> None:
+        self.__send = send
+        self.__compressor = compressor
+        self.__minimum_size = minimum_size
+        self.__start_message: Optional[Message] = None
+        self.__is_passthrough = False
+        self.__is_compressing = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.__start_message = message
+            headers = Headers(raw=message["headers"])
+            media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+            self.__is_passthrough = "content-encoding" in headers or media_type in COMPRESSED_MEDIA_TYPES
+            if self.__is_passthrough:
+                await self.__send(message)
+            return
+        if message_type != "http.response.body" or self.__is_passthrough:
+            await self.__send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.__is_compressing:
+            # The size of streamed responses is unknown, so only complete responses are sent uncompressed
+            if not more_body and len(body) < self.__minimum_size:
+                await self.__send(self.__start_message)
+                await self.__send(message)
+                return
+            await self.__start_compressing()
+
+        if more_body and not body:
+            return
+        if len(body) < THREADPOOL_COMPRESSION_SIZE:
+            compressed = self.__compressor.compress(body, not more_body)
+        else:
+            compressed = await run_in_threadpool(self.__compressor.compress, body, not more_body)
+        await self.__send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+    async def __start_compressing(self) -> None:
+        self.__is_compressing = True
+        headers = MutableHeaders(raw=self.__start_message["headers"])
+        headers["Content-Encoding"] = self.__compressor.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        await self.__send(self.__start_message)
+
+
+def _parse_quality(parameters: str) -> float:
+    """
+    Parses the quality value of an Accept-Encoding entry, defaulting to 1.
+    """
+    for parameter in parameters.split(";"):
+        name, _, value = parameter.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def _import_zstandard() -> Any:
+    """
+    Imports the optional zstandard package.
+    """
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "The zstd content encoding requires the optional zstandard package, install it via 'EDIParse[zstd]'."
+        ) from e
+    return zstandard
@@ -0,0 +1,29 @@
+# coding: utf-8
+"""
+Content negotiation helpers for the parse endpoints.
+
+The parse endpoints render their results as JSON by default. Clients can ask for alternative
+representations (e.g., NDJSON or MessagePack) via the Accept header of the request.
+"""
+
+from typing import Iterable, Optional
+
+
+def accepts_media_type(accept: Optional[str], media_types: Iterable[str]) -> bool:
+    """
+    Checks whether the Accept header of a request explicitly names one of the given media types.
+
+    Wildcards (e.g., */*) and quality values are not taken into account, so the default JSON
+    representation is kept unless an alternative representation is requested explicitly.
+
+    Args:
+        accept (Optional[str]): The value of the Accept header, if any
+        media_types (Iterable[str]): The media types to look for (lower case)
+
+    Returns:
+        bool: True if one of the media types is accepted, False otherwise
+    """
+    if not accept:
+        return False
+    accepted_media_types = {media_range.split(";")[0].strip().lower() for media_range in accept.split(",")}
+    return not accepted_media_types.isdisjoint(media_types)
@@ -0,0 +1,108 @@
+# coding: utf-8
+"""
+API routes for debugging the parse workloads in production.
+
+This module defines FastAPI routes for debugging, including:
+- Profile: Hands out the profiles aggregated by the parse profiler as pstats file,
+                  text report or collapsed stacks for flamegraphs (see ParseProfiler)
+
+The router is only mounted while the parse profiler is enabled (see PARSE_PROFILE_SAMPLE_RATE), so the
+debug endpoints do not exist otherwise. If a token is configured via the environment variable
+DEBUG_ENDPOINT_TOKEN, the requests have to carry it as bearer token ("Authorization: Bearer <token>"),
+otherwise they are refused with status 401 - Unauthorized.
+"""
+
+import hmac
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+
+from ediparse.infrastructure.parse_profiler import get_default_parse_profiler
+
+DEBUG_ENDPOINT_TOKEN = os.getenv("DEBUG_ENDPOINT_TOKEN", "")
+PROFILE_FORMATS = ("pstats", "text", "collapsed")
+
+
+async def verify_debug_token(authorization: Optional[str] = Header(None, alias="Authorization")) -> None:
+    """
+    Refuses the requests not carrying the configured debug token as bearer token.
+
+    Args:
+        authorization (Optional[str]): The Authorization header of the request
+
+    Raises:
+        HTTPException: With status 401, if a token is configured and the request does not carry it
+    """
+    if not DEBUG_ENDPOINT_TOKEN:
+        return
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), DEBUG_ENDPOINT_TOKEN.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="A valid debug token is required, see DEBUG_ENDPOINT_TOKEN",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
+router = APIRouter(dependencies=[Depends(verify_debug_token)])
+
+
+@router.get(
+    "/debug/profile",
+    responses={
+        200: {"description": "Accepted"},
+        400: {"description": "Bad request"},
+        401: {"description": "Unauthorized"},
+        404: {"description": "Not found"},
+    },
+    tags=["Debug"],
+    summary="Hands out the profiles of the sampled parsing runs",
+    response_model_by_alias=True,
+    include_in_schema=False,
+)
+async def get_profile(format: str = "pstats", sort: str = "cumulative", limit: int = 50,
+                      reset: Optional[bool] = False) -> Response:
+    """
+    Hands out the profiles aggregated by the parse profiler, either as pstats file (format=pstats),
+    as text report of the functions sorted by the given key (format=text) or as collapsed stacks
+    for flamegraph tools (format=collapsed). With reset=true, the profiles are removed afterward.
+    """
+    parse_profiler = get_default_parse_profiler()
+    if parse_profiler is None:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"error_message": "The parse profiler is disabled, see PARSE_PROFILE_SAMPLE_RATE"}
+        )
+    if format not in PROFILE_FORMATS:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"error_message": f"Unknown profile format {format}, expected one of {', '.join(PROFILE_FORMATS)}"}
+        )
+    statistics = parse_profiler.statistics
+    headers = {
+        "X-Profiled-Runs": str(statistics.profiled_runs),
+        "X-Skipped-Runs": str(statistics.skipped_runs),
+        "X-Stack-Samples": str(statistics.stack_samples),
+    }
+    # The profiles are rendered on the threadpool, since rendering them takes a while for large profiles
+    if format == "pstats":
+        headers["Content-Disposition"] = 'attachment; filename="parse-profile.pstats"'
+        content = await run_in_threadpool(parse_profiler.dump_stats)
+        response = Response(content=content, media_type="application/octet-stream", headers=headers)
+    elif format == "text":
+        try:
+            report = await run_in_threadpool(parse_profiler.render_stats, sort_key=sort, limit=limit)
+        except KeyError:
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": f"Unknown sort key {sort}"}
+            )
+        response = Response(content=report, media_type="text/plain", headers=headers)
+    else:
+        content = await run_in_threadpool(parse_profiler.render_collapsed_stacks)
+        response = Response(content=content, media_type="text/plain", headers=headers)
+    if reset:
+        parse_profiler.reset()
+    return response
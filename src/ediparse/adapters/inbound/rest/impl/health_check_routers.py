@@ -4,17 +4,27 @@ API routes for health checks.
 
 This module defines FastAPI routes for health checks, including:
 - Liveness check: Verifies that the application is running
-- Readiness check: Verifies that the application is ready to accept requests
-                  and that its dependencies are reachable
+- Readiness check: Verifies that the application is ready to accept requests,
+                  answering from the load sampled in the background (see load_sampler)
+- Admission check: Reports the number of parse requests in flight and waiting
+                  for a slot (see admission_control), e.g. for autoscaling
+- Parse cache check: Reports the hit and miss counters and the sizes of the
+                  parse result cache (see ParseResultCache)
+- Metrics: Exposes the metrics of the parse workloads in the Prometheus text
+                  exposition format (see parse_metrics)
 
 These endpoints are used by container orchestration systems like Kubernetes
 to monitor the health of the application and make decisions about routing
 traffic or restarting containers.
 """
 
-import psutil
 from fastapi import APIRouter, status
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
+
+from ediparse.adapters.inbound.rest.impl.admission_control import get_default_admission_controller
+from ediparse.adapters.inbound.rest.impl.load_sampler import get_default_load_sampler
+from ediparse.adapters.inbound.rest.impl.parse_metrics import PROMETHEUS_CONTENT_TYPE, get_default_parse_metrics
+from ediparse.infrastructure.parse_result_cache import get_default_message_cache, get_default_parse_result_cache
 
 router = APIRouter()
 
@@ -57,13 +67,14 @@ async def check_liveness() -> JSONResponse:
 )
 async def check_readiness() -> JSONResponse:
     """
-    Readiness check to ensure dependencies are reachable.
+    Readiness check answering from the load sampled in the background, without measuring it itself.
     """
     try:
-        if psutil.cpu_percent(interval=0.1) > 95:
+        load_sampler = get_default_load_sampler()
+        if not load_sampler.is_ready:
             return JSONResponse(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                content={"status": "not ready", "reason": "CPU overloaded"},
+                content={"status": "not ready", "reason": load_sampler.reason},
             )
         return JSONResponse(status_code=status.HTTP_200_OK, content={"status": "ok"})
     except Exception as e:
@@ -71,3 +82,92 @@ async def check_readiness() -> JSONResponse:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={"status": "not ready", "reason": str(e)},
         )
+
+
+@router.get(
+    "/health/admission",
+    responses={
+        200: {"description": "Accepted"},
+        400: {"description": "Bad request"},
+        401: {"description": "Unauthorized"},
+        403: {"description": "Forbidden"},
+        404: {"description": "Not found"},
+    },
+    tags=["Health checks"],
+    summary="Reports the queue depth of the admission control",
+    response_model_by_alias=True,
+    include_in_schema=False,
+)
+async def check_admission() -> JSONResponse:
+    """
+    Reports the number of parse requests in flight and waiting for a slot of the admission control.
+    """
+    admission_controller = get_default_admission_controller()
+    if admission_controller is None:
+        return JSONResponse(status_code=status.HTTP_200_OK, content={"status": "disabled"})
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "status": "ok",
+            "in_flight": admission_controller.in_flight,
+            "queued": admission_controller.queued,
+            "max_in_flight": admission_controller.max_in_flight,
+            "max_queued": admission_controller.max_queued,
+        },
+    )
+
+
+@router.get(
+    "/health/parse-cache",
+    responses={
+        200: {"description": "Accepted"},
+        400: {"description": "Bad request"},
+        401: {"description": "Unauthorized"},
+        403: {"description": "Forbidden"},
+        404: {"description": "Not found"},
+    },
+    tags=["Health checks"],
+    summary="Reports the counters of the parse result and message caches",
+    response_model_by_alias=True,
+    include_in_schema=False,
+)
+async def check_parse_cache() -> JSONResponse:
+    """
+    Reports the hit and miss counters and the sizes of the parse result cache, and the reused
+    and parsed messages of the message cache (as "messages").
+    """
+    parse_result_cache = get_default_parse_result_cache()
+    message_cache = get_default_message_cache()
+    if parse_result_cache is None and message_cache is None:
+        return JSONResponse(status_code=status.HTTP_200_OK, content={"status": "disabled"})
+    content = {"status": "ok"}
+    if parse_result_cache is not None:
+        content.update(parse_result_cache.statistics._asdict())
+    if message_cache is not None:
+        content["messages"] = message_cache.statistics._asdict()
+    return JSONResponse(status_code=status.HTTP_200_OK, content=content)
+
+
+@router.get(
+    "/metrics",
+    responses={
+        200: {"description": "Accepted"},
+        400: {"description": "Bad request"},
+        401: {"description": "Unauthorized"},
+        403: {"description": "Forbidden"},
+        404: {"description": "Not found"},
+    },
+    tags=["Health checks"],
+    summary="Exposes the metrics of the parse workloads",
+    response_model_by_alias=True,
+    include_in_schema=False,
+)
+async def get_metrics() -> Response:
+    """
+    Exposes the metrics of the parse workloads in the Prometheus text exposition format.
+    """
+    return Response(
+        status_code=status.HTTP_200_OK,
+        content=get_default_parse_metrics().render(),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
@@ -6,13 +6,25 @@ This module provides event handlers for the application lifecycle events,
 such as startup and shutdown. These handlers are used to perform initialization
 and cleanup tasks for the application.
 
-The event handlers are implemented as async context managers that can be used
-with FastAPI's lifespan events system.
+The startup logging is implemented as async context manager that can be used
+with FastAPI's lifespan events system, while the warm-ups of the parser pool and
+the parse executor are plain startup event handlers and the shutdowns of the job
+store and the parse executor plain shutdown event handlers.
 """
 
 import logging
 from contextlib import asynccontextmanager
 
+from starlette.concurrency import run_in_threadpool
+
+from ediparse.adapters.inbound.rest.impl.load_sampler import get_default_load_sampler
+
+from ediparse.infrastructure.job_store import shutdown_default_job_store
+from ediparse.infrastructure.parse_executor import (
+    PARSE_EXECUTOR, ParseExecutorBackend, get_default_parse_executor, shutdown_default_parse_executor
+)
+from ediparse.infrastructure.parser_pool import get_default_parser_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,3 +42,66 @@ async def startup_lifespan():
     """
     logger.info("App startup")
     yield
+
+
+async def warm_up_parser_pool() -> None:
+    """
+    Startup event handler creating the default parser pool.
+
+    The parsers of the pool are created in a worker thread when the application starts,
+    so that the first batch request does not have to wait for them.
+    """
+    parser_pool = await run_in_threadpool(get_default_parser_pool)
+    logger.info(f"Parser pool warmed up with {parser_pool.size} parsers")
+
+
+async def shut_down_job_store() -> None:
+    """
+    Shutdown event handler stopping the workers of the default job store.
+
+    The jobs are local to the process, so the spooled uploads and results of the job store
+    are removed from disk when the application shuts down.
+    """
+    await run_in_threadpool(shutdown_default_job_store)
+    logger.info("Job store shut down")
+
+
+async def warm_up_parse_executor() -> None:
+    """
+    Startup event handler creating the default parse executor and starting its worker processes.
+
+    Nothing is done for the thread backend, with which the parser service parses on the
+    threadpool of the server (see ParseEdifactMessageRouter).
+    """
+    if PARSE_EXECUTOR == ParseExecutorBackend.THREAD:
+        return
+    parse_executor = await run_in_threadpool(get_default_parse_executor)
+    await run_in_threadpool(parse_executor.warm_up)
+    logger.info(
+        f"Parse executor warmed up with the {parse_executor.backend} backend and {parse_executor.max_workers} workers"
+    )
+
+
+async def shut_down_parse_executor() -> None:
+    """
+    Shutdown event handler stopping the worker processes of the default parse executor.
+    """
+    await run_in_threadpool(shutdown_default_parse_executor)
+    logger.info("Parse executor shut down")
+
+
+async def start_load_sampler() -> None:
+    """
+    Startup event handler starting the default load sampler, whose state the readiness check answers from.
+    """
+    load_sampler = get_default_load_sampler()
+    load_sampler.start()
+    logger.info(f"Load sampler started with an interval of {load_sampler.interval_seconds} seconds")
+
+
+async def stop_load_sampler() -> None:
+    """
+    Shutdown event handler stopping the default load sampler.
+    """
+    await get_default_load_sampler().stop()
+    logger.info("Load sampler stopped")
@@ -0,0 +1,245 @@
+# coding: utf-8
+"""
+Load sampling for the readiness check.
+
+Measuring the CPU load within the readiness check itself blocks the event loop for the duration
+of the measurement on every probe and measures the load of the host rather than the saturation
+of the application. Instead, the LoadSampler defined here runs as background task on the event
+loop and samples the following load signals at a fixed interval into a moving window:
+
+- cpu_percent: The CPU usage of the server process, relative to the CPUs of the host
+- queue_depth: The number of requests and parse tasks waiting, i.e. the requests waiting for
+  admission (see admission_control), the calls waiting for a thread of the threadpool and the
+  parse tasks waiting for a worker of the parse executor (see ParseExecutor)
+- in_flight: The number of parse requests being processed
+
+The readiness check answers right away from the averages of the window. The readiness switches
+with hysteresis, so that a load fluctuating around a single threshold does not make it flap: the
+server turns not ready once an average exceeds its high threshold and turns ready again only once
+all averages have fallen below their low thresholds.
+
+The sampling is configured via the following environment variables:
+
+- LOAD_SAMPLE_INTERVAL_SECONDS: The interval between two samples (default: 1.0)
+- LOAD_SAMPLE_WINDOW_SIZE: The number of samples the averages are taken over (default: 10)
+- READINESS_CPU_HIGH_PERCENT: The average CPU usage turning the server not ready (default: 95)
+- READINESS_CPU_LOW_PERCENT: The average CPU usage below which the server turns ready again (default: 80)
+- READINESS_QUEUE_HIGH: The average queue depth turning the server not ready (default: 16)
+- READINESS_QUEUE_LOW: The average queue depth below which the server turns ready again (default: 4)
+- READINESS_IN_FLIGHT_HIGH: The average number of parse requests in flight turning the server not ready
+  (default: 0, which disables the in-flight threshold)
+- READINESS_IN_FLIGHT_LOW: The average number of parse requests in flight below which the server turns
+  ready again (default: 1)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections import deque
+from typing import Callable, NamedTuple, Optional
+
+import anyio.to_thread
+import psutil
+
+from ediparse.adapters.inbound.rest.impl.admission_control import AdmissionController, get_default_admission_controller
+from ediparse.infrastructure.parse_executor import (
+    PARSE_EXECUTOR, ParseExecutor, ParseExecutorBackend, get_default_parse_executor
+)
+
+LOAD_SAMPLE_INTERVAL_SECONDS = float(os.getenv("LOAD_SAMPLE_INTERVAL_SECONDS", "1.0"))
+LOAD_SAMPLE_WINDOW_SIZE = int(os.getenv("LOAD_SAMPLE_WINDOW_SIZE", "10"))
+READINESS_CPU_HIGH_PERCENT = float(os.getenv("READINESS_CPU_HIGH_PERCENT", "95"))
+READINESS_CPU_LOW_PERCENT = float(os.getenv("READINESS_CPU_LOW_PERCENT", "80"))
+READINESS_QUEUE_HIGH = float(os.getenv("READINESS_QUEUE_HIGH", "16"))
+READINESS_QUEUE_LOW = float(os.getenv("READINESS_QUEUE_LOW", "4"))
+READINESS_IN_FLIGHT_HIGH = float(os.getenv("READINESS_IN_FLIGHT_HIGH", "0"))
+READINESS_IN_FLIGHT_LOW = float(os.getenv("READINESS_IN_FLIGHT_LOW", "1"))
+
+_default_load_sampler: Optional["LoadSampler"] = None
+_default_load_sampler_lock = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+
+class LoadSample(NamedTuple):
+    """
+    The load signals sampled at one point in time (or their averages over the window).
+
+    Attributes:
+        cpu_percent (float): The CPU usage of the server process, relative to the CPUs of the host
+        queue_depth (float): The number of requests and parse tasks waiting
+        in_flight (float): The number of parse requests being processed
+    """
+    cpu_percent: float
+    queue_depth: float
+    in_flight: float
+
+
+class LoadSampler:
+    """
+    Background task sampling the load signals into a moving window, deriving the readiness with hysteresis.
+
+    Attributes:
+        interval_seconds (float): The interval between two samples
+        is_ready (bool): Whether the server is ready to accept requests
+        reason (Optional[str]): Why the server is not ready, None if it is ready
+    """
+
+    def __init__(
+            self,
+            interval_seconds: float = LOAD_SAMPLE_INTERVAL_SECONDS,
+            window_size: int = LOAD_SAMPLE_WINDOW_SIZE,
+            cpu_thresholds: tuple[float, float] = (READINESS_CPU_LOW_PERCENT, READINESS_CPU_HIGH_PERCENT),
+            queue_thresholds: tuple[float, float] = (READINESS_QUEUE_LOW, READINESS_QUEUE_HIGH),
+            in_flight_thresholds: tuple[float, float] = (READINESS_IN_FLIGHT_LOW, READINESS_IN_FLIGHT_HIGH),
+            admission_controller: AdmissionController = None,
+            parse_executor: ParseExecutor = None,
+            cpu_percent_function: Callable[[], float] = None
+    ) -> None:
+        """
+        Initializes a new load sampler. The sampling is started by start().
+
+        Args:
+            interval_seconds (float): The interval between two samples, defaults to LOAD_SAMPLE_INTERVAL_SECONDS
+            window_size (int): The number of samples the averages are taken over, defaults to LOAD_SAMPLE_WINDOW_SIZE
+            cpu_thresholds (tuple[float, float]): The low and high threshold of the average CPU usage,
+                defaults to READINESS_CPU_LOW_PERCENT and READINESS_CPU_HIGH_PERCENT
+            queue_thresholds (tuple[float, float]): The low and high threshold of the average queue depth,
+                defaults to READINESS_QUEUE_LOW and READINESS_QUEUE_HIGH
+            in_flight_thresholds (tuple[float, float]): The low and high threshold of the average number of parse
+                requests in flight, a high threshold of 0 or less disables them, defaults to READINESS_IN_FLIGHT_LOW
+                and READINESS_IN_FLIGHT_HIGH
+            admission_controller (AdmissionController): The admission controller of the parse requests, defaults to
+                None, in which case the default controller of the application is used (if the admission control
+                is enabled)
+            parse_executor (ParseExecutor): The parse executor, defaults to None, in which case the default executor
+                of the application is used (unless parsing on the threadpool)
+            cpu_percent_function (Callable[[], float]): Returns the CPU usage since its previous call, defaults to
+                None, in which case the CPU usage of the server process is measured
+
+        Raises:
+            ValueError: If the window is empty or a low threshold exceeds its high threshold
+        """
+        if window_size < 1:
+            raise ValueError(f"A load sampler needs a window of at least one sample, got {window_size}")
+        thresholds = [cpu_thresholds, queue_thresholds]
+        if in_flight_thresholds[1] > 0:
+            thresholds.append(in_flight_thresholds)
+        for low, high in thresholds:
+            if low > high:
+                raise ValueError(f"The low threshold {low} exceeds the high threshold {high}")
+        self.interval_seconds = interval_seconds
+        self.is_ready = True
+        self.reason: Optional[str] = None
+        self.__cpu_thresholds = cpu_thresholds
+        self.__queue_thresholds = queue_thresholds
+        self.__in_flight_thresholds = in_flight_thresholds
+        self.__samples: deque[LoadSample] = deque(maxlen=window_size)
+        self.__admission_controller = admission_controller or get_default_admission_controller()
+        self.__parse_executor = parse_executor
+        if self.__parse_executor is None and PARSE_EXECUTOR != ParseExecutorBackend.THREAD:
+            self.__parse_executor = get_default_parse_executor()
+        self.__cpu_percent_function = cpu_percent_function or self.__get_process_cpu_percent()
+        self.__task: Optional[asyncio.Task] = None
+
+    @property
+    def averages(self) -> Optional[LoadSample]:
+        """
+        The averages of the load signals over the window, None if nothing has been sampled yet.
+        """
+        if not self.__samples:
+            return None
+        return LoadSample(*(sum(values) / len(self.__samples) for values in zip(*self.__samples)))
+
+    def sample(self) -> LoadSample:
+        """
+        Samples the load signals. Has to be called on the event loop.
+
+        Returns:
+            LoadSample: The current load signals
+        """
+        thread_limiter = anyio.to_thread.current_default_thread_limiter().statistics()
+        queue_depth = thread_limiter.tasks_waiting
+        in_flight = 0
+        if self.__admission_controller is not None:
+            queue_depth += self.__admission_controller.queued
+            in_flight = self.__admission_controller.in_flight
+        if self.__parse_executor is not None:
+            queue_depth += max(self.__parse_executor.pending_tasks - self.__parse_executor.max_workers, 0)
+        return LoadSample(self.__cpu_percent_function(), queue_depth, in_flight)
+
+    def record(self, sample: LoadSample) -> None:
+        """
+        Adds a sample to the window and updates the readiness from the averages of the window.
+
+        Args:
+            sample (LoadSample): The sampled load signals
+        """
+        self.__samples.append(sample)
+        averages = self.averages
+        cpu_low, cpu_high = self.__cpu_thresholds
+        queue_low, queue_high = self.__queue_thresholds
+        in_flight_low, in_flight_high = self.__in_flight_thresholds
+        if self.is_ready:
+            if averages.cpu_percent > cpu_high:
+                self.__set_readiness(False, "CPU overloaded")
+            elif averages.queue_depth > queue_high:
+                self.__set_readiness(False, "Queue saturated")
+            elif 0 < in_flight_high < averages.in_flight:
+                self.__set_readiness(False, "Too many requests in flight")
+        elif (averages.cpu_percent < cpu_low and averages.queue_depth < queue_low
+              and (in_flight_high <= 0 or averages.in_flight < in_flight_low)):
+            self.__set_readiness(True, None)
+
+    def start(self) -> None:
+        """
+        Starts sampling in a background task on the running event loop.
+        """
+        if self.__task is None:
+            self.__task = asyncio.get_running_loop().create_task(self.__run())
+
+    async def stop(self) -> None:
+        """
+        Stops sampling and waits until the background task has finished.
+        """
+        task, self.__task = self.__task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def __run(self) -> None:
+        while True:
+            try:
+                self.record(self.sample())
+            except Exception as ex:
+                logger.warning(f"Sampling the load failed: {ex}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def __set_readiness(self, is_ready: bool, reason: Optional[str]) -> None:
+        self.is_ready = is_ready
+        self.reason = reason
+        logger.info(f"Server turned {'ready' if is_ready else 'not ready'}" + (f": {reason}" if reason else ""))
+
+    @staticmethod
+    def __get_process_cpu_percent() -> Callable[[], float]:
+        process = psutil.Process()
+        cpu_count = psutil.cpu_count() or 1
+        # The first call only starts the measurement, each further call returns the usage since the previous one
+        process.cpu_percent(interval=None)
+        return lambda: process.cpu_percent(interval=None) / cpu_count
+
+
+def get_default_load_sampler() -> LoadSampler:
+    """
+    Returns the load sampler shared by the application, creating it on first use.
+
+    Returns:
+        LoadSampler: The default load sampler
+    """
+    global _default_load_sampler
+    if _default_load_sampler is None:
+        with _default_load_sampler_lock:
+            if _default_load_sampler is None:
+                _default_load_sampler = LoadSampler()
+    return _default_load_sampler
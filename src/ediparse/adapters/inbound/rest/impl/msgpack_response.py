@@ -0,0 +1,81 @@
+# coding: utf-8
+"""
+MessagePack response class for parsed interchanges.
+
+Internal consumers calling the parse endpoints in a tight loop can request the parsed
+interchange as compact binary MessagePack payload instead of JSON by sending the Accept
+header application/msgpack (or one of its aliases). The payload follows the versioned
+schema of the msgpack_codec of the parser library and can be decoded with its
+decode_interchange(...) function. Like the JSON output, the payload can be requested in the
+compact representation, optionally with short keys.
+"""
+
+from typing import Optional, Union
+
+from starlette.responses import Response
+
+from ediparse.adapters.inbound.rest.impl.content_negotiation import accepts_media_type
+from ediparse.infrastructure.libs.edifactparser.exporters import MSGPACK_MEDIA_TYPE, encode_interchange
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange
+
+MSGPACK_MEDIA_TYPES = [MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"]
+
+
+def accepts_msgpack(accept: Optional[str]) -> bool:
+    """
+    Checks whether the Accept header of a request asks for MessagePack.
+
+    Args:
+        accept (Optional[str]): The value of the Accept header, if any
+
+    Returns:
+        bool: True if one of the MessagePack media types is accepted, False otherwise
+    """
+    return accepts_media_type(accept, MSGPACK_MEDIA_TYPES)
+
+
+class MessagePackResponse(Response):
+    """
+    Response rendering a parsed interchange as MessagePack payload.
+
+    Payloads already encoded (e.g., by a worker of the ParseExecutor) are sent as they are.
+
+    Attributes:
+        compact (bool): Whether the interchange is encoded in its compact representation
+        short_keys (bool): Whether the field names are replaced by their short aliases in compact mode
+    """
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def __init__(self, content: Union[EdifactInterchange, bytes], compact: bool = False, short_keys: bool = False,
+                 **kwargs) -> None:
+        """
+        Initializes a new MessagePack response.
+
+        Args:
+            content (Union[EdifactInterchange, bytes]): The parsed interchange or its encoded payload
+            compact (bool): Whether the interchange is encoded in its compact representation, defaults to False
+            short_keys (bool): Whether the field names are replaced by their short aliases in compact mode,
+                defaults to False
+            **kwargs: Further arguments of the Response, e.g. status_code or headers
+        """
+        # The content is rendered by the constructor of the response, so the flags have to be set before
+        self.compact = compact
+        self.short_keys = short_keys
+        super().__init__(content=content, **kwargs)
+
+    def render(self, content: Union[EdifactInterchange, bytes]) -> bytes:
+        """
+        Renders the parsed interchange to a MessagePack payload.
+
+        Args:
+            content (Union[EdifactInterchange, bytes]): The parsed interchange or its encoded payload
+
+        Returns:
+            bytes: The MessagePack payload
+        """
+        if isinstance(content, bytes):
+            return content
+        if self.compact:
+            return encode_interchange(content, compact=True, short_keys=self.short_keys)
+        return encode_interchange(content)
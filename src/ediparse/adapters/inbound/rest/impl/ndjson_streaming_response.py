@@ -0,0 +1,110 @@
+# coding: utf-8
+"""
+Streaming NDJSON rendering of interchanges parsed one message at a time.
+
+Clients requesting the media type application/x-ndjson receive the parsed messages as
+newline-delimited JSON instead of a single JSON document: one line per message or, at the
+finer measurement granularity, one denormalized line per MSCONS measurement (SG10). Like the
+InterchangeJSONStreamingResponse, each line is written as soon as its message has been parsed.
+
+Since the status code has been sent with the first line already, a parsing error in a later
+message is reported by a final error line, after the lines of the messages parsed before it:
+
+    {"status_code":400,"error_message":"..."}
+"""
+
+import logging
+from typing import Iterator, Optional
+
+import orjson
+from fastapi import status
+from starlette.responses import StreamingResponse
+
+from ediparse.adapters.inbound.rest.impl.content_negotiation import accepts_media_type
+from ediparse.infrastructure.libs.edifactparser.exceptions import (
+    DecompressionRatioExceededException, ParseMemoryBudgetExceededException
+)
+from ediparse.infrastructure.libs.edifactparser.exporters import NDJSONGranularity, iter_ndjson_lines
+from ediparse.infrastructure.libs.edifactparser.wrappers.message_stream import EdifactMessageStream
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+logger = logging.getLogger(__name__)
+
+
+def get_error_status_code(error: BaseException) -> int:
+    """
+    Maps an error raised while parsing a payload to the status code of the single parse endpoints.
+
+    Args:
+        error (BaseException): The raised error
+
+    Returns:
+        int: 413 if the memory budget or the decompression ratio was exceeded, 400 otherwise
+    """
+    if isinstance(error, (ParseMemoryBudgetExceededException, DecompressionRatioExceededException)):
+        return status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    return status.HTTP_400_BAD_REQUEST
+
+
+def iter_ndjson_lines_or_error(
+        message_stream: EdifactMessageStream,
+        granularity: NDJSONGranularity = NDJSONGranularity.MESSAGE
+) -> Iterator[bytes]:
+    """
+    Renders the parsed messages as NDJSON lines, ending with an error line if the parsing fails.
+
+    Args:
+        message_stream (EdifactMessageStream): The stream of the parsed messages
+        granularity (NDJSONGranularity): What a single line represents, defaults to one line per message
+
+    Returns:
+        Iterator[bytes]: The UTF-8 encoded lines, each terminated by a newline
+    """
+    try:
+        yield from iter_ndjson_lines(message_stream, granularity)
+    except Exception as ex:
+        logger.warning(f"Streaming the NDJSON lines failed: {ex}")
+        yield orjson.dumps({"status_code": get_error_status_code(ex), "error_message": str(ex)}) + b"\n"
+
+
+def accepts_ndjson(accept: Optional[str]) -> bool:
+    """
+    Checks whether the Accept header of a request asks for NDJSON.
+
+    Args:
+        accept (Optional[str]): The value of the Accept header, if any
+
+    Returns:
+        bool: True if application/x-ndjson is one of the accepted media types, False otherwise
+    """
+    return accepts_media_type(accept, [NDJSON_MEDIA_TYPE])
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    Streaming response writing the parsed messages of an interchange as NDJSON lines.
+
+    The message stream is consumed in a worker thread by Starlette, so the parsing of the
+    remaining messages does not block the event loop.
+    """
+
+    def __init__(
+            self,
+            message_stream: EdifactMessageStream,
+            granularity: NDJSONGranularity = NDJSONGranularity.MESSAGE,
+            **kwargs
+    ) -> None:
+        """
+        Initializes a new NDJSON streaming response for the given message stream.
+
+        Args:
+            message_stream (EdifactMessageStream): The stream of the parsed messages
+            granularity (NDJSONGranularity): What a single line represents, defaults to one line per message
+            **kwargs: Further arguments of the StreamingResponse, e.g. status_code or headers
+        """
+        super().__init__(
+            content=iter_ndjson_lines_or_error(message_stream, granularity),
+            media_type=NDJSON_MEDIA_TYPE,
+            **kwargs
+        )
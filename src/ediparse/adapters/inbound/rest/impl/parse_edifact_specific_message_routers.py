@@ -9,29 +9,81 @@ with options to download the parsed results or return them directly in the respo
 
 The implementation uses the ParserService from the application layer to perform
 the actual parsing, and handles error cases, file content extraction, and
-response formatting.
+response formatting. The response formats, the batch, archive and job endpoints
+and their configuration are described in the README.
+
+Environment variables:
+- MAX_PARSE_MEMORY_MB: Memory budget of a parsing run, exceeding inputs are refused with status 413
+- MAX_DECOMPRESSION_RATIO: Maximum expansion of compressed uploads, exceeding uploads are refused with status 413
+- MAX_BATCH_SIZE: Maximum number of payloads of a batch, larger batches are refused with status 413
+- UPLOAD_SPOOL_MEMORY_THRESHOLD_MB: Size up to which spooled uploads are kept in memory
 """
 
+import asyncio
 import logging
+import os
 import time
 import uuid
-from typing import Union, Tuple
+from typing import BinaryIO, Callable, Iterator, List, Union, Tuple, Optional
+
+import orjson
 
 from starlette.concurrency import run_in_threadpool
 from typing_extensions import Annotated
 
 from fastapi import status
 from pydantic import StrictStr, Field, StrictBool, StrictBytes
-from starlette.responses import JSONResponse
+from starlette.responses import FileResponse, JSONResponse, Response, StreamingResponse
 
 from ediparse.adapters.inbound.rest.apis.edifact_parser_api_base import BaseEDIFACTParserApi
-from ediparse.infrastructure.libs.edifactparser.exceptions import CONTRLException, EdifactParserException
+from ediparse.adapters.inbound.rest.impl.archive_streaming_response import (
+    ArchiveNDJSONStreamingResponse, ArchiveZipStreamingResponse, accepts_zip
+)
+from ediparse.adapters.inbound.rest.impl.batch_ndjson_response import BatchNDJSONStreamingResponse
+from ediparse.adapters.inbound.rest.impl.compact_json_response import CompactJSONResponse
+from ediparse.adapters.inbound.rest.impl.msgpack_response import MessagePackResponse, accepts_msgpack
+from ediparse.adapters.inbound.rest.impl.ndjson_streaming_response import NDJSONStreamingResponse, accepts_ndjson
+from ediparse.adapters.inbound.rest.impl.parse_jobs import ParseJobTask, render_job_status
+from ediparse.adapters.inbound.rest.impl.parse_metrics import (
+    InputTally, ParseMetrics, detect_message_type, get_default_parse_metrics, get_error_kind,
+    get_interchange_message_type
+)
+from ediparse.adapters.inbound.rest.impl.pydantic_json_response import PydanticJSONResponse
+from ediparse.adapters.inbound.rest.impl.request_body_stream import RequestBodyStream
+from ediparse.adapters.inbound.rest.impl.streaming_json_response import InterchangeJSONStreamingResponse
+from ediparse.infrastructure.job_store import (
+    JobQueueFullException, JobStatus, JobStore, get_default_job_store
+)
+from ediparse.infrastructure.libs.edifactparser.exceptions import (
+    CONTRLException, DecompressionRatioExceededException, EdifactParserException,
+    ParseMemoryBudgetExceededException
+)
+from ediparse.infrastructure.libs.edifactparser.exporters import NDJSONGranularity, is_msgpack_available
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget, ParseStage, StageTimings
+from ediparse.infrastructure.libs.edifactparser.utils.decompression import (
+    DEFAULT_DECOMPRESSION_CHUNK_SIZE, detect_compression_format, iter_decoded_text, iter_decompressed_text
+)
+from ediparse.infrastructure.libs.edifactparser.utils.stage_timings import measure_stage
+from ediparse.infrastructure.libs.edifactparser.wrappers.message_stream import EdifactMessageStream
+from ediparse.infrastructure.parse_executor import (
+    PARSE_EXECUTOR, ParseExecutor, ParseExecutorBackend, ParseOutputFormat, get_default_parse_executor
+)
+from ediparse.infrastructure.parse_capture import ParseCaptureSpool, get_default_parse_capture_spool
+from ediparse.infrastructure.parse_profiler import ParseProfiler, get_default_parse_profiler
+from ediparse.infrastructure.single_flight import SingleFlight, get_default_single_flight
 from ediparse.application.services import ParserService
 
 logger = logging.getLogger(__name__)
 
 MAX_LINES_TO_PARSE = 2442
 UNLIMITED_LINES_TO_PARSE_INDICATOR = -1
+MAX_PARSE_MEMORY_MB = int(os.getenv("MAX_PARSE_MEMORY_MB", "1024"))
+MAX_DECOMPRESSION_RATIO = int(os.getenv("MAX_DECOMPRESSION_RATIO", "100"))
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "1000"))
+UPLOAD_SPOOL_MEMORY_THRESHOLD_MB = int(os.getenv("UPLOAD_SPOOL_MEMORY_THRESHOLD_MB", "8"))
+DEBUG_TIMINGS = "timings"
+MESSAGE_CACHE_HEADER = "X-Message-Cache"
+PER_SEGMENT_STAGES = (ParseStage.TOKENIZE, ParseStage.GROUP_RESOLUTION, ParseStage.CONVERSION)
 
 
 class ParseEdifactMessageRouter(BaseEDIFACTParserApi):
@@ -47,6 +99,12 @@ class ParseEdifactMessageRouter(BaseEDIFACTParserApi):
     def __init__(
             self,
             parser_service: ParserService = None,
+            job_store: JobStore = None,
+            parse_executor: ParseExecutor = None,
+            single_flight: SingleFlight = None,
+            parse_metrics: ParseMetrics = None,
+            parse_profiler: ParseProfiler = None,
+            parse_capture_spool: ParseCaptureSpool = None,
     ):
         """
         Initialize the ParseEdifactMessageRouter with a parser service.
@@ -54,8 +112,27 @@ class ParseEdifactMessageRouter(BaseEDIFACTParserApi):
         Args:
             parser_service (ParserService): The parser service to use.
                 If None, a new ParserService instance will be created.
+            job_store (JobStore): The store of the asynchronous parsing jobs to use.
+                If None, the default job store of the application is used (created on first use).
+            parse_executor (ParseExecutor): The executor of the complete parsing runs to use.
+                If None, the default executor of the application is used, unless the configured
+                backend is the thread backend, in which case the parser service parses on the threadpool.
+            single_flight (SingleFlight): The single-flight coalescing identical concurrent parsing runs to use.
+                If None, the default single-flight of the application is used (if the coalescing is enabled).
+            parse_metrics (ParseMetrics): The metrics recording the parsing runs.
+                If None, the default metrics of the application are used.
+            parse_profiler (ParseProfiler): The profiler sampling the parsing runs on the threadpool.
+                If None, the default profiler of the application is used (if the profiler is enabled).
+            parse_capture_spool (ParseCaptureSpool): The spool capturing slow parsing runs.
+                If None, the default spool of the application is used (if a capture directory is configured).
         """
         self.__parser_service = parser_service or ParserService()
+        self.__job_store = job_store
+        self.__parse_executor = parse_executor
+        self.__single_flight = single_flight
+        self.__parse_metrics = parse_metrics
+        self.__parse_profiler = parse_profiler
+        self.__parse_capture_spool = parse_capture_spool
 
     async def parse_string_input(
             self,
@@ -63,24 +140,61 @@ class ParseEdifactMessageRouter(BaseEDIFACTParserApi):
                 description="If set to true, enables a parsing limit for the maximum number of lines. By default, the limit is 2442 lines.")],
             body: Annotated[StrictStr, Field(
                 description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) in plain text format.")],
-    ) -> JSONResponse:
+            accept: Annotated[Optional[StrictStr], Field(
+                description="The accepted media types. If application/msgpack is accepted, the result is returned as "
+                            "MessagePack.")] = None,
+            compact: Annotated[StrictBool, Field(
+                description="If set to true, empty values (null, empty lists and empty objects) are omitted from the "
+                            "result.")] = False,
+            short_keys: Annotated[StrictBool, Field(
+                description="If set to true in compact mode, the field names are replaced by their documented short "
+                            "aliases.")] = False,
+            debug: Annotated[Optional[StrictStr], Field(
+                description="If set to timings, the durations of the parsing stages are returned via the Server-Timing "
+                            "header.")] = None,
+    ) -> Response:
         """
         Parse a raw EDIFACT-specific message and return the result as JSON.
 
         This endpoint accepts a raw EDIFACT-specific message string and returns
-        the parsed data in a structured JSON format.
+        the parsed data in a structured JSON format, or as MessagePack payload if
+        application/msgpack is accepted.
 
         Args:
             limit_mode (bool): If true, limits parsing to a maximum of 2442 lines;
                 if false, parses the entire message regardless of size
             body (str): The raw EDIFACT-specific message to parse
+            accept (Optional[str]): The Accept header of the request, defaults to None
+            compact (bool): If true, omits empty values from the parsed data, defaults to False
+            short_keys (bool): If true in compact mode, replaces the field names by their short aliases,
+                defaults to False
+            debug (Optional[str]): If 'timings', returns the durations of the parsing stages via the
+                Server-Timing header, defaults to None
 
         Returns:
-            JSONResponse: A JSON response containing either the parsed data (status 200 - Success)
-                or an error message (status 400 - Bad request)
+            Response: A JSON or MessagePack response containing either the parsed data (status 200 - Success)
+                or an error message (status 400 - Bad request, status 406 - MessagePack not available,
+                status 413 - Memory budget exceeded)
         """
+        if accepts_msgpack(accept) and not is_msgpack_available():
+            return self.__create_msgpack_not_available_response()
+
+        stage_timings = StageTimings() if debug == DEBUG_TIMINGS else None
+        headers: dict[str, str] = {}
         try:
-            parsed_obj = await self.__get_parsed_result(body=body, limit_mode=limit_mode)
+            parsed_obj = await self.__get_parsed_result(
+                body=body,
+                limit_mode=limit_mode,
+                output_format=self.__get_output_format(accept, compact),
+                short_keys=short_keys,
+                endpoint="/parse-string",
+                stage_timings=stage_timings,
+                response_headers=headers
+            )
+        except ParseMemoryBudgetExceededException as ex:
+            return JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, content={"error_message": str(ex)}
+            )
         except CONTRLException as ex:
             return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": str(ex)})
         except EdifactParserException as ex:
@@ -88,7 +202,16 @@ class ParseEdifactMessageRouter(BaseEDIFACTParserApi):
         except Exception as ex:
             return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": str(ex)})
 
-        return JSONResponse(status_code=status.HTTP_200_OK, content=parsed_obj.model_dump())
+        return self.__create_parsed_response(
+            parsed_obj=parsed_obj,
+            endpoint="/parse-string",
+            status_code=status.HTTP_200_OK,
+            accept=accept,
+            compact=compact,
+            short_keys=short_keys,
+            headers=headers,
+            stage_timings=stage_timings
+        )
 
     async def parse_file(
         self,
@@ -96,7 +219,29 @@ class ParseEdifactMessageRouter(BaseEDIFACTParserApi):
             description="If set to true, enables a parsing limit for the maximum number of lines. By default, the limit is 2442 lines.")],
         body: Annotated[Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]], Field(
             description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.")],
-    ) -> JSONResponse:
+        stream: Annotated[StrictBool, Field(
+            description="If set to true, the result is streamed, writing each message as soon as it has been "
+                        "parsed.")] = False,
+        accept: Annotated[Optional[StrictStr], Field(
+            description="The accepted media types. If application/x-ndjson is accepted, the result is streamed as "
+                        "newline-delimited JSON, if application/msgpack is accepted, the result is returned as "
+                        "MessagePack.")] = None,
+        granularity: Annotated[StrictStr, Field(
+            description="What a single NDJSON line represents: a message (message) or an MSCONS measurement "
+                        "(measurement).")] = NDJSONGranularity.MESSAGE,
+        compact: Annotated[StrictBool, Field(
+            description="If set to true, empty values (null, empty lists and empty objects) are omitted from the "
+                        "result.")] = False,
+        short_keys: Annotated[StrictBool, Field(
+            description="If set to true in compact mode, the field names are replaced by their documented short "
+                        "aliases.")] = False,
+        content_encoding: Annotated[Optional[StrictStr], Field(
+            description="The content encoding of the uploaded file. Gzip files and zip archives are also detected from "
+                        "their content.")] = None,
+        debug: Annotated[Optional[StrictStr], Field(
+            description="If set to timings, the durations of the parsing stages are returned via the Server-Timing "
+                        "header.")] = None,
+    ) -> Response:
         """
         Parse a raw EDIFACT-specific message from a file and return the result as JSON.
 
@@ -105,22 +250,82 @@ class ParseEdifactMessageRouter(BaseEDIFACTParserApi):
         different file content formats and converts bytes to strings, attempting UTF-8
         decoding first and falling back to ISO-8859-1 if UTF-8 decoding fails.
 
+        In stream mode, the input is validated up front, but the messages are parsed while
+        the response is written, so the first bytes are sent after the first message has been
+        parsed and only about one message is held in memory at once. MessagePack payloads
+        are always rendered from the completely parsed interchange.
+
         Args:
             limit_mode (bool): If true, limits parsing to a maximum of 2442 lines;
                 if false, parses the entire message regardless of size
             body (str | dict[str, bytes]): The uploaded file containing the raw EDIFACT-specific message,
                 which may be a tuple or direct file content in various formats
+            stream (bool): If true, streams the parsed data message by message, defaults to False
+            accept (Optional[str]): The Accept header of the request; if application/x-ndjson is accepted,
+                the parsed data is streamed as NDJSON, if application/msgpack is accepted, the parsed
+                data is returned as MessagePack payload, defaults to None
+            granularity (str): The granularity of the NDJSON lines, either 'message' or 'measurement',
+                defaults to 'message'
+            compact (bool): If true, omits empty values from the parsed data, defaults to False
+            short_keys (bool): If true in compact mode, replaces the field names by their short aliases,
+                defaults to False
+            content_encoding (Optional[str]): The Content-Encoding header of the request; gzip and zip uploads
+                are decompressed while they are parsed, defaults to None
+            debug (Optional[str]): If 'timings', returns the durations of the parsing stages via the
+                Server-Timing header, unless the result is streamed, defaults to None
 
         Returns:
-            JSONResponse: A JSON response containing either the parsed data (status 200 - Success)
-                or an error message (status 400 - Bad request)
+            Response: A JSON, NDJSON or MessagePack response containing either the parsed data (status 200 - Success)
+                or an error message (status 400 - Bad request, status 406 - MessagePack not available,
+                status 413 - Memory budget or decompression ratio exceeded)
         """
-        if not body:
+        if not await self.__has_content(body):
             return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": "No file provided"})
+        if accepts_msgpack(accept) and not accepts_ndjson(accept) and not is_msgpack_available():
+            return self.__create_msgpack_not_available_response()
 
+        stage_timings = StageTimings() if debug == DEBUG_TIMINGS else None
+        headers: dict[str, str] = {}
         try:
-            file_content = await self.__get_file_content(body)
-            parsed_obj = await self.__get_parsed_result(body=file_content, limit_mode=limit_mode)
+            # Uploads decoded while they are parsed are read in the tokenize stage
+            with measure_stage(stage_timings, ParseStage.READ):
+                is_streamed_response = accepts_ndjson(accept) or (stream and not accepts_msgpack(accept))
+                file_content = await self.__get_decompressed_file_content(
+                    body, content_encoding, is_streamed_response=is_streamed_response
+                )
+            if accepts_ndjson(accept):
+                ndjson_granularity = NDJSONGranularity(granularity)
+                message_stream = await self.__get_message_stream(
+                    body=file_content, limit_mode=limit_mode, endpoint="/parse-file"
+                )
+                return NDJSONStreamingResponse(
+                    message_stream=message_stream,
+                    granularity=ndjson_granularity,
+                    status_code=status.HTTP_200_OK
+                )
+            if stream and not accepts_msgpack(accept):
+                message_stream = await self.__get_message_stream(
+                    body=file_content, limit_mode=limit_mode, endpoint="/parse-file"
+                )
+                return InterchangeJSONStreamingResponse(
+                    message_stream=message_stream,
+                    compact=compact,
+                    short_keys=short_keys,
+                    status_code=status.HTTP_200_OK
+                )
+            parsed_obj = await self.__get_parsed_result(
+                body=file_content,
+                limit_mode=limit_mode,
+                output_format=self.__get_output_format(accept, compact),
+                short_keys=short_keys,
+                endpoint="/parse-file",
+                stage_timings=stage_timings,
+                response_headers=headers
+            )
+        except (ParseMemoryBudgetExceededException, DecompressionRatioExceededException) as ex:
+            return JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, content={"error_message": str(ex)}
+            )
         except CONTRLException as ex:
             return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": str(ex)})
         except EdifactParserException as ex:
@@ -128,11 +333,26 @@ class ParseEdifactMessageRouter(BaseEDIFACTParserApi):
         except Exception as ex:
             return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": str(ex)})
 
-        return JSONResponse(status_code=status.HTTP_200_OK, content=parsed_obj.model_dump())
+        return self.__create_parsed_response(
+            parsed_obj=parsed_obj,
+            endpoint="/parse-file",
+            status_code=status.HTTP_200_OK,
+            accept=accept,
+            compact=compact,
+            short_keys=short_keys,
+            headers=headers,
+            stage_timings=stage_timings
+        )
 
     async def download_parsed_string_input(
         self,
         body: Annotated[StrictStr, Field(description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) in plain text format.")],
+        compact: Annotated[StrictBool, Field(
+            description="If set to true, empty values (null, empty lists and empty objects) are omitted from the "
+                        "result.")] = False,
+        short_keys: Annotated[StrictBool, Field(
+            description="If set to true in compact mode, the field names are replaced by their documented short "
+                        "aliases.")] = False,
     ) -> JSONResponse:
         """
         Parse a raw EDIFACT-specific message and return the result as a downloadable JSON file.
@@ -144,14 +364,29 @@ class ParseEdifactMessageRouter(BaseEDIFACTParserApi):
 
         Args:
             body (str): The raw EDIFACT-specific message to parse
+            compact (bool): If true, omits empty values from the parsed data, defaults to False
+            short_keys (bool): If true in compact mode, replaces the field names by their short aliases,
+                defaults to False
 
         Returns:
             JSONResponse: A JSON response containing either the parsed data (status 201 - Created)
-                or an error message (status 400 - Bad request), with headers set for file download
-                including a timestamp in the filename
+                or an error message (status 400 - Bad request, status 413 - Memory budget exceeded), with headers set
+                for file download including a timestamp in the filename
         """
+        headers = self.__get_download_headers()
         try:
-            parsed_obj = await self.__get_parsed_result(body=body, limit_mode=False)
+            parsed_obj = await self.__get_parsed_result(
+                body=body,
+                limit_mode=False,
+                output_format=self.__get_output_format(None, compact),
+                short_keys=short_keys,
+                endpoint="/download-parsed-string",
+                response_headers=headers
+            )
+        except ParseMemoryBudgetExceededException as ex:
+            return JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, content={"error_message": str(ex)}
+            )
         except CONTRLException as ex:
             return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": str(ex)})
         except EdifactParserException as ex:
@@ -159,18 +394,39 @@ class ParseEdifactMessageRouter(BaseEDIFACTParserApi):
         except Exception as ex:
             return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": str(ex)})
 
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        return JSONResponse(
+        return self.__create_parsed_response(
+            parsed_obj=parsed_obj,
+            endpoint="/download-parsed-string",
             status_code=status.HTTP_201_CREATED,
-            content=parsed_obj.model_dump(),
-            headers={"Content-Disposition": f"attachment; filename=edifact_message_parsed_{timestamp}.json"}
+            accept=None,
+            compact=compact,
+            short_keys=short_keys,
+            headers=headers
         )
 
     async def download_parsed_file(
         self,
         body: Annotated[Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]], Field(
             description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.")],
-    ) -> JSONResponse:
+        stream: Annotated[StrictBool, Field(
+            description="If set to true, the result is streamed, writing each message as soon as it has been "
+                        "parsed.")] = False,
+        accept: Annotated[Optional[StrictStr], Field(
+            description="The accepted media types. If application/x-ndjson is accepted, the result is streamed as "
+                        "newline-delimited JSON.")] = None,
+        granularity: Annotated[StrictStr, Field(
+            description="What a single NDJSON line represents: a message (message) or an MSCONS measurement "
+                        "(measurement).")] = NDJSONGranularity.MESSAGE,
+        compact: Annotated[StrictBool, Field(
+            description="If set to true, empty values (null, empty lists and empty objects) are omitted from the "
+                        "result.")] = False,
+        short_keys: Annotated[StrictBool, Field(
+            description="If set to true in compact mode, the field names are replaced by their documented short "
+                        "aliases.")] = False,
+        content_encoding: Annotated[Optional[StrictStr], Field(
+            description="The content encoding of the uploaded file. Gzip files and zip archives are also detected from "
+                        "their content.")] = None,
+    ) -> Response:
         """
         Parse a raw EDIFACT-specific message from a file and return the result as a downloadable JSON file.
 
@@ -180,21 +436,69 @@ class ParseEdifactMessageRouter(BaseEDIFACTParserApi):
         decoding first and falling back to ISO-8859-1 if UTF-8 decoding fails),
         and always parses the entire message without line limits.
 
+        In stream mode, the messages are parsed while the file is written (see parse_file(...)).
+
         Args:
             body (str | dict[str, bytes]): The uploaded file containing the raw EDIFACT-specific message,
                 which may be a tuple or direct file content in various formats
+            stream (bool): If true, streams the parsed data message by message, defaults to False
+            accept (Optional[str]): The Accept header of the request; if application/x-ndjson is accepted,
+                the parsed data is streamed as NDJSON file, defaults to None
+            granularity (str): The granularity of the NDJSON lines, either 'message' or 'measurement',
+                defaults to 'message'
+            compact (bool): If true, omits empty values from the parsed data, defaults to False
+            short_keys (bool): If true in compact mode, replaces the field names by their short aliases,
+                defaults to False
+            content_encoding (Optional[str]): The Content-Encoding header of the request; gzip and zip uploads
+                are decompressed while they are parsed, defaults to None
 
         Returns:
-            JSONResponse: A JSON response containing either the parsed data (status 201 - Created)
-                or an error message (status 400 - Bad request), with headers set for file download
-                including a timestamp in the filename
+            Response: A JSON or NDJSON response containing either the parsed data (status 201 - Created)
+                or an error message (status 400 - Bad request, status 413 - Memory budget or decompression ratio
+                exceeded), with headers set for file download including a timestamp in the filename
         """
-        if not body:
+        if not await self.__has_content(body):
             return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": "No file provided"})
 
+        headers = self.__get_download_headers()
         try:
-            file_content = await self.__get_file_content(body)
-            parsed_obj = await self.__get_parsed_result(body=file_content, limit_mode=False)
+            file_content = await self.__get_decompressed_file_content(
+                body, content_encoding, is_streamed_response=accepts_ndjson(accept) or stream
+            )
+            if accepts_ndjson(accept):
+                ndjson_granularity = NDJSONGranularity(granularity)
+                message_stream = await self.__get_message_stream(
+                    body=file_content, limit_mode=False, endpoint="/download-parsed-file"
+                )
+                return NDJSONStreamingResponse(
+                    message_stream=message_stream,
+                    granularity=ndjson_granularity,
+                    status_code=status.HTTP_201_CREATED,
+                    headers=self.__get_download_headers(file_extension="ndjson")
+                )
+            if stream:
+                message_stream = await self.__get_message_stream(
+                    body=file_content, limit_mode=False, endpoint="/download-parsed-file"
+                )
+                return InterchangeJSONStreamingResponse(
+                    message_stream=message_stream,
+                    compact=compact,
+                    short_keys=short_keys,
+                    status_code=status.HTTP_201_CREATED,
+                    headers=self.__get_download_headers()
+                )
+            parsed_obj = await self.__get_parsed_result(
+                body=file_content,
+                limit_mode=False,
+                output_format=self.__get_output_format(None, compact),
+                short_keys=short_keys,
+                endpoint="/download-parsed-file",
+                response_headers=headers
+            )
+        except (ParseMemoryBudgetExceededException, DecompressionRatioExceededException) as ex:
+            return JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, content={"error_message": str(ex)}
+            )
         except CONTRLException as ex:
             return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": str(ex)})
         except EdifactParserException as ex:
@@ -202,27 +506,742 @@ class ParseEdifactMessageRouter(BaseEDIFACTParserApi):
         except Exception as ex:
             return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": str(ex)})
 
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        return JSONResponse(
+        return self.__create_parsed_response(
+            parsed_obj=parsed_obj,
+            endpoint="/download-parsed-file",
+            status_code=status.HTTP_201_CREATED,
+            accept=None,
+            compact=compact,
+            short_keys=short_keys,
+            headers=headers
+        )
+
+    async def download_measurements_csv(
+        self,
+        body: Annotated[Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]], Field(
+            description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.")],
+        content_encoding: Annotated[Optional[StrictStr], Field(
+            description="The content encoding of the uploaded file. Gzip files and zip archives are also detected from "
+                        "their content.")] = None,
+    ) -> Response:
+        """
+        Export the measurements of a raw EDIFACT-MSCONS message from a file as a downloadable CSV file.
+
+        This endpoint accepts an uploaded file containing a raw EDIFACT-MSCONS message and returns one
+        CSV row per measurement (see CSV_COLUMNS of the CSV exporter). The upload is read as a sequence
+        of text chunks and the rows are written as soon as their measurements have been scanned, so the
+        upload is never held as one string.
+
+        Args:
+            body (str | dict[str, bytes]): The uploaded file containing the raw EDIFACT-MSCONS message,
+                which may be a tuple or direct file content in various formats
+            content_encoding (Optional[str]): The Content-Encoding header of the request; gzip and zip uploads
+                are decompressed while they are scanned, defaults to None
+
+        Returns:
+            Response: A CSV response containing the measurements (status 201 - Created) with headers set for file
+                download including a timestamp in the filename, or an error message (status 400 - Bad request,
+                status 413 - Memory budget or decompression ratio exceeded)
+        """
+        if not await self.__has_content(body):
+            return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": "No file provided"})
+
+        try:
+            file_content = await self.__get_decompressed_file_content(body, content_encoding, is_streamed_response=True)
+            job_id = uuid.uuid4()
+            logger.info(f"Measurement export triggered for job ID: {job_id} ...")
+            # The rows are scanned while they are streamed, so the export is recorded once they have been written
+            input_tally = InputTally()
+            csv_lines = await run_in_threadpool(
+                self.__parser_service.export_measurements_csv, message_content=input_tally.track(file_content)
+            )
+        except (ParseMemoryBudgetExceededException, DecompressionRatioExceededException) as ex:
+            self.__get_parse_metrics().count_error("/download-measurements-csv", get_error_kind(ex))
+            return JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, content={"error_message": str(ex)}
+            )
+        except EdifactParserException as ex:
+            self.__get_parse_metrics().count_error("/download-measurements-csv", get_error_kind(ex))
+            return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": str(ex)})
+        except Exception as ex:
+            self.__get_parse_metrics().count_error("/download-measurements-csv", get_error_kind(ex))
+            return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": str(ex)})
+
+        return StreamingResponse(
+            content=self.__get_parse_metrics().observe_iteration(csv_lines, "/download-measurements-csv", input_tally),
             status_code=status.HTTP_201_CREATED,
-            content=parsed_obj.model_dump(),
-            headers={"Content-Disposition": f"attachment; filename=edifact_message_parsed_{timestamp}.json"}
+            media_type="text/csv",
+            headers=self.__get_download_headers(file_extension="csv")
+        )
+
+    async def create_job(
+        self,
+        limit_mode: Annotated[StrictBool, Field(
+            description="If set to true, enables a parsing limit for the maximum number of lines. "
+                        "By default, the limit is 2442 lines.")],
+        body: Annotated[Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]], Field(
+            description="The raw EDIFACT-specific message (e.g., APERAK, MSCONS, etc.) provided as a file.")],
+        compact: Annotated[StrictBool, Field(
+            description="If set to true, empty values (null, empty lists and empty objects) are omitted from the "
+                        "result.")] = False,
+        short_keys: Annotated[StrictBool, Field(
+            description="If set to true in compact mode, the field names are replaced by their documented short "
+                        "aliases.")] = False,
+        content_encoding: Annotated[Optional[StrictStr], Field(
+            description="The content encoding of the uploaded file. Gzip files and zip archives are also detected from "
+                        "their content.")] = None,
+    ) -> JSONResponse:
+        """
+        Create an asynchronous job parsing a raw EDIFACT-specific message from a file.
+
+        This endpoint spools the uploaded file to disk and queues a job parsing it on the bounded
+        worker pool of the job store. It returns right away with the id and status of the job,
+        which can be polled via get_job(...) until the result can be fetched via get_job_result(...).
+
+        Args:
+            limit_mode (bool): If true, limits parsing to a maximum of 2442 lines;
+                if false, parses the entire message regardless of size
+            body (bytes | tuple[str, bytes]): The uploaded file containing the raw EDIFACT-specific message,
+                which may be a tuple or direct file content
+            compact (bool): If true, omits empty values from the result, defaults to False
+            short_keys (bool): If true in compact mode, replaces the field names by their short aliases,
+                defaults to False
+            content_encoding (Optional[str]): The Content-Encoding header of the request; gzip and zip uploads
+                are decompressed while they are parsed, defaults to None
+
+        Returns:
+            JSONResponse: The status of the queued job (status 202 - Accepted) or an error message
+                (status 400 - Bad request, status 503 - Job queue full)
+        """
+        if not await self.__has_content(body):
+            return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": "No file provided"})
+
+        task = ParseJobTask(
+            parser_service=self.__parser_service,
+            max_lines_to_parse=MAX_LINES_TO_PARSE if limit_mode else UNLIMITED_LINES_TO_PARSE_INDICATOR,
+            max_memory_bytes=self.__get_max_parse_memory_bytes(),
+            max_decompression_ratio=MAX_DECOMPRESSION_RATIO,
+            content_encoding=content_encoding,
+            compact=compact,
+            short_keys=short_keys,
+            parse_metrics=self.__get_parse_metrics()
+        )
+        try:
+            # The upload is spooled as is, compressed uploads are decompressed by the job
+            if isinstance(body, RequestBodyStream):
+                # Streamed uploads are written to the spool file of the job while they are received
+                upload = body
+            elif isinstance(body, str):
+                upload = body.encode("utf-8")
+            else:
+                upload = await self.__get_raw_file_content(body)
+            job = await run_in_threadpool(self.__get_job_store().submit, upload, task)
+        except JobQueueFullException as ex:
+            return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={"error_message": str(ex)})
+        except Exception as ex:
+            return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": str(ex)})
+
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=render_job_status(job),
+            headers={"Location": f"/jobs/{job.id}"}
+        )
+
+    async def get_job(
+        self,
+        job_id: Annotated[StrictStr, Field(description="The id of the job.")],
+    ) -> JSONResponse:
+        """
+        Get the status and progress of an asynchronous parsing job.
+
+        Args:
+            job_id (str): The id of the job
+
+        Returns:
+            JSONResponse: The status and progress of the job (status 200 - Success)
+                or an error message (status 404 - Job not found or expired)
+        """
+        job = self.__get_job_store().get(job_id)
+        if job is None:
+            return self.__create_job_not_found_response(job_id)
+        return JSONResponse(status_code=status.HTTP_200_OK, content=render_job_status(job))
+
+    async def get_job_result(
+        self,
+        job_id: Annotated[StrictStr, Field(description="The id of the job.")],
+    ) -> Response:
+        """
+        Get the result of an asynchronous parsing job as JSON file.
+
+        Results spilled to disk while parsing are sent from their file, smaller results from memory.
+
+        Args:
+            job_id (str): The id of the job
+
+        Returns:
+            Response: The parsed data (status 200 - Success) or an error message (status 400 - Bad request
+                or 413 - Memory budget or decompression ratio exceeded, if the job has failed,
+                status 404 - Job not found or expired, status 409 - Job not finished yet)
+        """
+        job = self.__get_job_store().get(job_id)
+        if job is None:
+            return self.__create_job_not_found_response(job_id)
+        if job.status == JobStatus.FAILED:
+            job_status = render_job_status(job)
+            return JSONResponse(
+                status_code=job_status["status_code"], content={"error_message": job_status["error_message"]}
+            )
+        if job.status != JobStatus.SUCCEEDED:
+            return JSONResponse(
+                status_code=status.HTTP_409_CONFLICT,
+                content={"error_message": f"The job {job_id} is {job.status.value}, its result is not available yet."}
+            )
+
+        headers = self.__get_download_headers()
+        if job.result_path:
+            return FileResponse(
+                path=job.result_path, status_code=status.HTTP_200_OK, media_type="application/json", headers=headers
+            )
+        return Response(
+            content=job.result_content, status_code=status.HTTP_200_OK, media_type="application/json", headers=headers
+        )
+
+    async def parse_archive(
+        self,
+        limit_mode: Annotated[StrictBool, Field(
+            description="If set to true, enables a parsing limit for the maximum number of lines per file. "
+                        "By default, the limit is 2442 lines.")],
+        body: Annotated[Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]], Field(
+            description="The zip or tar archive (optionally compressed with gzip, bzip2 or xz) containing the raw "
+                        "EDIFACT-specific messages (e.g., APERAK, MSCONS, etc.) as files.")],
+        accept: Annotated[Optional[StrictStr], Field(
+            description="The accepted media types. If application/zip is accepted, the results are returned as zip "
+                        "archive, otherwise as newline-delimited JSON.")] = None,
+        compact: Annotated[StrictBool, Field(
+            description="If set to true, empty values (null, empty lists and empty objects) are omitted from the "
+                        "results.")] = False,
+        short_keys: Annotated[StrictBool, Field(
+            description="If set to true in compact mode, the field names are replaced by their documented short "
+                        "aliases.")] = False,
+    ) -> Response:
+        """
+        Parse the raw EDIFACT-specific messages of a zip or tar archive and stream back the outcome of each file.
+
+        This endpoint accepts an uploaded archive, reads its files one after another and parses them
+        concurrently on the warm parser pool. The outcome of each file is written as soon as it is
+        available (i.e., not in archive order), keyed by the name of the file: as NDJSON line holding
+        either the parsed data (status_code 200) or the error message of the file (status_code 400,
+        or 413 if the memory budget was exceeded), or, if application/zip is accepted, as file of a
+        result archive. Only the files in flight are held in memory besides the uploaded archive.
+
+        Args:
+            limit_mode (bool): If true, limits parsing to a maximum of 2442 lines per file;
+                if false, parses the entire files regardless of size
+            body (bytes | tuple[str, bytes]): The uploaded zip or tar archive, which may be a tuple
+                or direct file content
+            accept (Optional[str]): The Accept header of the request; if application/zip is accepted, the results
+                are returned as zip archive, defaults to None
+            compact (bool): If true, omits empty values from the parsed data, defaults to False
+            short_keys (bool): If true in compact mode, replaces the field names by their short aliases,
+                defaults to False
+
+        Returns:
+            Response: An NDJSON or zip response with the outcome of each file (status 200 - Success)
+                or an error message (status 400 - Bad request)
+        """
+        if not await self.__has_content(body):
+            return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": "No file provided"})
+
+        try:
+            archive = await self.__get_raw_file_content(body)
+            job_id = uuid.uuid4()
+            logger.info(f"Archive parsing process triggered for job ID: {job_id} ...")
+            # The archive is opened right away, its files are parsed while the response is streamed
+            outcomes = await run_in_threadpool(
+                self.__parser_service.parse_archive,
+                archive=archive,
+                max_lines_to_parse=MAX_LINES_TO_PARSE if limit_mode else UNLIMITED_LINES_TO_PARSE_INDICATOR,
+                max_memory_bytes=self.__get_max_parse_memory_bytes(),
+                max_decompression_ratio=MAX_DECOMPRESSION_RATIO,
+                observer=self.__get_parse_metrics().create_parse_run_observer("/parse-archive")
+            )
+        except EdifactParserException as ex:
+            return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": str(ex)})
+        except Exception as ex:
+            return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": str(ex)})
+
+        if accepts_zip(accept):
+            return ArchiveZipStreamingResponse(
+                outcomes=outcomes,
+                compact=compact,
+                short_keys=short_keys,
+                status_code=status.HTTP_200_OK,
+                headers=self.__get_download_headers(file_extension="zip")
+            )
+        return ArchiveNDJSONStreamingResponse(
+            outcomes=outcomes,
+            compact=compact,
+            short_keys=short_keys,
+            status_code=status.HTTP_200_OK
+        )
+
+    async def parse_batch(
+        self,
+        limit_mode: Annotated[StrictBool, Field(
+            description="If set to true, enables a parsing limit for the maximum number of lines per payload. "
+                        "By default, the limit is 2442 lines.")],
+        body: Annotated[Union[List[StrictStr], StrictBytes, StrictStr], Field(
+            description="The raw EDIFACT-specific messages (e.g., APERAK, MSCONS, etc.) as JSON array of strings or as "
+                        "NDJSON with one JSON string per line.")],
+        compact: Annotated[StrictBool, Field(
+            description="If set to true, empty values (null, empty lists and empty objects) are omitted from the "
+                        "results.")] = False,
+        short_keys: Annotated[StrictBool, Field(
+            description="If set to true in compact mode, the field names are replaced by their documented short "
+                        "aliases.")] = False,
+    ) -> Response:
+        """
+        Parse a batch of raw EDIFACT-specific messages and stream back the outcome of each of them as NDJSON.
+
+        This endpoint accepts several raw EDIFACT-specific messages, parses them concurrently on the
+        warm parser pool and writes one NDJSON line per message in input order, holding either the
+        parsed data (status_code 200) or the error message of the message (status_code 400, or 413
+        if the memory budget was exceeded). A failing message does not affect the other messages.
+
+        Args:
+            limit_mode (bool): If true, limits parsing to a maximum of 2442 lines per message;
+                if false, parses the entire messages regardless of size
+            body (list[str] | bytes | str): The raw EDIFACT-specific messages, either as JSON array of strings
+                or as NDJSON with one JSON string per line
+            compact (bool): If true, omits empty values from the parsed data, defaults to False
+            short_keys (bool): If true in compact mode, replaces the field names by their short aliases,
+                defaults to False
+
+        Returns:
+            Response: An NDJSON response with the outcome of each message (status 200 - Success)
+                or an error message (status 400 - Bad request, status 413 - Too many messages)
+        """
+        if not body:
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": "No payloads provided"}
+            )
+
+        try:
+            payloads = await run_in_threadpool(self.__get_batch_payloads, body)
+        except Exception as ex:
+            return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error_message": str(ex)})
+        if 0 < MAX_BATCH_SIZE < len(payloads):
+            return JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={"error_message": (
+                    f"The batch contains {len(payloads)} payloads, at most {MAX_BATCH_SIZE} are allowed."
+                )}
+            )
+
+        job_id = uuid.uuid4()
+        logger.info(f"Batch parsing process triggered for job ID: {job_id} with {len(payloads)} payloads ...")
+        outcomes = self.__parser_service.parse_batch(
+            message_contents=payloads,
+            max_lines_to_parse=MAX_LINES_TO_PARSE if limit_mode else UNLIMITED_LINES_TO_PARSE_INDICATOR,
+            max_memory_bytes=self.__get_max_parse_memory_bytes(),
+            observer=self.__get_parse_metrics().create_parse_run_observer("/parse-batch")
+        )
+        return BatchNDJSONStreamingResponse(
+            outcomes=outcomes,
+            compact=compact,
+            short_keys=short_keys,
+            status_code=status.HTTP_200_OK
         )
 
-    async def __get_parsed_result(self, body: str, limit_mode: bool) -> object:
+    async def __get_parsed_result(
+            self,
+            body: Union[str, Iterator[str]],
+            limit_mode: bool,
+            output_format: ParseOutputFormat = ParseOutputFormat.JSON,
+            short_keys: bool = False,
+            endpoint: str = "/parse-string",
+            stage_timings: Optional[StageTimings] = None,
+            response_headers: Optional[dict[str, str]] = None
+    ) -> object:
         max_lines_to_parse = MAX_LINES_TO_PARSE if limit_mode else UNLIMITED_LINES_TO_PARSE_INDICATOR
+        memory_budget = MemoryBudget(max_bytes=self.__get_max_parse_memory_bytes())
+        parse_executor = self.__get_parse_executor()
+        single_flight = self.__get_single_flight()
+        parse_metrics = self.__get_parse_metrics()
+        capture_spool = self.__get_parse_capture_spool()
+        recorded_timings = stage_timings
+        if capture_spool is not None:
+            # The input and the stage timings are kept, so that a slow parsing run can be captured
+            if recorded_timings is None:
+                recorded_timings = StageTimings()
+            if not isinstance(body, str):
+                with measure_stage(recorded_timings, ParseStage.READ):
+                    body = await run_in_threadpool("".join, body)
+        input_tally = None
+        if not isinstance(body, str):
+            # The chunks are counted while they are parsed, so that the input is never held for the metrics
+            input_tally = InputTally()
+            body = input_tally.count(body)
         job_id = uuid.uuid4()
         logger.info(f"Parsing process triggered for job ID: {job_id} ...")
         t1 = time.perf_counter()
-        parsed_obj = await run_in_threadpool(
-            self.__parser_service.parse_message,
-            message_content=body,
-            max_lines_to_parse=max_lines_to_parse
-        )
+        parse_metrics.in_flight.inc()
+        try:
+            if parse_executor is None and self.__parser_service.parse_result_cache is None and single_flight is None:
+                parsed_obj = await self.__run_profiled(
+                    self.__parser_service.parse_message,
+                    message_content=body,
+                    max_lines_to_parse=max_lines_to_parse,
+                    memory_budget=memory_budget,
+                    stage_timings=recorded_timings
+                )
+            else:
+                # The rendered response body is handed out, which can be cached and shared by coalesced requests
+                with measure_stage(recorded_timings, ParseStage.READ):
+                    edifact_text = body if isinstance(body, str) else await run_in_threadpool("".join, body)
+                cache_key = None
+                if self.__parser_service.parse_result_cache is not None or single_flight is not None:
+                    # The payload is hashed in the threadpool, since large payloads would block the event loop
+                    cache_key = await run_in_threadpool(
+                        self.__parser_service.get_result_cache_key,
+                        edifact_text, max_lines_to_parse, output_format, short_keys
+                    )
+
+                async def render() -> bytes:
+                    return await self.__render_message(
+                        edifact_text, cache_key, max_lines_to_parse, memory_budget, output_format, short_keys,
+                        parse_executor, endpoint, recorded_timings
+                    )
+
+                if single_flight is None:
+                    parsed_obj = await render()
+                else:
+                    parsed_obj = await single_flight.run(cache_key, render)
+        except ParseMemoryBudgetExceededException as ex:
+            parse_metrics.count_error(endpoint, "memory_budget")
+            logger.warning(
+                f"MEMORY-ESTIMATE: Parsing refused with an estimate of {ex.estimated_bytes} bytes "
+                f"(budget: {ex.max_bytes} bytes) for job ID: {job_id} ..."
+            )
+            raise
+        except CONTRLException:
+            parse_metrics.count_error(endpoint, "contrl")
+            raise
+        except EdifactParserException:
+            parse_metrics.count_error(endpoint, "parser")
+            raise
+        except Exception:
+            parse_metrics.count_error(endpoint, "other")
+            raise
+        finally:
+            parse_metrics.in_flight.dec()
         t2 = time.perf_counter()
+        if input_tally is None:
+            message_type, input_length = detect_message_type(body), len(body)
+        else:
+            message_type, input_length = detect_message_type(input_tally.head), input_tally.length
+        parse_metrics.observe_parse(
+            endpoint, message_type, t2 - t1, input_length, memory_budget.segment_count, memory_budget.estimated_bytes
+        )
         logger.info(f"SPEED-TEST: Parsing took {(t2 - t1):2.2f}s for job ID: {job_id} ...")
+        logger.info(
+            f"MEMORY-ESTIMATE: Parsing allocated about {memory_budget.estimated_bytes} bytes "
+            f"for {memory_budget.segment_count} segments for job ID: {job_id} ..."
+        )
+        if stage_timings is not None:
+            logger.info(f"STAGE-TIMINGS: {self.__get_server_timing_header(stage_timings)} for job ID: {job_id} ...")
+        if response_headers is not None and (memory_budget.reused_messages or memory_budget.parsed_messages):
+            # The messages of this parsing run reused from the message cache, missing for cached or coalesced results
+            response_headers[MESSAGE_CACHE_HEADER] = (
+                f"reused={memory_budget.reused_messages}, parsed={memory_budget.parsed_messages}"
+            )
+        if capture_spool is not None and capture_spool.should_capture(t2 - t1, memory_budget.estimated_bytes):
+            await run_in_threadpool(
+                capture_spool.capture,
+                edifact_text=body,
+                options={
+                    "endpoint": endpoint,
+                    "max_lines_to_parse": max_lines_to_parse,
+                    "output_format": output_format,
+                    "short_keys": short_keys,
+                },
+                parse_seconds=t2 - t1,
+                estimated_bytes=memory_budget.estimated_bytes,
+                segment_count=memory_budget.segment_count,
+                stage_timings=recorded_timings,
+                message_type=message_type
+            )
         return parsed_obj
 
+    async def __render_message(
+            self,
+            edifact_text: str,
+            cache_key: Optional[str],
+            max_lines_to_parse: int,
+            memory_budget: MemoryBudget,
+            output_format: ParseOutputFormat,
+            short_keys: bool,
+            parse_executor: Optional[ParseExecutor],
+            endpoint: str,
+            stage_timings: Optional[StageTimings] = None
+    ) -> bytes:
+        if parse_executor is None:
+            return await self.__run_profiled(
+                self.__parser_service.render_message,
+                message_content=edifact_text,
+                max_lines_to_parse=max_lines_to_parse,
+                memory_budget=memory_budget,
+                output_format=output_format,
+                short_keys=short_keys,
+                cache_key=cache_key,
+                stage_timings=stage_timings
+            )
+        if self.__parser_service.parse_result_cache is not None:
+            content = await run_in_threadpool(self.__parser_service.get_cached_result, cache_key)
+            if content is not None:
+                return content
+        submit_kwargs = dict(
+            max_lines_to_parse=max_lines_to_parse,
+            max_memory_bytes=memory_budget.max_bytes,
+            output_format=output_format,
+            short_keys=short_keys,
+            collect_stage_timings=stage_timings is not None
+        )
+        if parse_executor.backend == ParseExecutorBackend.INLINE:
+            # The inline backend parses in the calling thread, which must not be the one of the event loop
+            future = await run_in_threadpool(parse_executor.submit, edifact_text, **submit_kwargs)
+        else:
+            future = parse_executor.submit(edifact_text, **submit_kwargs)
+        rendered = await asyncio.wrap_future(future)
+        memory_budget.estimated_bytes = rendered.estimated_bytes
+        memory_budget.segment_count = rendered.segment_count
+        memory_budget.reused_messages = rendered.reused_messages
+        memory_budget.parsed_messages = rendered.parsed_messages
+        if stage_timings is not None and rendered.stage_timings is not None:
+            stage_timings.merge(rendered.stage_timings)
+        self.__get_parse_metrics().observe_serialization(
+            endpoint, detect_message_type(edifact_text), rendered.render_seconds
+        )
+        if self.__parser_service.parse_result_cache is not None:
+            await run_in_threadpool(self.__parser_service.cache_result, cache_key, rendered.content)
+        return rendered.content
+
+    async def __run_profiled(self, function: Callable[..., object], **kwargs) -> object:
+        # The sampled parsing runs are profiled in the thread of the threadpool running them
+        parse_profiler = self.__get_parse_profiler()
+        if parse_profiler is None:
+            return await run_in_threadpool(function, **kwargs)
+        return await run_in_threadpool(parse_profiler.profile, function, **kwargs)
+
+    async def __get_message_stream(
+            self,
+            body: Union[str, Iterator[str]],
+            limit_mode: bool,
+            endpoint: str
+    ) -> EdifactMessageStream:
+        max_lines_to_parse = MAX_LINES_TO_PARSE if limit_mode else UNLIMITED_LINES_TO_PARSE_INDICATOR
+        memory_budget = MemoryBudget(max_bytes=self.__get_max_parse_memory_bytes())
+        job_id = uuid.uuid4()
+        logger.info(f"Streaming parsing process triggered for job ID: {job_id} ...")
+
+        def create_message_stream(message_content: Union[str, Iterator[str]]) -> EdifactMessageStream:
+            return self.__parser_service.stream_messages(
+                message_content=message_content,
+                max_lines_to_parse=max_lines_to_parse,
+                memory_budget=memory_budget
+            )
+
+        # The input is validated right away, the messages are parsed (and recorded) while the response is streamed
+        return await run_in_threadpool(
+            self.__get_parse_metrics().observe_message_stream, create_message_stream, body, endpoint, memory_budget
+        )
+
+    def __get_job_store(self) -> JobStore:
+        return self.__job_store or get_default_job_store()
+
+    def __get_single_flight(self) -> Optional[SingleFlight]:
+        return self.__single_flight or get_default_single_flight()
+
+    def __get_parse_capture_spool(self) -> Optional[ParseCaptureSpool]:
+        return self.__parse_capture_spool or get_default_parse_capture_spool()
+
+    def __get_parse_profiler(self) -> Optional[ParseProfiler]:
+        return self.__parse_profiler or get_default_parse_profiler()
+
+    def __get_parse_metrics(self) -> ParseMetrics:
+        return self.__parse_metrics or get_default_parse_metrics()
+
+    def __get_parse_executor(self) -> Optional[ParseExecutor]:
+        # With the thread backend, the parser service keeps parsing on the threadpool of the server
+        if self.__parse_executor is None and PARSE_EXECUTOR == ParseExecutorBackend.THREAD:
+            return None
+        return self.__parse_executor or get_default_parse_executor()
+
+    @staticmethod
+    def __get_output_format(accept: Optional[str], compact: bool) -> ParseOutputFormat:
+        if accepts_msgpack(accept):
+            return ParseOutputFormat.COMPACT_MSGPACK if compact else ParseOutputFormat.MSGPACK
+        if compact:
+            return ParseOutputFormat.COMPACT_JSON
+        return ParseOutputFormat.JSON
+
+    @staticmethod
+    def __create_job_not_found_response(job_id: str) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"error_message": f"The job {job_id} does not exist or has expired."}
+        )
+
+    @staticmethod
+    def __get_download_headers(file_extension: str = "json") -> dict[str, str]:
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        return {"Content-Disposition": f"attachment; filename=edifact_message_parsed_{timestamp}.{file_extension}"}
+
+    def __create_parsed_response(
+            self,
+            parsed_obj: object,
+            endpoint: str,
+            status_code: int,
+            accept: Optional[str],
+            compact: bool,
+            short_keys: bool,
+            headers: Optional[dict[str, str]] = None,
+            stage_timings: Optional[StageTimings] = None
+    ) -> Response:
+        render_start = time.perf_counter_ns()
+        if accepts_msgpack(accept):
+            response = MessagePackResponse(
+                content=parsed_obj, compact=compact, short_keys=short_keys, status_code=status_code, headers=headers
+            )
+        else:
+            response = self.__create_json_response(
+                parsed_obj=parsed_obj, status_code=status_code, compact=compact, short_keys=short_keys, headers=headers
+            )
+        if not isinstance(parsed_obj, bytes):
+            # The parsed interchange is rendered by the response, rendered bodies are observed by the executor
+            render_seconds = (time.perf_counter_ns() - render_start) / 1e9
+            self.__get_parse_metrics().observe_serialization(
+                endpoint, get_interchange_message_type(parsed_obj), render_seconds
+            )
+            if stage_timings is not None:
+                stage_timings.add(ParseStage.RENDER, render_seconds)
+        if stage_timings is not None:
+            response.headers["Server-Timing"] = self.__get_server_timing_header(stage_timings)
+        return response
+
+    @staticmethod
+    def __get_server_timing_header(stage_timings: StageTimings) -> str:
+        metrics = []
+        for stage, timing in stage_timings.items():
+            metric = f"{stage};dur={timing.seconds * 1000:.3f}"
+            if stage in PER_SEGMENT_STAGES:
+                metric += f';desc="{timing.count} segments"'
+            metrics.append(metric)
+        return ", ".join(metrics)
+
+    @staticmethod
+    def __create_json_response(
+            parsed_obj: object,
+            status_code: int,
+            compact: bool,
+            short_keys: bool,
+            headers: Optional[dict[str, str]] = None
+    ) -> JSONResponse:
+        if compact:
+            return CompactJSONResponse(
+                content=parsed_obj, short_keys=short_keys, status_code=status_code, headers=headers
+            )
+        return PydanticJSONResponse(content=parsed_obj, status_code=status_code, headers=headers)
+
+    @staticmethod
+    def __create_msgpack_not_available_response() -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            content={"error_message": (
+                "The MessagePack format is not available, the optional 'msgpack' package is not installed."
+            )}
+        )
+
+    @staticmethod
+    def __get_batch_payloads(body: Union[List[str], bytes, str]) -> List[str]:
+        # FastAPI hands out JSON bodies already decoded, NDJSON bodies as raw bytes
+        if isinstance(body, list):
+            payloads = body
+        else:
+            text = body.decode("utf-8") if isinstance(body, bytes) else body
+            if text.lstrip().startswith("["):
+                payloads = orjson.loads(text)
+                if not isinstance(payloads, list):
+                    raise ValueError("The batch has to be a JSON array of strings.")
+            else:
+                payloads = []
+                for line_number, line in enumerate(text.splitlines(), start=1):
+                    if line.strip():
+                        try:
+                            payloads.append(orjson.loads(line))
+                        except orjson.JSONDecodeError as e:
+                            raise ValueError(f"Invalid NDJSON line {line_number}: {e}") from e
+        for index, payload in enumerate(payloads):
+            if not isinstance(payload, str):
+                raise ValueError(f"The payload at index {index} is not a string.")
+        return payloads
+
+    @staticmethod
+    def __get_max_parse_memory_bytes() -> Optional[int]:
+        if MAX_PARSE_MEMORY_MB <= 0:
+            return None
+        return MAX_PARSE_MEMORY_MB * 1024 * 1024
+
+    async def __get_decompressed_file_content(
+            self,
+            body,
+            content_encoding: Optional[str],
+            is_streamed_response: bool = False
+    ) -> Union[str, Iterator[str]]:
+        if isinstance(body, RequestBodyStream):
+            compression_format = detect_compression_format(await body.peek(4), content_encoding)
+            if compression_format:
+                # Compressed uploads are received completely (zip archives are read from their end), but spooled
+                # to a temporary file beyond the memory threshold and decompressed from there chunk by chunk
+                spool_file = await run_in_threadpool(body.spool, UPLOAD_SPOOL_MEMORY_THRESHOLD_MB * 1024 * 1024)
+                return iter_decompressed_text(spool_file, compression_format, max_ratio=MAX_DECOMPRESSION_RATIO)
+            if is_streamed_response:
+                # A streaming response listens for the disconnect of the client on the receive channel,
+                # so the upload has to be received before the response starts
+                spool_file = await run_in_threadpool(body.spool, UPLOAD_SPOOL_MEMORY_THRESHOLD_MB * 1024 * 1024)
+                return iter_decoded_text(iter(lambda: spool_file.read(DEFAULT_DECOMPRESSION_CHUNK_SIZE), b""))
+            # Uncompressed uploads are decoded and parsed while they are received
+            return iter_decoded_text(body.iter_chunks())
+        # Compressed uploads are decompressed chunk by chunk while they are parsed
+        raw_content = body[1] if isinstance(body, tuple) and len(body) >= 2 else body
+        if isinstance(raw_content, bytes):
+            compression_format = detect_compression_format(raw_content, content_encoding)
+            if compression_format:
+                return iter_decompressed_text(
+                    raw_content, compression_format, max_ratio=MAX_DECOMPRESSION_RATIO
+                )
+        return await self.__get_file_content(body)
+
+    @staticmethod
+    async def __get_raw_file_content(body) -> Union[bytes, BinaryIO]:
+        # Archives and spooled uploads are kept binary, so their content is not decoded to text
+        if isinstance(body, RequestBodyStream):
+            return await run_in_threadpool(body.spool, UPLOAD_SPOOL_MEMORY_THRESHOLD_MB * 1024 * 1024)
+        if hasattr(body, "file"):
+            return await body.read()
+        file_content = body[1] if isinstance(body, tuple) and len(body) >= 2 else body
+        if hasattr(file_content, "read"):
+            file_content = file_content.read()
+        if not isinstance(file_content, bytes):
+            raise EdifactParserException("The file has to be uploaded as binary file")
+        return file_content
+
+    @staticmethod
+    async def __has_content(body) -> bool:
+        if isinstance(body, RequestBodyStream):
+            return bool(await body.peek(1))
+        return bool(body)
+
     @staticmethod
     async def __get_file_content(body):
         # If body is None or empty, return empty string
@@ -239,8 +1258,8 @@ class ParseEdifactMessageRouter(BaseEDIFACTParserApi):
             file_content = body[1]
             if hasattr(file_content, "read"):
                 # If it's a file-like object, read its content
-                return file_content.read()
-            return file_content
+                file_content = file_content.read()
+            return await ParseEdifactMessageRouter.__get_file_content(file_content)
 
         # Handle case when body is a dictionary from FastAPI file upload
         if isinstance(body, dict) and "file" in body:
@@ -250,8 +1269,8 @@ class ParseEdifactMessageRouter(BaseEDIFACTParserApi):
                 file_content = file_content[1]
             if hasattr(file_content, "read"):
                 # If it's a file-like object, read its content
-                return file_content.read()
-            return file_content
+                file_content = file_content.read()
+            return await ParseEdifactMessageRouter.__get_file_content(file_content)
 
         # If body is already a string, return it as is
         if isinstance(body, str):
@@ -0,0 +1,182 @@
+# coding: utf-8
+"""
+Asynchronous parsing jobs of the job endpoints.
+
+The job endpoints spool an upload to disk, parse it on the workers of the JobStore and serve
+the result once the job has finished (see JobStore). The ParseJobTask defined here parses the
+spooled upload one message at a time and writes the JSON document of the interchange while
+the messages are parsed (see iter_interchange_json), so the result is identical to the one of
+the /parse-file endpoint, but never held in memory completely. Like the file endpoints, the task
+accepts gzip files and zip archives (with exactly one file).
+
+The status of a job is rendered as JSON object, e.g.
+
+    {"job_id":"...","status":"running","created_at":"2024-01-31T12:00:00+00:00",
+     "progress":{"bytes_processed":1048576,"bytes_total":209715200,"messages_processed":42}}
+
+with the status code and error message of the job once it has failed.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Iterator, Optional
+
+from ediparse.adapters.inbound.rest.impl.batch_ndjson_response import get_error_status_code
+from ediparse.adapters.inbound.rest.impl.parse_metrics import ParseMetrics
+from ediparse.adapters.inbound.rest.impl.streaming_json_response import iter_interchange_json
+from ediparse.application.services import ParserService
+from ediparse.infrastructure.job_store import Job, JobStatus
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget
+from ediparse.infrastructure.libs.edifactparser.utils.decompression import (
+    DEFAULT_DECOMPRESSION_CHUNK_SIZE, detect_compression_format, iter_decoded_text, iter_decompressed_text
+)
+from ediparse.infrastructure.libs.edifactparser.wrappers.message_stream import EdifactMessageStream
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange
+
+# The endpoint label of the parsing runs of the jobs in the metrics
+JOBS_ENDPOINT = "/jobs"
+
+
+class ParseJobTask:
+    """
+    Task of a job parsing a spooled upload and writing the parsed interchange as JSON document.
+
+    Each task uses the parsers of its own ParserService, so that the jobs running concurrently
+    do not share any parser.
+    """
+
+    def __init__(
+            self,
+            parser_service: ParserService,
+            max_lines_to_parse: int = -1,
+            max_memory_bytes: Optional[int] = None,
+            max_decompression_ratio: int = 0,
+            content_encoding: Optional[str] = None,
+            compact: bool = False,
+            short_keys: bool = False,
+            parse_metrics: Optional[ParseMetrics] = None
+    ) -> None:
+        """
+        Initializes a new parse job task.
+
+        Args:
+            parser_service (ParserService): The parser service parsing the upload
+            max_lines_to_parse (int): The maximum number of lines to parse, defaults to -1 which means no parsing limit
+            max_memory_bytes (Optional[int]): The memory budget of the parsing run in bytes,
+                defaults to None (no budget)
+            max_decompression_ratio (int): The allowed ratio of decompressed to compressed bytes of compressed uploads,
+                defaults to 0 (no check)
+            content_encoding (Optional[str]): The Content-Encoding of the upload, defaults to None
+            compact (bool): Whether empty values are omitted from the result, defaults to False
+            short_keys (bool): Whether the field names are replaced by their short aliases in compact mode,
+                defaults to False
+            parse_metrics (Optional[ParseMetrics]): The metrics recording the parsing run of the job as one
+                of the /jobs endpoint, defaults to None (not recorded)
+        """
+        self.__parser_service = parser_service
+        self.__max_lines_to_parse = max_lines_to_parse
+        self.__max_memory_bytes = max_memory_bytes
+        self.__max_decompression_ratio = max_decompression_ratio
+        self.__content_encoding = content_encoding
+        self.__compact = compact
+        self.__short_keys = short_keys
+        self.__parse_metrics = parse_metrics
+
+    def __call__(self, job: Job, upload_file: BinaryIO, result_file: BinaryIO) -> None:
+        """
+        Parses the spooled upload of a job and writes the parsed interchange to the result file.
+
+        Args:
+            job (Job): The job, whose number of processed messages is updated while parsing
+            upload_file (BinaryIO): The spooled upload, which has to provide a peek() method
+            result_file (BinaryIO): The binary file object the JSON document is written to
+
+        Raises:
+            EdifactParserException: If the upload is not a valid EDIFACT-specific message
+            ParseMemoryBudgetExceededException: If the parsing run exceeds the memory budget
+            DecompressionRatioExceededException: If a compressed upload expands beyond the allowed ratio
+        """
+        memory_budget = MemoryBudget(max_bytes=self.__max_memory_bytes)
+
+        def create_message_stream(message_content: Iterator[str]) -> EdifactMessageStream:
+            return self.__parser_service.stream_messages(
+                message_content=message_content,
+                max_lines_to_parse=self.__max_lines_to_parse,
+                memory_budget=memory_budget
+            )
+
+        if self.__parse_metrics is None:
+            message_stream = create_message_stream(self.__read_text(upload_file))
+        else:
+            message_stream = self.__parse_metrics.observe_message_stream(
+                create_message_stream, self.__read_text(upload_file), JOBS_ENDPOINT, memory_budget
+            )
+        progress_message_stream = _ProgressMessageStream(job, message_stream)
+        for chunk in iter_interchange_json(progress_message_stream, self.__compact, self.__short_keys):
+            result_file.write(chunk)
+
+    def __read_text(self, upload_file: BinaryIO) -> Iterator[str]:
+        compression_format = detect_compression_format(upload_file.peek(4)[:4], self.__content_encoding)
+        if compression_format:
+            # Compressed uploads are much smaller than their content and are decompressed chunk by chunk
+            return iter_decompressed_text(
+                upload_file.read(), compression_format, max_ratio=self.__max_decompression_ratio
+            )
+        return iter_decoded_text(iter(lambda: upload_file.read(DEFAULT_DECOMPRESSION_CHUNK_SIZE), b""))
+
+
+def render_job_status(job: Job) -> dict[str, Any]:
+    """
+    Renders the status and progress of a job.
+
+    Args:
+        job (Job): The job
+
+    Returns:
+        dict[str, Any]: The status of the job, holding the status code and error message if the job has failed
+    """
+    job_status = {
+        "job_id": job.id,
+        "status": job.status.value,
+        "created_at": _format_timestamp(job.created_at),
+        "started_at": _format_timestamp(job.started_at),
+        "finished_at": _format_timestamp(job.finished_at),
+        "progress": {
+            "bytes_processed": min(job.bytes_processed, job.upload_size),
+            "bytes_total": job.upload_size,
+            "messages_processed": job.messages_processed
+        }
+    }
+    if job.status == JobStatus.SUCCEEDED:
+        job_status["result_size"] = job.result_size
+    if job.status == JobStatus.FAILED:
+        job_status["status_code"] = get_error_status_code(job.error)
+        job_status["error_message"] = str(job.error)
+    return job_status
+
+
+class _ProgressMessageStream(EdifactMessageStream):
+    """
+    Message stream counting the messages handed out as progress of a job.
+    """
+
+    def __init__(self, job: Job, message_stream: EdifactMessageStream) -> None:
+        self.__job = job
+        self.__message_stream = message_stream
+
+    @property
+    def interchange(self) -> EdifactInterchange:
+        return self.__message_stream.interchange
+
+    def __next__(self):
+        message = next(self.__message_stream)
+        self.__job.messages_processed += 1
+        return message
+
+
+def _format_timestamp(timestamp: Optional[float]) -> Optional[str]:
+    """
+    Formats a timestamp (seconds since the epoch) as ISO 8601 date and time in UTC.
+    """
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
@@ -0,0 +1,715 @@
+# coding: utf-8
+"""
+In-process metrics of the parse workloads in the Prometheus text exposition format.
+
+The metrics are kept in memory by the server process itself, without any client library, and are
+exposed via the /metrics endpoint (see health_check_routers). Recording a value is cheap enough
+for every request: a lock, a dictionary lookup by the label values and a bisection of the bucket
+boundaries of a histogram. The ParseMetrics defined here records the following metrics:
+
+- ediparse_parse_duration_seconds: Histogram of the parsing runs (including the cache lookups)
+- ediparse_serialization_duration_seconds: Histogram of the rendering of the parsed interchanges,
+  observed where the response or the parse executor renders them (not for cached results)
+- ediparse_parse_input_bytes: Histogram of the sizes of the parsed inputs (as decoded characters)
+- ediparse_parse_segments: Histogram of the numbers of parsed segments
+- ediparse_parse_estimated_memory_bytes: Histogram of the memory estimates of the parsing runs
+  (see MemoryBudget), e.g. to tune MAX_PARSE_MEMORY_MB
+- ediparse_parse_errors_total: Counter of the failed parsing runs, labelled by the kind of error
+  (contrl, parser, memory_budget or other)
+- ediparse_parses_in_flight: Gauge of the parsing runs in flight
+- ediparse_parse_queue_depth: Gauge of the parse tasks waiting for a worker of the parse executor
+  (see ParseExecutor), or for a thread of the threadpool if parsing on the threadpool
+
+The histograms and the counter are labelled by the endpoint and (except the errors) by the
+message type, which is detected from the head of the input. Besides the complete parsing runs,
+the streamed parsing runs are recorded once their messages (or rows) have been handed out (see
+ObservedMessageStream and ParseMetrics.observe_iteration(...)), and the parsing runs of the items
+of a batch or an archive as soon as each of them has completed (see create_parse_run_observer(...)).
+
+If several server worker processes are started, each of them exposes its own metrics.
+"""
+
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Iterable, Iterator, Optional, TypeVar, Union
+
+import anyio.to_thread
+
+from ediparse.infrastructure.libs.edifactparser.exceptions import (
+    CONTRLException, EdifactParserException, ParseMemoryBudgetExceededException
+)
+from ediparse.infrastructure.libs.edifactparser.mods.module_constants import EdifactMessageType
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget
+from ediparse.infrastructure.libs.edifactparser.wrappers.message_stream import EdifactMessageStream
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange
+from ediparse.infrastructure.parse_executor import (
+    PARSE_EXECUTOR, ParseExecutor, ParseExecutorBackend, get_default_parse_executor
+)
+from ediparse.infrastructure.parser_pool import ParseRunObserver
+
+T = TypeVar("T")
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+INPUT_BYTES_BUCKETS = tuple(float(1024 * 4 ** exponent) for exponent in range(10))
+MEMORY_BYTES_BUCKETS = tuple(float(64 * 1024 * 4 ** exponent) for exponent in range(10))
+SEGMENTS_BUCKETS = (10.0, 50.0, 100.0, 500.0, 1000.0, 5000.0, 10000.0, 50000.0, 100000.0, 500000.0)
+
+UNKNOWN_MESSAGE_TYPE = "unknown"
+# The message type is detected within this many leading characters of the input
+MESSAGE_TYPE_HEAD_LENGTH = 4096
+MESSAGE_TYPE_PATTERN = re.compile(
+    r"(?<![A-Z])(" + "|".join(message_type.value for message_type in EdifactMessageType) + r")(?![A-Z])"
+)
+
+_default_parse_metrics: Optional["ParseMetrics"] = None
+_default_parse_metrics_lock = threading.Lock()
+
+
+def detect_message_type(edifact_text: str) -> str:
+    """
+    Detects the message type from the head of an input, without parsing it.
+
+    Args:
+        edifact_text (str): The input, or at least its head
+
+    Returns:
+        str: The message type, "unknown" if none of the supported message types is found
+    """
+    match = MESSAGE_TYPE_PATTERN.search(edifact_text, 0, MESSAGE_TYPE_HEAD_LENGTH)
+    return match.group(1) if match else UNKNOWN_MESSAGE_TYPE
+
+
+def get_interchange_message_type(interchange: EdifactInterchange) -> str:
+    """
+    Gets the message type of a parsed interchange from the header of its first message.
+
+    Args:
+        interchange (EdifactInterchange): The parsed interchange
+
+    Returns:
+        str: The message type, "unknown" if the interchange has no message of a supported message type
+    """
+    if not isinstance(interchange, EdifactInterchange):
+        return UNKNOWN_MESSAGE_TYPE
+    messages = getattr(interchange, "unh_unt_nachrichten", None)
+    if not messages:
+        return UNKNOWN_MESSAGE_TYPE
+    message_header = messages[0].unh_nachrichtenkopfsegment
+    if message_header is None or message_header.nachrichten_kennung is None:
+        return UNKNOWN_MESSAGE_TYPE
+    return detect_message_type(message_header.nachrichten_kennung.nachrichtentyp_kennung or "")
+
+
+def get_error_kind(error: BaseException) -> str:
+    """
+    Classifies the error of a failed parsing run for the error counter.
+
+    Args:
+        error (BaseException): The error raised by the parsing run
+
+    Returns:
+        str: The kind of error (contrl, parser, memory_budget or other)
+    """
+    if isinstance(error, ParseMemoryBudgetExceededException):
+        return "memory_budget"
+    if isinstance(error, CONTRLException):
+        return "contrl"
+    if isinstance(error, EdifactParserException):
+        return "parser"
+    return "other"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _format_labels(label_names: tuple[str, ...], label_values: tuple[str, ...]) -> str:
+    if not label_names:
+        return ""
+    labels = ",".join(
+        name + '="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for name, value in zip(label_names, label_values)
+    )
+    return "{" + labels + "}"
+
+
+class Metric:
+    """
+    Base of the metrics, holding the values of each combination of label values.
+
+    Attributes:
+        name (str): The name of the metric
+        documentation (str): The help text of the metric
+        label_names (tuple[str, ...]): The names of the labels
+    """
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], object] = {}
+
+    def render(self) -> list[str]:
+        """
+        Renders the metric in the Prometheus text exposition format.
+
+        Returns:
+            list[str]: The lines of the metric
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        with self._lock:
+            values = list(self._values.items())
+        for label_values, value in sorted(values):
+            lines.extend(self._render_samples(label_values, value))
+        return lines
+
+    def _render_samples(self, label_values: tuple[str, ...], value: object) -> list[str]:
+        return [f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(value)}"]
+
+
+class Counter(Metric):
+    """
+    Monotonically increasing count, e.g. of errors.
+    """
+    metric_type = "counter"
+
+    def inc(self, label_values: tuple[str, ...] = (), amount: float = 1.0) -> None:
+        """
+        Increases the count of the given label values.
+
+        Args:
+            label_values (tuple[str, ...]): The values of the labels, in the order of the label names
+            amount (float): The amount to increase the count by, defaults to 1
+        """
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+
+class Gauge(Metric):
+    """
+    Value going up and down, either set by the application or read from a function when rendered.
+    """
+    metric_type = "gauge"
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            label_names: tuple[str, ...] = (),
+            function: Optional[Callable[[], float]] = None
+    ) -> None:
+        """
+        Initializes a new gauge.
+
+        Args:
+            name (str): The name of the gauge
+            documentation (str): The help text of the gauge
+            label_names (tuple[str, ...]): The names of the labels, defaults to none
+            function (Optional[Callable[[], float]]): Returns the value of an unlabelled gauge when it is
+                rendered, defaults to None (the value is set by the application)
+        """
+        super().__init__(name, documentation, label_names)
+        self.__function = function
+        if not label_names:
+            self._values[()] = 0.0
+
+    def inc(self, label_values: tuple[str, ...] = (), amount: float = 1.0) -> None:
+        """
+        Increases the value of the given label values.
+
+        Args:
+            label_values (tuple[str, ...]): The values of the labels, in the order of the label names
+            amount (float): The amount to increase the value by, defaults to 1
+        """
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def dec(self, label_values: tuple[str, ...] = (), amount: float = 1.0) -> None:
+        """
+        Decreases the value of the given label values.
+
+        Args:
+            label_values (tuple[str, ...]): The values of the labels, in the order of the label names
+            amount (float): The amount to decrease the value by, defaults to 1
+        """
+        self.inc(label_values, -amount)
+
+    def get(self, label_values: tuple[str, ...] = ()) -> float:
+        """
+        Returns the value of the given label values.
+
+        Args:
+            label_values (tuple[str, ...]): The values of the labels, in the order of the label names
+
+        Returns:
+            float: The value, 0 if it has never been set
+        """
+        if self.__function is not None:
+            return float(self.__function())
+        with self._lock:
+            return self._values.get(label_values, 0.0)
+
+    def render(self) -> list[str]:
+        if self.__function is not None:
+            with self._lock:
+                self._values[()] = float(self.__function())
+        return super().render()
+
+
+class Histogram(Metric):
+    """
+    Distribution of observed values over fixed buckets, e.g. of latencies.
+
+    Attributes:
+        buckets (tuple[float, ...]): The upper bounds of the buckets in ascending order (without +Inf)
+    """
+    metric_type = "histogram"
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            label_names: tuple[str, ...] = (),
+            buckets: tuple[float, ...] = DURATION_BUCKETS
+    ) -> None:
+        """
+        Initializes a new histogram.
+
+        Args:
+            name (str): The name of the histogram
+            documentation (str): The help text of the histogram
+            label_names (tuple[str, ...]): The names of the labels, defaults to none
+            buckets (tuple[float, ...]): The upper bounds of the buckets in ascending order,
+                defaults to DURATION_BUCKETS
+
+        Raises:
+            ValueError: If the buckets are not in ascending order
+        """
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError(f"The buckets of a histogram have to be ascending, got {buckets}")
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, label_values: tuple[str, ...] = ()) -> None:
+        """
+        Records an observed value.
+
+        Args:
+            value (float): The observed value
+            label_values (tuple[str, ...]): The values of the labels, in the order of the label names
+        """
+        # The counts are kept per bucket and only accumulated when rendered
+        bucket_index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(label_values)
+            if counts is None:
+                # The counts of the buckets, followed by the count of +Inf and the sum
+                counts = self._values[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+            counts[bucket_index] += 1
+            counts[-1] += value
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = [(label_values, list(counts)) for label_values, counts in self._values.items()]
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for label_values, counts in sorted(values):
+            labels = _format_labels(self.label_names, label_values)
+            cumulative_count = 0
+            for upper_bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative_count += count
+                bucket_labels = _format_labels(self.label_names + ("le",), label_values + (_format_value(upper_bound),))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative_count}")
+            lines.append(f"{self.name}_sum{labels} {_format_value(counts[-1])}")
+            lines.append(f"{self.name}_count{labels} {cumulative_count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together.
+    """
+
+    def __init__(self) -> None:
+        self.__metrics: list[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Adds a metric to the registry.
+
+        Args:
+            metric (Metric): The metric to add
+
+        Returns:
+            Metric: The added metric
+
+        Raises:
+            ValueError: If a metric of the same name has been added already
+        """
+        if any(registered.name == metric.name for registered in self.__metrics):
+            raise ValueError(f"A metric named {metric.name} is registered already")
+        self.__metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """
+        Renders all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The rendered metrics
+        """
+        lines = []
+        for metric in self.__metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class InputTally:
+    """
+    Counts the characters of an input provided as a sequence of text chunks while it is consumed,
+    keeping its head to detect the message type.
+
+    Attributes:
+        length (int): The number of characters consumed so far
+        head (str): The leading characters of the input
+    """
+
+    def __init__(self) -> None:
+        self.length = 0
+        self.head = ""
+
+    def track(self, message_content: Union[str, Iterable[str]]) -> Union[str, Iterator[str]]:
+        """
+        Tallies an input provided either as one string, which is tallied right away,
+        or as text chunks, which are counted while they are consumed (see count(...)).
+
+        Args:
+            message_content (Union[str, Iterable[str]]): The input
+
+        Returns:
+            Union[str, Iterator[str]]: The input, to be consumed instead of the given one
+        """
+        if isinstance(message_content, str):
+            self.length = len(message_content)
+            self.head = message_content[:MESSAGE_TYPE_HEAD_LENGTH]
+            return message_content
+        return self.count(message_content)
+
+    def count(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Hands out the chunks of an input, counting them on the way.
+
+        Args:
+            chunks (Iterable[str]): The text chunks of the input
+
+        Returns:
+            Iterator[str]: The text chunks of the input
+        """
+        for chunk in chunks:
+            self.length += len(chunk)
+            if len(self.head) < MESSAGE_TYPE_HEAD_LENGTH:
+                self.head += chunk[:MESSAGE_TYPE_HEAD_LENGTH]
+            yield chunk
+
+
+class ParseMetrics:
+    """
+    The metrics of the parse workloads.
+
+    Attributes:
+        registry (MetricsRegistry): The registry of the metrics
+        parse_duration_seconds (Histogram): The durations of the parsing runs
+        serialization_duration_seconds (Histogram): The durations of the rendering of the parsed interchanges
+        input_bytes (Histogram): The sizes of the parsed inputs
+        segments (Histogram): The numbers of parsed segments
+        estimated_memory_bytes (Histogram): The memory estimates of the parsing runs
+        errors (Counter): The failed parsing runs
+        in_flight (Gauge): The parsing runs in flight
+        queue_depth (Gauge): The parse tasks waiting for a worker
+    """
+
+    def __init__(self, parse_executor: ParseExecutor = None) -> None:
+        """
+        Initializes the metrics, all of them starting from zero.
+
+        Args:
+            parse_executor (ParseExecutor): The parse executor whose waiting tasks make up the queue depth,
+                defaults to None, in which case the default executor of the application is used (unless
+                parsing on the threadpool, in which case the calls waiting for a thread are used)
+        """
+        self.__parse_executor = parse_executor
+        if self.__parse_executor is None and PARSE_EXECUTOR != ParseExecutorBackend.THREAD:
+            self.__parse_executor = get_default_parse_executor()
+
+        self.registry = MetricsRegistry()
+        labels = ("endpoint", "message_type")
+        self.parse_duration_seconds = self.registry.register(Histogram(
+            "ediparse_parse_duration_seconds", "Duration of the parsing runs in seconds", labels
+        ))
+        self.serialization_duration_seconds = self.registry.register(Histogram(
+            "ediparse_serialization_duration_seconds", "Duration of rendering the parsed interchanges in seconds",
+            labels
+        ))
+        self.input_bytes = self.registry.register(Histogram(
+            "ediparse_parse_input_bytes", "Size of the parsed inputs in decoded characters", labels,
+            buckets=INPUT_BYTES_BUCKETS
+        ))
+        self.segments = self.registry.register(Histogram(
+            "ediparse_parse_segments", "Number of parsed segments", labels, buckets=SEGMENTS_BUCKETS
+        ))
+        self.estimated_memory_bytes = self.registry.register(Histogram(
+            "ediparse_parse_estimated_memory_bytes", "Estimated memory of the parsing runs in bytes", labels,
+            buckets=MEMORY_BYTES_BUCKETS
+        ))
+        self.errors = self.registry.register(Counter(
+            "ediparse_parse_errors_total", "Number of failed parsing runs", ("endpoint", "error")
+        ))
+        self.in_flight = self.registry.register(Gauge(
+            "ediparse_parses_in_flight", "Number of parsing runs in flight"
+        ))
+        self.queue_depth = self.registry.register(Gauge(
+            "ediparse_parse_queue_depth", "Number of parse tasks waiting for a worker", function=self.__get_queue_depth
+        ))
+
+    def observe_parse(
+            self,
+            endpoint: str,
+            message_type: str,
+            duration_seconds: float,
+            input_length: int,
+            segment_count: Optional[int],
+            estimated_bytes: Optional[int] = None
+    ) -> None:
+        """
+        Records a completed parsing run.
+
+        Args:
+            endpoint (str): The endpoint the input was sent to
+            message_type (str): The message type of the input (see detect_message_type)
+            duration_seconds (float): The duration of the parsing run
+            input_length (int): The number of characters of the input
+            segment_count (Optional[int]): The number of parsed segments, None if not counted
+            estimated_bytes (Optional[int]): The memory estimate of the parsing run (see MemoryBudget),
+                defaults to None (not recorded)
+        """
+        label_values = (endpoint, message_type)
+        self.parse_duration_seconds.observe(duration_seconds, label_values)
+        self.input_bytes.observe(input_length, label_values)
+        if segment_count is not None:
+            self.segments.observe(segment_count, label_values)
+        if estimated_bytes is not None:
+            self.estimated_memory_bytes.observe(estimated_bytes, label_values)
+
+    def observe_serialization(self, endpoint: str, message_type: str, duration_seconds: float) -> None:
+        """
+        Records the rendering of a parsed interchange.
+
+        Args:
+            endpoint (str): The endpoint the input was sent to
+            message_type (str): The message type of the input (see detect_message_type)
+            duration_seconds (float): The duration of the rendering
+        """
+        self.serialization_duration_seconds.observe(duration_seconds, (endpoint, message_type))
+
+    def count_error(self, endpoint: str, error: str) -> None:
+        """
+        Records a failed parsing run.
+
+        Args:
+            endpoint (str): The endpoint the input was sent to
+            error (str): The kind of error (contrl, parser, memory_budget or other)
+        """
+        self.errors.inc((endpoint, error))
+
+    def observe_iteration(
+            self,
+            items: Iterable[T],
+            endpoint: str,
+            input_tally: InputTally,
+            memory_budget: Optional[MemoryBudget] = None
+    ) -> Iterator[T]:
+        """
+        Hands out the items of a streamed parsing run, recording the run once they have been handed out.
+
+        Only the time spent producing the items is recorded as duration of the parsing run, not the time
+        the consumer spends between two items (e.g., writing them to the response). The parsing run is in
+        flight from the first item requested until the items are exhausted, have failed or are closed.
+
+        Args:
+            items (Iterable[T]): The items parsed while they are iterated (e.g., messages or CSV rows)
+            endpoint (str): The endpoint the input was sent to
+            input_tally (InputTally): The tally of the input, complete once the items are exhausted
+            memory_budget (Optional[MemoryBudget]): The memory budget of the parsing run, defaults to None,
+                in which case neither the segments nor the memory estimate are recorded
+
+        Returns:
+            Iterator[T]: The items
+
+        Raises:
+            Exception: The exception raised while producing the items, after it has been counted
+        """
+        iterator = iter(items)
+        duration_seconds = 0.0
+        self.in_flight.inc()
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    duration_seconds += time.perf_counter() - start
+                    break
+                except Exception as e:
+                    self.count_error(endpoint, get_error_kind(e))
+                    raise
+                duration_seconds += time.perf_counter() - start
+                yield item
+        finally:
+            self.in_flight.dec()
+        self.observe_parse(
+            endpoint,
+            detect_message_type(input_tally.head),
+            duration_seconds,
+            input_tally.length,
+            memory_budget.segment_count if memory_budget is not None else None,
+            memory_budget.estimated_bytes if memory_budget is not None else None
+        )
+
+    def observe_message_stream(
+            self,
+            create_message_stream: Callable[[Union[str, Iterator[str]]], EdifactMessageStream],
+            message_content: Union[str, Iterable[str]],
+            endpoint: str,
+            memory_budget: MemoryBudget
+    ) -> EdifactMessageStream:
+        """
+        Creates a message stream recording its parsing run once its messages have been handed out.
+
+        Args:
+            create_message_stream (Callable[[Union[str, Iterator[str]]], EdifactMessageStream]): Creates the
+                stream parsing the given input, accounted against the memory budget
+            message_content (Union[str, Iterable[str]]): The input, either as one string or as text chunks,
+                which are counted while they are parsed
+            endpoint (str): The endpoint the input was sent to
+            memory_budget (MemoryBudget): The memory budget of the parsing run
+
+        Returns:
+            EdifactMessageStream: The observed message stream
+
+        Raises:
+            Exception: The exception raised while creating the stream, after it has been counted
+        """
+        input_tally = InputTally()
+        try:
+            message_stream = create_message_stream(input_tally.track(message_content))
+        except Exception as e:
+            self.count_error(endpoint, get_error_kind(e))
+            raise
+        return ObservedMessageStream(message_stream, self, endpoint, input_tally, memory_budget)
+
+    def create_parse_run_observer(self, endpoint: str) -> ParseRunObserver:
+        """
+        Creates an observer recording the parsing runs reported to it (see run_observed(...)),
+        e.g. the parsing runs of the items of a batch or an archive.
+
+        Args:
+            endpoint (str): The endpoint the inputs were sent to
+
+        Returns:
+            ParseRunObserver: The observer recording the parsing runs
+        """
+
+        def observe(
+                edifact_text: str,
+                duration_seconds: float,
+                memory_budget: MemoryBudget,
+                error: Optional[BaseException]
+        ) -> None:
+            if error is not None:
+                self.count_error(endpoint, get_error_kind(error))
+                return
+            self.observe_parse(
+                endpoint,
+                detect_message_type(edifact_text),
+                duration_seconds,
+                len(edifact_text),
+                memory_budget.segment_count,
+                memory_budget.estimated_bytes
+            )
+
+        return observe
+
+    def render(self) -> str:
+        """
+        Renders all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The rendered metrics
+        """
+        return self.registry.render()
+
+    def __get_queue_depth(self) -> float:
+        if self.__parse_executor is not None:
+            return max(self.__parse_executor.pending_tasks - self.__parse_executor.max_workers, 0)
+        try:
+            return anyio.to_thread.current_default_thread_limiter().statistics().tasks_waiting
+        except RuntimeError:
+            # Not rendered on the event loop, so the threadpool cannot be inspected
+            return 0
+
+
+class ObservedMessageStream(EdifactMessageStream):
+    """
+    Message stream recording its parsing run once its messages have been handed out
+    (see ParseMetrics.observe_iteration(...)).
+    """
+
+    def __init__(
+            self,
+            message_stream: EdifactMessageStream,
+            parse_metrics: ParseMetrics,
+            endpoint: str,
+            input_tally: InputTally,
+            memory_budget: MemoryBudget
+    ) -> None:
+        """
+        Initializes a new observed message stream.
+
+        Args:
+            message_stream (EdifactMessageStream): The stream of the parsed messages
+            parse_metrics (ParseMetrics): The metrics recording the parsing run
+            endpoint (str): The endpoint the input was sent to
+            input_tally (InputTally): The tally of the input, complete once the stream is exhausted
+            memory_budget (MemoryBudget): The memory budget of the parsing run
+        """
+        self.__message_stream = message_stream
+        self.__messages = parse_metrics.observe_iteration(message_stream, endpoint, input_tally, memory_budget)
+
+    @property
+    def interchange(self) -> EdifactInterchange:
+        return self.__message_stream.interchange
+
+    def __next__(self):
+        return next(self.__messages)
+
+
+def get_default_parse_metrics() -> ParseMetrics:
+    """
+    Returns the parse metrics shared by the application, creating them on first use.
+
+    Returns:
+        ParseMetrics: The default parse metrics
+    """
+    global _default_parse_metrics
+    if _default_parse_metrics is None:
+        with _default_parse_metrics_lock:
+            if _default_parse_metrics is None:
+                _default_parse_metrics = ParseMetrics()
+    return _default_parse_metrics
@@ -0,0 +1,49 @@
+# coding: utf-8
+"""
+JSON response class rendering pydantic models directly to bytes.
+
+Starlette's JSONResponse expects a JSON-compatible Python object and encodes it with the
+standard library's json module. For parsed interchanges this means building the whole
+dictionary tree via model_dump() first and encoding it afterwards, which dominates the
+response time for large MSCONS messages.
+
+The PydanticJSONResponse defined here serializes pydantic models directly to bytes using
+the pydantic-core serializer and falls back to orjson for any other content, e.g. the
+error message dictionaries. The produced JSON is byte-identical to the JSONResponse output.
+"""
+
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response that renders pydantic models without an intermediate dictionary tree.
+
+    Models providing a to_json_bytes() method (e.g., EdifactInterchange) are rendered with it,
+    so that model specific preparations like the decoding of lazy segments are applied.
+    Other models are rendered with model_dump_json() and all other content with orjson. Content
+    already rendered to JSON bytes (e.g., by a worker of the ParseExecutor) is sent as it is.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Renders the content of the response to JSON bytes.
+
+        Args:
+            content (Any): A pydantic model, rendered JSON bytes or any other JSON-compatible content
+
+        Returns:
+            bytes: The UTF-8 encoded JSON representation of the content
+        """
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, BaseModel):
+            to_json_bytes = getattr(content, "to_json_bytes", None)
+            if callable(to_json_bytes):
+                return to_json_bytes()
+            return content.model_dump_json().encode("utf-8")
+        return orjson.dumps(content)
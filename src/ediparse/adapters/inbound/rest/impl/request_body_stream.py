@@ -0,0 +1,219 @@
+# coding: utf-8
+"""
+Streamed request bodies of the file endpoints.
+
+Instead of awaiting the complete upload before parsing it, the file endpoints receive their body
+as RequestBodyStream, which reads the chunks of the body from the ASGI receive channel only when
+they are needed. The parser consumes the stream in a worker thread of the threadpool, receiving
+each chunk on the event loop (see anyio.from_thread), so parsing starts with the first chunk and
+only a few chunks of the upload are held in memory at once, no matter how large or slow the upload is.
+
+Uploads that have to be received completely before they can be processed are spooled into a
+SpooledTemporaryFile, which keeps them in memory up to a threshold and moves them to disk beyond it.
+This applies to zip archives, whose directory is stored at their end, and to the uploads of
+streaming responses, which listen for the disconnect of the client on the receive channel and
+would swallow the remaining chunks of the body.
+
+The generated endpoints of the API declare their binary body as Body(...), which makes FastAPI receive
+the complete upload before calling them. use_streamed_request_bodies(...) rebuilds the routes of the
+file endpoints (see STREAMED_BODY_PATHS), so that their body is provided by get_request_body_stream
+instead, while the request body is still documented as binary file in the OpenAPI schema.
+"""
+
+import functools
+import inspect
+import io
+from tempfile import SpooledTemporaryFile
+from typing import Any, AsyncIterator, Iterable, Iterator
+
+import anyio.from_thread
+from fastapi import APIRouter, Depends
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+
+STREAMED_BODY_PATHS = ("/parse-file", "/download-parsed-file", "/download-measurements-csv", "/jobs", "/parse-archive")
+BODY_PARAMETER_NAME = "body"
+
+
+class RequestBodyStream(io.RawIOBase):
+    """
+    Binary stream reading the body of a request chunk by chunk.
+
+    The leading bytes of the body can be inspected on the event loop (see peek(...)), while the
+    body itself is read synchronously in a worker thread of the threadpool, either as chunks
+    (see iter_chunks()) or like a file (e.g., by shutil.copyfileobj(...)).
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        """
+        Initializes a new request body stream.
+
+        Args:
+            chunks (AsyncIterator[bytes]): The chunks of the body, e.g. Request.stream()
+        """
+        super().__init__()
+        self.__chunks = chunks
+        self.__buffer = b""
+        self.__is_exhausted = False
+
+    async def peek(self, size: int) -> bytes:
+        """
+        Returns the leading bytes of the remaining body without consuming them.
+
+        Args:
+            size (int): The number of bytes to return
+
+        Returns:
+            bytes: Up to size leading bytes, fewer only if the body is shorter
+        """
+        while len(self.__buffer) < size and not self.__is_exhausted:
+            self.__buffer += await self.__receive_chunk()
+        return self.__buffer[:size]
+
+    async def read_all(self) -> bytes:
+        """
+        Receives the remaining body completely.
+
+        Returns:
+            bytes: The remaining body
+        """
+        chunks = [self.__buffer]
+        self.__buffer = b""
+        while not self.__is_exhausted:
+            chunks.append(await self.__receive_chunk())
+        return b"".join(chunks)
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """
+        Iterates over the remaining chunks of the body. Has to be called in a worker thread of the threadpool.
+
+        Returns:
+            Iterator[bytes]: The chunks of the body as they are received
+        """
+        while True:
+            chunk = self.__next_chunk()
+            if not chunk:
+                return
+            yield chunk
+
+    def spool(self, memory_threshold_bytes: int) -> SpooledTemporaryFile:
+        """
+        Spools the remaining body into a temporary file. Has to be called in a worker thread of the threadpool.
+
+        Args:
+            memory_threshold_bytes (int): The size up to which the body is kept in memory
+
+        Returns:
+            SpooledTemporaryFile: The seekable temporary file holding the body, positioned at its start
+        """
+        spool_file = SpooledTemporaryFile(max_size=memory_threshold_bytes)
+        for chunk in self.iter_chunks():
+            spool_file.write(chunk)
+        spool_file.seek(0)
+        return spool_file
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        """
+        Reads the next bytes of the body into a buffer. Has to be called in a worker thread of the threadpool.
+
+        Args:
+            buffer: The writable buffer
+
+        Returns:
+            int: The number of bytes read, 0 at the end of the body
+        """
+        chunk = self.__next_chunk()
+        size = min(len(buffer), len(chunk))
+        buffer[:size] = chunk[:size]
+        # The rest of a chunk larger than the buffer is kept for the next read
+        self.__buffer = chunk[size:]
+        return size
+
+    def __next_chunk(self) -> bytes:
+        if self.__buffer:
+            chunk, self.__buffer = self.__buffer, b""
+            return chunk
+        if self.__is_exhausted:
+            return b""
+        return anyio.from_thread.run(self.__receive_chunk)
+
+    async def __receive_chunk(self) -> bytes:
+        # The ASGI server may deliver empty chunks, e.g. the final one
+        async for chunk in self.__chunks:
+            if chunk:
+                return chunk
+        self.__is_exhausted = True
+        return b""
+
+
+async def get_request_body_stream(request: Request) -> RequestBodyStream:
+    """
+    Dependency providing the body of a request as RequestBodyStream.
+
+    Args:
+        request (Request): The request
+
+    Returns:
+        RequestBodyStream: The streamed body of the request
+    """
+    return RequestBodyStream(request.stream())
+
+
+def use_streamed_request_bodies(router: APIRouter, paths: Iterable[str] = STREAMED_BODY_PATHS) -> None:
+    """
+    Rebuilds the routes of the given paths, so that their endpoints receive the body as RequestBodyStream.
+
+    Routes without a body parameter (e.g. GET /jobs/{job_id}) are kept unchanged.
+
+    Args:
+        router (APIRouter): The router holding the routes, e.g. the router of the application
+        paths (Iterable[str]): The paths of the routes, defaults to STREAMED_BODY_PATHS
+    """
+    paths = set(paths)
+    for index, route in enumerate(router.routes):
+        if not isinstance(route, APIRoute) or route.path not in paths:
+            continue
+        if BODY_PARAMETER_NAME not in inspect.signature(route.endpoint).parameters:
+            continue
+        router.routes[index] = _create_streamed_body_route(route)
+
+
+def _create_streamed_body_route(route: APIRoute) -> APIRoute:
+    """
+    Creates a copy of a route whose body parameter is provided by get_request_body_stream.
+    """
+    endpoint = route.endpoint
+    signature = inspect.signature(endpoint)
+    body_parameter = signature.parameters[BODY_PARAMETER_NAME]
+
+    @functools.wraps(endpoint)
+    async def streamed_body_endpoint(**kwargs) -> Any:
+        return await endpoint(**kwargs)
+
+    streamed_body_endpoint.__signature__ = signature.replace(parameters=[
+        parameter.replace(annotation=RequestBodyStream, default=Depends(get_request_body_stream))
+        if parameter is body_parameter else parameter
+        for parameter in signature.parameters.values()
+    ])
+    description = getattr(body_parameter.default, "description", None)
+    openapi_extra = {
+        "requestBody": {
+            "content": {
+                "application/octet-stream": {
+                    "schema": {"type": "string", "format": "binary", "description": description, "title": "Body"}
+                }
+            }
+        }
+    }
+    # The other arguments of the route are taken over unchanged
+    route_arguments = {
+        name: getattr(route, name) for name in inspect.signature(APIRoute.__init__).parameters
+        if name not in ("self", "path", "endpoint", "openapi_extra")
+    }
+    return APIRoute(
+        route.path, streamed_body_endpoint, openapi_extra={**(route.openapi_extra or {}), **openapi_extra},
+        **route_arguments
+    )
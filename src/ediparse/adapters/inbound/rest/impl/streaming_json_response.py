@@ -0,0 +1,176 @@
+# coding: utf-8
+"""
+Streaming JSON rendering of interchanges parsed one message at a time.
+
+For large interchanges, rendering the JSON body only after the whole interchange has been
+parsed keeps every message in memory and delays the first byte of the response until the
+very end. The functions defined here write the JSON document of an interchange incrementally
+instead: the envelope fields before the messages (UNA, UNB) as soon as the first message has
+been parsed, then each message right after its UNT segment, and finally the UNZ segment.
+
+The streamed document is byte-identical to the one rendered by the PydanticJSONResponse, or,
+in compact mode, to the one rendered by the CompactJSONResponse (except for the messages array,
+which is always written, even if it is empty).
+
+Since the status code of a streaming response has been sent with the first chunk already, a
+parsing error in a later message closes the messages array and ends the document with the status code and the error
+message the endpoint would have returned without streaming:
+
+    {...,"unh_unt_nachrichten":[{...},{...}],"status_code":400,"error_message":"..."}
+"""
+
+import logging
+from typing import Any, Iterator
+
+import orjson
+from pydantic_core import to_json
+from starlette.responses import StreamingResponse
+
+from ediparse.adapters.inbound.rest.impl.ndjson_streaming_response import get_error_status_code
+from ediparse.infrastructure.libs.edifactparser.exporters import get_compact_key, to_compact_data
+from ediparse.infrastructure.libs.edifactparser.wrappers.message_stream import EdifactMessageStream
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange
+
+MESSAGES_FIELD_NAME = "unh_unt_nachrichten"
+
+logger = logging.getLogger(__name__)
+
+
+def iter_interchange_json(
+        message_stream: EdifactMessageStream,
+        compact: bool = False,
+        short_keys: bool = False,
+        report_errors: bool = False
+) -> Iterator[bytes]:
+    """
+    Renders the interchange of a message stream as JSON document, one message at a time.
+
+    The keys of the document follow the field order of the EdifactInterchange model, with the
+    messages being written as JSON array while they are consumed from the message stream.
+
+    Args:
+        message_stream (EdifactMessageStream): The stream of the parsed messages
+        compact (bool): Whether the compact representation without empty values is rendered, defaults to False
+        short_keys (bool): Whether the field names are replaced by their short aliases in compact mode,
+            defaults to False
+        report_errors (bool): Whether a parsing error ends the document with its status code and error message
+            instead of being raised, defaults to False
+
+    Returns:
+        Iterator[bytes]: The chunks of the UTF-8 encoded JSON document
+    """
+    field_names = list(EdifactInterchange.model_fields)
+    messages_field_index = field_names.index(MESSAGES_FIELD_NAME)
+
+    header_field_names = field_names[:messages_field_index]
+    trailer_field_names = field_names[messages_field_index + 1:]
+
+    is_first_message = True
+    try:
+        for message in message_stream:
+            message.decode_lazy_segments()
+            if is_first_message:
+                is_first_message = False
+                yield _render_header(message_stream.interchange, header_field_names, compact, short_keys)
+                yield _render_message(message, compact, short_keys)
+            else:
+                yield b"," + _render_message(message, compact, short_keys)
+    except Exception as ex:
+        if not report_errors:
+            raise
+        logger.warning(f"Streaming the JSON document failed: {ex}")
+        if is_first_message:
+            yield _render_header(message_stream.interchange, header_field_names, compact, short_keys)
+        yield _render_error_trailer(ex)
+        return
+
+    if is_first_message:
+        # An interchange without any message
+        yield _render_header(message_stream.interchange, header_field_names, compact, short_keys)
+    yield _render_trailer(message_stream.interchange, trailer_field_names, compact, short_keys)
+
+
+def _render_message(message: Any, compact: bool, short_keys: bool) -> bytes:
+    """
+    Renders a single message as JSON object.
+    """
+    if compact:
+        return orjson.dumps(to_compact_data(message, short_keys) or {})
+    return message.__pydantic_serializer__.to_json(message)
+
+
+def _render_members(
+        interchange: EdifactInterchange,
+        field_names: list[str],
+        compact: bool,
+        short_keys: bool
+) -> list[bytes]:
+    """
+    Renders the given envelope fields of the interchange as JSON object members.
+    """
+    if not compact:
+        return [to_json(field_name) + b":" + to_json(getattr(interchange, field_name)) for field_name in field_names]
+    members = []
+    for field_name in field_names:
+        value = to_compact_data(getattr(interchange, field_name), short_keys)
+        if value is not None:
+            key = get_compact_key(EdifactInterchange, field_name, short_keys)
+            members.append(orjson.dumps(key) + b":" + orjson.dumps(value))
+    return members
+
+
+def _render_header(interchange: EdifactInterchange, field_names: list[str], compact: bool, short_keys: bool) -> bytes:
+    """
+    Renders the start of the JSON document up to the opening bracket of the messages array.
+    """
+    messages_key = get_compact_key(EdifactInterchange, MESSAGES_FIELD_NAME, compact and short_keys)
+    members = _render_members(interchange, field_names, compact, short_keys) + [to_json(messages_key) + b":["]
+    return b"{" + b",".join(members)
+
+
+def _render_trailer(interchange: EdifactInterchange, field_names: list[str], compact: bool, short_keys: bool) -> bytes:
+    """
+    Renders the end of the JSON document from the closing bracket of the messages array on.
+    """
+    members = [b"]"] + _render_members(interchange, field_names, compact, short_keys)
+    return b",".join(members) + b"}"
+
+
+def _render_error_trailer(error: Exception) -> bytes:
+    """
+    Renders the end of the JSON document from the closing bracket of the messages array on for a failed parsing run.
+    """
+    members = orjson.dumps({"status_code": get_error_status_code(error), "error_message": str(error)})
+    return b"]," + members[1:]
+
+
+class InterchangeJSONStreamingResponse(StreamingResponse):
+    """
+    Streaming response writing the JSON document of an interchange while its messages are parsed.
+
+    The message stream is consumed in a worker thread by Starlette, so the parsing of the
+    remaining messages does not block the event loop.
+    """
+
+    def __init__(
+            self,
+            message_stream: EdifactMessageStream,
+            compact: bool = False,
+            short_keys: bool = False,
+            **kwargs
+    ) -> None:
+        """
+        Initializes a new streaming response for the given message stream.
+
+        Args:
+            message_stream (EdifactMessageStream): The stream of the parsed messages
+            compact (bool): Whether the compact representation without empty values is rendered, defaults to False
+            short_keys (bool): Whether the field names are replaced by their short aliases in compact mode,
+                defaults to False
+            **kwargs: Further arguments of the StreamingResponse, e.g. status_code or headers
+        """
+        super().__init__(
+            content=iter_interchange_json(message_stream, compact=compact, short_keys=short_keys, report_errors=True),
+            media_type="application/json",
+            **kwargs
+        )
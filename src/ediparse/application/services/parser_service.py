@@ -7,50 +7,315 @@ using the appropriate use case. It acts as a facade for the parsing functionalit
 simplifying the interface for clients and delegating the actual parsing work to
 the use case.
 
+Optionally, the service keeps the rendered results of the parsed messages in a content-addressed
+cache (see ParseResultCache), so that byte-identical payloads (e.g., from upstream retries or
+duplicate deliveries) are answered without parsing them again.
+
 The service follows the Clean Architecture pattern, where services coordinate
 the flow of data between the domain layer and the adapters.
 """
 
-from typing import Any
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Union
 
+from ediparse.application.usecases.export_measurements_usecase import ExportMeasurementsUseCase
+from ediparse.application.usecases.parse_archive_usecase import ArchiveEntryResult, ParseArchiveUseCase
+from ediparse.application.usecases.parse_batch_usecase import ParseBatchUseCase
 from ediparse.application.usecases.parse_message_usecase import ParseMessageUseCase
+from ediparse.application.usecases.stream_messages_usecase import StreamMessagesUseCase
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget, ParseStage, StageTimings
+from ediparse.infrastructure.libs.edifactparser.utils.stage_timings import measure_stage
+from ediparse.infrastructure.libs.edifactparser.wrappers.message_stream import EdifactMessageStream
+from ediparse.infrastructure.parse_executor import ParseOutputFormat, render_parsed_interchange
+from ediparse.infrastructure.parse_result_cache import (
+    ParseResultCache, get_default_parse_result_cache, make_cache_key
+)
+from ediparse.infrastructure.parser_pool import ParseRunObserver, PoolTaskResult
 
 
 class ParserService:
     """
     Service for parsing EDIFACT-specific messages.
 
-    This service uses the ParseMessageUseCase to parse EDIFACT-specific messages.
+    This service uses the ParseMessageUseCase to parse EDIFACT-specific messages, the
+    StreamMessagesUseCase to parse them one message at a time, the ExportMeasurementsUseCase
+    to export their measurements as CSV, the ParseBatchUseCase to parse batches of them concurrently
+    and the ParseArchiveUseCase to parse the files of an archive concurrently.
 
     Attributes:
         __parse_message_usecase (ParseMessageUseCase): The use case for parsing EDIFACT-specific messages
+        __stream_messages_usecase (StreamMessagesUseCase): The use case for parsing EDIFACT-specific messages
+            one message at a time
+        __export_measurements_usecase (ExportMeasurementsUseCase): The use case for exporting the measurements
+            of EDIFACT-specific messages as CSV
+        __parse_batch_usecase (ParseBatchUseCase): The use case for parsing batches of EDIFACT-specific messages
+        __parse_archive_usecase (ParseArchiveUseCase): The use case for parsing archives of EDIFACT-specific messages
+        parse_result_cache (Optional[ParseResultCache]): The cache of the rendered results, None if caching is disabled
     """
 
-    def __init__(self, parse_message_usecase: ParseMessageUseCase = None) -> None:
+    def __init__(
+            self,
+            parse_message_usecase: ParseMessageUseCase = None,
+            stream_messages_usecase: StreamMessagesUseCase = None,
+            export_measurements_usecase: ExportMeasurementsUseCase = None,
+            parse_batch_usecase: ParseBatchUseCase = None,
+            parse_archive_usecase: ParseArchiveUseCase = None,
+            parse_result_cache: ParseResultCache = None
+    ) -> None:
         """
         Initializes a new instance of the ParserService class.
 
-        Creates a new ParseMessageUseCase instance to use for parsing if one is not provided.
+        Creates new use case instances to use for parsing if they are not provided.
 
         Args:
             parse_message_usecase (ParseMessageUseCase): The use case to use for parsing, defaults to None
+            stream_messages_usecase (StreamMessagesUseCase): The use case to use for parsing one message
+                at a time, defaults to None
+            export_measurements_usecase (ExportMeasurementsUseCase): The use case to use for exporting
+                measurements, defaults to None
+            parse_batch_usecase (ParseBatchUseCase): The use case to use for parsing batches, defaults to None
+            parse_archive_usecase (ParseArchiveUseCase): The use case to use for parsing archives, defaults to None
+            parse_result_cache (ParseResultCache): The cache of the rendered results, defaults to None, in which case
+                the default cache of the application is used (if caching is enabled)
         """
         self.__parse_message_usecase = parse_message_usecase or ParseMessageUseCase()
+        self.__stream_messages_usecase = stream_messages_usecase or StreamMessagesUseCase()
+        self.__export_measurements_usecase = export_measurements_usecase or ExportMeasurementsUseCase()
+        self.__parse_batch_usecase = parse_batch_usecase or ParseBatchUseCase()
+        self.__parse_archive_usecase = parse_archive_usecase or ParseArchiveUseCase()
+        self.parse_result_cache = parse_result_cache or get_default_parse_result_cache()
 
-    def parse_message(self, message_content: str, max_lines_to_parse: int = -1) -> Any:
+    def parse_message(
+            self,
+            message_content: Union[str, Iterable[str]],
+            max_lines_to_parse: int = -1,
+            memory_budget: Optional[MemoryBudget] = None,
+            stage_timings: Optional[StageTimings] = None
+    ) -> Any:
         """
         Parses an EDIFACT-specific message content into a structured format.
 
         This method uses the ParseMessageUseCase to parse the message content.
 
         Args:
-            message_content (str): The content of the EDIFACT-specific message to parse
+            message_content (Union[str, Iterable[str]]): The content of the EDIFACT-specific message to parse,
+                either as string or as sequence of text chunks (e.g., while it is decompressed)
             max_lines_to_parse (int): The maximum number of lines to parse, defaults to -1 which indicates no parsing limit
+            memory_budget (Optional[MemoryBudget]): The memory budget to account the parsing against,
+                defaults to None (no budget)
+            stage_timings (Optional[StageTimings]): The timings to record the stages of the parsing in,
+                defaults to None (no timing)
 
         Returns:
             Any: The parsed message in a structured format (EdifactInterchange)
         """
         return self.__parse_message_usecase.execute(
             edifact_specific_message_content=message_content,
-            max_lines_to_parse=max_lines_to_parse
+            max_lines_to_parse=max_lines_to_parse,
+            memory_budget=memory_budget,
+            stage_timings=stage_timings
+        )
+
+    def render_message(
+            self,
+            message_content: Union[str, Iterable[str]],
+            max_lines_to_parse: int = -1,
+            memory_budget: Optional[MemoryBudget] = None,
+            output_format: ParseOutputFormat = ParseOutputFormat.JSON,
+            short_keys: bool = False,
+            cache_key: Optional[str] = None,
+            stage_timings: Optional[StageTimings] = None
+    ) -> bytes:
+        """
+        Parses an EDIFACT-specific message content and renders the parsed interchange, using the result cache.
+
+        The rendered result is looked up in the result cache first and stored in it after parsing.
+
+        Args:
+            message_content (Union[str, Iterable[str]]): The content of the EDIFACT-specific message to parse,
+                either as string or as sequence of text chunks, which are joined to compute the cache key
+            max_lines_to_parse (int): The maximum number of lines to parse,
+                defaults to -1 which indicates no parsing limit
+            memory_budget (Optional[MemoryBudget]): The memory budget to account the parsing against,
+                defaults to None (no budget)
+            output_format (ParseOutputFormat): The format to render the interchange in,
+                defaults to ParseOutputFormat.JSON
+            short_keys (bool): Whether the field names are replaced by their short aliases in the compact formats,
+                defaults to False
+            cache_key (Optional[str]): The cache key of the result if it has been computed already (see
+                get_result_cache_key), defaults to None
+            stage_timings (Optional[StageTimings]): The timings to record the stages of the parsing and the rendering
+                in, defaults to None (no timing)
+
+        Returns:
+            bytes: The rendered interchange
+        """
+        if not isinstance(message_content, str):
+            message_content = "".join(message_content)
+        if cache_key is None and self.parse_result_cache is not None:
+            cache_key = self.get_result_cache_key(message_content, max_lines_to_parse, output_format, short_keys)
+        content = self.get_cached_result(cache_key)
+        if content is None:
+            interchange = self.parse_message(message_content, max_lines_to_parse, memory_budget, stage_timings)
+            with measure_stage(stage_timings, ParseStage.RENDER):
+                content = render_parsed_interchange(interchange, output_format, short_keys)
+            self.cache_result(cache_key, content)
+        return content
+
+    @staticmethod
+    def get_result_cache_key(
+            message_content: str,
+            max_lines_to_parse: int,
+            output_format: ParseOutputFormat,
+            short_keys: bool
+    ) -> str:
+        """
+        Computes the key identifying the rendered result of an EDIFACT-specific message content.
+
+        Args:
+            message_content (str): The content of the EDIFACT-specific message
+            max_lines_to_parse (int): The maximum number of lines parsed
+            output_format (ParseOutputFormat): The format the interchange is rendered in
+            short_keys (bool): Whether the field names are replaced by their short aliases
+
+        Returns:
+            str: The hash of the content, the parser version and the options (see make_cache_key)
+        """
+        return make_cache_key(message_content, max_lines_to_parse, output_format, short_keys)
+
+    def get_cached_result(self, cache_key: Optional[str]) -> Optional[bytes]:
+        """
+        Looks up a rendered result in the result cache.
+
+        Args:
+            cache_key (Optional[str]): The key of the result (see get_result_cache_key)
+
+        Returns:
+            Optional[bytes]: The rendered result, None if it is not cached or caching is disabled
+        """
+        if self.parse_result_cache is None or cache_key is None:
+            return None
+        return self.parse_result_cache.get(cache_key)
+
+    def cache_result(self, cache_key: Optional[str], content: bytes) -> None:
+        """
+        Stores a rendered result in the result cache (if caching is enabled).
+
+        Args:
+            cache_key (Optional[str]): The key of the result (see get_result_cache_key)
+            content (bytes): The rendered result
+        """
+        if self.parse_result_cache is not None and cache_key is not None:
+            self.parse_result_cache.put(cache_key, content)
+
+    def stream_messages(
+            self,
+            message_content: Union[str, Iterable[str]],
+            max_lines_to_parse: int = -1,
+            memory_budget: Optional[MemoryBudget] = None
+    ) -> EdifactMessageStream:
+        """
+        Parses an EDIFACT-specific message content one message at a time.
+
+        This method uses the StreamMessagesUseCase to parse the message content. The input is validated
+        immediately, while the messages are parsed when the returned stream is consumed.
+
+        Args:
+            message_content (Union[str, Iterable[str]]): The content of the EDIFACT-specific message to parse,
+                either as string or as sequence of text chunks (e.g., while it is decompressed)
+            max_lines_to_parse (int): The maximum number of lines to parse, defaults to -1 which indicates no parsing
+                limit
+            memory_budget (Optional[MemoryBudget]): The memory budget to account the parsing against,
+                defaults to None (no budget)
+
+        Returns:
+            EdifactMessageStream: The stream of the parsed messages, giving access to the interchange envelope
+        """
+        return self.__stream_messages_usecase.execute(
+            edifact_specific_message_content=message_content,
+            max_lines_to_parse=max_lines_to_parse,
+            memory_budget=memory_budget
+        )
+
+    def export_measurements_csv(self, message_content: Union[str, Iterable[str]]) -> Iterator[str]:
+        """
+        Exports the measurements of an EDIFACT-specific message content as CSV lines.
+
+        This method uses the ExportMeasurementsUseCase to export the measurements. The input is validated
+        immediately, while the rows are extracted when the returned iterator is consumed.
+
+        Args:
+            message_content (Union[str, Iterable[str]]): The content of the EDIFACT-specific message to export,
+                either as string or as sequence of text chunks (e.g., while it is decompressed)
+
+        Returns:
+            Iterator[str]: The CSV lines, starting with the header line
+        """
+        return self.__export_measurements_usecase.execute(edifact_specific_message_content=message_content)
+
+    def parse_batch(
+            self,
+            message_contents: Iterable[str],
+            max_lines_to_parse: int = -1,
+            max_memory_bytes: Optional[int] = None,
+            observer: Optional[ParseRunObserver] = None
+    ) -> Iterator[PoolTaskResult]:
+        """
+        Parses a batch of EDIFACT-specific message contents concurrently.
+
+        This method uses the ParseBatchUseCase to parse the message contents. The items are parsed
+        on the parser pool while the returned iterator is consumed.
+
+        Args:
+            message_contents (Iterable[str]): The contents of the EDIFACT-specific messages to parse
+            max_lines_to_parse (int): The maximum number of lines to parse per item, defaults to -1 which indicates no
+                parsing limit
+            max_memory_bytes (Optional[int]): The memory budget per item in bytes, defaults to None (no budget)
+            observer (Optional[ParseRunObserver]): The observer the parsing run of each item is reported to,
+                defaults to None
+
+        Returns:
+            Iterator[PoolTaskResult]: The outcome of each item in input order, holding either the parsed
+                message (EdifactInterchange) or the raised exception
+        """
+        return self.__parse_batch_usecase.execute(
+            edifact_specific_message_contents=message_contents,
+            max_lines_to_parse=max_lines_to_parse,
+            max_memory_bytes=max_memory_bytes,
+            observer=observer
+        )
+
+    def parse_archive(
+            self,
+            archive: Union[bytes, BinaryIO],
+            max_lines_to_parse: int = -1,
+            max_memory_bytes: Optional[int] = None,
+            max_decompression_ratio: int = 0,
+            observer: Optional[ParseRunObserver] = None
+    ) -> Iterator[ArchiveEntryResult]:
+        """
+        Parses the EDIFACT-specific message files of a zip or tar archive concurrently.
+
+        This method uses the ParseArchiveUseCase to parse the files. The archive is opened immediately,
+        while the files are read and parsed on the parser pool when the returned iterator is consumed.
+
+        Args:
+            archive (Union[bytes, BinaryIO]): The archive containing the EDIFACT-specific message files
+            max_lines_to_parse (int): The maximum number of lines to parse per file, defaults to -1 which indicates no
+                parsing limit
+            max_memory_bytes (Optional[int]): The memory budget per file in bytes, defaults to None (no budget)
+            max_decompression_ratio (int): The allowed ratio of the total size of the files to the archive size,
+                defaults to 0 (no check)
+            observer (Optional[ParseRunObserver]): The observer the parsing run of each file is reported to,
+                defaults to None
+
+        Returns:
+            Iterator[ArchiveEntryResult]: The outcome of each file in completion order, holding either the
+                parsed message (EdifactInterchange) or the raised exception
+        """
+        return self.__parse_archive_usecase.execute(
+            archive=archive,
+            max_lines_to_parse=max_lines_to_parse,
+            max_memory_bytes=max_memory_bytes,
+            max_decompression_ratio=max_decompression_ratio,
+            observer=observer
         )
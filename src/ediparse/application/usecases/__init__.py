@@ -8,8 +8,17 @@ and they orchestrate the flow of data between the domain entities and the extern
 
 The package includes:
 - ParseMessageUseCase: Use case for parsing EDIFACT messages using the EDIFACT parser
+- StreamMessagesUseCase: Use case for parsing EDIFACT messages one message at a time
+- ExportMeasurementsUseCase: Use case for exporting the measurements of EDIFACT messages as CSV
+- ParseBatchUseCase: Use case for parsing batches of EDIFACT messages concurrently on a parser pool
+- ParseArchiveUseCase: Use case for parsing the EDIFACT message files of zip or tar archives concurrently
 """
 
 from ediparse.application.usecases.parse_message_usecase import ParseMessageUseCase
+from ediparse.application.usecases.stream_messages_usecase import StreamMessagesUseCase
+from ediparse.application.usecases.export_measurements_usecase import ExportMeasurementsUseCase
+from ediparse.application.usecases.parse_batch_usecase import ParseBatchUseCase
+from ediparse.application.usecases.parse_archive_usecase import ParseArchiveUseCase
 
-__all__ = ["ParseMessageUseCase"]
+__all__ = ["ParseMessageUseCase", "StreamMessagesUseCase", "ExportMeasurementsUseCase", "ParseBatchUseCase",
+           "ParseArchiveUseCase"]
@@ -0,0 +1,38 @@
+# coding: utf-8
+"""
+Use case for exporting the measurements of EDIFACT messages as CSV.
+
+This module provides a use case implementation for exporting MSCONS measurement series
+as CSV lines according to the Clean Architecture pattern. It implements the
+MeasurementExportPort interface from the domain layer and uses the CSV exporter of the
+EDIFACT parser library from the infrastructure layer to perform the actual export.
+"""
+
+from typing import Iterable, Iterator, Union
+
+from ediparse.domain.ports.inbound import MeasurementExportPort
+from ediparse.infrastructure.libs.edifactparser.exporters import iter_measurement_csv, iter_measurement_csv_from_chunks
+
+
+class ExportMeasurementsUseCase(MeasurementExportPort):
+    """
+    Use case implementation for exporting the measurements of EDIFACT-specific messages as CSV.
+
+    This class implements the MeasurementExportPort interface and uses the CSV exporter,
+    which scans the raw segments and writes each row as soon as its measurement is complete.
+    """
+
+    def execute(self, edifact_specific_message_content: Union[str, Iterable[str]]) -> Iterator[str]:
+        """
+        Exports the measurements of an EDIFACT-specific message content as CSV lines.
+
+        Args:
+            edifact_specific_message_content (Union[str, Iterable[str]]): The EDIFACT-specific message content
+                to export, either as string or as sequence of text chunks
+
+        Returns:
+            Iterator[str]: The CSV lines, starting with the header line
+        """
+        if not isinstance(edifact_specific_message_content, str) and edifact_specific_message_content is not None:
+            return iter_measurement_csv_from_chunks(edifact_chunks=edifact_specific_message_content)
+        return iter_measurement_csv(edifact_text=edifact_specific_message_content)
@@ -0,0 +1,122 @@
+# coding: utf-8
+"""
+Use case for parsing archives of EDIFACT messages.
+
+This module provides a use case implementation for parsing the EDIFACT message files of
+a zip or tar archive according to the Clean Architecture pattern. It implements the
+MessageArchiveParserPort interface from the domain layer, reads the files of the archive
+one after another and parses them concurrently on a ParserPool of warm EdifactParser
+instances from the infrastructure layer.
+"""
+
+from typing import Any, BinaryIO, Iterator, NamedTuple, Optional, Union
+
+from ediparse.domain.ports.inbound import MessageArchiveParserPort
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget
+from ediparse.infrastructure.libs.edifactparser.utils.archive import ArchiveEntry, iter_archive_entries
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange
+from ediparse.infrastructure.parser_pool import ParserPool, ParseRunObserver, get_default_parser_pool, run_observed
+
+
+class ArchiveEntryResult(NamedTuple):
+    """
+    The outcome of parsing a file of an archive.
+
+    Attributes:
+        name (str): The path of the file within the archive
+        value (Any): The parsed message (EdifactInterchange), None if the parsing failed
+        error (Optional[BaseException]): The exception raised while parsing, None if the parsing succeeded
+    """
+    name: str
+    value: Any = None
+    error: Optional[BaseException] = None
+
+
+class ParseArchiveUseCase(MessageArchiveParserPort):
+    """
+    Use case implementation for parsing archives of EDIFACT-specific messages.
+
+    This class implements the MessageArchiveParserPort interface and parses the files
+    of an archive concurrently on a pool of warm parsers, handing out their outcomes in
+    completion order.
+
+    Attributes:
+        __parser_pool (Optional[ParserPool]): The pool the files are parsed on, None to use the default pool
+    """
+
+    def __init__(self, parser_pool: ParserPool = None) -> None:
+        """
+        Initializes a new instance of the ParseArchiveUseCase class.
+
+        Args:
+            parser_pool (ParserPool): The parser pool to use, defaults to None, in which case
+                the default pool of the application is used (created on first use)
+        """
+        self.__parser_pool = parser_pool
+
+    def execute(
+            self,
+            archive: Union[bytes, BinaryIO],
+            max_lines_to_parse: int = -1,
+            max_memory_bytes: Optional[int] = None,
+            max_decompression_ratio: int = 0,
+            observer: Optional[ParseRunObserver] = None
+    ) -> Iterator[ArchiveEntryResult]:
+        """
+        Parses the EDIFACT-specific message files of a zip or tar archive concurrently.
+
+        The archive is opened immediately, so unsupported archives are refused right away, while
+        the files are read and parsed when the returned iterator is consumed. Only the files in
+        flight on the parser pool are held in memory. Each file is accounted against its own memory
+        budget, and exceptions raised while parsing a file are handed out as the error of its outcome.
+
+        Args:
+            archive (Union[bytes, BinaryIO]): The archive containing the EDIFACT-specific message files
+            max_lines_to_parse (int): The maximum number of lines to parse per file, defaults to -1 which means no
+                parsing limit
+            max_memory_bytes (Optional[int]): The memory budget per file in bytes, defaults to None (no budget)
+            max_decompression_ratio (int): The allowed ratio of the total size of the files to the archive size,
+                defaults to 0 (no check)
+            observer (Optional[ParseRunObserver]): The observer the parsing run of each file is reported to
+                (e.g., to record its metrics), defaults to None
+
+        Returns:
+            Iterator[ArchiveEntryResult]: The outcome of each file in completion order, holding either the
+                parsed message (EdifactInterchange) or the raised exception
+
+        Raises:
+            EdifactParserException: If the archive is neither a zip nor a tar archive, or if it is invalid
+            DecompressionRatioExceededException: If the files expand beyond the allowed ratio (while iterating)
+        """
+        entries = iter_archive_entries(archive, max_ratio=max_decompression_ratio)
+        return self.__parse_entries(entries, max_lines_to_parse, max_memory_bytes, observer)
+
+    def __parse_entries(
+            self,
+            entries: Iterator[ArchiveEntry],
+            max_lines_to_parse: int,
+            max_memory_bytes: Optional[int],
+            observer: Optional[ParseRunObserver]
+    ) -> Iterator[ArchiveEntryResult]:
+        parser_pool = self.__parser_pool or get_default_parser_pool()
+        # Only the names of the files in flight are kept to key their outcomes
+        names_in_flight: dict[int, str] = {}
+
+        def track_names() -> Iterator[ArchiveEntry]:
+            for index, entry in enumerate(entries):
+                names_in_flight[index] = entry.name
+                yield entry
+
+        def parse_entry(parser: EdifactParser, entry: ArchiveEntry) -> EdifactInterchange:
+            edifact_text = entry.decode()
+            memory_budget = MemoryBudget(max_bytes=max_memory_bytes)
+            return run_observed(
+                lambda: parser.parse(
+                    edifact_text=edifact_text, max_lines_to_parse=max_lines_to_parse, memory_budget=memory_budget
+                ),
+                edifact_text, memory_budget, observer
+            )
+
+        for outcome in parser_pool.map_unordered(parse_entry, track_names()):
+            yield ArchiveEntryResult(name=names_in_flight.pop(outcome.index), value=outcome.value, error=outcome.error)
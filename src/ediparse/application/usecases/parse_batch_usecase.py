@@ -0,0 +1,80 @@
+# coding: utf-8
+"""
+Use case for parsing batches of EDIFACT messages.
+
+This module provides a use case implementation for parsing a batch of independent
+EDIFACT messages according to the Clean Architecture pattern. It implements the
+MessageBatchParserPort interface from the domain layer and runs the items concurrently
+on a ParserPool of warm EdifactParser instances from the infrastructure layer.
+"""
+
+from typing import Iterable, Iterator, Optional
+
+from ediparse.domain.ports.inbound import MessageBatchParserPort
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange
+from ediparse.infrastructure.parser_pool import (
+    ParserPool, ParseRunObserver, PoolTaskResult, get_default_parser_pool, run_observed
+)
+
+
+class ParseBatchUseCase(MessageBatchParserPort):
+    """
+    Use case implementation for parsing batches of EDIFACT-specific messages.
+
+    This class implements the MessageBatchParserPort interface and parses the items
+    of a batch concurrently on a pool of warm parsers.
+
+    Attributes:
+        __parser_pool (Optional[ParserPool]): The pool the items are parsed on, None to use the default pool
+    """
+
+    def __init__(self, parser_pool: ParserPool = None) -> None:
+        """
+        Initializes a new instance of the ParseBatchUseCase class.
+
+        Args:
+            parser_pool (ParserPool): The parser pool to use, defaults to None, in which case
+                the default pool of the application is used (created on first use)
+        """
+        self.__parser_pool = parser_pool
+
+    def execute(
+            self,
+            edifact_specific_message_contents: Iterable[str],
+            max_lines_to_parse: int = -1,
+            max_memory_bytes: Optional[int] = None,
+            observer: Optional[ParseRunObserver] = None
+    ) -> Iterator[PoolTaskResult]:
+        """
+        Parses a batch of EDIFACT-specific message contents concurrently.
+
+        Each item is accounted against its own memory budget. The items are parsed while the
+        returned iterator is consumed, and exceptions raised while parsing an item are handed out
+        as the error of its outcome.
+
+        Args:
+            edifact_specific_message_contents (Iterable[str]): The EDIFACT-specific message contents to parse
+            max_lines_to_parse (int): The maximum number of lines to parse per item, defaults to -1 which means no
+                parsing limit
+            max_memory_bytes (Optional[int]): The memory budget per item in bytes, defaults to None (no budget)
+            observer (Optional[ParseRunObserver]): The observer the parsing run of each item is reported to
+                (e.g., to record its metrics), defaults to None
+
+        Returns:
+            Iterator[PoolTaskResult]: The outcome of each item in input order, holding either the parsed
+                message (EdifactInterchange) or the raised exception
+        """
+        parser_pool = self.__parser_pool or get_default_parser_pool()
+
+        def parse_item(parser: EdifactParser, edifact_text: str) -> EdifactInterchange:
+            memory_budget = MemoryBudget(max_bytes=max_memory_bytes)
+            return run_observed(
+                lambda: parser.parse(
+                    edifact_text=edifact_text, max_lines_to_parse=max_lines_to_parse, memory_budget=memory_budget
+                ),
+                edifact_text, memory_budget, observer
+            )
+
+        return parser_pool.map_ordered(parse_item, edifact_specific_message_contents)
@@ -12,10 +12,12 @@ ensuring that the domain logic remains independent of the specific parsing
 implementation details.
 """
 
-from typing import Any
+from typing import Any, Iterable, Optional, Union
 
 from ediparse.domain.ports.inbound import MessageParserPort
 from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget, StageTimings
+from ediparse.infrastructure.parse_result_cache import get_default_message_cache
 
 
 class ParseMessageUseCase(MessageParserPort):
@@ -32,25 +34,45 @@ class ParseMessageUseCase(MessageParserPort):
     def __init__(self, parser: EdifactParser = None) -> None:
         """
         Initializes a new instance of the ParseMessageUseCase class or
-        creates a new EdifactParser instance to use for parsing.
+        creates a new EdifactParser instance sharing the default message cache to use for parsing.
 
         Args:
             parser (EdifactParser): The EDIFACT parser to use, defaults to None,
         """
-        self.__parser = parser or EdifactParser()
+        self.__parser = parser or EdifactParser(message_cache=get_default_message_cache())
 
-    def execute(self, edifact_specific_message_content: str, max_lines_to_parse: int = -1) -> Any:
+    def execute(
+            self,
+            edifact_specific_message_content: Union[str, Iterable[str]],
+            max_lines_to_parse: int = -1,
+            memory_budget: Optional[MemoryBudget] = None,
+            stage_timings: Optional[StageTimings] = None
+    ) -> Any:
         """
         Parses an EDIFACT-specific message content into a structured format.
 
         Args:
-            edifact_specific_message_content (str): The EDIFACT-specific message content to parse
+            edifact_specific_message_content (Union[str, Iterable[str]]): The EDIFACT-specific message content
+                to parse, either as string or as sequence of text chunks (e.g., while it is decompressed)
             max_lines_to_parse (int): The maximum number of lines to parse, defaults to -1 which means no parsing limit
+            memory_budget (Optional[MemoryBudget]): The memory budget to account the parsing against,
+                defaults to None (no budget)
+            stage_timings (Optional[StageTimings]): The timings to record the stages of the parsing in,
+                defaults to None (no timing)
 
         Returns:
             Any: The parsed message in a structured format (EdifactInterchange)
         """
+        if not isinstance(edifact_specific_message_content, str) and edifact_specific_message_content is not None:
+            return self.__parser.parse_chunks(
+                edifact_chunks=edifact_specific_message_content,
+                max_lines_to_parse=max_lines_to_parse,
+                memory_budget=memory_budget,
+                stage_timings=stage_timings
+            )
         return self.__parser.parse(
             edifact_text=edifact_specific_message_content,
-            max_lines_to_parse=max_lines_to_parse
+            max_lines_to_parse=max_lines_to_parse,
+            memory_budget=memory_budget,
+            stage_timings=stage_timings
         )
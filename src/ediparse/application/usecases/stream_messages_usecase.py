@@ -0,0 +1,75 @@
+# coding: utf-8
+"""
+Use case for parsing EDIFACT messages one message at a time.
+
+This module provides a use case implementation for parsing large EDIFACT interchanges
+message by message according to the Clean Architecture pattern. It implements the
+MessageStreamParserPort interface from the domain layer and uses the EdifactParser from
+the infrastructure layer to perform the actual parsing.
+"""
+
+from typing import Iterable, Optional, Union
+
+from ediparse.domain.ports.inbound import MessageStreamParserPort
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget
+from ediparse.infrastructure.parse_result_cache import get_default_message_cache
+from ediparse.infrastructure.libs.edifactparser.wrappers.message_stream import EdifactMessageStream
+
+
+class StreamMessagesUseCase(MessageStreamParserPort):
+    """
+    Use case implementation for parsing EDIFACT-specific messages one message at a time.
+
+    This class implements the MessageStreamParserPort interface and uses the
+    EdifactParser to hand out the messages of an interchange while they are parsed.
+
+    Attributes:
+        __parser (Optional[EdifactParser]): The parser used to parse EDIFACT-specific messages,
+            None until the first message stream is requested
+    """
+
+    def __init__(self, parser: EdifactParser = None) -> None:
+        """
+        Initializes a new instance of the StreamMessagesUseCase class.
+
+        Args:
+            parser (EdifactParser): The EDIFACT parser to use, defaults to None, in which case a new
+                EdifactParser sharing the default message cache is created when the first message stream
+                is requested (creating a parser takes longer than parsing a typical message, so it is only
+                paid for by the requests that actually stream)
+        """
+        self.__parser = parser
+
+    def execute(
+            self,
+            edifact_specific_message_content: Union[str, Iterable[str]],
+            max_lines_to_parse: int = -1,
+            memory_budget: Optional[MemoryBudget] = None
+    ) -> EdifactMessageStream:
+        """
+        Parses an EDIFACT-specific message content one message at a time.
+
+        Args:
+            edifact_specific_message_content (Union[str, Iterable[str]]): The EDIFACT-specific message content
+                to parse, either as string or as sequence of text chunks (e.g., while it is decompressed)
+            max_lines_to_parse (int): The maximum number of lines to parse, defaults to -1 which means no parsing limit
+            memory_budget (Optional[MemoryBudget]): The memory budget to account the parsing against,
+                defaults to None (no budget)
+
+        Returns:
+            EdifactMessageStream: The stream of the parsed messages, giving access to the interchange envelope
+        """
+        if self.__parser is None:
+            self.__parser = EdifactParser(message_cache=get_default_message_cache())
+        if not isinstance(edifact_specific_message_content, str) and edifact_specific_message_content is not None:
+            return self.__parser.iter_messages_from_chunks(
+                edifact_chunks=edifact_specific_message_content,
+                max_lines_to_parse=max_lines_to_parse,
+                memory_budget=memory_budget
+            )
+        return self.__parser.iter_messages(
+            edifact_text=edifact_specific_message_content,
+            max_lines_to_parse=max_lines_to_parse,
+            memory_budget=memory_budget
+        )
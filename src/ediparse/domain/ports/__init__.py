@@ -11,6 +11,6 @@ The package includes:
 - inbound: Ports that allow external systems to interact with the application
 """
 
-from ediparse.domain.ports.inbound import MessageParserPort
+from ediparse.domain.ports.inbound import MessageParserPort, MessageStreamParserPort, MeasurementExportPort
 
-__all__ = ["MessageParserPort"]
+__all__ = ["MessageParserPort", "MessageStreamParserPort", "MeasurementExportPort"]
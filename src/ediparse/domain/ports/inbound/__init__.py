@@ -9,8 +9,17 @@ Adapters (Hexagonal) architecture pattern.
 
 The package includes:
 - MessageParserPort: Interface for parsing EDIFACT messages
+- MessageStreamParserPort: Interface for parsing EDIFACT messages one message at a time
+- MeasurementExportPort: Interface for exporting the measurements of EDIFACT messages as CSV
+- MessageBatchParserPort: Interface for parsing batches of EDIFACT messages concurrently
+- MessageArchiveParserPort: Interface for parsing the EDIFACT message files of archives concurrently
 """
 
 from ediparse.domain.ports.inbound.message_parser_port import MessageParserPort
+from ediparse.domain.ports.inbound.message_stream_parser_port import MessageStreamParserPort
+from ediparse.domain.ports.inbound.measurement_export_port import MeasurementExportPort
+from ediparse.domain.ports.inbound.message_batch_parser_port import MessageBatchParserPort
+from ediparse.domain.ports.inbound.message_archive_parser_port import MessageArchiveParserPort
 
-__all__ = ["MessageParserPort"]
+__all__ = ["MessageParserPort", "MessageStreamParserPort", "MeasurementExportPort", "MessageBatchParserPort",
+           "MessageArchiveParserPort"]
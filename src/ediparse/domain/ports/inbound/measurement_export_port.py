@@ -0,0 +1,35 @@
+# coding: utf-8
+"""
+Port interface for exporting measurement series from EDIFACT messages.
+
+This module defines the MeasurementExportPort interface, which is a primary port
+in the Ports and Adapters (Hexagonal) architecture. It defines how external systems
+can export the measurements of EDIFACT-specific messages (e.g., MSCONS) as flat rows
+without receiving the complete structured message.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, Union
+
+
+class MeasurementExportPort(ABC):
+    """
+    Abstract port interface for exporting the measurements of EDIFACT-specific messages.
+
+    This port defines the interface for components that can export the measurements of
+    EDIFACT-specific message content as CSV lines while the content is being scanned.
+    """
+
+    @abstractmethod
+    def execute(self, edifact_specific_message_content: Union[str, Iterable[str]]) -> Iterator[str]:
+        """
+        Exports the measurements of an EDIFACT-specific message content as CSV lines.
+
+        Args:
+            edifact_specific_message_content (Union[str, Iterable[str]]): The EDIFACT-specific message content
+                to export, either as string or as sequence of text chunks
+
+        Returns:
+            Iterator[str]: The CSV lines, starting with the header line
+        """
+        pass
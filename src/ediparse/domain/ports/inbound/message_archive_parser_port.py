@@ -0,0 +1,47 @@
+# coding: utf-8
+"""
+Port interface for parsing archives of EDIFACT messages.
+
+This module defines the MessageArchiveParserPort interface, which is a primary port
+in the Ports and Adapters (Hexagonal) architecture. It parses the files of an archive
+(e.g., a zip or tar archive with hundreds of MSCONS files) concurrently and hands out the
+outcome of each file as soon as it is available, keyed by the name of the file.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Callable, Iterator, Optional, Union
+
+
+class MessageArchiveParserPort(ABC):
+    """
+    Abstract port interface for parsing archives of EDIFACT-specific messages.
+
+    This port defines the interface for components that can parse the EDIFACT-specific
+    message files of an archive and report the outcome per file.
+    """
+
+    @abstractmethod
+    def execute(
+            self,
+            archive: Union[bytes, BinaryIO],
+            max_lines_to_parse: int = -1,
+            max_memory_bytes: Optional[int] = None,
+            max_decompression_ratio: int = 0,
+            observer: Optional[Callable[..., None]] = None
+    ) -> Iterator[Any]:
+        """
+        Parses the EDIFACT-specific message files of an archive into a structured format.
+
+        Args:
+            archive (Union[bytes, BinaryIO]): The archive containing the EDIFACT-specific message files
+            max_lines_to_parse (int): The maximum number of lines to parse per file, defaults to -1 which means no
+                parsing limit
+            max_memory_bytes (Optional[int]): The memory budget per file in bytes, defaults to None (no budget)
+            max_decompression_ratio (int): The allowed ratio of the total size of the files to the archive size,
+                defaults to 0 (no check)
+            observer (Optional[Callable[..., None]]): The observer each parsing run is reported to, defaults to None
+
+        Returns:
+            Iterator[Any]: The outcome of each file (parsed message or error) keyed by its name
+        """
+        pass
@@ -0,0 +1,45 @@
+# coding: utf-8
+"""
+Port interface for parsing batches of EDIFACT messages.
+
+This module defines the MessageBatchParserPort interface, which is a primary port
+in the Ports and Adapters (Hexagonal) architecture. In contrast to the MessageParserPort,
+it parses a sequence of independent EDIFACT-specific message contents concurrently and
+hands out the outcome of each of them in input order, so that a failing item does not
+affect the other items of the batch.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+
+class MessageBatchParserPort(ABC):
+    """
+    Abstract port interface for parsing batches of EDIFACT-specific messages.
+
+    This port defines the interface for components that can parse several
+    EDIFACT-specific message contents at once and report the outcome per item.
+    """
+
+    @abstractmethod
+    def execute(
+            self,
+            edifact_specific_message_contents: Iterable[str],
+            max_lines_to_parse: int = -1,
+            max_memory_bytes: Optional[int] = None,
+            observer: Optional[Callable[..., None]] = None
+    ) -> Iterator[Any]:
+        """
+        Parses a batch of EDIFACT-specific message contents into a structured format.
+
+        Args:
+            edifact_specific_message_contents (Iterable[str]): The EDIFACT-specific message contents to parse
+            max_lines_to_parse (int): The maximum number of lines to parse per item, defaults to -1 which means no
+                parsing limit
+            max_memory_bytes (Optional[int]): The memory budget per item in bytes, defaults to None (no budget)
+            observer (Optional[Callable[..., None]]): The observer each parsing run is reported to, defaults to None
+
+        Returns:
+            Iterator[Any]: The outcome of each item (parsed message or error) in input order
+        """
+        pass
@@ -12,7 +12,7 @@ depending directly on application-specific implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterable, Union
 
 
 class MessageParserPort(ABC):
@@ -24,13 +24,22 @@ class MessageParserPort(ABC):
     """
 
     @abstractmethod
-    def execute(self, edifact_specific_message_content: str, max_lines_to_parse: int = -1) -> Any:
+    def execute(
+            self,
+            edifact_specific_message_content: Union[str, Iterable[str]],
+            max_lines_to_parse: int = -1,
+            memory_budget: Any = None,
+            stage_timings: Any = None
+    ) -> Any:
         """
         Parses an EDIFACT-specific message content into a structured format.
 
         Args:
-            edifact_specific_message_content (str): The EDIFACT-specific message content to parse
+            edifact_specific_message_content (Union[str, Iterable[str]]): The EDIFACT-specific message content
+                to parse, either as string or as sequence of text chunks
             max_lines_to_parse (int): The maximum number of lines to parse, defaults to -1 which means no parsing limit
+            memory_budget (Any): The memory budget to account the parsing against, defaults to None (no budget)
+            stage_timings (Any): The timings to record the stages of the parsing in, defaults to None (no timing)
 
         Returns:
             Any: The parsed message in a structured format
@@ -0,0 +1,42 @@
+# coding: utf-8
+"""
+Port interface for parsing EDIFACT messages one message at a time.
+
+This module defines the MessageStreamParserPort interface, which is a primary port
+in the Ports and Adapters (Hexagonal) architecture. In contrast to the MessageParserPort,
+it hands out the messages of an interchange one by one while they are parsed, so that
+large interchanges can be processed without holding all of their messages in memory.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Iterator, Union
+
+
+class MessageStreamParserPort(ABC):
+    """
+    Abstract port interface for parsing EDIFACT-specific messages one message at a time.
+
+    This port defines the interface for components that can parse EDIFACT-specific
+    message content and hand out its messages as soon as each of them has been parsed.
+    """
+
+    @abstractmethod
+    def execute(
+            self,
+            edifact_specific_message_content: Union[str, Iterable[str]],
+            max_lines_to_parse: int = -1,
+            memory_budget: Any = None
+    ) -> Iterator[Any]:
+        """
+        Parses an EDIFACT-specific message content one message at a time.
+
+        Args:
+            edifact_specific_message_content (Union[str, Iterable[str]]): The EDIFACT-specific message content
+                to parse, either as string or as sequence of text chunks
+            max_lines_to_parse (int): The maximum number of lines to parse, defaults to -1 which means no parsing limit
+            memory_budget (Any): The memory budget to account the parsing against, defaults to None (no budget)
+
+        Returns:
+            Iterator[Any]: The stream of the parsed messages in a structured format
+        """
+        pass
@@ -11,5 +11,13 @@ components are in the outermost layer and depend on the inner layers
 (domain and application) rather than the other way around.
 
 The package includes:
+- job_store: Local store and worker pool of asynchronous parsing jobs spooled to disk
 - logging_config: Configuration for application logging
+- parse_capture: Bounded local spool capturing slow parsing runs for offline replay
+- parse_executor: Executor parsing and rendering messages on a thread, process or inline backend
+- parse_profiler: Sampling profiler aggregating the profiles of a fraction of the parsing runs
+- parse_result_cache: Content-addressed LRU cache of rendered parse results with an optional on-disk tier,
+  and the default message cache shared by the parsers
+- parser_pool: Pool of warm EDIFACT parsers running parsing tasks concurrently
+- single_flight: Coalescing of identical concurrent calls into one computation sharing its result
 """
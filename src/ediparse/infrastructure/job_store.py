@@ -0,0 +1,410 @@
+# coding: utf-8
+"""
+Local store and worker pool of asynchronous parsing jobs.
+
+Parsing very large uploads (e.g., MSCONS files of several hundred megabytes) inline in an HTTP
+request easily exceeds the timeouts of ingress controllers and load balancers. The JobStore
+defined here decouples the parsing from the request instead: the upload is spooled to a job
+directory on disk, a job id is handed out right away and the job is run on a bounded pool of
+worker threads, while its status and progress can be polled.
+
+The result of a job is written while it is produced. Results up to a memory threshold are kept
+in memory, larger results are spilled to a file in the job directory, so that they can be sent
+from disk. Finished jobs are removed, including their files, once their retention period has
+passed.
+
+The jobs are local to the process; the store is configured via the environment variables:
+- JOB_SPOOL_DIR: The directory the job directories are created in (default: the temp directory)
+- JOB_WORKERS: The number of jobs run concurrently (default: 2)
+- MAX_QUEUED_JOBS: The number of jobs waiting for a worker (default: 16)
+- JOB_RETENTION_SECONDS: How long finished jobs are kept (default: 3600)
+- JOB_RESULT_MEMORY_THRESHOLD_MB: The size up to which results are kept in memory (default: 8)
+"""
+
+import io
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Optional, Union
+
+from ediparse.infrastructure.libs.edifactparser.wrappers.constants import StrEnum
+
+logger = logging.getLogger(__name__)
+
+JOB_SPOOL_DIR = os.getenv("JOB_SPOOL_DIR", tempfile.gettempdir())
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+MAX_QUEUED_JOBS = int(os.getenv("MAX_QUEUED_JOBS", "16"))
+JOB_RETENTION_SECONDS = int(os.getenv("JOB_RETENTION_SECONDS", "3600"))
+JOB_RESULT_MEMORY_THRESHOLD_MB = int(os.getenv("JOB_RESULT_MEMORY_THRESHOLD_MB", "8"))
+
+JOB_SPOOL_CHUNK_SIZE = 1024 * 1024
+UPLOAD_FILE_NAME = "upload"
+RESULT_FILE_NAME = "result"
+
+_default_job_store: Optional["JobStore"] = None
+_default_job_store_lock = threading.Lock()
+
+
+class JobStatus(StrEnum):
+    """
+    The states of a job.
+    """
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobQueueFullException(Exception):
+    """
+    Exception raised when a job is submitted while all workers are busy and the queue is full.
+    """
+
+    def __init__(self, max_jobs: int) -> None:
+        """
+        Initializes a new exception for the given number of jobs.
+
+        Args:
+            max_jobs (int): The number of jobs that may be running or queued at once
+        """
+        self.max_jobs = max_jobs
+        super().__init__(f"The job queue is full, at most {max_jobs} jobs may be running or queued at once.")
+
+
+class Job:
+    """
+    An asynchronous parsing job.
+
+    The attributes are updated by the worker running the job and read by the clients polling it.
+
+    Attributes:
+        id (str): The id of the job
+        status (JobStatus): The current state of the job
+        created_at (float): The time the job was submitted (seconds since the epoch)
+        started_at (Optional[float]): The time the job was started, None while it is queued
+        finished_at (Optional[float]): The time the job was finished, None while it is queued or running
+        upload_size (int): The size of the spooled upload in bytes
+        bytes_processed (int): The number of bytes of the upload read so far
+        messages_processed (int): The number of messages processed so far
+        result_size (int): The size of the result in bytes written so far
+        result_content (Optional[bytes]): The result, if it is kept in memory
+        result_path (Optional[str]): The path of the result file, if the result has been spilled to disk
+        error (Optional[BaseException]): The exception the job failed with, None unless the job failed
+    """
+
+    def __init__(self, job_id: str, directory: str, upload_size: int = 0) -> None:
+        """
+        Initializes a new queued job.
+
+        Args:
+            job_id (str): The id of the job
+            directory (str): The directory holding the files of the job
+            upload_size (int): The size of the spooled upload in bytes, defaults to 0
+        """
+        self.id = job_id
+        self.directory = directory
+        self.status = JobStatus.QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.upload_size = upload_size
+        self.bytes_processed = 0
+        self.messages_processed = 0
+        self.result_size = 0
+        self.result_content: Optional[bytes] = None
+        self.result_path: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+    @property
+    def upload_path(self) -> str:
+        """
+        Returns the path of the spooled upload of the job.
+        """
+        return os.path.join(self.directory, UPLOAD_FILE_NAME)
+
+    @property
+    def is_finished(self) -> bool:
+        """
+        Returns whether the job has succeeded or failed.
+        """
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+
+JobTask = Callable[[Job, BinaryIO, BinaryIO], None]
+
+
+class JobStore:
+    """
+    Store of asynchronous jobs, running them on a bounded pool of worker threads.
+
+    A job is run by a task called with the job, the spooled upload (as binary file object reporting
+    the read bytes as progress of the job) and the binary file object the result is written to.
+
+    Attributes:
+        max_workers (int): The number of jobs run concurrently
+        max_queued_jobs (int): The number of jobs waiting for a worker
+        retention_seconds (int): How long finished jobs are kept
+    """
+
+    def __init__(
+            self,
+            spool_dir: str = JOB_SPOOL_DIR,
+            max_workers: int = JOB_WORKERS,
+            max_queued_jobs: int = MAX_QUEUED_JOBS,
+            retention_seconds: int = JOB_RETENTION_SECONDS,
+            result_memory_threshold_bytes: int = JOB_RESULT_MEMORY_THRESHOLD_MB * 1024 * 1024
+    ) -> None:
+        """
+        Initializes a new job store with its own directory within the spool directory.
+
+        Args:
+            spool_dir (str): The directory the directory of the store is created in, defaults to JOB_SPOOL_DIR
+            max_workers (int): The number of jobs run concurrently, defaults to JOB_WORKERS
+            max_queued_jobs (int): The number of jobs waiting for a worker, defaults to MAX_QUEUED_JOBS
+            retention_seconds (int): How long finished jobs are kept, defaults to JOB_RETENTION_SECONDS
+            result_memory_threshold_bytes (int): The size up to which results are kept in memory,
+                defaults to JOB_RESULT_MEMORY_THRESHOLD_MB megabytes
+
+        Raises:
+            ValueError: If the store has no worker
+        """
+        if max_workers < 1:
+            raise ValueError(f"A job store needs at least one worker, got {max_workers}")
+        self.max_workers = max_workers
+        self.max_queued_jobs = max(max_queued_jobs, 0)
+        self.retention_seconds = retention_seconds
+        self.__result_memory_threshold_bytes = result_memory_threshold_bytes
+        os.makedirs(spool_dir, exist_ok=True)
+        # Each process uses its own directory, so that stores of other processes are left alone
+        self.__directory = tempfile.mkdtemp(prefix="ediparse-jobs-", dir=spool_dir)
+        self.__jobs: dict[str, Job] = {}
+        self.__lock = threading.Lock()
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="edifact-job")
+
+    @property
+    def directory(self) -> str:
+        """
+        Returns the directory holding the job directories of the store.
+        """
+        return self.__directory
+
+    def submit(self, upload: Union[bytes, BinaryIO], task: JobTask) -> Job:
+        """
+        Spools an upload to disk and queues a job running the task on it.
+
+        Args:
+            upload (Union[bytes, BinaryIO]): The upload, either as bytes or as binary file object
+            task (JobTask): The task processing the upload and writing the result
+
+        Returns:
+            Job: The queued job
+
+        Raises:
+            JobQueueFullException: If all workers are busy and the queue is full
+        """
+        self.cleanup_expired_jobs()
+        job_id = uuid.uuid4().hex
+        with self.__lock:
+            active_jobs = sum(1 for job in self.__jobs.values() if not job.is_finished)
+            if active_jobs >= self.max_workers + self.max_queued_jobs:
+                raise JobQueueFullException(self.max_workers + self.max_queued_jobs)
+            job = Job(job_id=job_id, directory=os.path.join(self.__directory, job_id))
+            self.__jobs[job_id] = job
+
+        try:
+            os.makedirs(job.directory)
+            job.upload_size = self.__spool(upload, job.upload_path)
+        except BaseException:
+            self.__remove(job)
+            raise
+        self.__executor.submit(self.__run, job, task)
+        logger.info(f"Job {job_id} queued with an upload of {job.upload_size} bytes")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Returns a job of the store.
+
+        Args:
+            job_id (str): The id of the job
+
+        Returns:
+            Optional[Job]: The job, None if there is no such job or the job has expired
+        """
+        self.cleanup_expired_jobs()
+        with self.__lock:
+            return self.__jobs.get(job_id)
+
+    def cleanup_expired_jobs(self, now: Optional[float] = None) -> int:
+        """
+        Removes the finished jobs whose retention period has passed, including their files.
+
+        Args:
+            now (Optional[float]): The current time (seconds since the epoch), defaults to None (the current time)
+
+        Returns:
+            int: The number of removed jobs
+        """
+        expired_before = (now if now is not None else time.time()) - self.retention_seconds
+        with self.__lock:
+            # Jobs whose finish time has not been set yet are skipped, since they are just finishing
+            expired_jobs = [
+                job for job in self.__jobs.values()
+                if job.is_finished and job.finished_at is not None and job.finished_at < expired_before
+            ]
+        for job in expired_jobs:
+            self.__remove(job)
+        return len(expired_jobs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the workers of the store and removes the directory of the store.
+
+        Args:
+            wait (bool): Whether to wait for the running jobs to finish, defaults to True
+        """
+        self.__executor.shutdown(wait=wait, cancel_futures=True)
+        shutil.rmtree(self.__directory, ignore_errors=True)
+
+    def __run(self, job: Job, task: JobTask) -> None:
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        result_spool = _ResultSpool(job, os.path.join(job.directory, RESULT_FILE_NAME),
+                                    self.__result_memory_threshold_bytes)
+        try:
+            with open(job.upload_path, "rb") as upload_file:
+                task(job, io.BufferedReader(_ProgressReader(job, upload_file)), result_spool)
+            result_spool.close()
+            status = JobStatus.SUCCEEDED
+        except Exception as ex:
+            result_spool.discard()
+            job.error = ex
+            status = JobStatus.FAILED
+        finally:
+            # The upload is not needed anymore once the job has finished
+            _remove_file(job.upload_path)
+        # The finish time is set before the final status, since finished jobs are expired by their finish time
+        job.finished_at = time.time()
+        job.status = status
+        logger.info(f"Job {job.id} {job.status} after {job.finished_at - job.started_at:2.2f}s")
+
+    def __remove(self, job: Job) -> None:
+        with self.__lock:
+            self.__jobs.pop(job.id, None)
+        shutil.rmtree(job.directory, ignore_errors=True)
+
+    @staticmethod
+    def __spool(upload: Union[bytes, BinaryIO], path: str) -> int:
+        with open(path, "wb") as spool_file:
+            if isinstance(upload, (bytes, bytearray)):
+                spool_file.write(upload)
+            else:
+                shutil.copyfileobj(upload, spool_file, JOB_SPOOL_CHUNK_SIZE)
+            return spool_file.tell()
+
+
+def get_default_job_store() -> JobStore:
+    """
+    Returns the job store shared by the application, creating it on first use.
+
+    Returns:
+        JobStore: The default job store
+    """
+    global _default_job_store
+    if _default_job_store is None:
+        with _default_job_store_lock:
+            if _default_job_store is None:
+                _default_job_store = JobStore()
+    return _default_job_store
+
+
+def shutdown_default_job_store() -> None:
+    """
+    Shuts down the job store shared by the application, if it has been created, removing its files.
+    """
+    global _default_job_store
+    with _default_job_store_lock:
+        job_store, _default_job_store = _default_job_store, None
+    if job_store is not None:
+        job_store.shutdown(wait=False)
+
+
+class _ProgressReader(io.RawIOBase):
+    """
+    Binary reader reporting the bytes read from the spooled upload as progress of the job.
+    """
+
+    def __init__(self, job: Job, raw: BinaryIO) -> None:
+        super().__init__()
+        self.__job = job
+        self.__raw = raw
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = self.__raw.readinto(buffer)
+        self.__job.bytes_processed += size
+        return size
+
+
+class _ResultSpool(io.RawIOBase):
+    """
+    Write buffer keeping the result of a job in memory up to a threshold and spilling it to a file beyond.
+    """
+
+    def __init__(self, job: Job, path: str, memory_threshold_bytes: int) -> None:
+        super().__init__()
+        self.__job = job
+        self.__path = path
+        self.__memory_threshold_bytes = memory_threshold_bytes
+        self.__buffer = bytearray()
+        self.__file: Optional[BinaryIO] = None
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.__file is None and len(self.__buffer) + len(data) > self.__memory_threshold_bytes:
+            self.__file = open(self.__path, "wb")
+            self.__file.write(self.__buffer)
+            self.__buffer = bytearray()
+        if self.__file is not None:
+            self.__file.write(data)
+        else:
+            self.__buffer += data
+        self.__job.result_size += len(data)
+        return len(data)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        if self.__file is not None:
+            self.__file.close()
+            self.__job.result_path = self.__path
+        else:
+            self.__job.result_content = bytes(self.__buffer)
+        super().close()
+
+    def discard(self) -> None:
+        if self.__file is not None:
+            self.__file.close()
+            _remove_file(self.__path)
+        self.__buffer = bytearray()
+        self.__job.result_size = 0
+        super().close()
+
+
+def _remove_file(path: str) -> None:
+    """
+    Removes a file, ignoring files that do not exist (anymore).
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -2,12 +2,14 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional, TypeVar, Generic
+from functools import partial
+from typing import Optional, TypeVar, Generic, get_args, get_origin
 
 from ..exceptions import CONTRLException
 from ..utils import EdifactSyntaxHelper
 from ..wrappers.context import ParsingContext
 from ..wrappers.constants import EdifactConstants, SegmentGroup
+from ..wrappers.segments.lazy import create_lazy_segment
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,9 @@ class SegmentConverter(ABC, Generic[T]):
         None
     """
 
+    # The decoder of the lazy segments, shared within the parsing run of its context
+    __lazy_decoder: Optional[partial] = None
+
     def __init__(self, syntax_helper: EdifactSyntaxHelper):
         """
         Initialize the __converter with the syntax parser to use for parsing segment components.
@@ -73,6 +78,93 @@ class SegmentConverter(ABC, Generic[T]):
             logger.error(error_message)
             raise CONTRLException(message=error_message)
 
+    def convert_segment_line(
+            self,
+            line_number: int,
+            segment_line: str,
+            last_segment_type: Optional[str],
+            current_segment_group: Optional[SegmentGroup],
+            context: ParsingContext
+    ) -> T:
+        """
+        Splits the raw segment line into its element components and converts them.
+
+        Args:
+            line_number: The line number in the EDI file where this segment appears
+            segment_line: The raw segment line (without the segment terminator) from the EDI file
+            last_segment_type: The type of the previous segment (e.g., 'UNH', 'BGM')
+            current_segment_group: The current segment group being processed
+            context: The context to use for the __converter.
+
+        Returns:
+            A typed domain model object of type T
+
+        Raises:
+            CONTRLException: If any error occurs during the conversion process
+        """
+        element_components = self._syntax_parser.split_elements(string_content=segment_line, context=context)
+        return self.convert(line_number, element_components, last_segment_type, current_segment_group, context)
+
+    def convert_lazily(
+            self,
+            line_number: int,
+            segment_line: str,
+            last_segment_type: Optional[str],
+            current_segment_group: Optional[SegmentGroup],
+            context: ParsingContext
+    ) -> T:
+        """
+        Creates a lazy segment that defers the tokenizing and the conversion until one of its fields is read.
+
+        The lazy segment only keeps the raw segment line and runs `convert_segment_line(...)` on first
+        field access. The decoder is shared by all lazy segments of this __converter within a parsing
+        run, so no callable is created per segment. Consequently, conversion errors (CONTRLException)
+        are raised on first access instead of during parsing.
+
+        Args:
+            line_number: The line number in the EDI file where this segment appears
+            segment_line: The raw segment line (without the segment terminator) from the EDI file
+            last_segment_type: The type of the previous segment (e.g., 'UNH', 'BGM')
+            current_segment_group: The current segment group being processed
+            context: The context to use for the __converter.
+
+        Returns:
+            A lazy segment instance of type T
+        """
+        lazy_decoder = self.__lazy_decoder
+        if lazy_decoder is None or lazy_decoder.keywords["context"] is not context:
+            lazy_decoder = partial(self.convert_segment_line, context=context)
+            self.__lazy_decoder = lazy_decoder
+        return create_lazy_segment(
+            self.get_segment_class(), lazy_decoder,
+            line_number, segment_line, last_segment_type, current_segment_group
+        )
+
+    @classmethod
+    def get_segment_class(cls) -> type:
+        """
+        Returns the segment model class (the generic type parameter T) this __converter produces.
+
+        Returns:
+            The segment model class, e.g. SegmentQTY for the QTYSegmentConverter
+
+        Raises:
+            TypeError: If the segment model class cannot be determined
+        """
+        segment_class = cls.__dict__.get("_segment_class")
+        if segment_class is None:
+            for klass in cls.__mro__:
+                for base in getattr(klass, "__orig_bases__", ()):
+                    if get_origin(base) is SegmentConverter:
+                        segment_class = get_args(base)[0]
+                        break
+                if segment_class is not None:
+                    break
+            if segment_class is None or isinstance(segment_class, TypeVar):
+                raise TypeError(f"Cannot determine the segment class of the __converter '{cls.__name__}'.")
+            cls._segment_class = segment_class
+        return segment_class
+
     @abstractmethod
     def _convert_internal(
             self,
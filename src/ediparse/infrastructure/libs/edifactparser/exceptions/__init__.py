@@ -8,8 +8,12 @@ This package contains custom exception classes used throughout the EDIFACT parse
 - MSCONSParserException: For errors specific to MSCONS message parsing
 - EdifactParserException: For general EDIFACT parsing errors
 - APERAKParserException: For errors specific to APERAK message parsing
+- ParseMemoryBudgetExceededException: For parsing runs exceeding their memory budget
+- DecompressionRatioExceededException: For compressed inputs exceeding their decompression ratio
 """
 from .contrl_exceptions import CONTRLException
 from .parser_exceptions import MSCONSParserException
 from .parser_exceptions import EdifactParserException
 from .parser_exceptions import APERAKParserException
+from .parser_exceptions import ParseMemoryBudgetExceededException
+from .parser_exceptions import DecompressionRatioExceededException
@@ -59,3 +59,74 @@ class APERAKParserException(Exception):
         self.message = message
         self.value = value
         super().__init__(f"{message}{': ' + value if value else ''}")
+
+
+class ParseMemoryBudgetExceededException(Exception):
+    """
+    Exception raised when the estimated memory of a parsing run exceeds its budget.
+
+    The parser keeps a running estimate of the memory allocated for the parsed model
+    objects (see MemoryBudget) and aborts with this exception as soon as the configured
+    budget is exceeded, instead of risking an out-of-memory error of the whole process.
+
+    Attributes:
+        message (str): Explanation of the error
+        value (str): Additional information about the error
+        estimated_bytes (int): The estimated number of bytes that exceeded the budget
+        max_bytes (int): The configured budget in bytes
+    """
+    def __init__(
+            self,
+            message: str = "Memory budget for parsing exceeded",
+            value: str = None,
+            estimated_bytes: int = 0,
+            max_bytes: int = 0
+    ):
+        self.message = message
+        self.value = value or f"estimated {estimated_bytes} bytes, allowed {max_bytes} bytes"
+        self.estimated_bytes = estimated_bytes
+        self.max_bytes = max_bytes
+        super().__init__(f"{message}{': ' + self.value if self.value else ''}")
+
+    def __reduce__(self):
+        # Rebuilt from its fields when unpickled, e.g. when raised in a worker process
+        return self.__class__, (self.message, self.value, self.estimated_bytes, self.max_bytes)
+
+
+class DecompressionRatioExceededException(Exception):
+    """
+    Exception raised when a compressed input expands beyond its allowed decompression ratio.
+
+    Compressed uploads are decompressed incrementally, and the decompressed size is checked against
+    the compressed size after every chunk. This protects the service against decompression bombs,
+    i.e. small archives expanding to gigabytes of data.
+
+    Attributes:
+        message (str): Explanation of the error
+        value (str): Additional information about the error
+        decompressed_bytes (int): The number of bytes decompressed when the ratio was exceeded
+        compressed_bytes (int): The size of the compressed input in bytes
+        max_ratio (int): The allowed ratio of decompressed to compressed bytes
+    """
+    def __init__(
+            self,
+            message: str = "Decompression ratio exceeded",
+            value: str = None,
+            decompressed_bytes: int = 0,
+            compressed_bytes: int = 0,
+            max_ratio: int = 0
+    ):
+        self.message = message
+        self.value = value or (
+            f"{decompressed_bytes} bytes decompressed from {compressed_bytes} bytes, allowed ratio {max_ratio}"
+        )
+        self.decompressed_bytes = decompressed_bytes
+        self.compressed_bytes = compressed_bytes
+        self.max_ratio = max_ratio
+        super().__init__(f"{message}{': ' + self.value if self.value else ''}")
+
+    def __reduce__(self):
+        # Rebuilt from its fields when unpickled, e.g. when raised in a worker process
+        return self.__class__, (
+            self.message, self.value, self.decompressed_bytes, self.compressed_bytes, self.max_ratio
+        )
@@ -0,0 +1,30 @@
+# coding: utf-8
+"""
+Package for exporters of parsed EDIFACT messages.
+
+This package contains functions that export parsed EDIFACT messages into formats
+suited for downstream data processing:
+
+- ndjson_exporter: Exports messages as newline-delimited JSON (NDJSON), either one line
+  per message or one denormalized line per MSCONS measurement (SG10)
+- msgpack_codec: Encodes interchanges as compact binary MessagePack payloads and decodes them
+  again (requires the optional msgpack package)
+- compact_serializer: Serializes interchanges as compact JSON without empty values and optionally
+  with short keys, which can be expanded to the field names again
+- csv_exporter: Exports the measurements of MSCONS interchanges as CSV rows, scanning the raw
+  segments without building the model tree, also for interchanges provided as text chunks
+"""
+from .ndjson_exporter import (
+    NDJSONGranularity, MSCONSMeasurementRecord, MSCONSMeasurementStatus,
+    iter_ndjson_lines, iter_message_lines, iter_measurement_lines, iter_measurement_records, write_ndjson
+)
+from .msgpack_codec import (
+    MSGPACK_MEDIA_TYPE, MSGPACK_SCHEMA_VERSION, is_msgpack_available, encode_interchange, decode_interchange
+)
+from .csv_exporter import (
+    CSV_COLUMNS, iter_measurement_rows, iter_measurement_rows_from_chunks, iter_measurement_csv,
+    iter_measurement_csv_from_chunks, write_measurement_csv
+)
+from .compact_serializer import (
+    to_compact_data, to_compact_json_bytes, get_compact_key, get_short_aliases, expand_short_keys, iter_model_classes
+)
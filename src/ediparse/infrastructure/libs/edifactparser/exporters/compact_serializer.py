@@ -0,0 +1,288 @@
+# coding: utf-8
+"""
+Compact JSON serialization of parsed EDIFACT interchanges.
+
+The default JSON representation contains every field of every segment and segment group
+model, including unset (None) fields and empty lists, with the long German field names as
+keys. For large MSCONS interchanges the keys and empty values make up most of the payload.
+
+The compact representation defined here applies two reductions to all models alike:
+
+- Empty values are omitted: None, empty lists and nested models without any remaining value.
+- Optionally, the field names are replaced by short aliases (short keys).
+
+The short alias of a field is derived from its name, so it is stable as long as the fields of
+a model do not change: segment group fields keep their group prefix (e.g., 'sg10'), fields named
+after a segment keep the segment tag followed by the initials of the remaining words (e.g.,
+'dtm_zeitangaben' becomes 'dtmz') and all other fields use the initials of their words (e.g.,
+'nachrichten_referenznummer' becomes 'nr'). If the alias is already taken by a preceding field
+of the same model, longer prefixes of the words are used (e.g., 'st' for 'status' following
+'statuskategorie'). The complete alias table is documented in docs/compact-short-aliases.md,
+which is generated by scripts/generate_short_alias_docs.py.
+
+Data with short keys can be turned back into data with the field names via expand_short_keys(...),
+e.g. to validate it against the model classes again.
+"""
+
+import re
+import typing
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
+
+import orjson
+from pydantic import BaseModel
+
+from ..wrappers.constants import SegmentType
+from ..wrappers.segments import EdifactInterchange, LazySegment
+
+SEGMENT_GROUP_FIELD_PATTERN = re.compile(r"sg\d+")
+SEGMENT_TAGS = frozenset(segment_type.value.lower() for segment_type in SegmentType)
+WORD_SEPARATOR = "_"
+MESSAGE_TYPE_FIELD = "message_type"
+
+
+def to_compact_data(value: Any, short_keys: bool = False) -> Any:
+    """
+    Converts a model (or a list of models) into its compact representation.
+
+    Args:
+        value (Any): The model, list or plain value to convert
+        short_keys (bool): Whether the field names are replaced by their short aliases, defaults to False
+
+    Returns:
+        Any: The compact representation of the value, None if the value is empty
+    """
+    if isinstance(value, list):
+        items = []
+        for item in value:
+            item = to_compact_data(item, short_keys)
+            if item is not None:
+                items.append(item)
+        return items or None
+    # The fields are looked up by the type of the value, which is considerably faster than isinstance
+    # checks against the model classes (going through the ABC machinery of their metaclass)
+    serialized_fields = _get_serialized_fields(type(value), short_keys)
+    if serialized_fields is not None:
+        if serialized_fields.is_lazy:
+            value.decode()
+        # The field values are read from the instance dictionary and only the fields that may hold
+        # models or lists are converted recursively, all other values are taken over as they are
+        field_values = value.__dict__
+        data = {}
+        for field_name, key, is_plain in serialized_fields.fields:
+            field_value = field_values.get(field_name)
+            if field_value is None:
+                continue
+            if not is_plain:
+                field_value = to_compact_data(field_value, short_keys)
+                if field_value is None:
+                    continue
+            data[key] = field_value
+        return data or None
+    return value
+
+
+def to_compact_json_bytes(model: BaseModel, short_keys: bool = False) -> bytes:
+    """
+    Serializes a model (e.g., an EdifactInterchange) to compact UTF-8 encoded JSON bytes.
+
+    Args:
+        model (BaseModel): The model to serialize
+        short_keys (bool): Whether the field names are replaced by their short aliases, defaults to False
+
+    Returns:
+        bytes: The compact JSON representation, '{}' if the model is empty
+    """
+    data = to_compact_data(model, short_keys)
+    return orjson.dumps(data if data is not None else {})
+
+
+def get_compact_key(model_class: type[BaseModel], field_name: str, short_keys: bool) -> str:
+    """
+    Returns the key of a field in the compact representation.
+
+    Args:
+        model_class (type[BaseModel]): The model class defining the field
+        field_name (str): The name of the field
+        short_keys (bool): Whether the short alias is returned instead of the field name
+
+    Returns:
+        str: The short alias or the field name
+    """
+    return get_short_aliases(model_class)[field_name] if short_keys else field_name
+
+
+@lru_cache(maxsize=None)
+def get_short_aliases(model_class: type[BaseModel]) -> dict[str, str]:
+    """
+    Derives the short aliases of all fields of a model class.
+
+    Args:
+        model_class (type[BaseModel]): The model class
+
+    Returns:
+        dict[str, str]: The short alias per field name, in the field order of the model
+    """
+    aliases: dict[str, str] = {}
+    for field_name in model_class.model_fields:
+        words = [word for word in field_name.split(WORD_SEPARATOR) if word]
+        prefix_length = 1
+        alias = _derive_short_alias(words, prefix_length)
+        while alias in aliases.values() and prefix_length < max(len(word) for word in words):
+            prefix_length += 1
+            alias = _derive_short_alias(words, prefix_length)
+        if alias in aliases.values():
+            alias = field_name
+        aliases[field_name] = alias
+    return aliases
+
+
+def expand_short_keys(data: Any, model_class: type[BaseModel]) -> Any:
+    """
+    Replaces the short aliases in the compact representation of a model by the field names again.
+
+    The models of a union (e.g., the messages of an interchange) are told apart by the 'message_type'
+    entry of their data, keys that are no short alias of the model are kept as they are.
+
+    Args:
+        data (Any): The compact representation with short keys, e.g. a dictionary or a list of dictionaries
+        model_class (type[BaseModel]): The model class of the data
+
+    Returns:
+        Any: The compact representation with the field names as keys
+    """
+    return _expand_short_keys(data, (model_class,))
+
+
+def iter_model_classes(root_class: type[BaseModel] = EdifactInterchange) -> list[type[BaseModel]]:
+    """
+    Collects all model classes reachable from a root model class, e.g. to document their short aliases.
+
+    Args:
+        root_class (type[BaseModel]): The root model class, defaults to EdifactInterchange
+
+    Returns:
+        list[type[BaseModel]]: The model classes in the order of their first occurrence
+    """
+    model_classes: list[type[BaseModel]] = []
+
+    def collect(annotation: Any) -> None:
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            if annotation not in model_classes:
+                model_classes.append(annotation)
+                for field_info in annotation.model_fields.values():
+                    collect(field_info.annotation)
+            return
+        for argument in typing.get_args(annotation):
+            collect(argument)
+
+    collect(root_class)
+    return model_classes
+
+
+def _derive_short_alias(words: list[str], prefix_length: int) -> str:
+    """
+    Derives the short alias of a field from the words of its name.
+    """
+    if SEGMENT_GROUP_FIELD_PATTERN.fullmatch(words[0]):
+        return words[0] + "".join(word[:prefix_length - 1] for word in words[1:])
+    if words[0] in SEGMENT_TAGS and len(words) > 1:
+        return words[0] + "".join(word[:prefix_length] for word in words[1:])
+    return "".join(word[:prefix_length] for word in words)
+
+
+def _collect_model_classes(annotation: Any) -> tuple[type[BaseModel], ...]:
+    """
+    Collects the model classes of a field annotation, e.g. (SegmentDTM,) for list[SegmentDTM].
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return (annotation,)
+    return tuple(
+        model_class for argument in typing.get_args(annotation) for model_class in _collect_model_classes(argument)
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_expanded_fields(model_class: type[BaseModel]) -> dict[str, tuple[str, tuple[type[BaseModel], ...]]]:
+    """
+    Returns the field names and the model classes of the field values per short alias of a model class.
+    """
+    return {
+        alias: (field_name, _collect_model_classes(model_class.model_fields[field_name].annotation))
+        for field_name, alias in get_short_aliases(model_class).items()
+    }
+
+
+def _expand_short_keys(data: Any, model_classes: tuple[type[BaseModel], ...]) -> Any:
+    """
+    Replaces the short aliases in the compact representation of one of the given model classes.
+    """
+    if isinstance(data, list):
+        return [_expand_short_keys(item, model_classes) for item in data]
+    model_class = _select_model_class(model_classes, data)
+    if model_class is None:
+        return data
+    expanded_fields = _get_expanded_fields(model_class)
+    expanded_data = {}
+    for key, value in data.items():
+        field_name, field_model_classes = expanded_fields.get(key, (key, ()))
+        expanded_data[field_name] = _expand_short_keys(value, field_model_classes) if field_model_classes else value
+    return expanded_data
+
+
+def _select_model_class(model_classes: tuple[type[BaseModel], ...], data: Any) -> Optional[type[BaseModel]]:
+    """
+    Selects the model class of the data, by its message type for unions of message classes.
+    """
+    if not isinstance(data, dict) or not model_classes:
+        return None
+    if len(model_classes) == 1:
+        return model_classes[0]
+    message_type = data.get(MESSAGE_TYPE_FIELD)
+    for model_class in model_classes:
+        field_info = model_class.model_fields.get(MESSAGE_TYPE_FIELD)
+        if field_info is not None and field_info.default == message_type:
+            return model_class
+    return None
+
+
+def _is_plain_annotation(annotation: Any) -> bool:
+    """
+    Checks whether the values of a field are neither models nor lists, i.e. taken over as they are.
+    """
+    if annotation is Any or annotation is list or typing.get_origin(annotation) is list:
+        return False
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return False
+    return all(_is_plain_annotation(argument) for argument in typing.get_args(annotation))
+
+
+class _SerializedFields(NamedTuple):
+    """
+    The fields of a model class that are part of its serialization.
+
+    Attributes:
+        fields (tuple[tuple[str, str, bool], ...]): The names, the compact keys and whether the values
+            are plain (see _is_plain_annotation) of the fields
+        is_lazy (bool): Whether the model class is a lazy segment class, which has to be decoded first
+    """
+    fields: tuple[tuple[str, str, bool], ...]
+    is_lazy: bool
+
+
+@lru_cache(maxsize=None)
+def _get_serialized_fields(value_type: type, short_keys: bool) -> Optional[_SerializedFields]:
+    """
+    Returns the fields of a model class that are part of its serialization, None if the type is no model class.
+    """
+    if not issubclass(value_type, BaseModel):
+        return None
+    return _SerializedFields(
+        fields=tuple(
+            (field_name, get_compact_key(value_type, field_name, short_keys),
+             _is_plain_annotation(field_info.annotation))
+            for field_name, field_info in value_type.model_fields.items()
+            if not field_info.exclude
+        ),
+        is_lazy=issubclass(value_type, LazySegment)
+    )
@@ -0,0 +1,322 @@
+# coding: utf-8
+"""
+Streaming CSV export of MSCONS measurement series.
+
+Analysts usually need the measurements of an MSCONS interchange as flat rows, e.g. to load
+them into spreadsheets or databases. Building the complete pydantic model tree and flattening
+it afterwards is expensive for large interchanges, so the export defined here scans the raw
+segments instead: it only tracks the few values of the enclosing segments a row depends on
+and writes each row as soon as its measurement (QTY with its DTM and STS segments) is complete.
+
+Each row consists of the following columns:
+
+- absender_code: The sender of the message (NAD+MS, falling back to the UNB sender)
+- empfaenger_code: The recipient of the message (NAD+MR, falling back to the UNB recipient)
+- ortsangabe_code: The ID of the location (LOC), e.g. the market or metering location
+- produkt_leistungsnummer: The product identification (PIA), e.g. the OBIS code '1-1:1.29.1'
+- beginn_messperiode: The start of the measurement interval (DTM+163)
+- ende_messperiode: The end of the measurement interval (DTM+164)
+- menge_qualifier: The qualifier of the quantity (QTY), e.g. '220' Wahrer Wert
+- menge: The measured value (QTY), with '.' as decimal mark
+- masseinheit_code: The unit of the value (QTY), e.g. 'KWH'
+- statusangaben: The status information (STS), each one as 'statuskategorie:status:statusanlass'
+  codes and several ones separated by '|'
+
+The interchange can also be provided as a sequence of text chunks (iter_measurement_rows_from_chunks and
+iter_measurement_csv_from_chunks), e.g. while an upload is decompressed, so it is never held as one string.
+"""
+
+import csv
+import io
+from itertools import chain
+from typing import Iterable, Iterator, Optional, TextIO
+
+from ..exceptions import EdifactParserException
+from ..utils import EdifactSyntaxHelper
+from ..wrappers.constants import EdifactConstants, SegmentType
+from ..wrappers.context import InitialParsingContext, ParsingContext
+from ..wrappers.segments import SegmentUNA
+
+CSV_COLUMNS = [
+    "absender_code",
+    "empfaenger_code",
+    "ortsangabe_code",
+    "produkt_leistungsnummer",
+    "beginn_messperiode",
+    "ende_messperiode",
+    "menge_qualifier",
+    "menge",
+    "masseinheit_code",
+    "statusangaben",
+]
+
+NAD_QUALIFIER_SENDER = "MS"
+NAD_QUALIFIER_RECIPIENT = "MR"
+DTM_QUALIFIER_BEGIN_OF_MEASUREMENT_PERIOD = "163"
+DTM_QUALIFIER_END_OF_MEASUREMENT_PERIOD = "164"
+STATUS_CODE_SEPARATOR = ":"
+STATUS_SEPARATOR = "|"
+# The UNA segment of chunked inputs has to be found within this many leading characters
+MAX_CHUNKED_HEADER_LENGTH = 64 * 1024
+
+
+def iter_measurement_rows(edifact_text: str) -> Iterator[list[str]]:
+    """
+    Scans an MSCONS interchange and yields one row per measurement (see CSV_COLUMNS).
+
+    The input is validated and split into segments immediately, while the rows are extracted
+    when the returned iterator is consumed. Messages other than MSCONS messages yield no rows.
+
+    Args:
+        edifact_text (str): The MSCONS interchange
+
+    Returns:
+        Iterator[list[str]]: The rows in the order of CSV_COLUMNS
+
+    Raises:
+        EdifactParserException: If the input is not a valid EDIFACT interchange
+    """
+    if not edifact_text:
+        raise EdifactParserException("No valid parsing input. Input was", str(edifact_text))
+
+    context = _create_context(edifact_text)
+    segments = EdifactSyntaxHelper.split_segments(string_content=edifact_text, context=context)
+    if len(segments) <= EdifactConstants.MIN_SEGMENT_COUNT_OF_AN_EDIFACT_MESSAGE:
+        raise EdifactParserException("No valid parsing input. Input was", str(edifact_text))
+
+    return _scan_segments(segments, context)
+
+
+def iter_measurement_rows_from_chunks(edifact_chunks: Iterable[str]) -> Iterator[list[str]]:
+    """
+    Scans an MSCONS interchange provided as a sequence of text chunks and yields one row per measurement.
+
+    The rows equal those of iter_measurement_rows(...) on the joined chunks, but the chunks are split into
+    segments incrementally. Only the header up to the interchange or message header is read immediately.
+
+    Args:
+        edifact_chunks (Iterable[str]): The text chunks of the MSCONS interchange
+
+    Returns:
+        Iterator[list[str]]: The rows in the order of CSV_COLUMNS
+
+    Raises:
+        EdifactParserException: If the input is not a valid EDIFACT interchange, possibly only while the rows
+            are consumed
+    """
+    if edifact_chunks is None:
+        raise EdifactParserException("No valid parsing input. Input was", str(edifact_chunks))
+
+    chunks = iter(edifact_chunks)
+    header = ""
+    # The UNA segment precedes the UNB and UNH segments
+    while SegmentType.UNB not in header and SegmentType.UNH not in header and len(header) <= MAX_CHUNKED_HEADER_LENGTH:
+        chunk = next(chunks, None)
+        if chunk is None:
+            break
+        header += chunk
+    if not header:
+        raise EdifactParserException("No valid parsing input. Input was", header)
+
+    context = _create_context(header)
+    segments = EdifactSyntaxHelper.iter_segments(string_chunks=chain([header], chunks), context=context)
+    return _scan_segments(_check_segment_count(segments), context)
+
+
+def iter_measurement_csv(edifact_text: str, delimiter: str = ",") -> Iterator[str]:
+    """
+    Scans an MSCONS interchange and yields the CSV lines of its measurements, starting with the header line.
+
+    Args:
+        edifact_text (str): The MSCONS interchange
+        delimiter (str): The CSV field delimiter, defaults to ','
+
+    Returns:
+        Iterator[str]: The CSV lines, each terminated by a line break
+
+    Raises:
+        EdifactParserException: If the input is not a valid EDIFACT interchange
+    """
+    rows = iter_measurement_rows(edifact_text)
+    return _render_csv_lines(rows, delimiter)
+
+
+def iter_measurement_csv_from_chunks(edifact_chunks: Iterable[str], delimiter: str = ",") -> Iterator[str]:
+    """
+    Scans an MSCONS interchange provided as a sequence of text chunks and yields the CSV lines of its
+    measurements, starting with the header line.
+
+    Args:
+        edifact_chunks (Iterable[str]): The text chunks of the MSCONS interchange
+        delimiter (str): The CSV field delimiter, defaults to ','
+
+    Returns:
+        Iterator[str]: The CSV lines, each terminated by a line break
+
+    Raises:
+        EdifactParserException: If the input is not a valid EDIFACT interchange, possibly only while the lines
+            are consumed
+    """
+    rows = iter_measurement_rows_from_chunks(edifact_chunks)
+    return _render_csv_lines(rows, delimiter)
+
+
+def write_measurement_csv(edifact_text: str, output: TextIO, delimiter: str = ",") -> int:
+    """
+    Scans an MSCONS interchange and writes the CSV lines of its measurements to a text file-like object.
+
+    Args:
+        edifact_text (str): The MSCONS interchange
+        output (TextIO): The text file-like object to write to (opened with newline='')
+        delimiter (str): The CSV field delimiter, defaults to ','
+
+    Returns:
+        int: The number of written measurement rows (without the header line)
+
+    Raises:
+        EdifactParserException: If the input is not a valid EDIFACT interchange
+    """
+    rows = iter_measurement_rows(edifact_text)
+    writer = csv.writer(output, delimiter=delimiter)
+    writer.writerow(CSV_COLUMNS)
+    amount_of_rows = 0
+    for row in rows:
+        writer.writerow(row)
+        amount_of_rows += 1
+    return amount_of_rows
+
+
+def _render_csv_lines(rows: Iterator[list[str]], delimiter: str) -> Iterator[str]:
+    """
+    Renders the header line and the rows as CSV lines.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=delimiter)
+    writer.writerow(CSV_COLUMNS)
+    yield buffer.getvalue()
+    for row in rows:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(row)
+        yield buffer.getvalue()
+
+
+def _check_segment_count(segments: Iterator[str]) -> Iterator[str]:
+    """
+    Checks the minimum number of segments of an incrementally split input while its segments are handed out.
+    """
+    amount_of_segments = 0
+    for segment in segments:
+        amount_of_segments += 1
+        yield segment
+
+    if amount_of_segments <= EdifactConstants.MIN_SEGMENT_COUNT_OF_AN_EDIFACT_MESSAGE:
+        raise EdifactParserException("No valid parsing input. Input had", f"{amount_of_segments} segments")
+
+
+def _create_context(edifact_text: str) -> ParsingContext:
+    """
+    Creates a parsing context holding the delimiters of the UNA segment, if any.
+    """
+    context = InitialParsingContext()
+    una_segment = EdifactSyntaxHelper.find_and_get_una_segment(edifact_text)
+    if una_segment:
+        context.interchange.una_service_string_advice = SegmentUNA(
+            component_separator=una_segment[3],
+            element_separator=una_segment[4],
+            decimal_mark=una_segment[5],
+            release_character=una_segment[6],
+            reserved=una_segment[7],
+            segment_terminator=una_segment[8]
+        )
+    return context
+
+
+def _scan_segments(segments: Iterable[str], context: ParsingContext) -> Iterator[list[str]]:
+    """
+    Tracks the values of the enclosing segments and yields each measurement once it is complete.
+    """
+    segment_types = [segment_type.value for segment_type in SegmentType]
+    decimal_mark = EdifactSyntaxHelper.get_decimal_mark(context)
+
+    interchange_sender = ""
+    interchange_recipient = ""
+    sender = ""
+    recipient = ""
+    location = ""
+    product = ""
+    measurement: Optional[list[str]] = None
+    statuses: list[str] = []
+
+    for segment in segments:
+        context.segment_count += 1
+        segment_line = segment.strip()
+        if not segment_line or segment_line.startswith(SegmentType.UNA):
+            continue
+        segment_line = EdifactSyntaxHelper.remove_invalid_prefix_from_segment_data(
+            string_content=segment_line,
+            segment_types=segment_types,
+            context=context,
+        )
+        elements = [
+            EdifactSyntaxHelper.split_components(string_content=element, context=context, include_escape_symbol=False)
+            for element in EdifactSyntaxHelper.split_elements(string_content=segment_line, context=context)
+        ]
+        segment_type = elements[0][0]
+
+        # A measurement (SG10) consists of a QTY segment followed by its DTM and STS segments
+        if measurement is not None and segment_type not in (SegmentType.DTM, SegmentType.STS):
+            measurement[-1] = STATUS_SEPARATOR.join(statuses)
+            yield measurement
+            measurement = None
+
+        if segment_type == SegmentType.UNB:
+            interchange_sender = _get_value(elements, 2)
+            interchange_recipient = _get_value(elements, 3)
+        elif segment_type == SegmentType.UNH:
+            sender, recipient, location, product = interchange_sender, interchange_recipient, "", ""
+        elif segment_type == SegmentType.NAD:
+            qualifier = _get_value(elements, 1)
+            if qualifier == NAD_QUALIFIER_SENDER:
+                sender = _get_value(elements, 2) or sender
+            elif qualifier == NAD_QUALIFIER_RECIPIENT:
+                recipient = _get_value(elements, 2) or recipient
+        elif segment_type == SegmentType.LOC:
+            location = _get_value(elements, 2)
+            product = ""
+        elif segment_type == SegmentType.LIN:
+            product = ""
+        elif segment_type == SegmentType.PIA:
+            product = _get_value(elements, 2)
+        elif segment_type == SegmentType.QTY:
+            value = _get_value(elements, 1, 1)
+            if decimal_mark != ".":
+                value = value.replace(decimal_mark, ".")
+            measurement = [
+                sender, recipient, location, product, "", "",
+                _get_value(elements, 1, 0), value, _get_value(elements, 1, 2), ""
+            ]
+            statuses = []
+        elif measurement is not None and segment_type == SegmentType.DTM:
+            qualifier = _get_value(elements, 1, 0)
+            if qualifier == DTM_QUALIFIER_BEGIN_OF_MEASUREMENT_PERIOD:
+                measurement[4] = _get_value(elements, 1, 1)
+            elif qualifier == DTM_QUALIFIER_END_OF_MEASUREMENT_PERIOD:
+                measurement[5] = _get_value(elements, 1, 1)
+        elif measurement is not None and segment_type == SegmentType.STS:
+            statuses.append(STATUS_CODE_SEPARATOR.join(
+                _get_value(elements, element_index) for element_index in (1, 2, 3)
+            ))
+
+    if measurement is not None:
+        measurement[-1] = STATUS_SEPARATOR.join(statuses)
+        yield measurement
+
+
+def _get_value(elements: list[list[str]], element_index: int, component_index: int = 0) -> str:
+    """
+    Returns the component of an element of a segment or an empty string if it is not present.
+    """
+    if element_index >= len(elements) or component_index >= len(elements[element_index]):
+        return ""
+    return elements[element_index][component_index]
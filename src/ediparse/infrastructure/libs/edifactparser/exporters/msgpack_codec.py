@@ -0,0 +1,141 @@
+# coding: utf-8
+"""
+MessagePack encoding of parsed EDIFACT interchanges.
+
+MessagePack is a compact binary alternative to JSON for service-to-service calls: numbers
+are stored in binary form and strings without quoting or escaping, so the payloads are
+smaller and cheaper to decode than the JSON output.
+
+The encoded schema is stable and versioned. The payload is a map with three entries:
+
+- schema_version: The version of the schema, see MSGPACK_SCHEMA_VERSION
+- short_keys: Whether the keys of the interchange are the short aliases of the field names
+- interchange: The interchange in the structure of its JSON representation, with unset
+  (None) fields omitted and each message carrying its message type (e.g., 'MSCONS'), so
+  that decode_interchange(...) restores the EdifactInterchange model
+
+In compact mode the interchange follows the compact representation of the compact_serializer
+instead, i.e. empty lists and empty nested models are omitted as well and the field names are
+optionally replaced by their short aliases, which makes the payload considerably smaller. The
+omitted values are restored as the defaults of their fields by decode_interchange(...).
+
+Version 1 payloads (without the short_keys entry) are still decoded.
+
+The msgpack package is an optional dependency (install the 'msgpack' extra), it is only
+imported when encoding or decoding.
+"""
+
+from typing import Any
+
+from .compact_serializer import MESSAGE_TYPE_FIELD, expand_short_keys, get_compact_key, to_compact_data
+from ..wrappers.segments import EdifactInterchange
+
+MSGPACK_SCHEMA_VERSION = 2
+SUPPORTED_MSGPACK_SCHEMA_VERSIONS = (1, MSGPACK_SCHEMA_VERSION)
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+SCHEMA_VERSION_KEY = "schema_version"
+SHORT_KEYS_KEY = "short_keys"
+INTERCHANGE_KEY = "interchange"
+
+
+def is_msgpack_available() -> bool:
+    """
+    Checks whether the optional msgpack package is installed.
+
+    Returns:
+        bool: True if MessagePack payloads can be encoded and decoded, False otherwise
+    """
+    try:
+        _import_msgpack()
+    except ImportError:
+        return False
+    return True
+
+
+def encode_interchange(interchange: EdifactInterchange, compact: bool = False, short_keys: bool = False) -> bytes:
+    """
+    Encodes a parsed interchange as MessagePack payload.
+
+    Args:
+        interchange (EdifactInterchange): The parsed interchange
+        compact (bool): Whether the interchange is encoded in its compact representation, defaults to False
+        short_keys (bool): Whether the field names are replaced by their short aliases in compact mode,
+            defaults to False
+
+    Returns:
+        bytes: The MessagePack payload
+
+    Raises:
+        ImportError: If the optional msgpack package is not installed
+    """
+    msgpack = _import_msgpack()
+    short_keys = compact and short_keys
+    return msgpack.packb(
+        {
+            SCHEMA_VERSION_KEY: MSGPACK_SCHEMA_VERSION,
+            SHORT_KEYS_KEY: short_keys,
+            INTERCHANGE_KEY: _to_schema(interchange, compact, short_keys)
+        },
+        use_bin_type=True
+    )
+
+
+def decode_interchange(payload: bytes) -> EdifactInterchange:
+    """
+    Decodes a MessagePack payload created by encode_interchange(...) back into an interchange.
+
+    Args:
+        payload (bytes): The MessagePack payload
+
+    Returns:
+        EdifactInterchange: The decoded interchange
+
+    Raises:
+        ImportError: If the optional msgpack package is not installed
+        ValueError: If the payload was encoded with an unsupported schema version
+    """
+    msgpack = _import_msgpack()
+    data = msgpack.unpackb(payload, raw=False)
+    schema_version = data.get(SCHEMA_VERSION_KEY)
+    if schema_version not in SUPPORTED_MSGPACK_SCHEMA_VERSIONS:
+        raise ValueError(
+            f"Unsupported MessagePack schema version '{schema_version}', expected '{MSGPACK_SCHEMA_VERSION}'."
+        )
+    interchange_data = data[INTERCHANGE_KEY]
+    if data.get(SHORT_KEYS_KEY, False):
+        interchange_data = expand_short_keys(interchange_data, EdifactInterchange)
+    return EdifactInterchange.model_validate(interchange_data)
+
+
+def _to_schema(interchange: EdifactInterchange, compact: bool, short_keys: bool) -> dict[str, Any]:
+    """
+    Converts the interchange into the data structure of the MessagePack schema.
+    """
+    # Both representations consist of plain Python values already, so they are packed as they are
+    # instead of being converted into their JSON-compatible form first
+    if compact:
+        interchange.decode_lazy_segments()
+        data = to_compact_data(interchange, short_keys) or {}
+    else:
+        data = interchange.model_dump(exclude_none=True)
+    # The message type is excluded from the JSON representation, but required to restore the messages.
+    # The messages are never empty, as each of them starts with its UNH segment
+    messages_key = get_compact_key(EdifactInterchange, "unh_unt_nachrichten", short_keys)
+    for message_data, message in zip(data.get(messages_key, []), interchange.unh_unt_nachrichten):
+        message_data[MESSAGE_TYPE_FIELD] = message.message_type.value
+    return data
+
+
+def _import_msgpack():
+    """
+    Imports the optional msgpack package.
+    """
+    try:
+        import msgpack
+    except ImportError as ex:
+        raise ImportError(
+            "The MessagePack format requires the optional 'msgpack' package, "
+            "install it via: pip install 'EDIParse[msgpack]'"
+        ) from ex
+    return msgpack
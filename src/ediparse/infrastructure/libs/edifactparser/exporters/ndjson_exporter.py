@@ -0,0 +1,223 @@
+# coding: utf-8
+"""
+Newline-delimited JSON (NDJSON) export of parsed EDIFACT messages.
+
+NDJSON writes one JSON document per line, which allows loaders like Spark or Kafka
+connectors to process the output line by line. The export works on any iterable of
+messages, e.g. the message stream of EdifactParser.iter_messages(...), so large
+interchanges never need to be materialized as one giant JSON document. As every line
+is terminated by a newline, the output of several exports can simply be appended.
+
+Two granularities are supported:
+
+- message: One line per message (EdifactMSconsMessage, EdifactAperakMessage, ...)
+- measurement: One line per MSCONS measurement (SG10), denormalized with the location (LOC),
+  the product identification (PIA, e.g. the OBIS code), the measurement period (DTM 163/164)
+  and the status information (STS). Messages without measurements (e.g. APERAK) yield no lines.
+"""
+
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from pydantic import BaseModel, Field
+
+from ..wrappers.constants import StrEnum
+from ..wrappers.segments import AbstractEdifactMessage, SegmentDTM
+from ..mods.mscons.segments import EdifactMSconsMessage
+
+NDJSON_LINE_SEPARATOR = b"\n"
+
+DTM_QUALIFIER_BEGIN_OF_MEASUREMENT_PERIOD = "163"
+DTM_QUALIFIER_END_OF_MEASUREMENT_PERIOD = "164"
+
+
+class NDJSONGranularity(StrEnum):
+    """
+    Granularity of the NDJSON export, i.e. what a single line represents.
+    """
+    MESSAGE = "message"
+    MEASUREMENT = "measurement"
+
+
+class MSCONSMeasurementStatus(BaseModel):
+    """
+    Status information (STS) of a measurement, reduced to its codes.
+    """
+    statuskategorie_code: Optional[str] = None  # e.g., 'Z33' Plausibilisierungshinweis
+    status_code: Optional[str] = None  # e.g., 'Z83' Kundenselbstablesung
+    statusanlass_code: Optional[str] = None  # e.g., 'Z88'
+
+
+class MSCONSMeasurementRecord(BaseModel):
+    """
+    A single MSCONS measurement (SG10), denormalized with the information of its enclosing segment groups.
+
+    Each record holds the references of its message (UNH, BGM), the location of the measured
+    object (LOC in SG6), the line item and product identification (LIN and PIA in SG9, e.g. the
+    OBIS code) and the measured quantity with its period and status information (QTY, DTM and STS
+    in SG10).
+    """
+    nachrichten_referenznummer: Optional[str] = None  # UNH
+    dokumentennummer: Optional[str] = None  # BGM
+    ortsangabe_qualifier: Optional[str] = None  # LOC, e.g., '172' Meldepunkt
+    ortsangabe_code: Optional[str] = None  # LOC, e.g., the ID of the market or metering location
+    positionsnummer: Optional[str] = None  # LIN
+    produkt_leistungsnummer: Optional[str] = None  # PIA, e.g., the OBIS code '1-1:1.29.1'
+    art_der_produkt_leistungsnummer_code: Optional[str] = None  # PIA, e.g., 'SRW'
+    menge_qualifier: Optional[str] = None  # QTY, e.g., '220' Wahrer Wert
+    menge: Optional[float] = None  # QTY
+    masseinheit_code: Optional[str] = None  # QTY, e.g., 'KWH'
+    beginn_messperiode: Optional[str] = None  # DTM+163
+    ende_messperiode: Optional[str] = None  # DTM+164
+    statusangaben: list[MSCONSMeasurementStatus] = Field(default_factory=list)  # STS
+
+
+def iter_ndjson_lines(
+        messages: Iterable[AbstractEdifactMessage],
+        granularity: NDJSONGranularity = NDJSONGranularity.MESSAGE
+) -> Iterator[bytes]:
+    """
+    Renders the messages as NDJSON lines in the given granularity.
+
+    Args:
+        messages (Iterable[AbstractEdifactMessage]): The parsed messages, e.g. a message stream
+        granularity (NDJSONGranularity): What a single line represents, defaults to one line per message
+
+    Returns:
+        Iterator[bytes]: The UTF-8 encoded lines, each terminated by a newline
+    """
+    if granularity == NDJSONGranularity.MEASUREMENT:
+        return iter_measurement_lines(messages)
+    return iter_message_lines(messages)
+
+
+def iter_message_lines(messages: Iterable[AbstractEdifactMessage]) -> Iterator[bytes]:
+    """
+    Renders one NDJSON line per message.
+
+    Args:
+        messages (Iterable[AbstractEdifactMessage]): The parsed messages
+
+    Returns:
+        Iterator[bytes]: The UTF-8 encoded lines, each terminated by a newline
+    """
+    for message in messages:
+        message.decode_lazy_segments()
+        yield message.__pydantic_serializer__.to_json(message) + NDJSON_LINE_SEPARATOR
+
+
+def iter_measurement_lines(messages: Iterable[AbstractEdifactMessage]) -> Iterator[bytes]:
+    """
+    Renders one NDJSON line per MSCONS measurement (SG10).
+
+    Args:
+        messages (Iterable[AbstractEdifactMessage]): The parsed messages
+
+    Returns:
+        Iterator[bytes]: The UTF-8 encoded lines, each terminated by a newline
+    """
+    for record in iter_measurement_records(messages):
+        yield record.__pydantic_serializer__.to_json(record) + NDJSON_LINE_SEPARATOR
+
+
+def iter_measurement_records(messages: Iterable[AbstractEdifactMessage]) -> Iterator[MSCONSMeasurementRecord]:
+    """
+    Flattens the MSCONS measurements (SG10) of the messages into denormalized records.
+
+    Args:
+        messages (Iterable[AbstractEdifactMessage]): The parsed messages, messages other than
+            MSCONS messages are skipped
+
+    Returns:
+        Iterator[MSCONSMeasurementRecord]: One record per measurement
+    """
+    for message in messages:
+        if not isinstance(message, EdifactMSconsMessage):
+            continue
+        unh = message.unh_nachrichtenkopfsegment
+        bgm = message.bgm_beginn_der_nachricht
+        message_fields = {
+            "nachrichten_referenznummer": unh.nachrichten_referenznummer if unh else None,
+            "dokumentennummer": (
+                bgm.dokumenten_nachrichten_identifikation.dokumentennummer
+                if bgm and bgm.dokumenten_nachrichten_identifikation else None
+            ),
+        }
+        for sg5 in message.sg5_liefer_bzw_bezugsorte:
+            for sg6 in sg5.sg6_wert_und_erfassungsangaben_zum_objekt:
+                loc = sg6.loc_identifikationsangabe
+                location_fields = {
+                    "ortsangabe_qualifier": loc.ortsangabe_qualifier if loc else None,
+                    "ortsangabe_code": loc.ortsangabe.ortsangabe_code if loc and loc.ortsangabe else None,
+                }
+                for sg9 in sg6.sg9_positionsdaten:
+                    lin = sg9.lin_lfd_position
+                    pia = sg9.pia_produktidentifikation
+                    product = pia.waren_leistungsnummer_identifikation if pia else None
+                    position_fields = {
+                        "positionsnummer": lin.positionsnummer if lin else None,
+                        "produkt_leistungsnummer": product.produkt_leistungsnummer if product else None,
+                        "art_der_produkt_leistungsnummer_code": (
+                            product.art_der_produkt_leistungsnummer_code if product else None
+                        ),
+                    }
+                    for sg10 in sg9.sg10_mengen_und_statusangaben:
+                        qty = sg10.qty_mengenangaben
+                        yield MSCONSMeasurementRecord(
+                            **message_fields,
+                            **location_fields,
+                            **position_fields,
+                            menge_qualifier=qty.menge_qualifier if qty else None,
+                            menge=qty.menge if qty else None,
+                            masseinheit_code=qty.masseinheit_code if qty else None,
+                            beginn_messperiode=_find_date(
+                                sg10.dtm_zeitangaben, DTM_QUALIFIER_BEGIN_OF_MEASUREMENT_PERIOD
+                            ),
+                            ende_messperiode=_find_date(
+                                sg10.dtm_zeitangaben, DTM_QUALIFIER_END_OF_MEASUREMENT_PERIOD
+                            ),
+                            statusangaben=[
+                                MSCONSMeasurementStatus(
+                                    statuskategorie_code=(
+                                        sts.statuskategorie.statuskategorie_code if sts.statuskategorie else None
+                                    ),
+                                    status_code=sts.status.status_code if sts.status else None,
+                                    statusanlass_code=sts.statusanlass.statusanlass_code if sts.statusanlass else None,
+                                )
+                                for sts in sg10.sts_statusangaben
+                            ],
+                        )
+
+
+def write_ndjson(
+        messages: Iterable[AbstractEdifactMessage],
+        output: BinaryIO,
+        granularity: NDJSONGranularity = NDJSONGranularity.MESSAGE
+) -> int:
+    """
+    Writes the messages as NDJSON lines to a binary file-like object.
+
+    The output can be opened in append mode to add the lines of several exports to the same file.
+
+    Args:
+        messages (Iterable[AbstractEdifactMessage]): The parsed messages, e.g. a message stream
+        output (BinaryIO): The binary file-like object to write to
+        granularity (NDJSONGranularity): What a single line represents, defaults to one line per message
+
+    Returns:
+        int: The number of written lines
+    """
+    amount_of_lines = 0
+    for line in iter_ndjson_lines(messages, granularity):
+        output.write(line)
+        amount_of_lines += 1
+    return amount_of_lines
+
+
+def _find_date(dates: list[SegmentDTM], qualifier: str) -> Optional[str]:
+    """
+    Returns the value of the first DTM segment with the given qualifier.
+    """
+    for dtm in dates:
+        if dtm.datums_oder_uhrzeits_oder_zeitspannen_funktion_qualifier == qualifier:
+            return dtm.datum_oder_uhrzeit_oder_zeitspanne_wert
+    return None
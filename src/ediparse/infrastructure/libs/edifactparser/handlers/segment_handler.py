@@ -31,8 +31,16 @@ class SegmentHandler(ABC, Generic[T]):
 
     The generic type parameter T represents the specific segment model type that 
     a concrete handler implementation will process.
+
+    If lazy decoding is enabled in the parsing context, the __converter creates a lazy segment
+    from the raw segment line instead, which is tokenized and decoded on first field access.
+    Handlers that need the converted values
+    to update the context (e.g., UNA, UNH) or that operate on interchange level opt out by
+    setting `_supports_lazy_decoding` to False.
     """
 
+    _supports_lazy_decoding: bool = True
+
     def __init__(
             self,
             syntax_helper: EdifactSyntaxHelper,
@@ -46,26 +54,36 @@ class SegmentHandler(ABC, Generic[T]):
                       If None, a message-type-specific __converter will be auto-detected
                       during the handle method execution.
         """
+        self.__syntax_helper = syntax_helper
         self.__converter_factory = SegmentConverterFactory(syntax_helper)
         self.__converter = converter
 
+    @property
+    def converter(self) -> Optional[SegmentConverter[T]]:
+        """
+        The converter of the segments, None until it has been auto-detected while handling the first segment.
+        """
+        return self.__converter
+
     def handle(
             self,
             line_number: int,
-            element_components: list[str],
+            element_components: Optional[list[str]],
             last_segment_type: Optional[str],
             current_segment_group: Optional[SegmentGroup],
-            context: ParsingContext
+            context: ParsingContext,
+            segment_line: Optional[str] = None
     ) -> None:
         """
         Handle a segment by converting it and updating the context.
 
         Args:
             line_number: The line number of the segment in the input file.
-            element_components: The components of the segment.
+            element_components: The components of the segment, None if the segment line has not been tokenized yet.
             last_segment_type: The type of the previous segment.
             current_segment_group: The current segment group.
             context: The parsing context to update.
+            segment_line: The raw segment line, required for lazy decoding or if no element components are given.
         """
         # Check if the context is valid for this handler
         if not self.can_handle(context):
@@ -75,14 +93,26 @@ class SegmentHandler(ABC, Generic[T]):
         if self.__converter is None:
             self.__auto_detect_converter(context)
 
-        # Convert the segment
-        segment = self.__converter.convert(
-            line_number=line_number,
-            element_components=element_components,
-            last_segment_type=last_segment_type,
-            current_segment_group=current_segment_group,
-            context=context
-        )
+        # Convert the segment (or defer its conversion if lazy decoding is enabled)
+        if context.lazy_decoding and self._supports_lazy_decoding and segment_line is not None:
+            segment = self.__converter.convert_lazily(
+                line_number=line_number,
+                segment_line=segment_line,
+                last_segment_type=last_segment_type,
+                current_segment_group=current_segment_group,
+                context=context
+            )
+            context.current_message.register_lazy_segment(segment)
+        else:
+            if element_components is None:
+                element_components = self.__syntax_helper.split_elements(string_content=segment_line, context=context)
+            segment = self.__converter.convert(
+                line_number=line_number,
+                element_components=element_components,
+                last_segment_type=last_segment_type,
+                current_segment_group=current_segment_group,
+                context=context
+            )
 
         # Update the context with the converted segment
         self._update_context(segment, current_segment_group, context)
@@ -17,6 +17,9 @@ class UNASegmentHandler(SegmentHandler[SegmentUNA]):
     When present, it overrides the default delimiters defined by the EDIFACT standard.
     """
 
+    # The UNA segment defines the delimiters used by all other converters, so it is always decoded eagerly
+    _supports_lazy_decoding = False
+
     def __init__(self, syntax_helper: EdifactSyntaxHelper):
         """
         Initialize the UNA segment handler with the appropriate __converter.
@@ -19,6 +19,9 @@ class UNBSegmentHandler(SegmentHandler[SegmentUNB]):
     UNB segment information.
     """
 
+    # Interchange level segment, which does not belong to any message, so it is always decoded eagerly
+    _supports_lazy_decoding = False
+
     def __init__(self, syntax_helper: EdifactSyntaxHelper):
         """
         Initialize the UNB segment handler with the appropriate __converter.
@@ -20,6 +20,9 @@ class UNHSegmentHandler(SegmentHandler[SegmentUNH], ABC):
     provided in their respective mods folders.
     """
 
+    # The message type of the UNH segment is needed to update the context, so it is always decoded eagerly
+    _supports_lazy_decoding = False
+
     def __init__(self, syntax_helper: EdifactSyntaxHelper):
         """
         Initialize the UNH segment handler with the appropriate __converter.
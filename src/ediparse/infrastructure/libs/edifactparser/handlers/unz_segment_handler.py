@@ -20,6 +20,9 @@ class UNZSegmentHandler(SegmentHandler[SegmentUNZ]):
     interchange reference.
     """
 
+    # Interchange level segment, which does not belong to any message, so it is always decoded eagerly
+    _supports_lazy_decoding = False
+
     def __init__(self, syntax_helper: EdifactSyntaxHelper):
         """
         Initialize the UNZ segment handler with the appropriate __converter.
@@ -1,20 +1,37 @@
 # coding: utf-8
 
 import logging
-from typing import Optional
+import time
+from itertools import chain
+from typing import Iterable, Iterator, NamedTuple, Optional
 
 from .exceptions import EdifactParserException
 from .handlers import SegmentHandlerFactory
 from .resolvers.group_state_resolver_factory import GroupStateResolverFactory
-from .utils import EdifactSyntaxHelper
+from .utils import EdifactSyntaxHelper, MemoryBudget, MessageCache, ParserObserver, ParseStage, StageTimings
+from .utils.message_cache import CachedMessage
+from .utils.stage_timings import measure_stage
 from .wrappers.constants import EdifactConstants, SegmentType
 from .wrappers.context import ParsingContext, InitialParsingContext
 from .wrappers.context_factory import ParsingContextFactory
-from .wrappers.segments import EdifactInterchange
+from .wrappers.message_stream import EdifactMessageStream
+from .wrappers.segments import AbstractEdifactMessage, EdifactInterchange
 
 logger = logging.getLogger(__name__)
 
 
+class _PreparedSegment(NamedTuple):
+    """
+    A segment split into its element components, ready to be handled.
+
+    With lazy decoding, the element components are None, as the segment line is only tokenized on demand.
+    """
+    line_number: int
+    segment_line: str
+    element_components: Optional[list[str]]
+    segment_type: str
+
+
 class EdifactParser:
     """
     Parser for EDIFACT-specific messages according to the defined domain model.
@@ -27,21 +44,72 @@ class EdifactParser:
     The parser uses a context-based approach to maintain state during parsing and
     delegates specific segment handling to specialized handlers. It also uses resolvers
     to determine the segment group context during parsing.
+
+    Besides parse, the parser hands out the messages of an interchange one at a time (iter_messages)
+    and accepts inputs provided as text chunks (parse_chunks and iter_messages_from_chunks).
     """
 
+    # The message type of chunked inputs has to be found within this many leading characters
+    MAX_CHUNKED_HEADER_LENGTH = 64 * 1024
+
     def __init__(
             self,
             handler_factory: Optional[SegmentHandlerFactory] = None,
             resolver_factory: Optional[GroupStateResolverFactory] = None,
-            context_factory: Optional[ParsingContextFactory] = None
+            context_factory: Optional[ParsingContextFactory] = None,
+            lazy_decoding: bool = False,
+            message_cache: Optional[MessageCache] = None,
+            observers: Optional[Iterable[ParserObserver]] = None
     ) -> None:
+        """
+        Initializes a new parser.
+
+        Args:
+            handler_factory (Optional[SegmentHandlerFactory]): The factory of the segment handlers
+            resolver_factory (Optional[GroupStateResolverFactory]): The factory of the group state resolvers
+            context_factory (Optional[ParsingContextFactory]): The factory of the parsing contexts
+            lazy_decoding (bool): If true, the segments are only converted on first field access
+                (see wrappers/segments/lazy.py), defaults to False
+            message_cache (Optional[MessageCache]): The cache of the parsed messages, reused across parsing runs
+                (see utils/message_cache.py), defaults to None
+            observers (Optional[Iterable[ParserObserver]]): The observers notified while parsing
+                (see utils/parser_observer.py), defaults to None
+        """
         self.__context: Optional[ParsingContext] = InitialParsingContext()
         self.__syntax_parser = EdifactSyntaxHelper()
         self.__handler_factory = handler_factory or SegmentHandlerFactory(self.__syntax_parser)
         self.__resolver_factory = resolver_factory or GroupStateResolverFactory()
         self.__context_factory = context_factory or ParsingContextFactory()
+        self.__lazy_decoding = lazy_decoding
+        self.__message_cache = message_cache
+        # Replaced instead of modified, so that running parsing runs keep their observers
+        self.__observers: tuple[ParserObserver, ...] = tuple(observers or ())
+
+    def add_observer(self, observer: ParserObserver) -> None:
+        """
+        Registers an observer, which is notified from the next parsing run on.
+
+        Args:
+            observer (ParserObserver): The observer to notify
+        """
+        self.__observers = self.__observers + (observer,)
+
+    def remove_observer(self, observer: ParserObserver) -> None:
+        """
+        Unregisters an observer, which is still notified by running parsing runs.
+
+        Args:
+            observer (ParserObserver): The observer not to notify anymore
+        """
+        self.__observers = tuple(registered for registered in self.__observers if registered is not observer)
 
-    def parse(self, edifact_text: str, max_lines_to_parse: int = -1) -> EdifactInterchange:
+    def parse(
+            self,
+            edifact_text: str,
+            max_lines_to_parse: int = -1,
+            memory_budget: Optional[MemoryBudget] = None,
+            stage_timings: Optional[StageTimings] = None
+    ) -> EdifactInterchange:
         """
         Main method: Reads the EDIFACT-specific message string, splits it at the segment separators,
         and calls the appropriate handler for each segment and resolver for resolving the group state
@@ -50,28 +118,296 @@ class EdifactParser:
         Args:
             edifact_text (str): The string content of the EDIFACT-specific message to parse
             max_lines_to_parse (int): The maximum number of lines to parse, defaults to -1 has no line-parsing limit
+            memory_budget (Optional[MemoryBudget]): The memory budget to account the parsing run against,
+                defaults to None (no accounting). After parsing, it holds the estimate of the allocated memory.
+            stage_timings (Optional[StageTimings]): The timings to record the stages of the parsing run in,
+                defaults to None (no timing)
 
         Returns:
             EdifactInterchange: The parsed interchange object containing the structured content of the EDIFACT-specific message
+
+        Raises:
+            EdifactParserException: If the input is not a valid EDIFACT-specific message
+            ParseMemoryBudgetExceededException: If the estimated memory of the parsing run exceeds the memory budget
         """
-        if edifact_text is None:
-            raise EdifactParserException("No valid parsing input. Input was", str(edifact_text))
+        segments, has_una_segment = self.__prepare_parsing(
+            edifact_text=edifact_text, max_lines_to_parse=max_lines_to_parse, stage_timings=stage_timings
+        )
+        if memory_budget:
+            # Refuse oversized inputs early, before any segment model has been allocated
+            memory_budget.reserve_input(input_length=len(edifact_text), amount_of_segments=len(segments))
 
-        segment_types = [segment_type.value for segment_type in SegmentType]
+        for _ in self.__parse_segments(
+                segments=segments,
+                has_una_segment=has_una_segment,
+                context=self.__context,
+                memory_budget=memory_budget,
+                stage_timings=stage_timings
+        ):
+            pass
+
+        return self.__context.interchange
+
+    def iter_messages(
+            self,
+            edifact_text: str,
+            max_lines_to_parse: int = -1,
+            memory_budget: Optional[MemoryBudget] = None
+    ) -> EdifactMessageStream:
+        """
+        Parses the EDIFACT-specific message string one message at a time.
+
+        In contrast to parse(...), each message is handed out as soon as its UNT segment has been
+        processed and is released from the interchange afterward, so that only one message is held
+        in memory at once. The envelope of the interchange (UNA, UNB and UNZ) is available via the
+        interchange of the returned stream; the UNZ segment only after all messages have been consumed.
+
+        The input is validated before this method returns, so invalid inputs are refused before
+        the first message is parsed.
+
+        Args:
+            edifact_text (str): The string content of the EDIFACT-specific message to parse
+            max_lines_to_parse (int): The maximum number of lines to parse, defaults to -1 has no line-parsing limit
+            memory_budget (Optional[MemoryBudget]): The memory budget to account the parsing run against,
+                defaults to None (no accounting). The segments of released messages are released from the budget.
+
+        Returns:
+            EdifactMessageStream: The stream of the parsed messages
+
+        Raises:
+            EdifactParserException: If the input is not a valid EDIFACT-specific message
+            ParseMemoryBudgetExceededException: If the estimated memory of the parsing run exceeds the memory budget
+        """
+        segments, has_una_segment = self.__prepare_parsing(
+            edifact_text=edifact_text, max_lines_to_parse=max_lines_to_parse
+        )
+        if memory_budget:
+            # Only one message is held at once, so only the raw input can be checked up front
+            memory_budget.reserve_input(input_length=len(edifact_text), amount_of_segments=0)
+
+        context = self.__context
+        return EdifactMessageStream(
+            context=context,
+            messages=self.__release_messages(
+                context=context,
+                messages=self.__parse_segments(
+                    segments=segments,
+                    has_una_segment=has_una_segment,
+                    context=context,
+                    memory_budget=memory_budget
+                ),
+                memory_budget=memory_budget
+            )
+        )
+
+    def parse_chunks(
+            self,
+            edifact_chunks: Iterable[str],
+            max_lines_to_parse: int = -1,
+            memory_budget: Optional[MemoryBudget] = None,
+            stage_timings: Optional[StageTimings] = None
+    ) -> EdifactInterchange:
+        """
+        Parses an EDIFACT-specific message provided as a sequence of text chunks.
+
+        The result equals the one of parse(...) on the joined chunks, but the chunks are split into
+        segments incrementally, so the complete input text is never held in memory.
+
+        Args:
+            edifact_chunks (Iterable[str]): The text chunks of the EDIFACT-specific message to parse
+            max_lines_to_parse (int): The maximum number of lines to parse, defaults to -1 has no line-parsing limit
+            memory_budget (Optional[MemoryBudget]): The memory budget to account the parsing run against,
+                defaults to None (no accounting). After parsing, it holds the estimate of the allocated memory.
+            stage_timings (Optional[StageTimings]): The timings to record the stages of the parsing run in,
+                defaults to None (no timing). The segments are split while they are tokenized, so the
+                splitting (and the reading of the chunks) is part of the tokenize stage.
+
+        Returns:
+            EdifactInterchange: The parsed interchange object containing the structured content of the EDIFACT-specific
+                message
+
+        Raises:
+            EdifactParserException: If the input is not a valid EDIFACT-specific message
+            ParseMemoryBudgetExceededException: If the estimated memory of the parsing run exceeds the memory budget
+        """
+        segments, has_una_segment = self.__prepare_chunked_parsing(
+            edifact_chunks=edifact_chunks, max_lines_to_parse=max_lines_to_parse, stage_timings=stage_timings
+        )
+        for _ in self.__parse_segments(
+                segments=segments,
+                has_una_segment=has_una_segment,
+                context=self.__context,
+                memory_budget=memory_budget,
+                stage_timings=stage_timings
+        ):
+            pass
+
+        return self.__context.interchange
+
+    def iter_messages_from_chunks(
+            self,
+            edifact_chunks: Iterable[str],
+            max_lines_to_parse: int = -1,
+            memory_budget: Optional[MemoryBudget] = None
+    ) -> EdifactMessageStream:
+        """
+        Parses an EDIFACT-specific message provided as a sequence of text chunks one message at a time.
+
+        In contrast to iter_messages(...), only the header of the input (up to the first message
+        type) is validated before this method returns. Violations of the segment limits are raised
+        while the stream is consumed, since the number of segments is unknown up front.
+
+        Args:
+            edifact_chunks (Iterable[str]): The text chunks of the EDIFACT-specific message to parse
+            max_lines_to_parse (int): The maximum number of lines to parse, defaults to -1 has no line-parsing limit
+            memory_budget (Optional[MemoryBudget]): The memory budget to account the parsing run against,
+                defaults to None (no accounting). The segments of released messages are released from the budget.
 
-        has_una_segment = self.__initialize_una_segment_logic_return_if_has_una_segment(edifact_text=edifact_text)
+        Returns:
+            EdifactMessageStream: The stream of the parsed messages
+
+        Raises:
+            EdifactParserException: If the input is not a valid EDIFACT-specific message
+            ParseMemoryBudgetExceededException: If the estimated memory of the parsing run exceeds the memory budget
+        """
+        segments, has_una_segment = self.__prepare_chunked_parsing(
+            edifact_chunks=edifact_chunks, max_lines_to_parse=max_lines_to_parse
+        )
+        context = self.__context
+        return EdifactMessageStream(
+            context=context,
+            messages=self.__release_messages(
+                context=context,
+                messages=self.__parse_segments(
+                    segments=segments,
+                    has_una_segment=has_una_segment,
+                    context=context,
+                    memory_budget=memory_budget
+                ),
+                memory_budget=memory_budget
+            )
+        )
+
+    def __initialize_context(self, edifact_text: str, stage_timings: Optional[StageTimings] = None) -> bool:
+        """
+        Creates the parsing context for the message type of the input, including the delimiters of its UNA segment.
+
+        Args:
+            edifact_text (str): The string content (or at least its header) of the EDIFACT-specific message to parse
+            stage_timings (Optional[StageTimings]): The timings to record the detection stages in, defaults to None
+
+        Returns:
+            bool: Whether the input has a UNA segment
+
+        Raises:
+            EdifactParserException: If no valid message type is found in the input
+        """
+        # Start each parsing run with a clean context, so that nothing leaks from previous runs
+        self.__context = InitialParsingContext()
+        with measure_stage(stage_timings, ParseStage.UNA):
+            has_una_segment = self.__initialize_una_segment_logic_return_if_has_una_segment(edifact_text=edifact_text)
         interchange_cached = None
         if has_una_segment:
             interchange_cached = self.__context.interchange
 
         # Updates the parsing context by specifying the algorithm to be used for the message type to be parsed (e.g., APERAK, MSCONS, etc.).
-        self.__context = self.__context_factory.identify_and_create_context(
-            edifact_text=edifact_text, parsing_context=self.__context
-        )
+        with measure_stage(stage_timings, ParseStage.MESSAGE_TYPE):
+            self.__context = self.__context_factory.identify_and_create_context(
+                edifact_text=edifact_text, parsing_context=self.__context
+            )
         if interchange_cached:
             self.__context.interchange = interchange_cached
+        self.__context.lazy_decoding = self.__lazy_decoding
+        return has_una_segment
+
+    def __prepare_chunked_parsing(
+            self,
+            edifact_chunks: Iterable[str],
+            max_lines_to_parse: int,
+            stage_timings: Optional[StageTimings] = None
+    ) -> tuple[Iterator[str], bool]:
+        """
+        Reads the header of a chunked input, creates the parsing context for its message type
+        and splits the input into segments incrementally.
+
+        Args:
+            edifact_chunks (Iterable[str]): The text chunks of the EDIFACT-specific message to parse
+            max_lines_to_parse (int): The maximum number of lines to parse, -1 has no line-parsing limit
+            stage_timings (Optional[StageTimings]): The timings to record the detection stages in, defaults to None
+
+        Returns:
+            tuple[Iterator[str], bool]: The segments of the EDIFACT-specific message and whether it has a UNA segment
+        """
+        if edifact_chunks is None:
+            raise EdifactParserException("No valid parsing input. Input was", str(edifact_chunks))
+
+        chunks = iter(edifact_chunks)
+        header = ""
+        while True:
+            chunk = next(chunks, None)
+            if chunk is not None:
+                header += chunk
+            try:
+                has_una_segment = self.__initialize_context(edifact_text=header, stage_timings=stage_timings)
+                break
+            except EdifactParserException:
+                # The message type is not contained in the header read so far
+                if chunk is None or len(header) > self.MAX_CHUNKED_HEADER_LENGTH:
+                    raise
+
+        segments = self.__syntax_parser.iter_segments(string_chunks=chain([header], chunks), context=self.__context)
+        return self.__check_segment_count(segments=segments, max_lines_to_parse=max_lines_to_parse), has_una_segment
+
+    @staticmethod
+    def __check_segment_count(segments: Iterator[str], max_lines_to_parse: int) -> Iterator[str]:
+        """
+        Checks the segment limits of an incrementally split input while its segments are handed out.
+
+        Args:
+            segments (Iterator[str]): The segments of the EDIFACT-specific message
+            max_lines_to_parse (int): The maximum number of lines to parse, -1 has no line-parsing limit
+
+        Returns:
+            Iterator[str]: The segments of the EDIFACT-specific message
+        """
+        amount_of_segments = 0
+        for segment in segments:
+            amount_of_segments += 1
+            if 0 < max_lines_to_parse < amount_of_segments:
+                raise EdifactParserException(
+                    f"Maximum number of segments reached (max: {max_lines_to_parse} less than number of segments: "
+                    f"at least {amount_of_segments})"
+                )
+            yield segment
+
+        if amount_of_segments <= EdifactConstants.MIN_SEGMENT_COUNT_OF_AN_EDIFACT_MESSAGE:
+            raise EdifactParserException("No valid parsing input. Input had", f"{amount_of_segments} segments")
+
+    def __prepare_parsing(
+            self,
+            edifact_text: str,
+            max_lines_to_parse: int,
+            stage_timings: Optional[StageTimings] = None
+    ) -> tuple[list[str], bool]:
+        """
+        Validates the input, creates the parsing context for the message type and splits the input into segments.
 
-        segments = self.__syntax_parser.split_segments(string_content=edifact_text, context=self.__context)
+        Args:
+            edifact_text (str): The string content of the EDIFACT-specific message to parse
+            max_lines_to_parse (int): The maximum number of lines to parse, -1 has no line-parsing limit
+            stage_timings (Optional[StageTimings]): The timings to record the detection and split stages in,
+                defaults to None
+
+        Returns:
+            tuple[list[str], bool]: The segments of the EDIFACT-specific message and whether it has a UNA segment
+        """
+        if edifact_text is None:
+            raise EdifactParserException("No valid parsing input. Input was", str(edifact_text))
+
+        has_una_segment = self.__initialize_context(edifact_text=edifact_text, stage_timings=stage_timings)
+
+        with measure_stage(stage_timings, ParseStage.SPLIT):
+            segments = self.__syntax_parser.split_segments(string_content=edifact_text, context=self.__context)
         amount_of_segments = len(segments)
 
         if amount_of_segments <= EdifactConstants.MIN_SEGMENT_COUNT_OF_AN_EDIFACT_MESSAGE:
@@ -81,13 +417,161 @@ class EdifactParser:
             raise EdifactParserException(
                 f"Maximum number of segments reached (max: {max_lines_to_parse} less than number of segments: {amount_of_segments})")
 
-        group_state_resolver = self.__resolver_factory.get_resolver(self.__context.message_type)
+        return segments, has_una_segment
+
+    def __parse_segments(
+            self,
+            segments: Iterable[str],
+            has_una_segment: bool,
+            context: ParsingContext,
+            memory_budget: Optional[MemoryBudget],
+            stage_timings: Optional[StageTimings] = None
+    ) -> Iterator[AbstractEdifactMessage]:
+        """
+        Processes the segments one by one and yields each message as soon as its UNT segment has been processed.
+
+        With a message cache, the segments are processed message by message instead: the parsed
+        message of an unchanged UNH..UNT span is reused from the cache, while the segments of other
+        spans are processed one by one and the parsed message is cached afterward.
+
+        Args:
+            segments (Iterable[str]): The segments of the EDIFACT-specific message
+            has_una_segment (bool): Whether the first segment is the already processed UNA segment
+            context (ParsingContext): The parsing context of the parsing run
+            memory_budget (Optional[MemoryBudget]): The memory budget to account the parsed segments against
+            stage_timings (Optional[StageTimings]): The timings to record the per-segment stages in, defaults to None
 
+        Returns:
+            Iterator[AbstractEdifactMessage]: The completely parsed messages
+        """
+        group_state_resolver = self.__resolver_factory.get_resolver(context.message_type)
+        observers = self.__observers
+        prepared_segments = self.__prepare_segments(
+            segments=segments, has_una_segment=has_una_segment, context=context
+        )
+        if stage_timings is not None:
+            prepared_segments = stage_timings.measure_iterator(ParseStage.TOKENIZE, prepared_segments)
+        # Lazily decoded messages are modified on first field access, so they are never shared
+        message_cache = None if context.lazy_decoding else self.__message_cache
+        if message_cache is None:
+            spans = ([prepared_segment] for prepared_segment in prepared_segments)
+        else:
+            spans = self.__group_message_spans(prepared_segments)
+
+        reused_messages = 0
+        parsed_messages = 0
         last_segment_type: Optional[str] = None
         current_segment_group: Optional[str] = None
+        for span in spans:
+            message_key = None
+            if message_cache is not None and span[0].segment_type == SegmentType.UNH \
+                    and span[-1].segment_type == SegmentType.UNT:
+                message_key = message_cache.make_key(
+                    segment_lines=(prepared_segment.segment_line for prepared_segment in span), context=context
+                )
+                cached_message = message_cache.get(message_key)
+                if cached_message is not None:
+                    if memory_budget:
+                        memory_budget.reused_messages += 1
+                        for _ in range(cached_message.segment_count):
+                            memory_budget.account_segment()
+                    context.reset_for_new_message()
+                    context.interchange.unh_unt_nachrichten.append(cached_message.message)
+                    context.current_message = cached_message.message
+                    reused_messages += 1
+                    for observer in observers:
+                        observer.on_message_end(cached_message.message)
+                    yield cached_message.message
+                    last_segment_type = SegmentType.UNT
+                    current_segment_group = cached_message.segment_group
+                    continue
+                parsed_messages += 1
+                if memory_budget:
+                    memory_budget.parsed_messages += 1
+
+            handled_segments = 0
+            for prepared_segment in span:
+                segment_type = prepared_segment.segment_type
+                if stage_timings is not None:
+                    resolution_start = time.perf_counter()
+                current_segment_group = group_state_resolver.resolve_and_get_segment_group(
+                    current_segment_type=segment_type,
+                    current_segment_group=current_segment_group,
+                    context=context
+                )
+                if stage_timings is not None:
+                    conversion_start = time.perf_counter()
+                    stage_timings.add(ParseStage.GROUP_RESOLUTION, conversion_start - resolution_start)
+
+                segment_handler = self.__handler_factory.get_handler(segment_type, context)
+                if segment_handler:
+                    if memory_budget:
+                        memory_budget.account_segment()
+                    if observers:
+                        for observer in observers:
+                            observer.on_segment_start(segment_type, current_segment_group)
+                    # Use the dedicated handler
+                    try:
+                        segment_handler.handle(
+                            line_number=prepared_segment.line_number,
+                            element_components=prepared_segment.element_components,
+                            last_segment_type=last_segment_type,
+                            current_segment_group=current_segment_group,
+                            context=context,
+                            segment_line=prepared_segment.segment_line
+                        )
+                    except Exception as ex:
+                        for observer in observers:
+                            observer.on_error(ex, segment_type, prepared_segment.line_number)
+                        raise
+                    if observers:
+                        for observer in observers:
+                            observer.on_segment_end(segment_type, current_segment_group, segment_handler)
+                    if stage_timings is not None:
+                        stage_timings.add(ParseStage.CONVERSION, time.perf_counter() - conversion_start)
+                    handled_segments += 1
+                    if segment_type == SegmentType.UNT and context.current_message:
+                        if message_key is not None:
+                            message_cache.put(message_key, CachedMessage(
+                                message=context.current_message,
+                                segment_count=handled_segments,
+                                segment_group=current_segment_group
+                            ))
+                        for observer in observers:
+                            observer.on_message_end(context.current_message)
+                        yield context.current_message
+                last_segment_type = segment_type
+
+        if message_cache is not None:
+            logger.info(
+                f"Reused {reused_messages} of {reused_messages + parsed_messages} messages from the message cache"
+            )
+
+    def __prepare_segments(
+            self,
+            segments: Iterable[str],
+            has_una_segment: bool,
+            context: ParsingContext
+    ) -> Iterator[_PreparedSegment]:
+        """
+        Splits the segments into their element components and skips the empty ones and the UNA segment.
+
+        With lazy decoding, only the segment type is determined: the segment handlers tokenize the
+        segments they convert eagerly, while lazy segments are tokenized on first field access.
+
+        Args:
+            segments (Iterable[str]): The segments of the EDIFACT-specific message
+            has_una_segment (bool): Whether the first segment is the already processed UNA segment
+            context (ParsingContext): The parsing context of the parsing run
+
+        Returns:
+            Iterator[_PreparedSegment]: The segments to process
+        """
+        segment_types = [segment_type.value for segment_type in SegmentType]
+        lazy_decoding = context.lazy_decoding
         for segment in segments:
-            self.__context.segment_count += 1
-            line_number = self.__context.segment_count
+            context.segment_count += 1
+            line_number = context.segment_count
 
             segment_line = segment.strip()
             if not segment_line:
@@ -100,41 +584,96 @@ class EdifactParser:
             segment_line = self.__syntax_parser.remove_invalid_prefix_from_segment_data(
                 string_content=segment_line,
                 segment_types=segment_types,
-                context=self.__context,
+                context=context,
             )
 
+            if lazy_decoding:
+                segment_type = self.__syntax_parser.get_segment_type(string_content=segment_line, context=context)
+                if segment_type:
+                    yield _PreparedSegment(
+                        line_number=line_number,
+                        segment_line=segment_line,
+                        element_components=None,
+                        segment_type=segment_type
+                    )
+                continue
+
             element_components = self.__syntax_parser.split_elements(
                 string_content=segment_line,
-                context=self.__context
+                context=context
             )
             if not element_components:
                 continue
             segment_type_components = self.__syntax_parser.split_components(
                 string_content=element_components[0],
-                context=self.__context
+                context=context
             )
             if not segment_type_components:
                 continue
-            segment_type = segment_type_components[0]
-            current_segment_group = group_state_resolver.resolve_and_get_segment_group(
-                current_segment_type=segment_type,
-                current_segment_group=current_segment_group,
-                context=self.__context
+            yield _PreparedSegment(
+                line_number=line_number,
+                segment_line=segment_line,
+                element_components=element_components,
+                segment_type=segment_type_components[0]
             )
 
-            segment_handler = self.__handler_factory.get_handler(segment_type, self.__context)
-            if segment_handler:
-                # Use the dedicated handler
-                segment_handler.handle(
-                    line_number=line_number,
-                    element_components=element_components,
-                    last_segment_type=last_segment_type,
-                    current_segment_group=current_segment_group,
-                    context=self.__context
-                )
-            last_segment_type = segment_type
+    @staticmethod
+    def __group_message_spans(prepared_segments: Iterator[_PreparedSegment]) -> Iterator[list[_PreparedSegment]]:
+        """
+        Groups the segments of each UNH..UNT span, while the segments outside of messages stay on their own.
 
-        return self.__context.interchange
+        A span missing its UNT segment ends before the next UNH segment or at the end of the input.
+
+        Args:
+            prepared_segments (Iterator[_PreparedSegment]): The segments to process
+
+        Returns:
+            Iterator[list[_PreparedSegment]]: The spans of the segments
+        """
+        span: list[_PreparedSegment] = []
+        for prepared_segment in prepared_segments:
+            if prepared_segment.segment_type == SegmentType.UNH:
+                if span:
+                    yield span
+                span = [prepared_segment]
+            elif span:
+                span.append(prepared_segment)
+                if prepared_segment.segment_type == SegmentType.UNT:
+                    yield span
+                    span = []
+            else:
+                yield [prepared_segment]
+        if span:
+            yield span
+
+    @staticmethod
+    def __release_messages(
+            context: ParsingContext,
+            messages: Iterator[AbstractEdifactMessage],
+            memory_budget: Optional[MemoryBudget]
+    ) -> Iterator[AbstractEdifactMessage]:
+        """
+        Releases each parsed message from the interchange and hands it out.
+
+        Args:
+            context (ParsingContext): The parsing context holding the interchange
+            messages (Iterator[AbstractEdifactMessage]): The parsed messages
+            memory_budget (Optional[MemoryBudget]): The memory budget to release the segments of the messages from
+
+        Returns:
+            Iterator[AbstractEdifactMessage]: The parsed messages
+        """
+        accounted_segments = 0
+        for message in messages:
+            parsed_messages = context.interchange.unh_unt_nachrichten
+            if parsed_messages and parsed_messages[-1] is message:
+                parsed_messages.pop()
+            if context.current_message is message:
+                context.current_message = None
+            yield message
+            if memory_budget:
+                memory_budget.release_segments(memory_budget.segment_count - accounted_segments)
+                accounted_segments = memory_budget.segment_count
 
     def __initialize_una_segment_logic_return_if_has_una_segment(self, edifact_text: str) -> bool:
         """
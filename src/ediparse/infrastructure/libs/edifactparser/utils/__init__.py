@@ -7,5 +7,22 @@ This package contains utility classes that support the EDIFACT parsing process:
 - EdifactSyntaxHelper: Provides methods for parsing and manipulating EDIFACT syntax,
   including splitting segments, elements, and components according to the EDIFACT
   standard's delimiter rules.
+- MemoryBudget: Keeps a running estimate of the memory allocated by a parsing run and
+  aborts the run once a configurable budget is exceeded.
+- decompression: Decompresses gzip and zip inputs incrementally to text chunks, guarded by
+  a maximum decompression ratio.
+- archive: Reads the files of zip and tar archives one after another, guarded by a maximum
+  decompression ratio.
+- MessageCache: Keeps the parsed messages of recent parsing runs, keyed by the hash of their raw
+  segment spans, so that unchanged messages of a resubmitted interchange are not parsed again.
+- StageTimings: Accumulates the durations of the stages of a parsing run (e.g. tokenizing,
+  group resolution and conversion of the segments), if they are requested.
+- ParserObserver: Instrumentation hooks notified around the handling of every segment, with
+  built-in observers counting the segments per segment type (SegmentTypeCounter) and recording
+  the durations per converter (ConverterTimingObserver).
 """
 from .edifact_syntax_helper import EdifactSyntaxHelper
+from .memory_budget import MemoryBudget
+from .message_cache import MessageCache
+from .parser_observer import ConverterTimingObserver, ParserObserver, SegmentTypeCounter
+from .stage_timings import ParseStage, StageTimings
@@ -0,0 +1,247 @@
+# coding: utf-8
+"""
+Sequential reading of the files of zip and tar archives.
+
+Archives of EDIFACT files (e.g., the MSCONS files of a month-end reprocessing) are read entry
+by entry, so that only the entries currently being processed are held in memory besides the
+archive itself. Tar archives may be compressed with gzip, bzip2 or xz and are read as a stream,
+i.e. without seeking, so the archive can also be provided as an unseekable file object.
+
+Since the entries of an archive can expand to an arbitrary amount of data (decompression bomb),
+the total size of the read entries is checked against the archive size while reading, and the
+reading is aborted once the allowed ratio is exceeded.
+"""
+
+import io
+import tarfile
+import zipfile
+from typing import BinaryIO, Iterator, NamedTuple, Union
+
+from ..exceptions import DecompressionRatioExceededException, EdifactParserException
+from ..wrappers.constants import StrEnum
+from .decompression import (
+    DEFAULT_DECOMPRESSION_CHUNK_SIZE, DEFAULT_MAX_DECOMPRESSION_RATIO, DEFAULT_TEXT_ENCODING, FALLBACK_TEXT_ENCODING,
+    ZIP_MAGIC_NUMBER
+)
+
+
+class ArchiveFormat(StrEnum):
+    """
+    The supported archive formats.
+    """
+    ZIP = "zip"
+    TAR = "tar"
+
+
+class ArchiveEntry(NamedTuple):
+    """
+    A file of an archive.
+
+    Attributes:
+        name (str): The path of the file within the archive
+        content (bytes): The content of the file
+    """
+    name: str
+    content: bytes
+
+    def decode(self) -> str:
+        """
+        Decodes the content of the file, attempting UTF-8 first and falling back to ISO-8859-1.
+
+        Returns:
+            str: The decoded content
+        """
+        try:
+            return self.content.decode(DEFAULT_TEXT_ENCODING)
+        except UnicodeDecodeError:
+            return self.content.decode(FALLBACK_TEXT_ENCODING)
+
+
+def iter_archive_entries(
+        archive: Union[bytes, BinaryIO],
+        max_ratio: int = DEFAULT_MAX_DECOMPRESSION_RATIO
+) -> Iterator[ArchiveEntry]:
+    """
+    Reads the files of a zip or tar archive one after another, skipping directories and other non-file entries.
+
+    The archive format is detected from the leading bytes of the archive. The archive is opened
+    before this function returns, so unsupported or invalid archives are refused right away.
+    Zip archives have to be provided as bytes or seekable file object.
+
+    Args:
+        archive (Union[bytes, BinaryIO]): The archive, either as bytes or as binary file object
+        max_ratio (int): The allowed ratio of the total size of the files to the archive size (or to the
+            bytes read so far, if the size of the archive is unknown), defaults to DEFAULT_MAX_DECOMPRESSION_RATIO
+            (0 or less disables the check)
+
+    Returns:
+        Iterator[ArchiveEntry]: The files of the archive in archive order
+
+    Raises:
+        EdifactParserException: If the archive is neither a zip nor a tar archive, or if it is invalid
+        DecompressionRatioExceededException: If the files expand beyond the allowed ratio (while iterating)
+    """
+    counting_reader = _CountingReader(io.BytesIO(archive) if isinstance(archive, (bytes, bytearray)) else archive)
+    archive_file = counting_reader
+    if not counting_reader.seekable() and not hasattr(counting_reader.raw, "peek"):
+        # The leading bytes of unseekable streams can only be inspected through a buffer
+        archive_file = io.BufferedReader(counting_reader)
+    ratio_guard = _RatioGuard(max_ratio, archive_size=_get_size(archive_file), archive_file=counting_reader)
+    if detect_archive_format(archive_file) == ArchiveFormat.ZIP:
+        return _iter_zip_entries(_open_zip(archive_file), ratio_guard)
+    return _iter_tar_entries(_open_tar(archive_file), ratio_guard)
+
+
+def detect_archive_format(archive_file: BinaryIO) -> ArchiveFormat:
+    """
+    Detects the format of an archive from its leading bytes, without consuming them.
+
+    Args:
+        archive_file (BinaryIO): The archive as binary file object, which has to be seekable
+            or to provide a peek() method
+
+    Returns:
+        ArchiveFormat: ArchiveFormat.ZIP for zip archives, ArchiveFormat.TAR for all other
+            inputs, which are validated when the tar archive is opened
+    """
+    if hasattr(archive_file, "peek"):
+        leading_bytes = archive_file.peek(len(ZIP_MAGIC_NUMBER))
+    else:
+        position = archive_file.tell()
+        leading_bytes = archive_file.read(len(ZIP_MAGIC_NUMBER))
+        archive_file.seek(position)
+    return ArchiveFormat.ZIP if leading_bytes.startswith(ZIP_MAGIC_NUMBER) else ArchiveFormat.TAR
+
+
+class _CountingReader(io.RawIOBase):
+    """
+    Binary reader counting the bytes read from the wrapped file object.
+    """
+
+    def __init__(self, raw: BinaryIO) -> None:
+        super().__init__()
+        self.raw = raw
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self.raw.seekable() if hasattr(self.raw, "seekable") else False
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.raw.read(size)
+        self.bytes_read += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def peek(self, size: int = 0) -> bytes:
+        if hasattr(self.raw, "peek"):
+            return self.raw.peek(size)[:size]
+        position = self.raw.tell()
+        data = self.raw.read(size)
+        self.raw.seek(position)
+        return data
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self.raw.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.raw.tell()
+
+
+class _RatioGuard:
+    """
+    Reads the files of an archive in chunks while checking the total size against the allowed ratio.
+    """
+
+    def __init__(self, max_ratio: int, archive_size: int, archive_file: _CountingReader) -> None:
+        self.__max_ratio = max_ratio
+        self.__archive_size = archive_size
+        self.__archive_file = archive_file
+        self.__total_bytes = 0
+
+    def read(self, member_file: BinaryIO) -> bytes:
+        chunks = []
+        while True:
+            chunk = member_file.read(DEFAULT_DECOMPRESSION_CHUNK_SIZE)
+            if not chunk:
+                return b"".join(chunks)
+            self.__total_bytes += len(chunk)
+            # The size of unseekable archives is unknown, the bytes read so far are used instead
+            compressed_bytes = self.__archive_size or self.__archive_file.bytes_read
+            if 0 < self.__max_ratio and self.__max_ratio * max(compressed_bytes, 1) < self.__total_bytes:
+                raise DecompressionRatioExceededException(
+                    decompressed_bytes=self.__total_bytes,
+                    compressed_bytes=compressed_bytes,
+                    max_ratio=self.__max_ratio
+                )
+            chunks.append(chunk)
+
+
+def _get_size(archive_file: BinaryIO) -> int:
+    """
+    Determines the size of the remaining archive, 0 if the file object is not seekable.
+    """
+    try:
+        position = archive_file.tell()
+        size = archive_file.seek(0, io.SEEK_END) - position
+        archive_file.seek(position)
+        return size
+    except (AttributeError, OSError):
+        return 0
+
+
+def _open_zip(archive_file: BinaryIO) -> zipfile.ZipFile:
+    """
+    Opens a zip archive.
+    """
+    try:
+        return zipfile.ZipFile(archive_file)
+    except (zipfile.BadZipFile, zipfile.LargeZipFile, OSError) as e:
+        raise EdifactParserException("Invalid zip archive", str(e)) from e
+
+
+def _open_tar(archive_file: BinaryIO) -> tarfile.TarFile:
+    """
+    Opens a (possibly compressed) tar archive for reading as a stream.
+    """
+    try:
+        return tarfile.open(fileobj=archive_file, mode="r|*")
+    except (tarfile.TarError, EOFError, OSError) as e:
+        raise EdifactParserException(
+            "Unsupported archive format, expected a zip or tar archive", str(e)
+        ) from e
+
+
+def _iter_zip_entries(archive: zipfile.ZipFile, ratio_guard: _RatioGuard) -> Iterator[ArchiveEntry]:
+    """
+    Reads the files of a zip archive one after another.
+    """
+    with archive:
+        for member in archive.infolist():
+            if member.is_dir():
+                continue
+            try:
+                with archive.open(member) as member_file:
+                    content = ratio_guard.read(member_file)
+            except (zipfile.BadZipFile, zipfile.LargeZipFile, NotImplementedError, RuntimeError, EOFError) as e:
+                raise EdifactParserException("Invalid zip archive", f"{member.filename}: {e}") from e
+            yield ArchiveEntry(name=member.filename, content=content)
+
+
+def _iter_tar_entries(archive: tarfile.TarFile, ratio_guard: _RatioGuard) -> Iterator[ArchiveEntry]:
+    """
+    Reads the files of a tar archive one after another.
+    """
+    with archive:
+        try:
+            for member in archive:
+                if member.isfile():
+                    yield ArchiveEntry(name=member.name, content=ratio_guard.read(archive.extractfile(member)))
+        except (tarfile.TarError, EOFError, OSError) as e:
+            raise EdifactParserException("Invalid tar archive", str(e)) from e
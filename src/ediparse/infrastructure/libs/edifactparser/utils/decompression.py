@@ -0,0 +1,243 @@
+# coding: utf-8
+"""
+Incremental decompression of compressed EDIFACT inputs.
+
+EDIFACT files are often exchanged as gzip files or zip archives. The functions defined here
+decompress such inputs chunk by chunk and decode the chunks to text, so that they can be fed
+straight into the parser (see EdifactParser.parse_chunks(...)) without ever holding the complete
+decompressed text in memory. The compressed input is either given as bytes or as seekable binary
+file (e.g., a spooled upload), which is read chunk by chunk as well.
+
+Since a small compressed input can expand to an arbitrary amount of data (decompression bomb),
+the decompressed size is checked against the compressed size after every chunk and the
+decompression is aborted once the allowed ratio is exceeded.
+"""
+
+import codecs
+import io
+import zipfile
+import zlib
+from typing import BinaryIO, Iterator, Optional, Union
+
+from ..exceptions import DecompressionRatioExceededException, EdifactParserException
+from ..wrappers.constants import StrEnum
+
+# EDIFACT files typically compress by a factor of 10 to 20
+DEFAULT_MAX_DECOMPRESSION_RATIO = 100
+DEFAULT_DECOMPRESSION_CHUNK_SIZE = 64 * 1024
+
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+ZIP_MAGIC_NUMBER = b"PK\x03\x04"
+
+DEFAULT_TEXT_ENCODING = "utf-8"
+# ISO-8859-1 (Latin-1) is a common encoding for EDIFACT files and can decode all byte values
+FALLBACK_TEXT_ENCODING = "iso-8859-1"
+
+
+class CompressionFormat(StrEnum):
+    """
+    The supported compression formats of EDIFACT inputs.
+    """
+    GZIP = "gzip"
+    ZIP = "zip"
+
+
+def detect_compression_format(data: bytes, content_encoding: Optional[str] = None) -> Optional[CompressionFormat]:
+    """
+    Detects the compression format of an input from its Content-Encoding or its leading bytes.
+
+    Args:
+        data (bytes): The (possibly compressed) input
+        content_encoding (Optional[str]): The Content-Encoding of the input, if any
+
+    Returns:
+        Optional[CompressionFormat]: The compression format, None if the input is not compressed
+
+    Raises:
+        EdifactParserException: If the Content-Encoding is not supported
+    """
+    if content_encoding:
+        encoding = content_encoding.strip().lower()
+        if encoding in ("gzip", "x-gzip"):
+            return CompressionFormat.GZIP
+        if encoding != "identity":
+            raise EdifactParserException("Unsupported content encoding", content_encoding)
+    if data.startswith(GZIP_MAGIC_NUMBER):
+        return CompressionFormat.GZIP
+    if data.startswith(ZIP_MAGIC_NUMBER):
+        return CompressionFormat.ZIP
+    return None
+
+
+def iter_decompressed_chunks(
+        data: Union[bytes, BinaryIO],
+        compression_format: CompressionFormat,
+        max_ratio: int = DEFAULT_MAX_DECOMPRESSION_RATIO,
+        chunk_size: int = DEFAULT_DECOMPRESSION_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Decompresses an input chunk by chunk.
+
+    Gzip inputs may consist of several members, which are decompressed one after another.
+    Zip archives have to contain exactly one file. The archive is opened before this function
+    returns, so invalid archives are refused right away.
+
+    Args:
+        data (Union[bytes, BinaryIO]): The compressed input or a seekable binary file positioned at its start
+        compression_format (CompressionFormat): The compression format of the input
+        max_ratio (int): The allowed ratio of decompressed to compressed bytes,
+            defaults to DEFAULT_MAX_DECOMPRESSION_RATIO (0 or less disables the check)
+        chunk_size (int): The maximum size of a decompressed chunk, defaults to DEFAULT_DECOMPRESSION_CHUNK_SIZE
+
+    Returns:
+        Iterator[bytes]: The decompressed chunks
+
+    Raises:
+        EdifactParserException: If the input is not valid for its compression format
+        DecompressionRatioExceededException: If the input expands beyond the allowed ratio (while iterating)
+    """
+    if isinstance(data, bytes):
+        compressed_bytes = len(data)
+        compressed_file = io.BytesIO(data)
+    else:
+        compressed_bytes = data.seek(0, io.SEEK_END) - data.seek(0)
+        compressed_file = data
+    if compression_format == CompressionFormat.ZIP:
+        chunks = _iter_zip_chunks(_open_single_zip_member(compressed_file), chunk_size)
+    else:
+        chunks = _iter_gzip_chunks(compressed_file, chunk_size)
+    return _check_ratio(chunks, compressed_bytes=compressed_bytes, max_ratio=max_ratio)
+
+
+def iter_decompressed_text(
+        data: Union[bytes, BinaryIO],
+        compression_format: CompressionFormat,
+        max_ratio: int = DEFAULT_MAX_DECOMPRESSION_RATIO,
+        chunk_size: int = DEFAULT_DECOMPRESSION_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Decompresses an input chunk by chunk and decodes the chunks to text (see iter_decoded_text(...)).
+
+    Args:
+        data (Union[bytes, BinaryIO]): The compressed input or a seekable binary file positioned at its start
+        compression_format (CompressionFormat): The compression format of the input
+        max_ratio (int): The allowed ratio of decompressed to compressed bytes,
+            defaults to DEFAULT_MAX_DECOMPRESSION_RATIO (0 or less disables the check)
+        chunk_size (int): The maximum size of a decompressed chunk, defaults to DEFAULT_DECOMPRESSION_CHUNK_SIZE
+
+    Returns:
+        Iterator[str]: The decompressed text chunks
+
+    Raises:
+        EdifactParserException: If the input is not valid for its compression format
+        DecompressionRatioExceededException: If the input expands beyond the allowed ratio (while iterating)
+    """
+    return iter_decoded_text(iter_decompressed_chunks(data, compression_format, max_ratio, chunk_size))
+
+
+def iter_decoded_text(byte_chunks: Iterator[bytes]) -> Iterator[str]:
+    """
+    Decodes byte chunks to text, attempting UTF-8 first and falling back to ISO-8859-1.
+
+    Multibyte characters spanning two chunks are decoded correctly. As soon as a chunk is not
+    valid UTF-8, this chunk and all following chunks are decoded as ISO-8859-1, which matches
+    the decoding of uncompressed uploads for all inputs that are not mixing both encodings.
+
+    Args:
+        byte_chunks (Iterator[bytes]): The byte chunks
+
+    Returns:
+        Iterator[str]: The text chunks
+    """
+    decoder = codecs.getincrementaldecoder(DEFAULT_TEXT_ENCODING)()
+    for byte_chunk in byte_chunks:
+        try:
+            text_chunk = decoder.decode(byte_chunk)
+        except UnicodeDecodeError:
+            undecoded_bytes = decoder.getstate()[0]
+            decoder = codecs.getincrementaldecoder(FALLBACK_TEXT_ENCODING)()
+            text_chunk = decoder.decode(undecoded_bytes + byte_chunk)
+        if text_chunk:
+            yield text_chunk
+    try:
+        text_chunk = decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        # The input ends with an incomplete UTF-8 sequence
+        text_chunk = decoder.getstate()[0].decode(FALLBACK_TEXT_ENCODING)
+    if text_chunk:
+        yield text_chunk
+
+
+def _iter_gzip_chunks(compressed_file: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """
+    Decompresses the members of a gzip input chunk by chunk, reading the compressed input chunk by chunk as well.
+    """
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+        for pending in iter(lambda: compressed_file.read(chunk_size), b""):
+            while pending:
+                chunk = decompressor.decompress(pending, chunk_size)
+                if chunk:
+                    yield chunk
+                if decompressor.eof:
+                    # Continue with the next member, if any
+                    pending = decompressor.unused_data
+                    if pending:
+                        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                else:
+                    pending = decompressor.unconsumed_tail
+        chunk = decompressor.flush()
+        if chunk:
+            yield chunk
+    except zlib.error as e:
+        raise EdifactParserException("Invalid gzip input", str(e)) from e
+    if not decompressor.eof:
+        raise EdifactParserException("Invalid gzip input", "the compressed data is incomplete")
+
+
+def _open_single_zip_member(compressed_file: BinaryIO) -> io.BufferedIOBase:
+    """
+    Opens the only file of a zip archive.
+    """
+    try:
+        archive = zipfile.ZipFile(compressed_file)
+        members = [member for member in archive.infolist() if not member.is_dir()]
+        if len(members) != 1:
+            raise EdifactParserException(
+                "The zip archive has to contain exactly one file", f"found {len(members)} files"
+            )
+        return archive.open(members[0])
+    except (zipfile.BadZipFile, zipfile.LargeZipFile, NotImplementedError, RuntimeError) as e:
+        raise EdifactParserException("Invalid zip input", str(e)) from e
+
+
+def _iter_zip_chunks(member: io.BufferedIOBase, chunk_size: int) -> Iterator[bytes]:
+    """
+    Decompresses a file of a zip archive chunk by chunk.
+    """
+    with member:
+        try:
+            while True:
+                chunk = member.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        except (zipfile.BadZipFile, zlib.error, EOFError) as e:
+            raise EdifactParserException("Invalid zip input", str(e)) from e
+
+
+def _check_ratio(chunks: Iterator[bytes], compressed_bytes: int, max_ratio: int) -> Iterator[bytes]:
+    """
+    Hands out the decompressed chunks while checking the decompression ratio.
+    """
+    max_decompressed_bytes = max_ratio * max(compressed_bytes, 1)
+    decompressed_bytes = 0
+    for chunk in chunks:
+        decompressed_bytes += len(chunk)
+        if 0 < max_ratio and max_decompressed_bytes < decompressed_bytes:
+            raise DecompressionRatioExceededException(
+                decompressed_bytes=decompressed_bytes,
+                compressed_bytes=compressed_bytes,
+                max_ratio=max_ratio
+            )
+        yield chunk
@@ -14,7 +14,7 @@ This module helps manage these characters and apply them correctly during parsin
 
 import logging
 import re
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from ..wrappers.context import ParsingContext
 from ..wrappers.constants import EdifactConstants, SegmentType
@@ -217,6 +217,40 @@ class EdifactSyntaxHelper:
             include_escape_symbol=True
         )
 
+    @staticmethod
+    def iter_segments(string_chunks: Iterable[str], context: ParsingContext = None) -> Iterator[str]:
+        """
+        Splits a sequence of string chunks into segments using the segment terminator,
+        which is part of the parsing context.
+
+        In contrast to split_segments(...), the input is never joined into one string: each
+        segment is handed out as soon as its terminator has been read, and only the unterminated
+        rest of the current chunk is kept. Terminators and release characters spanning two chunks
+        are handled, so the segments equal those of split_segments(...) on the joined input.
+
+        Args:
+            string_chunks: The chunks of the input string.
+            context: The context containing splitting information, if any.
+
+        Returns:
+            An iterator over the string segments.
+        """
+        segment_terminator = EdifactSyntaxHelper.get_segment_terminator(context)
+        pending_chunks: list[str] = []
+        for string_chunk in string_chunks:
+            pending_chunks.append(string_chunk)
+            if segment_terminator not in string_chunk:
+                # Chunks without a terminator only extend the current segment
+                continue
+            # The unterminated rest is kept unchanged (including release characters), so it is split again
+            # together with the next chunks
+            *segments, pending = EdifactSyntaxHelper.split_segments(
+                string_content="".join(pending_chunks), context=context
+            )
+            pending_chunks = [pending]
+            yield from segments
+        yield "".join(pending_chunks)
+
     @staticmethod
     def split_components(
             string_content: str,
@@ -267,6 +301,24 @@ class EdifactSyntaxHelper:
             include_escape_symbol=include_escape_symbol
         )
 
+    @staticmethod
+    def get_segment_type(string_content: str, context: ParsingContext = None) -> str:
+        """
+        Returns the segment type (the first component of the first element) of a segment
+        without splitting the whole segment, e.g. 'QTY' for 'QTY+220:4250.000:KWH'.
+
+        Segment tags never contain release characters, so no escape handling is needed.
+
+        Args:
+            string_content: The segment to get the type of.
+            context: The context containing splitting information, if any.
+
+        Returns:
+            The segment type.
+        """
+        segment_tag = string_content.split(EdifactSyntaxHelper.get_element_separator(context), 1)[0]
+        return segment_tag.split(EdifactSyntaxHelper.get_component_separator(context), 1)[0]
+
     @staticmethod
     def remove_invalid_prefix_from_segment_data(
             string_content: str,
@@ -0,0 +1,194 @@
+# coding: utf-8
+"""
+Message-level cache for incremental re-parsing.
+
+Corrections of an interchange (e.g. MSCONS corrections) are often resent as a whole, although
+only a few of its UNH..UNT messages have changed. The MessageCache defined here keeps the parsed
+messages of recent parsing runs, keyed by a BLAKE2b hash of the raw segment span of each message
+together with the message type and the delimiters of its interchange. On resubmission, the parser
+reuses the parsed message of every unchanged span and only hands the segments of changed messages
+to the segment handlers.
+
+The messages are cached pickled, so that every lookup hands out a private copy: the messages
+handed out by the parser may be modified without affecting the results of later parsing runs.
+Unpickling a message is still several times faster than parsing its segments. Messages parsed
+with lazy decoding are never cached, since their segments are decoded on first field access.
+A cache may only be shared by parsers with the same segment handlers.
+"""
+
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Iterable, NamedTuple, Optional
+
+from .edifact_syntax_helper import EdifactSyntaxHelper
+from ..wrappers.constants import SegmentGroup
+from ..wrappers.context import ParsingContext
+from ..wrappers.segments.base import AbstractEdifactMessage
+
+MESSAGE_KEY_DIGEST_SIZE = 20
+
+
+class CachedMessage(NamedTuple):
+    """
+    A parsed message together with the parsing state it leaves behind.
+
+    Attributes:
+        message (AbstractEdifactMessage): The parsed message
+        segment_count (int): The number of segments handled for the message, accounted against
+            the memory budget when the message is reused
+        segment_group (Optional[SegmentGroup]): The segment group resolved for the UNT segment of the message
+    """
+    message: AbstractEdifactMessage
+    segment_count: int
+    segment_group: Optional[SegmentGroup]
+
+
+class _PickledMessage(NamedTuple):
+    payload: bytes
+    segment_count: int
+    segment_group: Optional[SegmentGroup]
+
+
+class MessageCacheStatistics(NamedTuple):
+    """
+    The counters and sizes of a message cache.
+
+    Attributes:
+        reused_messages (int): The number of messages reused from the cache
+        parsed_messages (int): The number of messages not found in the cache, which had to be parsed
+        entries (int): The number of cached messages
+        segments (int): The number of segments of the cached messages
+    """
+    reused_messages: int
+    parsed_messages: int
+    entries: int
+    segments: int
+
+
+class MessageCache:
+    """
+    Thread-safe LRU cache of parsed messages, bounded by the number of segments of the cached messages.
+
+    Attributes:
+        max_segments (int): The maximum number of segments of the cached messages
+    """
+
+    def __init__(self, max_segments: int) -> None:
+        """
+        Initializes a new, empty message cache.
+
+        Args:
+            max_segments (int): The maximum number of segments of the cached messages
+
+        Raises:
+            ValueError: If the cache cannot hold any message
+        """
+        if max_segments < 1:
+            raise ValueError(f"A message cache needs a positive size, got {max_segments}")
+        self.max_segments = max_segments
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict[bytes, _PickledMessage] = OrderedDict()
+        self.__segments = 0
+        self.__reused_messages = 0
+        self.__parsed_messages = 0
+
+    @property
+    def statistics(self) -> MessageCacheStatistics:
+        """
+        The counters and sizes of the cache.
+        """
+        with self.__lock:
+            return MessageCacheStatistics(
+                reused_messages=self.__reused_messages,
+                parsed_messages=self.__parsed_messages,
+                entries=len(self.__entries),
+                segments=self.__segments
+            )
+
+    @staticmethod
+    def make_key(segment_lines: Iterable[str], context: ParsingContext) -> bytes:
+        """
+        Computes the key of a message from its raw segment span and the parsing context of its interchange.
+
+        Args:
+            segment_lines (Iterable[str]): The raw segments of the message, from UNH to UNT
+            context (ParsingContext): The parsing context holding the message type and the delimiters
+
+        Returns:
+            bytes: The key of the message
+        """
+        segment_terminator = EdifactSyntaxHelper.get_segment_terminator(context)
+        delimiters = "".join((
+            EdifactSyntaxHelper.get_component_separator(context),
+            EdifactSyntaxHelper.get_element_separator(context),
+            EdifactSyntaxHelper.get_decimal_mark(context),
+            EdifactSyntaxHelper.get_release_indicator(context),
+            EdifactSyntaxHelper.get_reserved_indicator(context),
+            segment_terminator
+        ))
+        digest = hashlib.blake2b(digest_size=MESSAGE_KEY_DIGEST_SIZE)
+        digest.update(f"{type(context).__qualname__}|{context.message_type}|{delimiters}|".encode("utf-8"))
+        for segment_line in segment_lines:
+            digest.update(segment_line.encode("utf-8"))
+            digest.update(segment_terminator.encode("utf-8"))
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[CachedMessage]:
+        """
+        Looks up a parsed message, counting it as reused or as to be parsed.
+
+        Args:
+            key (bytes): The key of the message (see make_key)
+
+        Returns:
+            Optional[CachedMessage]: A copy of the cached message, None if it is not cached
+        """
+        with self.__lock:
+            pickled_message = self.__entries.get(key)
+            if pickled_message is None:
+                self.__parsed_messages += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__reused_messages += 1
+        return CachedMessage(
+            message=pickle.loads(pickled_message.payload),
+            segment_count=pickled_message.segment_count,
+            segment_group=pickled_message.segment_group
+        )
+
+    def put(self, key: bytes, cached_message: CachedMessage) -> None:
+        """
+        Stores a copy of a parsed message, evicting the least recently used messages beyond the size limit.
+
+        Messages with more segments than the size limit are not stored.
+
+        Args:
+            key (bytes): The key of the message (see make_key)
+            cached_message (CachedMessage): The parsed message
+        """
+        if cached_message.segment_count > self.max_segments:
+            return
+        pickled_message = _PickledMessage(
+            payload=pickle.dumps(cached_message.message, protocol=pickle.HIGHEST_PROTOCOL),
+            segment_count=cached_message.segment_count,
+            segment_group=cached_message.segment_group
+        )
+        with self.__lock:
+            previous_message = self.__entries.pop(key, None)
+            if previous_message is not None:
+                self.__segments -= previous_message.segment_count
+            self.__entries[key] = pickled_message
+            self.__segments += cached_message.segment_count
+            while self.__segments > self.max_segments:
+                _, evicted_message = self.__entries.popitem(last=False)
+                self.__segments -= evicted_message.segment_count
+
+    def clear(self) -> None:
+        """
+        Removes all cached messages.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__segments = 0
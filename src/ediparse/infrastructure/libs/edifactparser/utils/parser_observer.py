@@ -0,0 +1,254 @@
+# coding: utf-8
+"""
+Instrumentation hooks of the parser.
+
+A ParserObserver registered with the EdifactParser is notified around the handling of every
+segment (on_segment_start and on_segment_end), after every completely parsed message
+(on_message_end) and when a segment handler fails (on_error). Parsers without observers skip
+the notifications, so they do not pay for the hooks.
+
+Two built-in observers aggregate the notifications across parsing runs:
+
+- SegmentTypeCounter: Counts the handled segments per segment type and segment group
+- ConverterTimingObserver: Records a histogram of the durations of handling the segments per
+  converter (e.g. UNBSegmentConverter or MSCONSDTMSegmentConverter), so that the converter
+  being the hotspot on a given corpus can be found
+
+The built-in observers are thread-safe, so a single instance can be registered with all parsers
+of a parser pool. Custom observers registered with parsers used by several threads at once have
+to be thread-safe as well.
+"""
+
+import bisect
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+from ..wrappers.constants import SegmentGroup
+from ..wrappers.segments.base import AbstractEdifactMessage
+
+if TYPE_CHECKING:
+    from ..handlers import SegmentHandler
+
+# The upper bounds of the histogram buckets in seconds, from 1 µs up to 10 ms
+DEFAULT_CONVERTER_TIMING_BUCKETS = (
+    0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.01
+)
+
+
+class ParserObserver:
+    """
+    Base class of the observers of a parser, whose hooks do nothing by default.
+
+    Observers override the hooks they are interested in. The hooks are called by the thread
+    running the parsing run and must not modify the passed segments or messages.
+    """
+
+    def on_segment_start(self, segment_type: str, segment_group: Optional[SegmentGroup]) -> None:
+        """
+        Called before a segment is handled.
+
+        Args:
+            segment_type (str): The type (tag) of the segment, e.g. DTM
+            segment_group (Optional[SegmentGroup]): The segment group resolved for the segment
+        """
+        pass
+
+    def on_segment_end(
+            self,
+            segment_type: str,
+            segment_group: Optional[SegmentGroup],
+            handler: "SegmentHandler"
+    ) -> None:
+        """
+        Called after a segment has been handled successfully.
+
+        Args:
+            segment_type (str): The type (tag) of the segment, e.g. DTM
+            segment_group (Optional[SegmentGroup]): The segment group resolved for the segment
+            handler (SegmentHandler): The handler of the segment, holding the converter used
+        """
+        pass
+
+    def on_message_end(self, message: AbstractEdifactMessage) -> None:
+        """
+        Called after a message has been parsed completely, i.e. after its UNT segment.
+
+        Messages reused from the message cache are passed as well, without segment notifications.
+
+        Args:
+            message (AbstractEdifactMessage): The parsed message
+        """
+        pass
+
+    def on_error(self, error: Exception, segment_type: str, line_number: int) -> None:
+        """
+        Called if handling a segment has failed, before the exception is raised to the caller.
+
+        Args:
+            error (Exception): The raised exception
+            segment_type (str): The type (tag) of the segment, e.g. DTM
+            line_number (int): The line number of the segment in the input
+        """
+        pass
+
+
+class SegmentTypeCounter(ParserObserver):
+    """
+    Counts the handled segments per segment type and segment group, as well as the parsed messages
+    and the failed segments per segment type.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new counter without any counted segment.
+        """
+        self.__lock = threading.Lock()
+        self.__segments: dict[tuple[str, Optional[str]], int] = {}
+        self.__errors: dict[str, int] = {}
+        self.__messages = 0
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """
+        The number of handled segments per segment type.
+        """
+        counts: dict[str, int] = {}
+        for (segment_type, _), count in self.counts_by_group.items():
+            counts[segment_type] = counts.get(segment_type, 0) + count
+        return counts
+
+    @property
+    def counts_by_group(self) -> dict[tuple[str, Optional[str]], int]:
+        """
+        The number of handled segments per segment type and segment group (None outside of segment groups).
+        """
+        with self.__lock:
+            return dict(self.__segments)
+
+    @property
+    def errors(self) -> dict[str, int]:
+        """
+        The number of segments whose handling has failed per segment type.
+        """
+        with self.__lock:
+            return dict(self.__errors)
+
+    @property
+    def messages(self) -> int:
+        """
+        The number of parsed messages.
+        """
+        return self.__messages
+
+    def on_segment_end(
+            self,
+            segment_type: str,
+            segment_group: Optional[SegmentGroup],
+            handler: "SegmentHandler"
+    ) -> None:
+        key = (segment_type, segment_group.value if segment_group else None)
+        with self.__lock:
+            self.__segments[key] = self.__segments.get(key, 0) + 1
+
+    def on_message_end(self, message: AbstractEdifactMessage) -> None:
+        with self.__lock:
+            self.__messages += 1
+
+    def on_error(self, error: Exception, segment_type: str, line_number: int) -> None:
+        with self.__lock:
+            self.__errors[segment_type] = self.__errors.get(segment_type, 0) + 1
+
+    def reset(self) -> None:
+        """
+        Resets all counters.
+        """
+        with self.__lock:
+            self.__segments.clear()
+            self.__errors.clear()
+            self.__messages = 0
+
+
+class ConverterTiming(NamedTuple):
+    """
+    The histogram of the durations of handling the segments of a converter.
+
+    Attributes:
+        count (int): The number of handled segments
+        total_seconds (float): The total duration of handling the segments
+        bucket_counts (tuple[int, ...]): The number of segments per bucket (non-cumulative), the last one
+            counting the segments above the largest upper bound
+    """
+    count: int
+    total_seconds: float
+    bucket_counts: tuple[int, ...]
+
+
+class ConverterTimingObserver(ParserObserver):
+    """
+    Records a histogram of the durations of handling the segments per converter.
+
+    The duration of a segment covers its conversion and the update of the parsing context by its handler.
+    Segments whose handler has no converter are recorded under the name of the handler.
+
+    Attributes:
+        buckets (tuple[float, ...]): The upper bounds of the histogram buckets in seconds
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_CONVERTER_TIMING_BUCKETS) -> None:
+        """
+        Initializes a new observer without any recorded duration.
+
+        Args:
+            buckets (tuple[float, ...]): The upper bounds of the histogram buckets in seconds,
+                defaults to DEFAULT_CONVERTER_TIMING_BUCKETS
+
+        Raises:
+            ValueError: If the upper bounds are not increasing
+        """
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError(f"The buckets of a histogram have to be increasing, got {buckets}")
+        self.buckets = tuple(buckets)
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.__timings: dict[str, list] = {}
+
+    @property
+    def timings(self) -> dict[str, ConverterTiming]:
+        """
+        The histograms of the converters, the slowest converter (by total duration) first.
+        """
+        with self.__lock:
+            timings = [
+                (name, ConverterTiming(count=count, total_seconds=total_seconds, bucket_counts=tuple(bucket_counts)))
+                for name, (count, total_seconds, bucket_counts) in self.__timings.items()
+            ]
+        return dict(sorted(timings, key=lambda item: item[1].total_seconds, reverse=True))
+
+    def on_segment_start(self, segment_type: str, segment_group: Optional[SegmentGroup]) -> None:
+        self.__local.start = time.perf_counter()
+
+    def on_segment_end(
+            self,
+            segment_type: str,
+            segment_group: Optional[SegmentGroup],
+            handler: "SegmentHandler"
+    ) -> None:
+        seconds = time.perf_counter() - self.__local.start
+        converter = handler.converter
+        name = type(converter).__name__ if converter is not None else type(handler).__name__
+        bucket = bisect.bisect_left(self.buckets, seconds)
+        with self.__lock:
+            timing = self.__timings.get(name)
+            if timing is None:
+                timing = self.__timings[name] = [0, 0.0, [0] * (len(self.buckets) + 1)]
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2][bucket] += 1
+
+    def reset(self) -> None:
+        """
+        Removes all recorded durations.
+        """
+        with self.__lock:
+            self.__timings.clear()
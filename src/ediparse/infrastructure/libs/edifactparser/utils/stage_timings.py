@@ -0,0 +1,164 @@
+# coding: utf-8
+"""
+Per-stage timing breakdown of a parsing run.
+
+A parsing run passes through several stages: reading the input, detecting the UNA segment and
+the message type, splitting the input into segments, tokenizing the segments into their
+elements, resolving the segment groups, converting the segments into the model and rendering the
+parsed interchange. The StageTimings defined here accumulate the duration and the number of
+passes of each stage (e.g. the number of tokenized or converted segments), so that a slow parsing
+run can be attributed to the stage causing it.
+
+The stages are only timed if a StageTimings instance is handed to the parser, so parsing runs
+without it do not read the clock at all.
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Iterator, NamedTuple, Optional, TypeVar
+
+from ..wrappers.constants import StrEnum
+
+T = TypeVar("T")
+
+
+class ParseStage(StrEnum):
+    """
+    The stages of a parsing run.
+    """
+    READ = "read"
+    UNA = "una"
+    MESSAGE_TYPE = "message_type"
+    SPLIT = "split"
+    TOKENIZE = "tokenize"
+    GROUP_RESOLUTION = "group_resolution"
+    CONVERSION = "conversion"
+    RENDER = "render"
+
+
+class StageTiming(NamedTuple):
+    """
+    The accumulated duration of a stage.
+
+    Attributes:
+        seconds (float): The total duration of the stage
+        count (int): The number of passes of the stage, e.g. the number of segments of per-segment stages
+    """
+    seconds: float
+    count: int
+
+
+class StageTimings:
+    """
+    Accumulates the durations of the stages of a parsing run, in the order the stages were first entered.
+
+    The instance of a parsing run is only used by the thread running it, so it is not synchronized.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes new timings without any timed stage.
+        """
+        self.__timings: dict[str, list] = {}
+
+    def add(self, stage: str, seconds: float, count: int = 1) -> None:
+        """
+        Adds a duration to a stage.
+
+        Args:
+            stage (str): The stage (see ParseStage)
+            seconds (float): The duration to add
+            count (int): The number of passes to add, defaults to 1
+        """
+        timing = self.__timings.get(stage)
+        if timing is None:
+            self.__timings[stage] = [seconds, count]
+        else:
+            timing[0] += seconds
+            timing[1] += count
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """
+        Times the enclosed block as one pass of a stage.
+
+        Args:
+            stage (str): The stage (see ParseStage)
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    def measure_iterator(self, stage: str, iterator: Iterator[T]) -> Iterator[T]:
+        """
+        Times the production of each item of an iterator as one pass of a stage.
+
+        The time to detect the end of the iterator is added to the stage without counting a pass.
+
+        Args:
+            stage (str): The stage (see ParseStage)
+            iterator (Iterator[T]): The iterator producing the items
+
+        Returns:
+            Iterator[T]: The items of the iterator
+        """
+        sentinel = object()
+        while True:
+            start = time.perf_counter()
+            item = next(iterator, sentinel)
+            if item is sentinel:
+                self.add(stage, time.perf_counter() - start, count=0)
+                return
+            self.add(stage, time.perf_counter() - start)
+            yield item
+
+    def merge(self, other: "StageTimings") -> None:
+        """
+        Adds the durations of other timings, e.g. the ones recorded by a worker process.
+
+        Args:
+            other (StageTimings): The timings to add
+        """
+        for stage, timing in other.items():
+            self.add(stage, timing.seconds, timing.count)
+
+    def get(self, stage: str) -> StageTiming:
+        """
+        Returns the accumulated duration of a stage.
+
+        Args:
+            stage (str): The stage (see ParseStage)
+
+        Returns:
+            StageTiming: The duration and the number of passes of the stage, zero if it has not been timed
+        """
+        seconds, count = self.__timings.get(stage, (0.0, 0))
+        return StageTiming(seconds=seconds, count=count)
+
+    def items(self) -> Iterator[tuple[str, StageTiming]]:
+        """
+        Returns the timed stages in the order they were first entered.
+
+        Returns:
+            Iterator[tuple[str, StageTiming]]: The stages with their accumulated durations
+        """
+        for stage, (seconds, count) in self.__timings.items():
+            yield stage, StageTiming(seconds=seconds, count=count)
+
+
+def measure_stage(stage_timings: Optional[StageTimings], stage: str) -> ContextManager:
+    """
+    Times the enclosed block as one pass of a stage, if timings are recorded at all.
+
+    Args:
+        stage_timings (Optional[StageTimings]): The timings of the parsing run, None if they are not recorded
+        stage (str): The stage (see ParseStage)
+
+    Returns:
+        ContextManager: The context timing the block
+    """
+    if stage_timings is None:
+        return nullcontext()
+    return stage_timings.measure(stage)
@@ -32,6 +32,7 @@ class ParsingContext(BaseModel, ABC):
     interchange: EdifactInterchange = EdifactInterchange()
     current_message: Optional[AbstractEdifactMessage] = None
     message_type: Optional[EdifactMessageType] = None
+    lazy_decoding: bool = False  # If True, segments are decoded on first field access
 
     @abstractmethod
     def reset_for_new_message(self) -> None:
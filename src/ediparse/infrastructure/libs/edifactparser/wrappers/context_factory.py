@@ -50,25 +50,25 @@ class ParsingContextFactory:
         Initialize the factory by registering all parsing contexts.
 
         This constructor creates a dictionary mapping EDIFACT message types to their respective
-        context instances.
+        context classes.
         """
-        self.__contexts: dict[EdifactMessageType, ParsingContext] = {}
+        self.__contexts: dict[EdifactMessageType, type[ParsingContext]] = {}
         self.__register_contexts()
 
     def __register_contexts(self) -> None:
         """
-        Initialize and register the contexts dictionary with instances of all parsing contexts.
+        Initialize and register the contexts dictionary with the classes of all parsing contexts.
         """
         # Initialize contexts for each message type by discovering them in the mods folder
         self.__contexts = self.__discover_contexts()
 
     @staticmethod
-    def __discover_contexts() -> dict[EdifactMessageType, ParsingContext]:
+    def __discover_contexts() -> dict[EdifactMessageType, type[ParsingContext]]:
         """
-        Dynamically discover and instantiate all parsing contexts in the mods folder.
+        Dynamically discover all parsing contexts in the mods folder.
 
         Returns:
-            A dictionary mapping message types to their respective parsing context instances.
+            A dictionary mapping message types to their respective parsing context classes.
         """
         contexts = {}
 
@@ -101,8 +101,8 @@ class ParsingContextFactory:
                                     try:
                                         # Convert to uppercase to match the enum values
                                         message_type = EdifactMessageType(message_type_name.upper())
-                                        # Instantiate the context and add it to the dictionary
-                                        contexts[message_type] = obj()
+                                        # Register the context class in the dictionary
+                                        contexts[message_type] = obj
                                     except ValueError:
                                         logger.warning(
                                             f"Message type {message_type_name} not found in EdifactMessageType enum."
@@ -114,7 +114,10 @@ class ParsingContextFactory:
 
     def create_context(self, message_type: EdifactMessageType) -> ParsingContext:
         """
-        Create a ParsingContext instance based on the message type.
+        Create a new ParsingContext instance based on the message type.
+
+        A fresh context is created for every call, so that parsing results (and lazy segments
+        referencing their context) of previous parsing runs are never shared.
 
         Args:
             message_type: The type of EDIFACT message.
@@ -125,9 +128,9 @@ class ParsingContextFactory:
         Raises:
             EdifactParserException: If the message type is not supported.
         """
-        context = self.__contexts.get(message_type)
-        if context:
-            return context
+        context_class = self.__contexts.get(message_type)
+        if context_class:
+            return context_class()
         else:
             raise EdifactParserException(f"Unsupported message type: {message_type}")
 
@@ -0,0 +1,48 @@
+# coding: utf-8
+"""
+Stream of messages parsed one at a time.
+
+This module provides the iterator returned by EdifactParser.iter_messages(...). It hands out
+the messages of an interchange one by one while they are parsed and gives access to the
+envelope of the interchange (UNA, UNB and UNZ), which is filled in during the iteration.
+"""
+
+from typing import Iterator
+
+from .context import ParsingContext
+from .segments.base import AbstractEdifactMessage
+from .segments.message_structure import EdifactInterchange
+
+
+class EdifactMessageStream(Iterator[AbstractEdifactMessage]):
+    """
+    Iterator over the messages of an interchange that are parsed one at a time.
+
+    The UNA and UNB segments of the interchange are available as soon as the first message
+    has been handed out, the UNZ segment only after the stream has been exhausted. Messages
+    already handed out are not contained in the interchange anymore.
+    """
+
+    def __init__(self, context: ParsingContext, messages: Iterator[AbstractEdifactMessage]) -> None:
+        """
+        Initializes a new message stream.
+
+        Args:
+            context (ParsingContext): The parsing context of the parsing run
+            messages (Iterator[AbstractEdifactMessage]): The iterator parsing and handing out the messages
+        """
+        self.__context = context
+        self.__messages = messages
+
+    @property
+    def interchange(self) -> EdifactInterchange:
+        """
+        Returns the interchange of the parsing run, holding the envelope segments (UNA, UNB and UNZ).
+        """
+        return self.__context.interchange
+
+    def __iter__(self) -> "EdifactMessageStream":
+        return self
+
+    def __next__(self) -> AbstractEdifactMessage:
+        return next(self.__messages)
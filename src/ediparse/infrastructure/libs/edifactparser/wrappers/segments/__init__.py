@@ -8,6 +8,7 @@ of parsed EDIFACT messages, making it easier to work with the data.
 
 The segments are organized into categories:
 - Base models: Abstract base classes for EDIFACT messages
+- Lazy models: Helpers for segments that are decoded on first field access
 - Error code models: Segments related to error reporting (ERC, FTX)
 - Location models: Segments related to locations and places (LOC, CCI)
 - Measurement models: Segments related to measurements and quantities (LIN, PIA, QTY, STS)
@@ -20,6 +21,11 @@ The segments are organized into categories:
 # Import base models
 from .base import AbstractEdifactMessage
 
+# Import lazy segment helpers
+from .lazy import (
+    LazySegment, create_lazy_segment, decode_lazy_segments, get_lazy_segment_class
+)
+
 # Import error code models
 from .error_code import (
     SegmentERC, SegmentFTX, Anwendungsfehler, Text
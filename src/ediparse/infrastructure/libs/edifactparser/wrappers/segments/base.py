@@ -9,8 +9,9 @@ should inherit from, establishing a common interface and structure.
 from abc import ABC
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
+from ...wrappers.segments.lazy import LazySegment, decode_lazy_segments
 from ...wrappers.segments.message import SegmentUNH, SegmentBGM, SegmentUNT
 from ...wrappers.segments.reference import SegmentDTM
 
@@ -57,6 +58,12 @@ class AbstractEdifactMessage(BaseModel, ABC):
     - Easy addition of new message types without changing existing code
     - Polymorphic handling of different message types
     - Type-safe operations on message collections
+
+    Lazy Decoding:
+    -------------
+    When the parser runs with lazy decoding enabled, the segments of a message are registered
+    as lazy segments (see lazy.py) and only decoded on first field access. Dumping a message
+    forces the decoding of all of its pending lazy segments first.
     """
     # These fields are defined generically without specific segment type dependencies
     # Concrete implementations will override these with their specific segment types
@@ -64,3 +71,31 @@ class AbstractEdifactMessage(BaseModel, ABC):
     bgm_beginn_der_nachricht: Optional[SegmentBGM] = Field(default=None)  # Beginning of a message
     dtm_nachrichtendatum: list[SegmentDTM] = Field(default_factory=list)  # Message date
     unt_nachrichtenendsegment: Optional[SegmentUNT] = Field(default=None)  # Message trailer
+
+    _lazy_segments: list[LazySegment] = PrivateAttr(default_factory=list)
+
+    def register_lazy_segment(self, segment: LazySegment) -> None:
+        """
+        Registers a lazy segment that belongs to this message, so it can be decoded before serialization.
+
+        Args:
+            segment: The lazy segment to register
+        """
+        # Accessing the private storage directly skips pydantic's (comparatively slow) private attribute lookup
+        self.__pydantic_private__["_lazy_segments"].append(segment)
+
+    def decode_lazy_segments(self) -> None:
+        """
+        Forces the decoding of all pending lazy segments of this message.
+        """
+        if self._lazy_segments:
+            decode_lazy_segments(self._lazy_segments)
+            self._lazy_segments.clear()
+
+    def model_dump(self, **kwargs):
+        self.decode_lazy_segments()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs):
+        self.decode_lazy_segments()
+        return super().model_dump_json(**kwargs)
@@ -0,0 +1,177 @@
+# coding: utf-8
+"""
+Lazily decoded EDIFACT segment models.
+
+This module provides the building blocks for deferring the conversion of a segment
+until one of its fields is read for the first time. A lazy segment only keeps the raw
+segment line together with a decoder that is shared by all segments of the same type
+within a parsing run. The tokenizing of the elements and the conversion (unescaping,
+decimal conversion, identifier lookup) run on first field access, and the result is
+cached on the segment itself.
+
+A lazy segment is an instance of a dynamically created subclass of the regular segment
+model (e.g., ``SegmentQTY``), so ``isinstance`` checks and type hints keep working.
+Serialization of a lazy segment that has not been decoded yet would silently produce an
+empty object, which is why the message and interchange models force the decoding of all
+pending lazy segments before they are dumped.
+"""
+
+from typing import Any, Callable, Iterable, Type, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar('T', bound=BaseModel)
+
+_LAZY_DECODER_KEY = "_lazy_decoder"
+_LAZY_DECODER_ARGS_KEY = "_lazy_decoder_args"
+_UNDECODED_FIELDS_SET = frozenset()
+
+
+class LazySegment:
+    """
+    Mixin that turns a segment model into a lazily decoded segment.
+
+    Instances are created with an empty field dictionary and a decoder callable (plus its
+    arguments) stored in the pydantic private storage. The first access to any model field
+    triggers the decoder, copies the decoded field values into the instance and drops the
+    decoder, so the raw segment data can be garbage collected.
+    """
+
+    def __getattr__(self, item: str):
+        if item in type(self).model_fields:
+            self.decode()
+            return self.__dict__[item]
+        return super().__getattr__(item)
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in type(self).model_fields:
+            # Decode first, otherwise the pending decoder would overwrite the assigned value later on
+            self.decode()
+        super().__setattr__(name, value)
+
+    @property
+    def is_decoded(self) -> bool:
+        """
+        Returns True if the segment has already been decoded.
+        """
+        private = object.__getattribute__(self, '__pydantic_private__')
+        return not private or _LAZY_DECODER_KEY not in private
+
+    def decode(self) -> None:
+        """
+        Runs the pending decoder (if any) and caches the decoded field values.
+
+        Raises:
+            CONTRLException: If the underlying converter fails to convert the raw segment data
+        """
+        private = object.__getattribute__(self, '__pydantic_private__')
+        if not private or _LAZY_DECODER_KEY not in private:
+            return
+        decoded = private[_LAZY_DECODER_KEY](*private[_LAZY_DECODER_ARGS_KEY])
+        # The decoded segment is discarded, so its field dictionary and fields set are taken over without copying
+        object.__setattr__(self, '__dict__', decoded.__dict__)
+        object.__setattr__(self, '__pydantic_fields_set__', decoded.__pydantic_fields_set__)
+        del private[_LAZY_DECODER_KEY]
+        del private[_LAZY_DECODER_ARGS_KEY]
+
+    def to_eager_segment(self) -> BaseModel:
+        """
+        Returns a plain (non-lazy) copy of the segment with all fields decoded.
+        """
+        self.decode()
+        # The MRO of a lazy class is always (Lazy<Segment>, LazySegment, <Segment>, ...)
+        segment_class = type(self).__mro__[2]
+        return segment_class.model_construct(_fields_set=set(self.__pydantic_fields_set__), **self.__dict__)
+
+    def model_dump(self, **kwargs):
+        self.decode()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs):
+        self.decode()
+        return super().model_dump_json(**kwargs)
+
+    def model_copy(self, **kwargs):
+        return self.to_eager_segment().model_copy(**kwargs)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazySegment):
+            other = other.to_eager_segment()
+        return self.to_eager_segment() == other
+
+    def __repr_args__(self):
+        self.decode()
+        return super().__repr_args__()
+
+    def __reduce_ex__(self, protocol):
+        # Lazy subclasses are created dynamically, so they are pickled as their plain segment model.
+        eager_segment = self.to_eager_segment()
+        return _restore_segment, (type(eager_segment), eager_segment.__getstate__())
+
+
+def _restore_segment(segment_class: Type[T], state: dict) -> T:
+    """
+    Restores a pickled lazy segment as an instance of its plain segment model class.
+    """
+    segment = segment_class.__new__(segment_class)
+    segment.__setstate__(state)
+    return segment
+
+
+_lazy_segment_classes: dict[type, type] = {}
+
+
+def get_lazy_segment_class(segment_class: Type[T]) -> Type[T]:
+    """
+    Returns the (cached) lazy subclass of the given segment model class.
+
+    Args:
+        segment_class: The segment model class, e.g. SegmentQTY
+
+    Returns:
+        The lazy subclass, e.g. LazySegmentQTY
+    """
+    lazy_class = _lazy_segment_classes.get(segment_class)
+    if lazy_class is None:
+        lazy_class = type(f"Lazy{segment_class.__name__}", (LazySegment, segment_class), {})
+        _lazy_segment_classes[segment_class] = lazy_class
+    return lazy_class
+
+
+def create_lazy_segment(segment_class: Type[T], decoder: Callable[..., T], *decoder_args: Any) -> T:
+    """
+    Creates a lazy segment instance that runs the decoder on first field access.
+
+    Passing the per-segment data as decoder arguments (instead of binding it into a new callable)
+    allows to share one decoder between all segments of the same type, which keeps the number of
+    objects per lazy segment (and thus the garbage collection overhead) small.
+
+    Args:
+        segment_class: The segment model class the decoder returns, e.g. SegmentQTY
+        decoder: A callable returning the decoded segment
+        *decoder_args: The arguments to call the decoder with
+
+    Returns:
+        A lazy segment instance which behaves like an instance of the segment model class
+    """
+    lazy_class = get_lazy_segment_class(segment_class)
+    segment = lazy_class.__new__(lazy_class)
+    # The instance dictionary is only materialized on decoding, and the shared empty fields set is
+    # replaced on decoding as well, which keeps the number of tracked objects per lazy segment small
+    object.__setattr__(segment, '__pydantic_fields_set__', _UNDECODED_FIELDS_SET)
+    object.__setattr__(segment, '__pydantic_extra__', None)
+    object.__setattr__(
+        segment, '__pydantic_private__', {_LAZY_DECODER_KEY: decoder, _LAZY_DECODER_ARGS_KEY: decoder_args}
+    )
+    return segment
+
+
+def decode_lazy_segments(segments: Iterable[LazySegment]) -> None:
+    """
+    Forces the decoding of all given lazy segments.
+
+    Args:
+        segments: The lazy segments to decode
+    """
+    for segment in segments:
+        segment.decode()
@@ -7,7 +7,6 @@ According to the MSCONS D.04B 2.4c standard, an interchange can contain multiple
 messages, and each message follows a specific structure with segment groups.
 """
 
-import json
 from typing import Optional, Union, Annotated
 from pydantic import BaseModel, Field
 
@@ -178,12 +177,30 @@ class EdifactInterchange(BaseModel):
     The 'message_type' field in each message class serves as the discriminator,
     allowing the system to automatically determine the correct message type during
     deserialization.
+
+    If the interchange was parsed with lazy decoding enabled, dumping it forces the decoding
+    of all pending lazy segments of its messages first.
     """
     una_service_string_advice: Optional[SegmentUNA] = Field(default=None)  # Service string advice
     unb_nutzdaten_kopfsegment: SegmentUNB = Field(default=None)  # Interchange header
     unh_unt_nachrichten: list[EdifactMessageUnion] = Field(default_factory=list)  # Messages
     unz_nutzdaten_endsegment: SegmentUNZ = Field(default=None)  # Interchange trailer
 
+    def decode_lazy_segments(self) -> None:
+        """
+        Forces the decoding of all pending lazy segments of all messages within the interchange.
+        """
+        for message in self.unh_unt_nachrichten:
+            message.decode_lazy_segments()
+
+    def model_dump(self, **kwargs):
+        self.decode_lazy_segments()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs):
+        self.decode_lazy_segments()
+        return super().model_dump_json(**kwargs)
+
     def to_json(self) -> str:
         """
         Converts the interchange to a JSON string.
@@ -191,4 +208,21 @@ class EdifactInterchange(BaseModel):
         Returns:
             str: A JSON representation of the interchange with all its messages and segments.
         """
-        return json.dumps(self.model_dump(), indent=2, ensure_ascii=False, default=str)
+        return self.to_json_bytes(indent=2).decode("utf-8")
+
+    def to_json_bytes(self, indent: Optional[int] = None) -> bytes:
+        """
+        Serializes the interchange directly to UTF-8 encoded JSON bytes.
+
+        The pydantic-core serializer writes the bytes straight from the model, without building
+        an intermediate dictionary tree in Python, which makes it considerably faster than
+        json.dumps(self.model_dump()) for large interchanges while producing the same output.
+
+        Args:
+            indent (Optional[int]): The number of spaces to indent the JSON with, defaults to None (compact)
+
+        Returns:
+            bytes: A JSON representation of the interchange with all its messages and segments.
+        """
+        self.decode_lazy_segments()
+        return self.__pydantic_serializer__.to_json(self, indent=indent)
@@ -0,0 +1,301 @@
+# coding: utf-8
+"""
+Local capture spool of slow parsing runs for offline replay.
+
+Performance regressions often only show on the shapes of real production payloads, which are
+hard to reproduce with synthetic samples. The ParseCaptureSpool defined here writes the parsing
+runs exceeding a latency or memory threshold to a local capture directory, so that they can be
+replayed against other parser builds (see scripts/replay_captures.py). Each capture is a
+directory holding:
+
+- input.edi: The parsed EDIFACT text
+- capture.json: The options of the parsing run (endpoint, max_lines_to_parse, output_format and
+  short_keys), its duration, estimated memory and segment count, its stage timings (see
+  StageTimings), the detected message type and the version of the parser
+
+Captures are written to a hidden directory first and renamed once complete, so that readers never
+see partial captures. The capture directory is bounded in size: after each capture, the oldest
+captures are removed until the size of all captures is within the limit. Captures larger than
+the limit are not written at all.
+
+Optionally, the partner ids (the sender and recipient of the UNB segment and the party of the NAD
+segments) are replaced by pseudonyms of the same length before the input is written. A partner id
+is replaced by the same pseudonym within a server process, so captures keep their structure, while
+the pseudonyms cannot be traced back to the partner ids.
+
+The spool is enabled via the environment variable PARSE_CAPTURE_DIR and configured via:
+- PARSE_CAPTURE_DIR: The directory the captures are written to (default: empty, which disables the spool)
+- PARSE_CAPTURE_MIN_SECONDS: The parse duration from which parsing runs are captured (default: 5)
+- PARSE_CAPTURE_MIN_MEMORY_MB: The estimated memory from which parsing runs are captured
+  (default: 512, a value of 0 or less disables the memory threshold)
+- PARSE_CAPTURE_MAX_MB: The size of all captures (default: 256)
+- PARSE_CAPTURE_REDACT: Whether the partner ids are replaced by pseudonyms (default: false)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import secrets
+import shutil
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from ediparse.infrastructure.libs.edifactparser.utils import EdifactSyntaxHelper, StageTimings
+from ediparse.infrastructure.libs.edifactparser.wrappers.constants import SegmentType
+from ediparse.infrastructure.libs.edifactparser.wrappers.context import InitialParsingContext, ParsingContext
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import SegmentUNA
+from ediparse.infrastructure.parse_result_cache import PARSER_VERSION
+
+logger = logging.getLogger(__name__)
+
+PARSE_CAPTURE_DIR = os.getenv("PARSE_CAPTURE_DIR", "")
+PARSE_CAPTURE_MIN_SECONDS = float(os.getenv("PARSE_CAPTURE_MIN_SECONDS", "5"))
+PARSE_CAPTURE_MIN_MEMORY_MB = int(os.getenv("PARSE_CAPTURE_MIN_MEMORY_MB", "512"))
+PARSE_CAPTURE_MAX_MB = int(os.getenv("PARSE_CAPTURE_MAX_MB", "256"))
+PARSE_CAPTURE_REDACT = os.getenv("PARSE_CAPTURE_REDACT", "false").lower() == "true"
+
+INPUT_FILE_NAME = "input.edi"
+CAPTURE_FILE_NAME = "capture.json"
+# The positions of the elements holding partner ids per segment type, the id being their first component
+PARTNER_ID_ELEMENTS = {
+    SegmentType.UNB: (2, 3),
+    SegmentType.NAD: (2,),
+}
+
+_default_parse_capture_spool: Optional["ParseCaptureSpool"] = None
+_default_parse_capture_spool_lock = threading.Lock()
+
+
+class ParseCaptureSpool:
+    """
+    Writes the parsing runs exceeding a latency or memory threshold to a bounded capture directory.
+
+    The spool is shared by the threads of the server, the rotation of the captures is guarded by a lock.
+    Server processes sharing a capture directory tolerate captures removed by each other.
+
+    Attributes:
+        directory (Path): The directory the captures are written to
+        min_seconds (float): The parse duration from which parsing runs are captured
+        min_memory_bytes (Optional[int]): The estimated memory from which parsing runs are captured, if any
+        max_bytes (int): The size of all captures
+        redact (bool): Whether the partner ids are replaced by pseudonyms
+    """
+
+    def __init__(
+            self,
+            directory: Path,
+            min_seconds: float,
+            min_memory_bytes: Optional[int] = None,
+            max_bytes: int = PARSE_CAPTURE_MAX_MB * 1024 * 1024,
+            redact: bool = False
+    ) -> None:
+        """
+        Initializes a new spool, creating the capture directory if it does not exist.
+
+        Args:
+            directory (Path): The directory the captures are written to
+            min_seconds (float): The parse duration from which parsing runs are captured
+            min_memory_bytes (Optional[int]): The estimated memory from which parsing runs are captured,
+                None to capture by duration only
+            max_bytes (int): The size of all captures, defaults to PARSE_CAPTURE_MAX_MB
+            redact (bool): Whether the partner ids are replaced by pseudonyms, defaults to False
+        """
+        self.directory = Path(directory)
+        self.min_seconds = min_seconds
+        self.min_memory_bytes = min_memory_bytes
+        self.max_bytes = max_bytes
+        self.redact = redact
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.__lock = threading.Lock()
+        self.__redaction_key = secrets.token_bytes(32)
+
+    def should_capture(self, parse_seconds: float, estimated_bytes: int) -> bool:
+        """
+        Checks whether a parsing run exceeds the latency or the memory threshold.
+
+        Args:
+            parse_seconds (float): The duration of the parsing run
+            estimated_bytes (int): The estimated memory of the parsing run
+
+        Returns:
+            bool: True if the parsing run is to be captured, False otherwise
+        """
+        if parse_seconds >= self.min_seconds:
+            return True
+        return self.min_memory_bytes is not None and estimated_bytes >= self.min_memory_bytes
+
+    def capture(
+            self,
+            edifact_text: str,
+            options: dict[str, Any],
+            parse_seconds: float,
+            estimated_bytes: int,
+            segment_count: int,
+            stage_timings: Optional[StageTimings] = None,
+            message_type: Optional[str] = None
+    ) -> Optional[Path]:
+        """
+        Writes a parsing run to the capture directory and removes the oldest captures beyond the size limit.
+
+        Args:
+            edifact_text (str): The parsed EDIFACT text
+            options (dict[str, Any]): The options of the parsing run, e.g. its endpoint and output format
+            parse_seconds (float): The duration of the parsing run
+            estimated_bytes (int): The estimated memory of the parsing run
+            segment_count (int): The number of parsed segments
+            stage_timings (Optional[StageTimings]): The stage timings of the parsing run, if recorded
+            message_type (Optional[str]): The detected message type, e.g. MSCONS
+
+        Returns:
+            Optional[Path]: The directory of the capture, None if the capture exceeds the size limit
+        """
+        if self.redact:
+            edifact_text = redact_partner_ids(edifact_text, self.__pseudonymize)
+        content = edifact_text.encode("utf-8")
+        metadata = {
+            "captured_at": datetime.now(timezone.utc).isoformat(),
+            "parser_version": PARSER_VERSION,
+            "message_type": message_type,
+            "options": options,
+            "parse_seconds": parse_seconds,
+            "estimated_bytes": estimated_bytes,
+            "segment_count": segment_count,
+            "input_bytes": len(content),
+            "redacted": self.redact,
+            "stage_timings": {
+                stage: timing._asdict() for stage, timing in stage_timings.items()
+            } if stage_timings is not None else None,
+        }
+        metadata_content = json.dumps(metadata, indent=2).encode("utf-8")
+        if len(content) + len(metadata_content) > self.max_bytes:
+            logger.warning(f"SLOW-PARSE: Capture of {len(content)} bytes exceeds the size limit and is skipped ...")
+            return None
+
+        name = f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%fZ')}-{uuid.uuid4().hex[:8]}"
+        partial_directory = self.directory / f".{name}"
+        partial_directory.mkdir()
+        (partial_directory / INPUT_FILE_NAME).write_bytes(content)
+        (partial_directory / CAPTURE_FILE_NAME).write_bytes(metadata_content)
+        capture_directory = self.directory / name
+        partial_directory.rename(capture_directory)
+        self.__rotate()
+        logger.warning(f"SLOW-PARSE: Captured parsing run of {parse_seconds:2.2f}s to {capture_directory} ...")
+        return capture_directory
+
+    def __rotate(self) -> None:
+        with self.__lock:
+            captures = []
+            for capture_directory in sorted(iter_capture_directories(self.directory), reverse=True):
+                try:
+                    size = sum(file.stat().st_size for file in capture_directory.iterdir())
+                except FileNotFoundError:
+                    # Removed by another server process in the meantime
+                    continue
+                captures.append((capture_directory, size))
+            total_bytes = 0
+            for capture_directory, size in captures:
+                total_bytes += size
+                if total_bytes > self.max_bytes:
+                    shutil.rmtree(capture_directory, ignore_errors=True)
+
+    def __pseudonymize(self, partner_id: str) -> str:
+        digest = hashlib.blake2b(partner_id.encode("utf-8"), key=self.__redaction_key)
+        if partner_id.isdigit():
+            # Numeric ids (e.g. GLN or BDEW codes) are replaced by digits, so they keep their format
+            return str(int.from_bytes(digest.digest(), "big"))[:len(partner_id)]
+        return digest.hexdigest().upper()[:len(partner_id)]
+
+
+def iter_capture_directories(directory: Path) -> Iterator[Path]:
+    """
+    Lists the complete captures of a capture directory, skipping the ones being written.
+
+    Args:
+        directory (Path): The capture directory
+
+    Returns:
+        Iterator[Path]: The directories of the captures, in no particular order
+    """
+    for capture_directory in Path(directory).iterdir():
+        if capture_directory.is_dir() and not capture_directory.name.startswith("."):
+            yield capture_directory
+
+
+def redact_partner_ids(edifact_text: str, pseudonymize: Callable[[str], str]) -> str:
+    """
+    Replaces the partner ids of an EDIFACT text, i.e. the sender and recipient of the UNB segment and
+    the party of the NAD segments, keeping the rest of the text unchanged.
+
+    Args:
+        edifact_text (str): The EDIFACT text
+        pseudonymize (Callable[[str], str]): The function returning the replacement of a partner id
+
+    Returns:
+        str: The EDIFACT text with replaced partner ids
+    """
+    context = _create_context(edifact_text)
+    element_separator = EdifactSyntaxHelper.get_element_separator(context)
+    component_separator = EdifactSyntaxHelper.get_component_separator(context)
+    segments = EdifactSyntaxHelper.split_segments(string_content=edifact_text, context=context)
+    for index, segment in enumerate(segments):
+        segment_line = segment.lstrip()
+        elements = EdifactSyntaxHelper.split_elements(string_content=segment_line, context=context)
+        positions = PARTNER_ID_ELEMENTS.get(elements[0], ())
+        for position in positions:
+            if position >= len(elements):
+                break
+            components = EdifactSyntaxHelper.split_components(string_content=elements[position], context=context)
+            if components[0]:
+                components[0] = pseudonymize(components[0])
+                elements[position] = component_separator.join(components)
+        if positions:
+            segments[index] = segment[:len(segment) - len(segment_line)] + element_separator.join(elements)
+    return EdifactSyntaxHelper.get_segment_terminator(context).join(segments)
+
+
+def _create_context(edifact_text: str) -> ParsingContext:
+    """
+    Creates a parsing context holding the delimiters of the UNA segment, if any.
+    """
+    context = InitialParsingContext()
+    una_segment = EdifactSyntaxHelper.find_and_get_una_segment(edifact_text)
+    if una_segment:
+        context.interchange.una_service_string_advice = SegmentUNA(
+            component_separator=una_segment[3],
+            element_separator=una_segment[4],
+            decimal_mark=una_segment[5],
+            release_character=una_segment[6],
+            reserved=una_segment[7],
+            segment_terminator=una_segment[8]
+        )
+    return context
+
+
+def get_default_parse_capture_spool() -> Optional[ParseCaptureSpool]:
+    """
+    Returns the capture spool shared by the application, creating it on first use.
+
+    Returns:
+        Optional[ParseCaptureSpool]: The default capture spool, None if no capture directory is configured
+    """
+    global _default_parse_capture_spool
+    if not PARSE_CAPTURE_DIR:
+        return None
+    if _default_parse_capture_spool is None:
+        with _default_parse_capture_spool_lock:
+            if _default_parse_capture_spool is None:
+                min_memory_bytes = None
+                if PARSE_CAPTURE_MIN_MEMORY_MB > 0:
+                    min_memory_bytes = PARSE_CAPTURE_MIN_MEMORY_MB * 1024 * 1024
+                _default_parse_capture_spool = ParseCaptureSpool(
+                    directory=Path(PARSE_CAPTURE_DIR),
+                    min_seconds=PARSE_CAPTURE_MIN_SECONDS,
+                    min_memory_bytes=min_memory_bytes,
+                    max_bytes=PARSE_CAPTURE_MAX_MB * 1024 * 1024,
+                    redact=PARSE_CAPTURE_REDACT
+                )
+    return _default_parse_capture_spool
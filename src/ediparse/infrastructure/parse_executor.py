@@ -0,0 +1,349 @@
+# coding: utf-8
+"""
+Executor parsing EDIFACT messages and rendering the parsed interchanges on a configurable backend.
+
+Parsing is pure-Python CPU work, so parsing on threads is bound to a single core by the GIL.
+The ParseExecutor defined here runs a parse task (parsing a message and rendering the parsed
+interchange as response body) on one of the following backends:
+
+- thread: on the warm parsers of a ParserPool (shares the GIL with the server)
+- process: on a pool of worker processes, each of them holding a warm parser created when the
+  process is started, so that the parsing scales with the number of cores
+- inline: in the calling thread, without any hand-over (lowest overhead for small messages,
+  e.g. if the server itself is scaled with several worker processes)
+
+The parsed interchange is rendered in the worker (as JSON, compact JSON or MessagePack), so only
+the rendered bytes, the memory statistics and (if requested) the stage timings are transferred back
+from a worker process instead of the pickled model tree.
+
+The backend and the number of workers of the default executor are configured via the
+environment variables PARSE_EXECUTOR (default: thread) and PARSE_EXECUTOR_WORKERS (default:
+the number of CPUs).
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import NamedTuple, Optional
+
+from ediparse.infrastructure.libs.edifactparser.exporters import encode_interchange, to_compact_json_bytes
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget, ParseStage, StageTimings
+from ediparse.infrastructure.libs.edifactparser.wrappers.constants import StrEnum
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange
+from ediparse.infrastructure.parse_result_cache import get_default_message_cache
+from ediparse.infrastructure.parser_pool import ParserPool, get_default_parser_pool
+
+
+class ParseExecutorBackend(StrEnum):
+    """
+    The backends a ParseExecutor runs its parse tasks on.
+    """
+    THREAD = "thread"
+    PROCESS = "process"
+    INLINE = "inline"
+
+
+class ParseOutputFormat(StrEnum):
+    """
+    The formats a parsed interchange is rendered in.
+    """
+    JSON = "json"
+    COMPACT_JSON = "compact_json"
+    MSGPACK = "msgpack"
+    COMPACT_MSGPACK = "compact_msgpack"
+
+
+PARSE_EXECUTOR = ParseExecutorBackend(os.getenv("PARSE_EXECUTOR", ParseExecutorBackend.THREAD.value))
+PARSE_EXECUTOR_WORKERS = int(os.getenv("PARSE_EXECUTOR_WORKERS", str(os.cpu_count() or 1)))
+
+_default_parse_executor: Optional["ParseExecutor"] = None
+_default_parse_executor_lock = threading.Lock()
+
+# The warm parser of a worker process, created by the initializer of the process
+_worker_parser: Optional[EdifactParser] = None
+
+
+class RenderedInterchange(NamedTuple):
+    """
+    A parsed interchange rendered as response body.
+
+    Attributes:
+        content (bytes): The rendered interchange
+        estimated_bytes (int): The estimated memory allocated while parsing (see MemoryBudget)
+        segment_count (int): The number of parsed segments
+        reused_messages (int): The number of messages reused from the message cache
+        parsed_messages (int): The number of messages not found in the message cache
+        render_seconds (float): The duration of rendering the parsed interchange
+        stage_timings (Optional[StageTimings]): The durations of the stages of the parsing run and the rendering,
+            None if they have not been requested
+    """
+    content: bytes
+    estimated_bytes: int = 0
+    segment_count: int = 0
+    reused_messages: int = 0
+    parsed_messages: int = 0
+    render_seconds: float = 0.0
+    stage_timings: Optional[StageTimings] = None
+
+
+def render_interchange(
+        parser: EdifactParser,
+        edifact_text: str,
+        max_lines_to_parse: int = -1,
+        max_memory_bytes: Optional[int] = None,
+        output_format: ParseOutputFormat = ParseOutputFormat.JSON,
+        short_keys: bool = False,
+        collect_stage_timings: bool = False
+) -> RenderedInterchange:
+    """
+    Parses an EDIFACT-specific message and renders the parsed interchange.
+
+    Args:
+        parser (EdifactParser): The parser to use
+        edifact_text (str): The EDIFACT-specific message to parse
+        max_lines_to_parse (int): The maximum number of lines to parse, defaults to -1 which means no parsing limit
+        max_memory_bytes (Optional[int]): The memory budget of the parsing run in bytes, defaults to None (no budget)
+        output_format (ParseOutputFormat): The format to render the interchange in, defaults to ParseOutputFormat.JSON
+        short_keys (bool): Whether the field names are replaced by their short aliases in the compact formats,
+            defaults to False
+        collect_stage_timings (bool): Whether the durations of the stages are recorded, defaults to False
+
+    Returns:
+        RenderedInterchange: The rendered interchange with the memory statistics of the parsing run
+
+    Raises:
+        EdifactParserException: If the message is not a valid EDIFACT-specific message
+        ParseMemoryBudgetExceededException: If the parsing run exceeds the memory budget
+    """
+    memory_budget = MemoryBudget(max_bytes=max_memory_bytes)
+    stage_timings = StageTimings() if collect_stage_timings else None
+    interchange = parser.parse(
+        edifact_text=edifact_text,
+        max_lines_to_parse=max_lines_to_parse,
+        memory_budget=memory_budget,
+        stage_timings=stage_timings
+    )
+    render_start = time.perf_counter()
+    content = render_parsed_interchange(interchange, output_format, short_keys)
+    render_seconds = time.perf_counter() - render_start
+    if stage_timings is not None:
+        stage_timings.add(ParseStage.RENDER, render_seconds)
+    return RenderedInterchange(
+        content=content,
+        estimated_bytes=memory_budget.estimated_bytes,
+        segment_count=memory_budget.segment_count,
+        reused_messages=memory_budget.reused_messages,
+        parsed_messages=memory_budget.parsed_messages,
+        render_seconds=render_seconds,
+        stage_timings=stage_timings
+    )
+
+
+def render_parsed_interchange(
+        interchange: EdifactInterchange,
+        output_format: ParseOutputFormat = ParseOutputFormat.JSON,
+        short_keys: bool = False
+) -> bytes:
+    """
+    Renders a parsed interchange like the response classes render it.
+
+    Args:
+        interchange (EdifactInterchange): The parsed interchange
+        output_format (ParseOutputFormat): The format to render the interchange in, defaults to ParseOutputFormat.JSON
+        short_keys (bool): Whether the field names are replaced by their short aliases in the compact formats,
+            defaults to False
+
+    Returns:
+        bytes: The rendered interchange
+    """
+    if output_format == ParseOutputFormat.MSGPACK:
+        return encode_interchange(interchange)
+    if output_format == ParseOutputFormat.COMPACT_MSGPACK:
+        return encode_interchange(interchange, compact=True, short_keys=short_keys)
+    if output_format == ParseOutputFormat.COMPACT_JSON:
+        return to_compact_json_bytes(interchange, short_keys)
+    return interchange.to_json_bytes()
+
+
+class ParseExecutor:
+    """
+    Executor running parse tasks on a thread, process or inline backend.
+
+    Attributes:
+        backend (ParseExecutorBackend): The backend the parse tasks are run on
+        max_workers (int): The number of parse tasks run concurrently (1 for the inline backend)
+    """
+
+    def __init__(
+            self,
+            backend: ParseExecutorBackend = PARSE_EXECUTOR,
+            max_workers: int = PARSE_EXECUTOR_WORKERS,
+            parser_pool: ParserPool = None
+    ) -> None:
+        """
+        Initializes a new executor. The worker processes of the process backend are started by warm_up().
+
+        Args:
+            backend (ParseExecutorBackend): The backend to run the parse tasks on, defaults to PARSE_EXECUTOR
+            max_workers (int): The number of worker processes of the process backend, defaults to PARSE_EXECUTOR_WORKERS
+            parser_pool (ParserPool): The parser pool of the thread backend, defaults to None, in which case
+                the default pool of the application is used
+
+        Raises:
+            ValueError: If the executor has no worker
+        """
+        if max_workers < 1:
+            raise ValueError(f"A parse executor needs at least one worker, got {max_workers}")
+        self.backend = ParseExecutorBackend(backend)
+        self.__pending_tasks = 0
+        self.__pending_tasks_lock = threading.Lock()
+        self.__parser_pool: Optional[ParserPool] = None
+        self.__process_pool: Optional[ProcessPoolExecutor] = None
+        self.__inline_parser: Optional[EdifactParser] = None
+        if self.backend == ParseExecutorBackend.THREAD:
+            self.__parser_pool = parser_pool or get_default_parser_pool()
+            self.max_workers = self.__parser_pool.size
+        elif self.backend == ParseExecutorBackend.PROCESS:
+            # Worker processes are spawned rather than forked, so they do not inherit the threads of the server
+            self.__process_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker
+            )
+            self.max_workers = max_workers
+        else:
+            self.__inline_parser = EdifactParser(message_cache=get_default_message_cache())
+            self.max_workers = 1
+
+    @property
+    def pending_tasks(self) -> int:
+        """
+        The number of submitted parse tasks that have not finished yet, i.e. running or waiting for a worker.
+        """
+        return self.__pending_tasks
+
+    def submit(
+            self,
+            edifact_text: str,
+            max_lines_to_parse: int = -1,
+            max_memory_bytes: Optional[int] = None,
+            output_format: ParseOutputFormat = ParseOutputFormat.JSON,
+            short_keys: bool = False,
+            collect_stage_timings: bool = False
+    ) -> "Future[RenderedInterchange]":
+        """
+        Submits a parse task parsing an EDIFACT-specific message and rendering the parsed interchange.
+
+        The inline backend runs the task right away, returning a completed future.
+
+        Args:
+            edifact_text (str): The EDIFACT-specific message to parse
+            max_lines_to_parse (int): The maximum number of lines to parse, defaults to -1 which means no parsing limit
+            max_memory_bytes (Optional[int]): The memory budget of the parsing run in bytes,
+                defaults to None (no budget)
+            output_format (ParseOutputFormat): The format to render the interchange in,
+                defaults to ParseOutputFormat.JSON
+            short_keys (bool): Whether the field names are replaced by their short aliases in the compact formats,
+                defaults to False
+            collect_stage_timings (bool): Whether the durations of the stages are recorded and handed out
+                with the rendered interchange, defaults to False
+
+        Returns:
+            Future[RenderedInterchange]: The future of the rendered interchange, holding the raised exception
+                if the message could not be parsed
+        """
+        args = (edifact_text, max_lines_to_parse, max_memory_bytes, output_format, short_keys, collect_stage_timings)
+        if self.__parser_pool is not None:
+            return self.__track(self.__parser_pool.submit(render_interchange, *args))
+        if self.__process_pool is not None:
+            return self.__track(self.__process_pool.submit(_render_in_worker, *args))
+
+        future: "Future[RenderedInterchange]" = Future()
+        try:
+            future.set_result(render_interchange(self.__inline_parser, *args))
+        except Exception as ex:
+            future.set_exception(ex)
+        return future
+
+    def __track(self, future: Future) -> Future:
+        with self.__pending_tasks_lock:
+            self.__pending_tasks += 1
+        future.add_done_callback(self.__untrack)
+        return future
+
+    def __untrack(self, future: Future) -> None:
+        with self.__pending_tasks_lock:
+            self.__pending_tasks -= 1
+
+    def warm_up(self) -> None:
+        """
+        Starts all worker processes of the process backend and waits until their parsers have been created.
+
+        The worker processes are started on demand otherwise, so that the first requests would have to wait
+        for them. Nothing is done for the other backends, whose parsers are created along with the executor.
+        """
+        if self.__process_pool is not None:
+            wait([self.__process_pool.submit(_get_worker_pid) for _ in range(self.max_workers)])
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the worker processes of the process backend.
+
+        The parser pool of the thread backend is left running, since it is shared with other components.
+
+        Args:
+            wait (bool): Whether to wait for the running tasks to finish, defaults to True
+        """
+        if self.__process_pool is not None:
+            self.__process_pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def get_default_parse_executor() -> ParseExecutor:
+    """
+    Returns the parse executor shared by the application, creating it on first use.
+
+    Returns:
+        ParseExecutor: The default parse executor
+    """
+    global _default_parse_executor
+    if _default_parse_executor is None:
+        with _default_parse_executor_lock:
+            if _default_parse_executor is None:
+                _default_parse_executor = ParseExecutor()
+    return _default_parse_executor
+
+
+def shutdown_default_parse_executor() -> None:
+    """
+    Shuts down the parse executor shared by the application, if it has been created.
+    """
+    global _default_parse_executor
+    with _default_parse_executor_lock:
+        parse_executor, _default_parse_executor = _default_parse_executor, None
+    if parse_executor is not None:
+        parse_executor.shutdown(wait=False)
+
+
+def _initialize_worker() -> None:
+    """
+    Creates the warm parser of a worker process when the process is started.
+    """
+    global _worker_parser
+    _worker_parser = EdifactParser(message_cache=get_default_message_cache())
+
+
+def _render_in_worker(*args) -> RenderedInterchange:
+    """
+    Runs a parse task with the warm parser of the worker process.
+    """
+    return render_interchange(_worker_parser, *args)
+
+
+def _get_worker_pid() -> int:
+    """
+    Returns the process id of the worker process, used to start all worker processes.
+    """
+    return os.getpid()
@@ -0,0 +1,260 @@
+# coding: utf-8
+"""
+Sampling profiler of production parsing runs.
+
+Synthetic benchmarks do not always reproduce the hotspots of the payloads seen in production. The
+ParseProfiler defined here profiles a configurable fraction of the parsing runs of the server and
+aggregates their profiles across requests:
+
+- Function statistics: The sampled runs are profiled with cProfile. Their statistics are added up
+  and handed out in the pstats format (loadable with pstats.Stats, snakeviz and the like) or as
+  text report.
+- Collapsed stacks: While a sampled run is profiled, a background thread samples the stack of the
+  thread running it at a fixed interval. The sampled stacks are counted and handed out in the
+  collapsed-stack format (one "frame;frame;frame count" line per stack), which is the input of
+  flamegraph.pl, speedscope and the like.
+
+At most one parsing run is profiled at a time, further sampled runs are run without profiling. So
+the overhead is bounded to one profiled run, also under load.
+
+The profiler is enabled via the environment variable PARSE_PROFILE_SAMPLE_RATE, the fraction of the
+parsing runs to profile (default: 0, which disables the profiler), and the interval of the stack
+samples via PARSE_PROFILE_STACK_INTERVAL_MS (default: 5).
+"""
+
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import random
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Callable, NamedTuple, Optional, TypeVar
+
+T = TypeVar("T")
+
+PARSE_PROFILE_SAMPLE_RATE = float(os.getenv("PARSE_PROFILE_SAMPLE_RATE", "0"))
+PARSE_PROFILE_STACK_INTERVAL_MS = float(os.getenv("PARSE_PROFILE_STACK_INTERVAL_MS", "5"))
+# The number of distinct stacks kept, further stacks are counted as OTHER_STACK
+MAX_COLLAPSED_STACKS = 10000
+OTHER_STACK = "[other]"
+
+_default_parse_profiler: Optional["ParseProfiler"] = None
+_default_parse_profiler_lock = threading.Lock()
+
+
+class ProfilerStatistics(NamedTuple):
+    """
+    The counters of a parse profiler.
+
+    Attributes:
+        profiled_runs (int): The number of profiled parsing runs
+        skipped_runs (int): The number of sampled parsing runs not profiled, since another run was profiled
+        stack_samples (int): The number of sampled stacks
+    """
+    profiled_runs: int
+    skipped_runs: int
+    stack_samples: int
+
+
+class ParseProfiler:
+    """
+    Profiles a fraction of the parsing runs and aggregates their profiles across the runs.
+
+    The profiler is shared by the threads of the server, its aggregated profiles are guarded by a lock.
+    """
+
+    def __init__(
+            self,
+            sample_rate: float,
+            stack_interval: float = PARSE_PROFILE_STACK_INTERVAL_MS / 1000,
+            random_function: Callable[[], float] = random.random
+    ) -> None:
+        """
+        Initializes a new profiler without any profiled run.
+
+        Args:
+            sample_rate (float): The fraction of the parsing runs to profile, between 0 and 1
+            stack_interval (float): The interval of the stack samples in seconds
+            random_function (Callable[[], float]): The function drawing the random numbers deciding
+                whether a run is sampled, defaults to random.random
+
+        Raises:
+            ValueError: If the sample rate is not between 0 and 1 or the interval is not positive
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(f"The sample rate has to be between 0 and 1, got {sample_rate}")
+        if stack_interval <= 0:
+            raise ValueError(f"The interval of the stack samples has to be positive, got {stack_interval}")
+        self.sample_rate = sample_rate
+        self.stack_interval = stack_interval
+        self.__random_function = random_function
+        self.__profiling = threading.Lock()
+        self.__lock = threading.Lock()
+        self.__stats: Optional[pstats.Stats] = None
+        self.__stacks: Counter = Counter()
+        self.__profiled_runs = 0
+        self.__skipped_runs = 0
+
+    @property
+    def statistics(self) -> ProfilerStatistics:
+        """
+        The counters of the profiler.
+        """
+        with self.__lock:
+            return ProfilerStatistics(
+                profiled_runs=self.__profiled_runs,
+                skipped_runs=self.__skipped_runs,
+                stack_samples=sum(self.__stacks.values())
+            )
+
+    def profile(self, function: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Runs a function in the calling thread, profiling it if the run is sampled.
+
+        Args:
+            function (Callable[..., T]): The function running the parsing run
+            *args: The positional arguments of the function
+            **kwargs: The keyword arguments of the function
+
+        Returns:
+            T: The result of the function
+        """
+        if self.__random_function() >= self.sample_rate:
+            return function(*args, **kwargs)
+        if not self.__profiling.acquire(blocking=False):
+            with self.__lock:
+                self.__skipped_runs += 1
+            return function(*args, **kwargs)
+        try:
+            return self.__run_profiled(function, args, kwargs)
+        finally:
+            self.__profiling.release()
+
+    def dump_stats(self) -> bytes:
+        """
+        Returns the aggregated function statistics in the pstats format, i.e. the content of a file
+        written by pstats.Stats.dump_stats.
+
+        Returns:
+            bytes: The marshalled function statistics, empty ones if no run has been profiled
+        """
+        with self.__lock:
+            return marshal.dumps(self.__stats.stats if self.__stats is not None else {})
+
+    def render_stats(self, sort_key: str = "cumulative", limit: int = 50) -> str:
+        """
+        Renders the aggregated function statistics as text report.
+
+        Args:
+            sort_key (str): The key the functions are sorted by (see pstats.Stats.sort_stats), defaults to cumulative
+            limit (int): The number of listed functions, defaults to 50
+
+        Returns:
+            str: The report of the function statistics, empty if no run has been profiled
+
+        Raises:
+            KeyError: If the sort key is unknown
+        """
+        stream = io.StringIO()
+        with self.__lock:
+            if self.__stats is None:
+                return ""
+            self.__stats.stream = stream
+            self.__stats.sort_stats(sort_key).print_stats(limit)
+        return stream.getvalue()
+
+    def render_collapsed_stacks(self) -> str:
+        """
+        Renders the aggregated stack samples in the collapsed-stack format, the input of flamegraph tools.
+
+        Returns:
+            str: One line per stack, the frames from the outermost to the innermost one separated by
+                semicolons and followed by the number of samples
+        """
+        with self.__lock:
+            return "".join(f"{stack} {count}\n" for stack, count in sorted(self.__stacks.items()))
+
+    def reset(self) -> None:
+        """
+        Removes all aggregated profiles and counters.
+        """
+        with self.__lock:
+            self.__stats = None
+            self.__stacks.clear()
+            self.__profiled_runs = 0
+            self.__skipped_runs = 0
+
+    def __run_profiled(self, function: Callable[..., T], args: tuple, kwargs: dict) -> T:
+        stacks: Counter = Counter()
+        stop = threading.Event()
+        sampler = threading.Thread(
+            target=self.__sample_stacks,
+            args=(threading.get_ident(), stop, stacks),
+            name="parse-profiler",
+            daemon=True
+        )
+        profile = cProfile.Profile()
+        sampler.start()
+        profile.enable()
+        try:
+            return _call_profiled(function, args, kwargs)
+        finally:
+            profile.disable()
+            stop.set()
+            sampler.join()
+            self.__add(profile, stacks)
+
+    def __sample_stacks(self, thread_id: int, stop: threading.Event, stacks: Counter) -> None:
+        while not stop.wait(self.stack_interval):
+            frame = sys._current_frames().get(thread_id)
+            frames = []
+            # Only the frames below the profiled function are kept, not the ones of the threadpool. Samples
+            # taken before the function has been called or after it has returned are discarded.
+            while frame is not None and frame.f_code is not _call_profiled.__code__:
+                frames.append(self.__get_frame_name(frame))
+                frame = frame.f_back
+            if frame is not None and frames:
+                stacks[";".join(reversed(frames))] += 1
+
+    def __add(self, profile: cProfile.Profile, stacks: Counter) -> None:
+        with self.__lock:
+            if self.__stats is None:
+                self.__stats = pstats.Stats(profile)
+            else:
+                self.__stats.add(profile)
+            for stack, count in stacks.items():
+                if stack not in self.__stacks and len(self.__stacks) >= MAX_COLLAPSED_STACKS:
+                    stack = OTHER_STACK
+                self.__stacks[stack] += count
+            self.__profiled_runs += 1
+
+    @staticmethod
+    def __get_frame_name(frame: FrameType) -> str:
+        code = frame.f_code
+        return f"{frame.f_globals.get('__name__', '?')}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+def _call_profiled(function: Callable[..., T], args: tuple, kwargs: dict) -> T:
+    # The frame of this function marks the outermost frame of the sampled stacks
+    return function(*args, **kwargs)
+
+
+def get_default_parse_profiler() -> Optional[ParseProfiler]:
+    """
+    Returns the parse profiler shared by the application, creating it on first use.
+
+    Returns:
+        Optional[ParseProfiler]: The default parse profiler, None if the profiler is disabled
+    """
+    global _default_parse_profiler
+    if PARSE_PROFILE_SAMPLE_RATE <= 0:
+        return None
+    if _default_parse_profiler is None:
+        with _default_parse_profiler_lock:
+            if _default_parse_profiler is None:
+                _default_parse_profiler = ParseProfiler(min(PARSE_PROFILE_SAMPLE_RATE, 1.0))
+    return _default_parse_profiler
@@ -0,0 +1,317 @@
+# coding: utf-8
+"""
+Content-addressed cache of rendered parse results.
+
+Upstream retries and duplicate deliveries make the service parse byte-identical payloads several
+times. The ParseResultCache defined here keeps the rendered results (the response bodies) of
+recent parsing runs, keyed by a BLAKE2b hash of the payload together with the parser version
+and the options the result depends on (the line limit, the output format and the short keys),
+so that a repeated payload is answered without parsing it again.
+
+The results are held in memory up to a size limit, evicting the least recently used results
+beyond it. Optionally, the evicted results are moved to a directory on disk, which is bounded
+by its own size limit and survives restarts (the parser version is part of the key, so the
+results of an older version are never hit).
+
+The cache is disabled by default and configured via the following environment variables:
+
+- PARSE_CACHE_MAX_MB: The size of the results held in memory (default: 0, which disables the cache)
+- PARSE_CACHE_DIR: The directory of the on-disk tier (default: empty, which disables the on-disk tier)
+- PARSE_CACHE_DISK_MAX_MB: The size of the results held on disk (default: 1024)
+
+Resubmitted interchanges that differ in a few messages only (e.g. corrections) are never hit by
+the results cache. For them, the parsers share a MessageCache (see the edifactparser utils),
+which reuses the parsed messages of unchanged UNH..UNT spans. It is disabled by default and
+configured via the environment variable MESSAGE_CACHE_MAX_SEGMENTS (the number of segments of
+the cached messages, default: 0, which disables the message cache).
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from importlib import metadata
+from typing import NamedTuple, Optional
+
+from ediparse.infrastructure.libs.edifactparser.exporters import MSGPACK_SCHEMA_VERSION
+from ediparse.infrastructure.libs.edifactparser.utils import MessageCache
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_MAX_MB = int(os.getenv("PARSE_CACHE_MAX_MB", "0"))
+PARSE_CACHE_DIR = os.getenv("PARSE_CACHE_DIR", "")
+PARSE_CACHE_DISK_MAX_MB = int(os.getenv("PARSE_CACHE_DISK_MAX_MB", "1024"))
+MESSAGE_CACHE_MAX_SEGMENTS = int(os.getenv("MESSAGE_CACHE_MAX_SEGMENTS", "0"))
+
+CACHE_KEY_DIGEST_SIZE = 20
+CACHE_FILE_SUFFIX = ".bin"
+
+_default_parse_result_cache: Optional["ParseResultCache"] = None
+_default_parse_result_cache_lock = threading.Lock()
+_default_message_cache: Optional[MessageCache] = None
+_default_message_cache_lock = threading.Lock()
+
+
+def _get_parser_version() -> str:
+    try:
+        package_version = metadata.version("EDIParse")
+    except metadata.PackageNotFoundError:
+        package_version = "unknown"
+    return f"{package_version}+msgpack{MSGPACK_SCHEMA_VERSION}"
+
+
+# The version of the parser and its output, results of other versions are never hit
+PARSER_VERSION = _get_parser_version()
+
+
+class CacheStatistics(NamedTuple):
+    """
+    The counters and sizes of a parse result cache.
+
+    Attributes:
+        hits (int): The number of lookups answered from memory or disk
+        disk_hits (int): The number of lookups answered from disk (included in hits)
+        misses (int): The number of lookups not answered
+        entries (int): The number of results held in memory
+        size_bytes (int): The size of the results held in memory
+        disk_entries (int): The number of results held on disk
+        disk_size_bytes (int): The size of the results held on disk
+    """
+    hits: int
+    disk_hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+    disk_entries: int
+    disk_size_bytes: int
+
+
+def make_cache_key(edifact_text: str, max_lines_to_parse: int, output_format: str, short_keys: bool) -> str:
+    """
+    Computes the key of a parse result from the payload and the options the result depends on.
+
+    Args:
+        edifact_text (str): The parsed EDIFACT-specific message
+        max_lines_to_parse (int): The maximum number of lines parsed
+        output_format (str): The format the interchange is rendered in (see ParseOutputFormat)
+        short_keys (bool): Whether the field names are replaced by their short aliases
+
+    Returns:
+        str: The hexadecimal key
+    """
+    digest = hashlib.blake2b(digest_size=CACHE_KEY_DIGEST_SIZE)
+    digest.update(f"{PARSER_VERSION}|{max_lines_to_parse}|{output_format}|{short_keys}|".encode("utf-8"))
+    digest.update(edifact_text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ParseResultCache:
+    """
+    Thread-safe LRU cache of rendered parse results with an optional on-disk tier.
+
+    Attributes:
+        max_bytes (int): The size of the results held in memory
+        directory (Optional[str]): The directory of the on-disk tier, None if there is none
+        disk_max_bytes (int): The size of the results held on disk
+    """
+
+    def __init__(
+            self,
+            max_bytes: int = PARSE_CACHE_MAX_MB * 1024 * 1024,
+            directory: Optional[str] = PARSE_CACHE_DIR or None,
+            disk_max_bytes: int = PARSE_CACHE_DISK_MAX_MB * 1024 * 1024
+    ) -> None:
+        """
+        Initializes a new cache, indexing the results already held in the directory of the on-disk tier.
+
+        Args:
+            max_bytes (int): The size of the results held in memory, defaults to PARSE_CACHE_MAX_MB
+            directory (Optional[str]): The directory of the on-disk tier, defaults to PARSE_CACHE_DIR
+                (None disables the on-disk tier)
+            disk_max_bytes (int): The size of the results held on disk, defaults to PARSE_CACHE_DISK_MAX_MB
+
+        Raises:
+            ValueError: If the cache cannot hold any result
+        """
+        if max_bytes < 1:
+            raise ValueError(f"A parse result cache needs a positive size, got {max_bytes}")
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.disk_max_bytes = disk_max_bytes
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict[str, bytes] = OrderedDict()
+        self.__size_bytes = 0
+        self.__disk_entries: OrderedDict[str, int] = OrderedDict()
+        self.__disk_size_bytes = 0
+        self.__hits = 0
+        self.__disk_hits = 0
+        self.__misses = 0
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+            self.__index_disk_entries()
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        """
+        The counters and sizes of the cache.
+        """
+        with self.__lock:
+            return CacheStatistics(
+                hits=self.__hits,
+                disk_hits=self.__disk_hits,
+                misses=self.__misses,
+                entries=len(self.__entries),
+                size_bytes=self.__size_bytes,
+                disk_entries=len(self.__disk_entries),
+                disk_size_bytes=self.__disk_size_bytes
+            )
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Looks up a result, moving a result found on disk back to memory.
+
+        Args:
+            key (str): The key of the result (see make_cache_key)
+
+        Returns:
+            Optional[bytes]: The result, None if it is not cached
+        """
+        with self.__lock:
+            content = self.__entries.get(key)
+            if content is not None:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                return content
+            content = self.__read_disk_entry(key)
+            if content is None:
+                self.__misses += 1
+                return None
+            self.__hits += 1
+            self.__disk_hits += 1
+            self.__store(key, content)
+            return content
+
+    def put(self, key: str, content: bytes) -> None:
+        """
+        Stores a result, evicting the least recently used results beyond the size limit.
+
+        Results larger than the size limit are not stored.
+
+        Args:
+            key (str): The key of the result (see make_cache_key)
+            content (bytes): The result
+        """
+        if len(content) > self.max_bytes:
+            return
+        with self.__lock:
+            self.__store(key, content)
+
+    def clear(self) -> None:
+        """
+        Removes all results from memory and disk.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__size_bytes = 0
+            for key in list(self.__disk_entries):
+                self.__remove_disk_entry(key)
+
+    def __store(self, key: str, content: bytes) -> None:
+        previous_content = self.__entries.pop(key, None)
+        if previous_content is not None:
+            self.__size_bytes -= len(previous_content)
+        self.__entries[key] = content
+        self.__size_bytes += len(content)
+        while self.__size_bytes > self.max_bytes:
+            evicted_key, evicted_content = self.__entries.popitem(last=False)
+            self.__size_bytes -= len(evicted_content)
+            self.__write_disk_entry(evicted_key, evicted_content)
+
+    def __get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_FILE_SUFFIX)
+
+    def __index_disk_entries(self) -> None:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(CACHE_FILE_SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[:-len(CACHE_FILE_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(entries):
+            self.__disk_entries[key] = size
+            self.__disk_size_bytes += size
+        self.__evict_disk_entries()
+
+    def __read_disk_entry(self, key: str) -> Optional[bytes]:
+        if key not in self.__disk_entries:
+            return None
+        try:
+            with open(self.__get_path(key), "rb") as cache_file:
+                content = cache_file.read()
+        except OSError as ex:
+            logger.warning(f"Reading the cached parse result {key} failed: {ex}")
+            content = None
+        self.__remove_disk_entry(key)
+        return content
+
+    def __write_disk_entry(self, key: str, content: bytes) -> None:
+        if self.directory is None or len(content) > self.disk_max_bytes:
+            return
+        path = self.__get_path(key)
+        try:
+            # The result is written to a temporary file first, so that a crash never leaves a partial result
+            with open(path + ".tmp", "wb") as cache_file:
+                cache_file.write(content)
+            os.replace(path + ".tmp", path)
+        except OSError as ex:
+            logger.warning(f"Writing the cached parse result {key} failed: {ex}")
+            return
+        self.__disk_size_bytes -= self.__disk_entries.pop(key, 0)
+        self.__disk_entries[key] = len(content)
+        self.__disk_size_bytes += len(content)
+        self.__evict_disk_entries()
+
+    def __evict_disk_entries(self) -> None:
+        while self.__disk_size_bytes > self.disk_max_bytes:
+            self.__remove_disk_entry(next(iter(self.__disk_entries)))
+
+    def __remove_disk_entry(self, key: str) -> None:
+        self.__disk_size_bytes -= self.__disk_entries.pop(key)
+        try:
+            os.remove(self.__get_path(key))
+        except OSError:
+            pass
+
+
+def get_default_parse_result_cache() -> Optional[ParseResultCache]:
+    """
+    Returns the parse result cache shared by the application, creating it on first use.
+
+    Returns:
+        Optional[ParseResultCache]: The default parse result cache, None if the cache is disabled
+    """
+    global _default_parse_result_cache
+    if PARSE_CACHE_MAX_MB <= 0:
+        return None
+    if _default_parse_result_cache is None:
+        with _default_parse_result_cache_lock:
+            if _default_parse_result_cache is None:
+                _default_parse_result_cache = ParseResultCache()
+    return _default_parse_result_cache
+
+
+def get_default_message_cache() -> Optional[MessageCache]:
+    """
+    Returns the message cache shared by the parsers of the application, creating it on first use.
+
+    Returns:
+        Optional[MessageCache]: The default message cache, None if the message cache is disabled
+    """
+    global _default_message_cache
+    if MESSAGE_CACHE_MAX_SEGMENTS <= 0:
+        return None
+    if _default_message_cache is None:
+        with _default_message_cache_lock:
+            if _default_message_cache is None:
+                _default_message_cache = MessageCache(max_segments=MESSAGE_CACHE_MAX_SEGMENTS)
+    return _default_message_cache
@@ -0,0 +1,254 @@
+# coding: utf-8
+"""
+Pool of warm EDIFACT parsers.
+
+Creating an EdifactParser sets up its segment handlers, group state resolvers and parsing
+context factory, which takes considerably longer than parsing a typical message. The ParserPool
+defined here creates a fixed number of parsers up front and hands them out to the tasks run on
+its worker threads, so that every task finds a warm parser. Since a parser keeps the state of
+the current parsing run, each parser is used by one task at a time.
+
+The size of the default pool shared by the application is configured via the environment
+variable PARSER_POOL_SIZE (default: the number of CPUs, at most 8). By default, its parsers share
+the default message cache (see parse_result_cache.py).
+
+The tasks parsing the items of a batch or an archive can report each parsing run to a
+ParseRunObserver (see run_observed(...)), e.g. to record the metrics of the runs.
+"""
+
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Iterable, Iterator, NamedTuple, Optional, TypeVar
+
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget
+from ediparse.infrastructure.parse_result_cache import get_default_message_cache
+
+T = TypeVar("T")
+
+# Called with the parsed text, the duration of the parsing run in seconds, its memory budget
+# and the raised exception (None if the parsing run succeeded)
+ParseRunObserver = Callable[[str, float, MemoryBudget, Optional[BaseException]], None]
+
+PARSER_POOL_SIZE = int(os.getenv("PARSER_POOL_SIZE", str(min(8, os.cpu_count() or 1))))
+
+_default_parser_pool: Optional["ParserPool"] = None
+_default_parser_pool_lock = threading.Lock()
+
+
+def _create_parser() -> EdifactParser:
+    return EdifactParser(message_cache=get_default_message_cache())
+
+
+class PoolTaskResult(NamedTuple):
+    """
+    The outcome of a task run on the parser pool for one item of a sequence.
+
+    Attributes:
+        index (int): The position of the item in the input sequence
+        value (Any): The result of the task, None if the task failed
+        error (Optional[BaseException]): The exception raised by the task, None if the task succeeded
+    """
+    index: int
+    value: Any = None
+    error: Optional[BaseException] = None
+
+
+def run_observed(
+        parse: Callable[[], T],
+        edifact_text: str,
+        memory_budget: MemoryBudget,
+        observer: Optional[ParseRunObserver] = None
+) -> T:
+    """
+    Runs a parsing run and reports it to an observer, if any.
+
+    Args:
+        parse (Callable[[], T]): The parsing run, accounted against the memory budget
+        edifact_text (str): The parsed text
+        memory_budget (MemoryBudget): The memory budget of the parsing run
+        observer (Optional[ParseRunObserver]): The observer to report the parsing run to, defaults to None
+
+    Returns:
+        T: The result of the parsing run
+
+    Raises:
+        Exception: The exception raised by the parsing run, after it has been reported
+    """
+    if observer is None:
+        return parse()
+    start = time.perf_counter()
+    try:
+        result = parse()
+    except Exception as e:
+        observer(edifact_text, time.perf_counter() - start, memory_budget, e)
+        raise
+    observer(edifact_text, time.perf_counter() - start, memory_budget, None)
+    return result
+
+
+class ParserPool:
+    """
+    Fixed-size pool of warm EdifactParser instances with one worker thread per parser.
+
+    Attributes:
+        size (int): The number of parsers and worker threads of the pool
+    """
+
+    def __init__(
+            self,
+            size: int = PARSER_POOL_SIZE,
+            parser_factory: Callable[[], EdifactParser] = _create_parser
+    ) -> None:
+        """
+        Initializes a new pool and creates all of its parsers right away.
+
+        Args:
+            size (int): The number of parsers and worker threads, defaults to PARSER_POOL_SIZE
+            parser_factory (Callable[[], EdifactParser]): The factory creating the parsers, defaults to parsers
+                sharing the default message cache
+
+        Raises:
+            ValueError: If the size is less than 1
+        """
+        if size < 1:
+            raise ValueError(f"The parser pool size has to be at least 1, got {size}.")
+        self.size = size
+        self.__parsers: "queue.SimpleQueue[EdifactParser]" = queue.SimpleQueue()
+        for _ in range(size):
+            self.__parsers.put(parser_factory())
+        self.__executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="edifact-parser")
+
+    @contextmanager
+    def acquire(self) -> Iterator[EdifactParser]:
+        """
+        Borrows a parser from the pool, waiting until one is available.
+
+        Yields:
+            EdifactParser: The borrowed parser, which is returned to the pool afterwards
+        """
+        parser = self.__parsers.get()
+        try:
+            yield parser
+        finally:
+            self.__parsers.put(parser)
+
+    def submit(self, task: Callable[..., T], *args: Any) -> "Future[T]":
+        """
+        Runs a task with a borrowed parser on a worker thread of the pool.
+
+        Args:
+            task (Callable[..., T]): The task, called with the borrowed parser followed by the given arguments
+            *args (Any): The further arguments of the task
+
+        Returns:
+            Future[T]: The future of the task's result
+        """
+        return self.__executor.submit(self.__run, task, *args)
+
+    def map_ordered(self, task: Callable[[EdifactParser, Any], T], items: Iterable[Any]) -> Iterator[PoolTaskResult]:
+        """
+        Runs a task for each item concurrently and hands out the outcomes in input order.
+
+        At most twice as many items as the pool has parsers are in flight at once, so the
+        items are consumed lazily and a slow item only holds back the items following it
+        within this window. Exceptions raised by the task are handed out as the outcome of
+        their item instead of being raised.
+
+        Args:
+            task (Callable[[EdifactParser, Any], T]): The task, called with a borrowed parser and the item
+            items (Iterable[Any]): The items to process
+
+        Returns:
+            Iterator[PoolTaskResult]: The outcomes of the items in input order
+        """
+        pending: Deque[tuple[int, Future]] = deque()
+        max_pending = 2 * self.size
+        try:
+            for index, item in enumerate(items):
+                pending.append((index, self.submit(task, item)))
+                if len(pending) >= max_pending:
+                    yield self.__get_result(*pending.popleft())
+            while pending:
+                yield self.__get_result(*pending.popleft())
+        finally:
+            # The consumer stopped early, the items not yet started are dropped
+            for _, future in pending:
+                future.cancel()
+
+    def map_unordered(self, task: Callable[[EdifactParser, Any], T], items: Iterable[Any]) -> Iterator[PoolTaskResult]:
+        """
+        Runs a task for each item concurrently and hands out the outcomes as soon as they are available.
+
+        In contrast to map_ordered(...), a slow item does not hold back any other item, so the
+        outcomes are handed out in completion order. The index of each outcome refers to the
+        position of its item in the input sequence. As with map_ordered(...), at most twice as many
+        items as the pool has parsers are in flight at once and exceptions raised by the task are
+        handed out as the outcome of their item.
+
+        Args:
+            task (Callable[[EdifactParser, Any], T]): The task, called with a borrowed parser and the item
+            items (Iterable[Any]): The items to process
+
+        Returns:
+            Iterator[PoolTaskResult]: The outcomes of the items in completion order
+        """
+        pending: dict[Future, int] = {}
+        max_pending = 2 * self.size
+        try:
+            for index, item in enumerate(items):
+                pending[self.submit(task, item)] = index
+                if len(pending) >= max_pending:
+                    yield from self.__get_completed_results(pending)
+            while pending:
+                yield from self.__get_completed_results(pending)
+        finally:
+            # The consumer stopped early, the items not yet started are dropped
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the worker threads of the pool.
+
+        Args:
+            wait (bool): Whether to wait for the running tasks to finish, defaults to True
+        """
+        self.__executor.shutdown(wait=wait)
+
+    def __run(self, task: Callable[..., T], *args: Any) -> T:
+        with self.acquire() as parser:
+            return task(parser, *args)
+
+    @classmethod
+    def __get_completed_results(cls, pending: dict[Future, int]) -> Iterator[PoolTaskResult]:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield cls.__get_result(pending.pop(future), future)
+
+    @staticmethod
+    def __get_result(index: int, future: Future) -> PoolTaskResult:
+        try:
+            return PoolTaskResult(index=index, value=future.result())
+        except Exception as e:
+            return PoolTaskResult(index=index, error=e)
+
+
+def get_default_parser_pool() -> ParserPool:
+    """
+    Returns the parser pool shared by the application, creating it on first use.
+
+    Returns:
+        ParserPool: The default parser pool with PARSER_POOL_SIZE parsers
+    """
+    global _default_parser_pool
+    if _default_parser_pool is None:
+        with _default_parser_pool_lock:
+            if _default_parser_pool is None:
+                _default_parser_pool = ParserPool()
+    return _default_parser_pool
@@ -0,0 +1,120 @@
+# coding: utf-8
+"""
+Coalescing of identical concurrent calls (single-flight).
+
+Senders retrying aggressively deliver identical payloads within milliseconds, each of them
+starting its own CPU-heavy parsing run. The SingleFlight defined here coalesces such calls: the
+first call of a key starts the computation, while further calls of the same key arriving before
+it has finished wait for the same computation and share its result.
+
+- Errors: An exception raised by the computation is raised to every waiting caller.
+- Cancellation: A cancelled caller only stops waiting. The computation continues as long as
+  another caller waits for it and is cancelled once the last caller has stopped waiting. A call
+  arriving afterwards starts a new computation.
+
+The single-flight is used from the event loop only, so its state is not guarded by a lock. It is
+enabled via the environment variable PARSE_SINGLE_FLIGHT (default: false).
+"""
+
+import asyncio
+import os
+import threading
+from typing import Awaitable, Callable, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+PARSE_SINGLE_FLIGHT = os.getenv("PARSE_SINGLE_FLIGHT", "false").lower() == "true"
+
+_default_single_flight: Optional["SingleFlight"] = None
+_default_single_flight_lock = threading.Lock()
+
+
+class _Call:
+    """
+    A computation in flight and the number of callers waiting for it.
+    """
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls of the same key into one computation, sharing its result.
+
+    Attributes:
+        coalesced_calls (int): The number of calls that have joined a computation in flight
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new single-flight without computations in flight.
+        """
+        self.coalesced_calls = 0
+        self.__calls: dict[Hashable, _Call] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of computations in flight.
+        """
+        return len(self.__calls)
+
+    async def run(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        """
+        Runs the computation of a key, or waits for the computation of the key already in flight.
+
+        Args:
+            key (Hashable): The key identifying identical calls, e.g. the hash of the payload and the options
+            function (Callable[[], Awaitable[T]]): The computation, only called if none is in flight for the key
+
+        Returns:
+            T: The result of the computation
+
+        Raises:
+            Exception: The exception raised by the computation
+        """
+        call = self.__calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(function()))
+            self.__calls[key] = call
+            call.task.add_done_callback(lambda task: self.__on_done(key, call, task))
+        else:
+            self.coalesced_calls += 1
+        call.waiters += 1
+        try:
+            # The computation is shielded, so that a cancelled caller does not cancel it for the other callers
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                self.__forget(key, call)
+                call.task.cancel()
+
+    def __on_done(self, key: Hashable, call: _Call, task: asyncio.Task) -> None:
+        self.__forget(key, call)
+        # The exception is retrieved here, since no caller may be left waiting for it
+        if not task.cancelled():
+            task.exception()
+
+    def __forget(self, key: Hashable, call: _Call) -> None:
+        if self.__calls.get(key) is call:
+            del self.__calls[key]
+
+
+def get_default_single_flight() -> Optional[SingleFlight]:
+    """
+    Returns the single-flight shared by the application, creating it on first use.
+
+    Returns:
+        Optional[SingleFlight]: The default single-flight, None if the coalescing is disabled
+    """
+    global _default_single_flight
+    if not PARSE_SINGLE_FLIGHT:
+        return None
+    if _default_single_flight is None:
+        with _default_single_flight_lock:
+            if _default_single_flight is None:
+                _default_single_flight = SingleFlight()
+    return _default_single_flight
@@ -15,20 +15,59 @@ import logging.config
 from fastapi.responses import RedirectResponse
 
 from ediparse.adapters.inbound.rest import main
+from ediparse.adapters.inbound.rest.impl.admission_control import AdmissionControlMiddleware
+from ediparse.adapters.inbound.rest.impl.compression_middleware import CompressionMiddleware
+from ediparse.adapters.inbound.rest.impl.debug_routers import router as DebugApiRouter
 from ediparse.adapters.inbound.rest.impl.health_check_routers import router as HealthChecksApiRouter
-from ediparse.adapters.inbound.rest.impl.lifespan_events import startup_lifespan
+from ediparse.adapters.inbound.rest.impl.lifespan_events import (
+    shut_down_job_store, shut_down_parse_executor, start_load_sampler, startup_lifespan, stop_load_sampler,
+    warm_up_parse_executor, warm_up_parser_pool
+)
+from ediparse.adapters.inbound.rest.impl.request_body_stream import use_streamed_request_bodies
 from ediparse.infrastructure.logging_config import get_logging_config
+from ediparse.infrastructure.parse_profiler import get_default_parse_profiler
 
 logging.config.dictConfig(get_logging_config())
 
 app = main.app
 
+# Let the file endpoints receive their upload as stream instead of awaiting the complete body
+use_streamed_request_bodies(app.router)
+
+# Compress the responses with the content encoding accepted by the client (gzip or zstd)
+app.add_middleware(CompressionMiddleware)
+
+# Bound the parse requests in flight and refuse them with 429 once the wait queue is full
+app.add_middleware(AdmissionControlMiddleware)
+
 # Add event handler during application startup
 app.add_event_handler("startup", startup_lifespan)
 
+# Create the warm parsers of the parser pool before the first request arrives
+app.add_event_handler("startup", warm_up_parser_pool)
+
+# Start the warm worker processes of the parse executor (unless parsing on threads)
+app.add_event_handler("startup", warm_up_parse_executor)
+
+# Sample the load in the background, so that the readiness check answers right away
+app.add_event_handler("startup", start_load_sampler)
+
+# Stop the workers of the job store and remove its spooled uploads and results
+app.add_event_handler("shutdown", shut_down_job_store)
+
+# Stop the worker processes of the parse executor
+app.add_event_handler("shutdown", shut_down_parse_executor)
+
+# Stop sampling the load
+app.add_event_handler("shutdown", stop_load_sampler)
+
 # Make a redirect to the swagger-ui docs when accessing the base url
 @app.get("/", include_in_schema=False)
 async def docs_redirect() -> RedirectResponse:
     return RedirectResponse(url=str(app.docs_url))
 
 app.include_router(HealthChecksApiRouter)
+
+# The debug endpoints only exist while the parse profiler is enabled
+if get_default_parse_profiler() is not None:
+    app.include_router(DebugApiRouter)
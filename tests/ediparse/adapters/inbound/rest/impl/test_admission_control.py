@@ -0,0 +1,171 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from ediparse.adapters.inbound.rest.impl import admission_control
+from ediparse.adapters.inbound.rest.impl.admission_control import (
+    AdmissionControlMiddleware, AdmissionController, AdmissionQueueFullException, get_default_admission_controller
+)
+
+
+class TestAdmissionController(unittest.TestCase):
+    """Test cases for the AdmissionController class."""
+
+    def test_init_without_slots(self):
+        """Test that a controller admitting no request at all is refused."""
+        with self.assertRaises(ValueError):
+            AdmissionController(max_in_flight=0)
+
+    def test_acquire_queues_and_hands_over_slots_in_order(self):
+        """Test that requests beyond the slots wait in FIFO order and get the slot handed over on release."""
+        # Arrange
+        controller = AdmissionController(max_in_flight=1, max_queued=2)
+        admitted = []
+
+        async def request(name):
+            await controller.acquire()
+            admitted.append(name)
+
+        async def run():
+            await request("first")
+            waiters = [asyncio.create_task(request("second")), asyncio.create_task(request("third"))]
+            await asyncio.sleep(0)
+            queued = controller.queued
+            controller.release()
+            await asyncio.sleep(0)
+            controller.release()
+            await asyncio.gather(*waiters)
+            return queued
+
+        # Act
+        queued = asyncio.run(run())
+
+        # Assert
+        self.assertEqual(2, queued)
+        self.assertEqual(["first", "second", "third"], admitted)
+        self.assertEqual(1, controller.in_flight)
+        self.assertEqual(0, controller.queued)
+
+    def test_acquire_with_full_queue(self):
+        """Test that a request arriving at a full queue is refused with a Retry-After estimate."""
+        # Arrange
+        controller = AdmissionController(max_in_flight=2, max_queued=0)
+
+        async def run():
+            await controller.acquire()
+            await controller.acquire()
+            controller.release(duration_seconds=3.0)
+            await controller.acquire()
+            await controller.acquire()
+
+        # Act
+        with self.assertRaises(AdmissionQueueFullException) as context:
+            asyncio.run(run())
+
+        # Assert
+        self.assertEqual(2, context.exception.retry_after_seconds)
+        self.assertEqual(2, controller.in_flight)
+
+    def test_cancelled_waiter_leaves_queue(self):
+        """Test that a cancelled waiting request leaves the queue and does not take the next slot."""
+        # Arrange
+        controller = AdmissionController(max_in_flight=1, max_queued=1)
+
+        async def run():
+            await controller.acquire()
+            waiter = asyncio.create_task(controller.acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+            controller.release()
+
+        # Act
+        asyncio.run(run())
+
+        # Assert
+        self.assertEqual(0, controller.in_flight)
+        self.assertEqual(0, controller.queued)
+
+    def test_estimate_retry_after_seconds(self):
+        """Test that the estimate covers the queued requests, based on the recent durations."""
+        # Arrange
+        controller = AdmissionController(max_in_flight=2, max_queued=4)
+
+        # Act
+        default_estimate = controller.estimate_retry_after_seconds()
+        controller.release(duration_seconds=0.1)
+        controller.release(duration_seconds=0.3)
+        fast_estimate = controller.estimate_retry_after_seconds()
+        controller.release(duration_seconds=11.6)
+
+        # Assert
+        self.assertEqual(1, default_estimate)
+        self.assertEqual(1, fast_estimate)
+        self.assertEqual(2, controller.estimate_retry_after_seconds())
+
+    def test_get_default_admission_controller(self):
+        """Test that the default controller is shared and not created if the admission control is disabled."""
+        with patch.object(admission_control, "_default_admission_controller", None):
+            self.assertIs(get_default_admission_controller(), get_default_admission_controller())
+        with patch.object(admission_control, "ADMISSION_MAX_IN_FLIGHT", 0), \
+                patch.object(admission_control, "_default_admission_controller", None):
+            self.assertIsNone(get_default_admission_controller())
+
+
+class TestAdmissionControlMiddleware(unittest.TestCase):
+    """Test cases for the admission of the parse requests."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.controller = AdmissionController(max_in_flight=1, max_queued=0)
+
+        def parse(request):
+            return Response(f'{{"in_flight":{self.controller.in_flight}}}', media_type="application/json")
+
+        app = Starlette(routes=[Route("/parse-file", parse, methods=["POST"]), Route("/health/liveness", parse)])
+        app.add_middleware(AdmissionControlMiddleware, admission_controller=self.controller)
+        self.client = TestClient(app)
+
+    def test_request_holds_slot(self):
+        """Test that an admitted request holds a slot while processed and gives it back afterwards."""
+        # Act
+        response = self.client.post("/parse-file")
+
+        # Assert
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"in_flight": 1}, response.json())
+        self.assertEqual(0, self.controller.in_flight)
+
+    def test_request_refused_with_full_queue(self):
+        """Test that a request is refused with 429 and Retry-After while all slots are taken."""
+        # Arrange
+        asyncio.run(self.controller.acquire())
+
+        # Act
+        response = self.client.post("/parse-file")
+
+        # Assert
+        self.assertEqual(429, response.status_code)
+        self.assertEqual("1", response.headers["Retry-After"])
+        self.assertIn("error_message", response.json())
+
+    def test_other_paths_not_admitted(self):
+        """Test that the requests of other endpoints pass the admission control."""
+        # Arrange
+        asyncio.run(self.controller.acquire())
+
+        # Act
+        response = self.client.get("/health/liveness")
+
+        # Assert
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"in_flight": 1}, response.json())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import asyncio
+import io
+import os
+import unittest
+import zipfile
+from pathlib import Path
+
+import orjson
+
+from ediparse.adapters.inbound.rest.impl.archive_streaming_response import (
+    ArchiveNDJSONStreamingResponse, ArchiveZipStreamingResponse, accepts_zip, iter_archive_ndjson_lines,
+    iter_result_archive_chunks, render_archive_entry_line
+)
+from ediparse.application.usecases.parse_archive_usecase import ArchiveEntryResult
+from ediparse.infrastructure.libs.edifactparser.exceptions import (
+    DecompressionRatioExceededException, EdifactParserException, ParseMemoryBudgetExceededException
+)
+from ediparse.infrastructure.libs.edifactparser.exporters import to_compact_json_bytes
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+
+
+class TestArchiveStreamingResponse(unittest.TestCase):
+    """Test cases for the streaming responses of the archive endpoint."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.samples_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))))) / "samples"
+        with open(self.samples_dir / "mscons-message-example-request.txt", encoding='utf-8') as f:
+            self.interchange = EdifactParser().parse(f.read())
+
+    def __get_outcomes(self, error: BaseException = None):
+        yield ArchiveEntryResult(name="2024-01/mscons.txt", value=self.interchange)
+        yield ArchiveEntryResult(
+            name="invalid.txt", error=ParseMemoryBudgetExceededException(estimated_bytes=2, max_bytes=1)
+        )
+        if error:
+            raise error
+
+    @staticmethod
+    def __read_body(response) -> bytes:
+        async def read_body():
+            return b"".join([chunk async for chunk in response.body_iterator])
+
+        return asyncio.run(read_body())
+
+    def test_accepts_zip(self):
+        """Test that the result archive is only chosen if application/zip is accepted."""
+        self.assertTrue(accepts_zip("application/zip"))
+        self.assertTrue(accepts_zip("application/x-ndjson;q=0.5, application/zip"))
+        self.assertFalse(accepts_zip("application/x-ndjson"))
+        self.assertFalse(accepts_zip(None))
+
+    def test_render_archive_entry_line(self):
+        """Test that the outcome of a file is rendered with the name of the file."""
+        # Act
+        line = render_archive_entry_line(ArchiveEntryResult(name="mscons.txt", value=self.interchange))
+        error_line = render_archive_entry_line(
+            ArchiveEntryResult(name="invalid.txt", error=EdifactParserException("Invalid file"))
+        )
+
+        # Assert
+        self.assertEqual(
+            {"entry": "mscons.txt", "status_code": 200, "result": orjson.loads(self.interchange.to_json_bytes())},
+            orjson.loads(line)
+        )
+        self.assertEqual(
+            {"entry": "invalid.txt", "status_code": 400, "error_message": "Invalid file"},
+            orjson.loads(error_line)
+        )
+
+    def test_iter_archive_ndjson_lines_with_archive_error(self):
+        """Test that an error raised while reading the archive ends the output with a line without entry name."""
+        # Arrange
+        error = DecompressionRatioExceededException(decompressed_bytes=1000, compressed_bytes=1, max_ratio=10)
+
+        # Act
+        lines = [orjson.loads(line) for line in iter_archive_ndjson_lines(self.__get_outcomes(error))]
+
+        # Assert
+        self.assertEqual(["2024-01/mscons.txt", "invalid.txt", None], [line["entry"] for line in lines])
+        self.assertEqual([200, 413, 413], [line["status_code"] for line in lines])
+
+    def test_iter_result_archive_chunks(self):
+        """Test that the result archive holds one file per outcome and is written chunk by chunk."""
+        # Act
+        chunks = list(iter_result_archive_chunks(self.__get_outcomes(), compact=True))
+
+        # Assert
+        self.assertGreater(len(chunks), 1)
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as result_archive:
+            self.assertEqual(["2024-01/mscons.txt.json", "invalid.txt.error.json"], result_archive.namelist())
+            self.assertEqual(to_compact_json_bytes(self.interchange), result_archive.read("2024-01/mscons.txt.json"))
+            self.assertEqual(413, orjson.loads(result_archive.read("invalid.txt.error.json"))["status_code"])
+
+    def test_iter_result_archive_chunks_with_archive_error(self):
+        """Test that an error raised while reading the archive is written as last file of the result archive."""
+        # Act
+        data = b"".join(iter_result_archive_chunks(self.__get_outcomes(EdifactParserException("Invalid tar archive"))))
+
+        # Assert
+        with zipfile.ZipFile(io.BytesIO(data)) as result_archive:
+            self.assertEqual("_error.json", result_archive.namelist()[-1])
+            self.assertEqual(
+                {"status_code": 400, "error_message": "Invalid tar archive"},
+                orjson.loads(result_archive.read("_error.json"))
+            )
+
+    def test_iter_result_archive_chunks_drops_unsafe_path_parts(self):
+        """Test that absolute and parent directory parts of the file names are not written to the result archive."""
+        # Arrange
+        outcomes = iter([
+            ArchiveEntryResult(name="../../etc/mscons.txt", value=self.interchange),
+            ArchiveEntryResult(name="/absolute/aperak.txt", error=EdifactParserException("Invalid file"))
+        ])
+
+        # Act
+        data = b"".join(iter_result_archive_chunks(outcomes))
+
+        # Assert
+        with zipfile.ZipFile(io.BytesIO(data)) as result_archive:
+            self.assertEqual(["etc/mscons.txt.json", "absolute/aperak.txt.error.json"], result_archive.namelist())
+
+    def test_streaming_responses(self):
+        """Test that the responses write the outcomes with their media types."""
+        # Act
+        ndjson_response = ArchiveNDJSONStreamingResponse(outcomes=self.__get_outcomes())
+        zip_response = ArchiveZipStreamingResponse(outcomes=self.__get_outcomes())
+
+        # Assert
+        self.assertEqual("application/x-ndjson", ndjson_response.headers["content-type"])
+        self.assertEqual(2, len(self.__read_body(ndjson_response).splitlines()))
+        self.assertEqual("application/zip", zip_response.headers["content-type"])
+        with zipfile.ZipFile(io.BytesIO(self.__read_body(zip_response))) as result_archive:
+            self.assertEqual(2, len(result_archive.namelist()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import asyncio
+import os
+import unittest
+from pathlib import Path
+
+import orjson
+
+from ediparse.adapters.inbound.rest.impl.batch_ndjson_response import (
+    BatchNDJSONStreamingResponse, get_error_status_code, render_batch_line
+)
+from ediparse.infrastructure.libs.edifactparser.exceptions import (
+    CONTRLException, EdifactParserException, ParseMemoryBudgetExceededException
+)
+from ediparse.infrastructure.libs.edifactparser.exporters import to_compact_json_bytes
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.parser_pool import PoolTaskResult
+
+
+class TestBatchNDJSONStreamingResponse(unittest.TestCase):
+    """Test cases for the batch NDJSON streaming response."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.samples_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))))) / "samples"
+        with open(self.samples_dir / "mscons-message-example-request.txt", encoding='utf-8') as f:
+            self.interchange = EdifactParser().parse(f.read())
+
+    def test_get_error_status_code(self):
+        """Test that the errors are mapped to the status codes of the single parse endpoints."""
+        self.assertEqual(413, get_error_status_code(ParseMemoryBudgetExceededException(estimated_bytes=2, max_bytes=1)))
+        self.assertEqual(400, get_error_status_code(CONTRLException("CONTRL error")))
+        self.assertEqual(400, get_error_status_code(EdifactParserException("Parser error")))
+        self.assertEqual(400, get_error_status_code(ValueError("Other error")))
+
+    def test_render_batch_line_with_result(self):
+        """Test that a parsed payload is rendered with its index and its full result."""
+        # Act
+        line = render_batch_line(PoolTaskResult(index=3, value=self.interchange))
+
+        # Assert
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertEqual(
+            {"index": 3, "status_code": 200, "result": orjson.loads(self.interchange.to_json_bytes())},
+            orjson.loads(line)
+        )
+
+    def test_render_batch_line_with_compact_result(self):
+        """Test that a parsed payload is rendered in compact mode with short keys."""
+        # Act
+        line = render_batch_line(PoolTaskResult(index=0, value=self.interchange), compact=True, short_keys=True)
+
+        # Assert
+        expected_result = orjson.loads(to_compact_json_bytes(self.interchange, short_keys=True))
+        self.assertEqual(expected_result, orjson.loads(line)["result"])
+
+    def test_render_batch_line_with_error(self):
+        """Test that a failed payload is rendered with its status code and error message."""
+        # Act
+        line = render_batch_line(PoolTaskResult(index=1, error=EdifactParserException("Invalid payload")))
+
+        # Assert
+        self.assertEqual(
+            {"index": 1, "status_code": 400, "error_message": "Invalid payload"},
+            orjson.loads(line)
+        )
+
+    def test_streaming_response(self):
+        """Test that the response writes one NDJSON line per outcome in the given order."""
+        # Arrange
+        outcomes = iter([
+            PoolTaskResult(index=0, value=self.interchange),
+            PoolTaskResult(index=1, error=CONTRLException("CONTRL error"))
+        ])
+        response = BatchNDJSONStreamingResponse(outcomes=outcomes)
+
+        # Act
+        async def read_body():
+            return b"".join([chunk async for chunk in response.body_iterator])
+
+        body = asyncio.run(read_body())
+
+        # Assert
+        self.assertEqual("application/x-ndjson", response.headers["content-type"])
+        lines = [orjson.loads(line) for line in body.splitlines()]
+        self.assertEqual([0, 1], [line["index"] for line in lines])
+        self.assertEqual([200, 400], [line["status_code"] for line in lines])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import json
+import unittest
+
+from ediparse.adapters.inbound.rest.impl.compact_json_response import CompactJSONResponse
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import SegmentBGM
+
+
+class TestCompactJSONResponse(unittest.TestCase):
+    """Test cases for the compact JSON response."""
+
+    def test_render_model(self):
+        """Test that a model is rendered without empty values."""
+        # Arrange
+        segment = SegmentBGM(nachrichtenfunktion_code="9")
+
+        # Act
+        response = CompactJSONResponse(content=segment)
+
+        # Assert
+        self.assertEqual({"nachrichtenfunktion_code": "9"}, json.loads(response.body))
+        self.assertEqual("application/json", response.media_type)
+
+    def test_render_model_with_short_keys(self):
+        """Test that a model is rendered with its short aliases if short keys are enabled."""
+        # Arrange
+        segment = SegmentBGM(nachrichtenfunktion_code="9")
+
+        # Act
+        response = CompactJSONResponse(content=segment, short_keys=True)
+
+        # Assert
+        self.assertEqual({"nc": "9"}, json.loads(response.body))
+
+    def test_render_other_content(self):
+        """Test that content other than models is rendered unchanged."""
+        # Act
+        response = CompactJSONResponse(content={"error": "message", "details": None}, status_code=400)
+
+        # Assert
+        self.assertEqual({"error": "message", "details": None}, json.loads(response.body))
+        self.assertEqual(400, response.status_code)
+
+    def test_render_rendered_bytes(self):
+        """Test that content already rendered to compact JSON bytes is sent as it is."""
+        # Act
+        response = CompactJSONResponse(content=b'{"nc":"9"}', short_keys=True)
+
+        # Assert
+        self.assertEqual(b'{"nc":"9"}', response.body)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+import asyncio
+import gzip
+import unittest
+import zlib
+
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from ediparse.adapters.inbound.rest.impl.compression_middleware import (
+    CompressionMiddleware, StreamCompressor, is_zstd_available, select_content_encoding
+)
+
+LARGE_BODY = b'{"menge":"1.234","masseinheit_code":"KWH"},' * 200
+
+
+class TestCompressionMiddleware(unittest.TestCase):
+    """Test cases for the negotiated response compression."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.streamed_chunks = [LARGE_BODY[:500], LARGE_BODY[500:], b"end"]
+
+        def large(request):
+            return Response(LARGE_BODY, media_type="application/json")
+
+        def small(request):
+            return Response(b'{"status":"ok"}', media_type="application/json")
+
+        def streamed(request):
+            return StreamingResponse(iter(self.streamed_chunks), media_type="application/json")
+
+        def encoded(request):
+            return Response(gzip.compress(LARGE_BODY), headers={"Content-Encoding": "gzip"})
+
+        def archive(request):
+            return Response(LARGE_BODY, media_type="application/zip")
+
+        app = Starlette(routes=[
+            Route("/large", large), Route("/small", small), Route("/streamed", streamed), Route("/encoded", encoded),
+            Route("/archive", archive)
+        ])
+        app.add_middleware(CompressionMiddleware, minimum_size=1024, gzip_level=6)
+        self.client = TestClient(app)
+
+    def test_select_content_encoding(self):
+        """Test that the supported encoding with the highest quality value is selected."""
+        self.assertEqual("gzip", select_content_encoding("gzip, deflate, br", zstd_available=False))
+        self.assertEqual("zstd", select_content_encoding("gzip, zstd", zstd_available=True))
+        self.assertEqual("gzip", select_content_encoding("gzip, zstd", zstd_available=False))
+        self.assertEqual("gzip", select_content_encoding("zstd;q=0.5, gzip", zstd_available=True))
+        self.assertEqual("gzip", select_content_encoding("*", zstd_available=False))
+        self.assertIsNone(select_content_encoding("gzip;q=0", zstd_available=False))
+        self.assertIsNone(select_content_encoding("identity", zstd_available=True))
+        self.assertIsNone(select_content_encoding(None, zstd_available=True))
+
+    def test_large_response_is_compressed(self):
+        """Test that a response above the minimum size is compressed with gzip."""
+        # Act
+        response = self.client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("gzip", response.headers["content-encoding"])
+        self.assertIn("Accept-Encoding", response.headers["vary"])
+        self.assertEqual(LARGE_BODY, response.content)
+
+    def test_small_response_is_not_compressed(self):
+        """Test that a response below the minimum size is sent uncompressed."""
+        # Act
+        response = self.client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(b'{"status":"ok"}', response.content)
+
+    def test_response_without_accepted_encoding_is_not_compressed(self):
+        """Test that a response is sent uncompressed if the client accepts no supported encoding."""
+        # Act
+        response = self.client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        # Assert
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(LARGE_BODY, response.content)
+
+    def test_streamed_response_is_compressed(self):
+        """Test that a streamed response is compressed chunk by chunk."""
+        # Act
+        response = self.client.get("/streamed", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        self.assertEqual("gzip", response.headers["content-encoding"])
+        self.assertNotIn("content-length", response.headers)
+        self.assertEqual(b"".join(self.streamed_chunks), response.content)
+
+    def test_streamed_chunks_are_flushed_right_away(self):
+        """Test that every chunk of a streamed response is sent compressed as soon as it arrives."""
+        # Arrange
+        sent_messages = []
+        chunks = [b'{"line":1}\n', b'{"line":2}\n']
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            for chunk in chunks:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                # Every chunk has to be decodable before the next one is produced
+                self.assertEqual(chunk, decompressor.decompress(sent_messages[-1]["body"]))
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        async def send(message):
+            sent_messages.append(message)
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        middleware = CompressionMiddleware(app, minimum_size=1024)
+        scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+
+        # Act
+        asyncio.run(middleware(scope, None, send))
+
+        # Assert
+        self.assertEqual("gzip", dict(sent_messages[0]["headers"])[b"content-encoding"].decode())
+        self.assertEqual(4, len(sent_messages))
+        self.assertFalse(sent_messages[-1]["more_body"])
+        self.assertEqual(b"", decompressor.decompress(sent_messages[-1]["body"]))
+        self.assertTrue(decompressor.eof)
+
+    def test_encoded_response_is_passed_through(self):
+        """Test that a response that already has a content encoding is not compressed again."""
+        # Act
+        response = self.client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        self.assertEqual("gzip", response.headers["content-encoding"])
+        self.assertEqual(LARGE_BODY, response.content)
+
+    def test_compressed_media_type_is_passed_through(self):
+        """Test that a response of a compressed media type (e.g., a zip archive) is not compressed."""
+        # Act
+        response = self.client.get("/archive", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(LARGE_BODY, response.content)
+
+    def test_stream_compressor_flushes_each_part(self):
+        """Test that every compressed part can be decoded as soon as it has been produced."""
+        # Arrange
+        compressor = StreamCompressor("gzip")
+        decompressor = gzip.zlib.decompressobj(16 + gzip.zlib.MAX_WBITS)
+
+        # Act
+        first_part = decompressor.decompress(compressor.compress(b"first,"))
+        second_part = decompressor.decompress(compressor.compress(b"second", final=True))
+
+        # Assert
+        self.assertEqual(b"first,", first_part)
+        self.assertEqual(b"second", second_part)
+        self.assertTrue(decompressor.eof)
+
+    def test_stream_compressor_unsupported_encoding(self):
+        """Test that an unsupported content encoding is refused."""
+        with self.assertRaises(ValueError):
+            StreamCompressor("br")
+
+    @unittest.skipUnless(is_zstd_available(), "The optional zstandard package is not installed")
+    def test_stream_compressor_zstd(self):
+        """Test that the zstd compressor produces a decodable frame."""
+        import zstandard
+
+        # Arrange
+        compressor = StreamCompressor("zstd")
+
+        # Act
+        compressed = compressor.compress(LARGE_BODY[:100]) + compressor.compress(LARGE_BODY[100:], final=True)
+
+        # Assert
+        self.assertEqual(LARGE_BODY, zstandard.ZstdDecompressor().decompressobj().decompress(compressed))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch
+
+from fastapi import HTTPException, status
+
+from ediparse.infrastructure.parse_profiler import ParseProfiler
+
+from ediparse.adapters.inbound.rest.impl import debug_routers
+from ediparse.adapters.inbound.rest.impl.debug_routers import get_profile, verify_debug_token
+
+
+class TestDebugRouters(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the debug router functions."""
+
+    @patch('ediparse.adapters.inbound.rest.impl.debug_routers.get_default_parse_profiler')
+    async def test_get_profile_disabled(self, mock_get_default_parse_profiler):
+        """Test that get_profile answers with status 404 while the parse profiler is disabled."""
+        mock_get_default_parse_profiler.return_value = None
+
+        response = await get_profile()
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @patch('ediparse.adapters.inbound.rest.impl.debug_routers.get_default_parse_profiler')
+    async def test_get_profile_collapsed_with_reset(self, mock_get_default_parse_profiler):
+        """Test that get_profile hands out the collapsed stacks with the counters and resets the profiler on request."""
+        parse_profiler = ParseProfiler(sample_rate=1.0, stack_interval=0.001)
+        parse_profiler.profile(sum, range(10))
+        mock_get_default_parse_profiler.return_value = parse_profiler
+
+        response = await get_profile(format="collapsed", reset=True)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.media_type, "text/plain")
+        self.assertEqual(response.headers["X-Profiled-Runs"], "1")
+        self.assertEqual(0, parse_profiler.statistics.profiled_runs)
+
+    @patch('ediparse.adapters.inbound.rest.impl.debug_routers.get_default_parse_profiler')
+    async def test_get_profile_text(self, mock_get_default_parse_profiler):
+        """Test that get_profile hands out the text report of the function statistics."""
+        parse_profiler = ParseProfiler(sample_rate=1.0)
+        parse_profiler.profile(sum, range(10))
+        mock_get_default_parse_profiler.return_value = parse_profiler
+
+        response = await get_profile(format="text", sort="tottime", limit=5)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("function calls", response.body.decode())
+
+    @patch('ediparse.adapters.inbound.rest.impl.debug_routers.get_default_parse_profiler')
+    async def test_get_profile_invalid_format(self, mock_get_default_parse_profiler):
+        """Test that get_profile refuses unknown formats and sort keys with status 400."""
+        parse_profiler = ParseProfiler(sample_rate=1.0)
+        parse_profiler.profile(sum, range(10))
+        mock_get_default_parse_profiler.return_value = parse_profiler
+
+        unknown_format_response = await get_profile(format="svg")
+        unknown_sort_response = await get_profile(format="text", sort="unknown")
+
+        self.assertEqual(unknown_format_response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(unknown_sort_response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_verify_debug_token(self):
+        """Test that the requests have to carry the configured debug token, if there is one."""
+        with patch.object(debug_routers, "DEBUG_ENDPOINT_TOKEN", ""):
+            await verify_debug_token(None)
+        with patch.object(debug_routers, "DEBUG_ENDPOINT_TOKEN", "secret"):
+            await verify_debug_token("Bearer secret")
+            for authorization in (None, "Bearer wrong", "Basic secret"):
+                with self.assertRaises(HTTPException) as context:
+                    await verify_debug_token(authorization)
+                self.assertEqual(context.exception.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+if __name__ == "__main__":
+    unittest.main()
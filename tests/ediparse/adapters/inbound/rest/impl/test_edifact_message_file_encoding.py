@@ -1,27 +1,28 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 
 import pytest
 from fastapi import status
 from starlette.responses import JSONResponse
 
 from ediparse.adapters.inbound.rest.impl.parse_edifact_specific_message_routers import ParseEdifactMessageRouter
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange
 
 
-class TestEdifactMessageFileEncoding(unittest.TestCase):
+class TestEdifactMessageFileEncoding(unittest.IsolatedAsyncioTestCase):
     """Test cases for handling different file encodings in ParseEdifactMessageRouter."""
 
     def setUp(self):
         """Set up test fixtures."""
-        self.mock_parser_service = MagicMock()
+        self.mock_parser_service = MagicMock(parse_result_cache=None)
         self.router = ParseEdifactMessageRouter(parser_service=self.mock_parser_service)
 
     @pytest.mark.asyncio
     async def test_parse_file_with_non_utf8_encoding(self):
         """Test that parse_file can handle files with non-UTF-8 encoding."""
         # Setup
-        mock_parsed_obj = MagicMock()
-        mock_parsed_obj.model_dump.return_value = {"key": "value"}
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{"key":"value"}'
         self.mock_parser_service.parse_message.return_value = mock_parsed_obj
 
         # Create a bytes object that will fail UTF-8 decoding but succeed with ISO-8859-1
@@ -42,15 +43,17 @@ class TestEdifactMessageFileEncoding(unittest.TestCase):
         expected_decoded = "UNA:+.? 'UNB+UNOC:3+9904935000ä"
         self.mock_parser_service.parse_message.assert_called_once_with(
             message_content=expected_decoded,
-            max_lines_to_parse=-1
+            max_lines_to_parse=-1,
+            memory_budget=ANY,
+            stage_timings=None
         )
 
     @pytest.mark.asyncio
     async def test_download_parsed_file_with_non_utf8_encoding(self):
         """Test that download_parsed_file can handle files with non-UTF-8 encoding."""
         # Setup
-        mock_parsed_obj = MagicMock()
-        mock_parsed_obj.model_dump.return_value = {"key": "value"}
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{"key":"value"}'
         self.mock_parser_service.parse_message.return_value = mock_parsed_obj
 
         # Create a bytes object that will fail UTF-8 decoding but succeed with ISO-8859-1
@@ -70,7 +73,9 @@ class TestEdifactMessageFileEncoding(unittest.TestCase):
         expected_decoded = "UNA:+.? 'UNB+UNOC:3+9904935000ä"
         self.mock_parser_service.parse_message.assert_called_once_with(
             message_content=expected_decoded,
-            max_lines_to_parse=-1
+            max_lines_to_parse=-1,
+            memory_budget=ANY,
+            stage_timings=None
         )
 
 
@@ -1,13 +1,20 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from fastapi import status
 from starlette.responses import JSONResponse
 
-from ediparse.adapters.inbound.rest.impl.health_check_routers import check_liveness, check_readiness
+from ediparse.adapters.inbound.rest.impl.admission_control import AdmissionController
+from ediparse.adapters.inbound.rest.impl.parse_metrics import PROMETHEUS_CONTENT_TYPE, ParseMetrics
+from ediparse.infrastructure.libs.edifactparser.utils import MessageCache
+from ediparse.infrastructure.parse_result_cache import ParseResultCache
 
+from ediparse.adapters.inbound.rest.impl.health_check_routers import (
+    check_admission, check_liveness, check_parse_cache, check_readiness, get_metrics
+)
 
-class TestHealthCheckRouters(unittest.TestCase):
+
+class TestHealthCheckRouters(unittest.IsolatedAsyncioTestCase):
     """Test cases for the health check router functions."""
 
     async def test_check_liveness(self):
@@ -18,41 +25,114 @@ class TestHealthCheckRouters(unittest.TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.body.decode(), '{"status":"ok"}')
 
-    @patch('psutil.cpu_percent')
-    async def test_check_readiness_ok(self, mock_cpu_percent):
-        """Test that check_readiness returns a 200 OK response when CPU is not overloaded."""
-        mock_cpu_percent.return_value = 50.0  # CPU at 50%
+    @patch('ediparse.adapters.inbound.rest.impl.health_check_routers.get_default_load_sampler')
+    async def test_check_readiness_ok(self, mock_get_default_load_sampler):
+        """Test that check_readiness returns a 200 OK response when the sampled load is not too high."""
+        mock_get_default_load_sampler.return_value = MagicMock(is_ready=True, reason=None)
 
         response = await check_readiness()
 
         self.assertIsInstance(response, JSONResponse)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.body.decode(), '{"status":"ok"}')
-        mock_cpu_percent.assert_called_once_with(interval=0.1)
 
-    @patch('psutil.cpu_percent')
-    async def test_check_readiness_cpu_overload(self, mock_cpu_percent):
-        """Test that check_readiness returns a 503 Service Unavailable response when CPU is overloaded."""
-        mock_cpu_percent.return_value = 96.0  # CPU at 96%, over the 95% threshold
+    @patch('ediparse.adapters.inbound.rest.impl.health_check_routers.get_default_load_sampler')
+    async def test_check_readiness_cpu_overload(self, mock_get_default_load_sampler):
+        """Test that check_readiness returns a 503 Service Unavailable response when the CPU is overloaded."""
+        mock_get_default_load_sampler.return_value = MagicMock(is_ready=False, reason="CPU overloaded")
 
         response = await check_readiness()
 
         self.assertIsInstance(response, JSONResponse)
         self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
         self.assertEqual(response.body.decode(), '{"status":"not ready","reason":"CPU overloaded"}')
-        mock_cpu_percent.assert_called_once_with(interval=0.1)
 
-    @patch('psutil.cpu_percent')
-    async def test_check_readiness_exception(self, mock_cpu_percent):
+    @patch('ediparse.adapters.inbound.rest.impl.health_check_routers.get_default_load_sampler')
+    async def test_check_readiness_exception(self, mock_get_default_load_sampler):
         """Test that check_readiness handles exceptions and returns a 503 Service Unavailable response."""
-        mock_cpu_percent.side_effect = Exception("Test exception")
+        mock_get_default_load_sampler.side_effect = Exception("Test exception")
 
         response = await check_readiness()
 
         self.assertIsInstance(response, JSONResponse)
         self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
         self.assertEqual(response.body.decode(), '{"status":"not ready","reason":"Test exception"}')
-        mock_cpu_percent.assert_called_once_with(interval=0.1)
+
+    @patch('ediparse.adapters.inbound.rest.impl.health_check_routers.get_default_admission_controller')
+    async def test_check_admission(self, mock_get_default_admission_controller):
+        """Test that check_admission reports the queue depth of the admission control."""
+        controller = AdmissionController(max_in_flight=2, max_queued=4)
+        await controller.acquire()
+        mock_get_default_admission_controller.return_value = controller
+
+        response = await check_admission()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.body.decode(),
+            '{"status":"ok","in_flight":1,"queued":0,"max_in_flight":2,"max_queued":4}'
+        )
+
+    @patch('ediparse.adapters.inbound.rest.impl.health_check_routers.get_default_admission_controller')
+    async def test_check_admission_disabled(self, mock_get_default_admission_controller):
+        """Test that check_admission reports a disabled admission control."""
+        mock_get_default_admission_controller.return_value = None
+
+        response = await check_admission()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.body.decode(), '{"status":"disabled"}')
+
+    @patch('ediparse.adapters.inbound.rest.impl.health_check_routers.get_default_parse_result_cache')
+    async def test_check_parse_cache(self, mock_get_default_parse_result_cache):
+        """Test that check_parse_cache reports the counters and sizes of the parse result cache."""
+        parse_result_cache = ParseResultCache(max_bytes=1024, directory=None)
+        parse_result_cache.put("key", b"{}")
+        parse_result_cache.get("key")
+        parse_result_cache.get("other-key")
+        mock_get_default_parse_result_cache.return_value = parse_result_cache
+
+        response = await check_parse_cache()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.body.decode(),
+            '{"status":"ok","hits":1,"disk_hits":0,"misses":1,"entries":1,"size_bytes":2,'
+            '"disk_entries":0,"disk_size_bytes":0}'
+        )
+
+    @patch('ediparse.adapters.inbound.rest.impl.health_check_routers.get_default_message_cache')
+    @patch('ediparse.adapters.inbound.rest.impl.health_check_routers.get_default_parse_result_cache')
+    async def test_check_parse_cache_with_message_cache(
+            self, mock_get_default_parse_result_cache, mock_get_default_message_cache
+    ):
+        """Test that check_parse_cache reports the reused and parsed messages of the message cache."""
+        message_cache = MessageCache(max_segments=100)
+        message_cache.get(b"key")
+        mock_get_default_parse_result_cache.return_value = None
+        mock_get_default_message_cache.return_value = message_cache
+
+        response = await check_parse_cache()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.body.decode(),
+            '{"status":"ok","messages":{"reused_messages":0,"parsed_messages":1,"entries":0,"segments":0}}'
+        )
+
+    @patch('ediparse.adapters.inbound.rest.impl.health_check_routers.get_default_parse_metrics')
+    async def test_get_metrics(self, mock_get_default_parse_metrics):
+        """Test that get_metrics exposes the parse metrics in the Prometheus text format."""
+        parse_metrics = ParseMetrics(parse_executor=MagicMock(pending_tasks=0, max_workers=1))
+        parse_metrics.count_error("/parse-file", "parser")
+        mock_get_default_parse_metrics.return_value = parse_metrics
+
+        response = await get_metrics()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.headers["content-type"], PROMETHEUS_CONTENT_TYPE)
+        self.assertEqual(response.body.decode(), parse_metrics.render())
+        self.assertIn('ediparse_parse_errors_total{endpoint="/parse-file",error="parser"} 1', response.body.decode())
 
 
 if __name__ == "__main__":
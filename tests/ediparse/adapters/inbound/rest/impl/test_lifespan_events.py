@@ -1,10 +1,15 @@
+import asyncio
 import unittest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from ediparse.adapters.inbound.rest.impl.lifespan_events import startup_lifespan
+from ediparse.adapters.inbound.rest.impl.lifespan_events import (
+    shut_down_job_store, shut_down_parse_executor, start_load_sampler, startup_lifespan, stop_load_sampler,
+    warm_up_parse_executor, warm_up_parser_pool
+)
+from ediparse.infrastructure.parse_executor import ParseExecutorBackend
 
 
-class TestLifespanEvents(unittest.TestCase):
+class TestLifespanEvents(unittest.IsolatedAsyncioTestCase):
     """Test cases for the lifespan event functions."""
 
     @patch('ediparse.adapters.inbound.rest.impl.lifespan_events.logger')
@@ -21,6 +26,70 @@ class TestLifespanEvents(unittest.TestCase):
         # No additional assertions needed after the context manager exits
         # The test passes if no exceptions are raised
 
+    @patch('ediparse.adapters.inbound.rest.impl.lifespan_events.get_default_parser_pool')
+    def test_warm_up_parser_pool(self, mock_get_default_parser_pool):
+        """Test that warm_up_parser_pool creates the default parser pool."""
+        # Arrange
+        mock_get_default_parser_pool.return_value = MagicMock(size=2)
+
+        # Act
+        asyncio.run(warm_up_parser_pool())
+
+        # Assert
+        mock_get_default_parser_pool.assert_called_once_with()
+
+    @patch('ediparse.adapters.inbound.rest.impl.lifespan_events.shutdown_default_job_store')
+    def test_shut_down_job_store(self, mock_shutdown_default_job_store):
+        """Test that shut_down_job_store shuts down the default job store."""
+        # Act
+        asyncio.run(shut_down_job_store())
+
+        # Assert
+        mock_shutdown_default_job_store.assert_called_once_with()
+
+    @patch('ediparse.adapters.inbound.rest.impl.lifespan_events.PARSE_EXECUTOR', ParseExecutorBackend.PROCESS)
+    @patch('ediparse.adapters.inbound.rest.impl.lifespan_events.get_default_parse_executor')
+    def test_warm_up_parse_executor(self, mock_get_default_parse_executor):
+        """Test that warm_up_parse_executor starts the worker processes of the default parse executor."""
+        # Act
+        asyncio.run(warm_up_parse_executor())
+
+        # Assert
+        mock_get_default_parse_executor.return_value.warm_up.assert_called_once_with()
+
+    @patch('ediparse.adapters.inbound.rest.impl.lifespan_events.PARSE_EXECUTOR', ParseExecutorBackend.THREAD)
+    @patch('ediparse.adapters.inbound.rest.impl.lifespan_events.get_default_parse_executor')
+    def test_warm_up_parse_executor_with_thread_backend(self, mock_get_default_parse_executor):
+        """Test that warm_up_parse_executor does not create an executor for the thread backend."""
+        # Act
+        asyncio.run(warm_up_parse_executor())
+
+        # Assert
+        mock_get_default_parse_executor.assert_not_called()
+
+    @patch('ediparse.adapters.inbound.rest.impl.lifespan_events.shutdown_default_parse_executor')
+    def test_shut_down_parse_executor(self, mock_shutdown_default_parse_executor):
+        """Test that shut_down_parse_executor shuts down the default parse executor."""
+        # Act
+        asyncio.run(shut_down_parse_executor())
+
+        # Assert
+        mock_shutdown_default_parse_executor.assert_called_once_with()
+
+    @patch('ediparse.adapters.inbound.rest.impl.lifespan_events.get_default_load_sampler')
+    def test_start_and_stop_load_sampler(self, mock_get_default_load_sampler):
+        """Test that start_load_sampler starts and stop_load_sampler stops the default load sampler."""
+        # Arrange
+        mock_get_default_load_sampler.return_value = MagicMock(interval_seconds=1.0, stop=AsyncMock())
+
+        # Act
+        asyncio.run(start_load_sampler())
+        asyncio.run(stop_load_sampler())
+
+        # Assert
+        mock_get_default_load_sampler.return_value.start.assert_called_once_with()
+        mock_get_default_load_sampler.return_value.stop.assert_awaited_once_with()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from ediparse.adapters.inbound.rest.impl.admission_control import AdmissionController
+from ediparse.adapters.inbound.rest.impl.load_sampler import LoadSample, LoadSampler
+
+
+class TestLoadSampler(unittest.TestCase):
+    """Test cases for the LoadSampler class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.admission_controller = AdmissionController(max_in_flight=1, max_queued=4)
+        self.load_sampler = LoadSampler(
+            interval_seconds=0.01,
+            window_size=2,
+            cpu_thresholds=(50.0, 90.0),
+            queue_thresholds=(2.0, 8.0),
+            admission_controller=self.admission_controller,
+            parse_executor=MagicMock(pending_tasks=5, max_workers=2),
+            cpu_percent_function=lambda: 42.0
+        )
+
+    def test_init_with_invalid_thresholds(self):
+        """Test that a sampler without window or with swapped thresholds is refused."""
+        with self.assertRaises(ValueError):
+            LoadSampler(window_size=0, cpu_percent_function=lambda: 0.0)
+        with self.assertRaises(ValueError):
+            LoadSampler(cpu_thresholds=(90.0, 50.0), cpu_percent_function=lambda: 0.0)
+
+    def test_sample(self):
+        """Test that the queue depth adds up the waiting requests and the parse tasks waiting for a worker."""
+        async def sample():
+            await self.admission_controller.acquire()
+            waiter = asyncio.create_task(self.admission_controller.acquire())
+            await asyncio.sleep(0)
+            load_sample = self.load_sampler.sample()
+            waiter.cancel()
+            return load_sample
+
+        # Act
+        load_sample = asyncio.run(sample())
+
+        # Assert
+        self.assertEqual(LoadSample(cpu_percent=42.0, queue_depth=4, in_flight=1), load_sample)
+
+    def test_record_with_hysteresis(self):
+        """Test that the readiness follows the window averages, turning ready only below the low thresholds."""
+        # Act & Assert
+        self.assertIsNone(self.load_sampler.averages)
+        self.load_sampler.record(LoadSample(cpu_percent=100.0, queue_depth=0, in_flight=1))
+        self.assertFalse(self.load_sampler.is_ready)
+        self.assertEqual("CPU overloaded", self.load_sampler.reason)
+
+        self.load_sampler.record(LoadSample(cpu_percent=20.0, queue_depth=0, in_flight=1))
+        self.assertEqual(60.0, self.load_sampler.averages.cpu_percent)
+        self.assertFalse(self.load_sampler.is_ready)
+
+        self.load_sampler.record(LoadSample(cpu_percent=20.0, queue_depth=0, in_flight=1))
+        self.assertTrue(self.load_sampler.is_ready)
+        self.assertIsNone(self.load_sampler.reason)
+
+        self.load_sampler.record(LoadSample(cpu_percent=20.0, queue_depth=20, in_flight=1))
+        self.assertFalse(self.load_sampler.is_ready)
+        self.assertEqual("Queue saturated", self.load_sampler.reason)
+
+    def test_record_with_in_flight_thresholds(self):
+        """Test that the average number of parse requests in flight switches the readiness, if enabled."""
+        # Arrange
+        load_sampler = LoadSampler(window_size=1, in_flight_thresholds=(2.0, 8.0), cpu_percent_function=lambda: 0.0)
+
+        # Act & Assert
+        load_sampler.record(LoadSample(cpu_percent=0.0, queue_depth=0, in_flight=9))
+        self.assertFalse(load_sampler.is_ready)
+        self.assertEqual("Too many requests in flight", load_sampler.reason)
+
+        load_sampler.record(LoadSample(cpu_percent=0.0, queue_depth=0, in_flight=4))
+        self.assertFalse(load_sampler.is_ready)
+
+        load_sampler.record(LoadSample(cpu_percent=0.0, queue_depth=0, in_flight=1))
+        self.assertTrue(load_sampler.is_ready)
+
+        with self.assertRaises(ValueError):
+            LoadSampler(in_flight_thresholds=(8.0, 2.0), cpu_percent_function=lambda: 0.0)
+
+    def test_start_and_stop(self):
+        """Test that the background task samples the load until it is stopped."""
+        async def run():
+            self.load_sampler.start()
+            await asyncio.sleep(0.05)
+            await self.load_sampler.stop()
+
+        # Act
+        asyncio.run(run())
+
+        # Assert
+        self.assertEqual(42.0, self.load_sampler.averages.cpu_percent)
+        self.assertTrue(self.load_sampler.is_ready)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+from ediparse.adapters.inbound.rest.impl.msgpack_response import MessagePackResponse, accepts_msgpack
+
+
+class TestMessagePackResponse(unittest.TestCase):
+    """Test cases for the MessagePack response."""
+
+    def test_accepts_msgpack(self):
+        """Test that the MessagePack media types are detected among the accepted media types."""
+        self.assertTrue(accepts_msgpack("application/msgpack"))
+        self.assertTrue(accepts_msgpack("application/json;q=0.5, application/x-msgpack"))
+        self.assertTrue(accepts_msgpack("application/vnd.msgpack"))
+        self.assertFalse(accepts_msgpack("application/json"))
+        self.assertFalse(accepts_msgpack("*/*"))
+        self.assertFalse(accepts_msgpack(None))
+
+    @patch('ediparse.adapters.inbound.rest.impl.msgpack_response.encode_interchange')
+    def test_render_encodes_interchange(self, mock_encode_interchange):
+        """Test that the response body is the MessagePack payload of the interchange."""
+        # Arrange
+        mock_interchange = MagicMock()
+        mock_encode_interchange.return_value = b"\x82payload"
+
+        # Act
+        response = MessagePackResponse(content=mock_interchange)
+
+        # Assert
+        self.assertEqual(b"\x82payload", response.body)
+        self.assertEqual("application/msgpack", response.media_type)
+        mock_encode_interchange.assert_called_once_with(mock_interchange)
+
+    @patch('ediparse.adapters.inbound.rest.impl.msgpack_response.encode_interchange')
+    def test_render_encodes_compact_interchange(self, mock_encode_interchange):
+        """Test that the interchange is encoded in its compact representation in compact mode."""
+        # Arrange
+        mock_interchange = MagicMock()
+        mock_encode_interchange.return_value = b"\x83payload"
+
+        # Act
+        response = MessagePackResponse(content=mock_interchange, compact=True, short_keys=True)
+
+        # Assert
+        self.assertEqual(b"\x83payload", response.body)
+        mock_encode_interchange.assert_called_once_with(mock_interchange, compact=True, short_keys=True)
+
+    @patch('ediparse.adapters.inbound.rest.impl.msgpack_response.encode_interchange')
+    def test_render_encoded_payload(self, mock_encode_interchange):
+        """Test that an already encoded payload is sent as it is."""
+        # Act
+        response = MessagePackResponse(content=b"\x82payload")
+
+        # Assert
+        self.assertEqual(b"\x82payload", response.body)
+        mock_encode_interchange.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import json
+import os
+import unittest
+from pathlib import Path
+
+from ediparse.adapters.inbound.rest.impl.ndjson_streaming_response import (
+    NDJSONStreamingResponse, accepts_ndjson, iter_ndjson_lines_or_error
+)
+from ediparse.infrastructure.libs.edifactparser.exceptions import ParseMemoryBudgetExceededException
+from ediparse.infrastructure.libs.edifactparser.exporters import NDJSONGranularity
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+
+
+class TestNDJSONStreamingResponse(unittest.TestCase):
+    """Test cases for the NDJSON streaming response."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.samples_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))))) / "samples"
+
+    def test_accepts_ndjson(self):
+        """Test that the NDJSON media type is detected among the accepted media types."""
+        self.assertTrue(accepts_ndjson("application/x-ndjson"))
+        self.assertTrue(accepts_ndjson("application/json;q=0.5, Application/X-NDJSON;q=1"))
+        self.assertFalse(accepts_ndjson("application/json"))
+        self.assertFalse(accepts_ndjson("*/*"))
+        self.assertFalse(accepts_ndjson(None))
+
+    def test_iter_ndjson_lines_or_error(self):
+        """Test that a parsing error after the first message is written as final error line."""
+        # Arrange
+        with open(self.samples_dir / "mscons-message-example-request.txt", encoding='utf-8') as f:
+            edifact_data = f.read()
+        message_stream = EdifactParser().iter_messages(edifact_data)
+
+        def fail_after_first_message():
+            yield next(message_stream)
+            raise ParseMemoryBudgetExceededException(estimated_bytes=2, max_bytes=1)
+
+        # Act
+        lines = list(iter_ndjson_lines_or_error(fail_after_first_message()))
+
+        # Assert
+        self.assertEqual(2, len(lines))
+        self.assertIn("unh_nachrichtenkopfsegment", json.loads(lines[0]))
+        self.assertEqual(413, json.loads(lines[1])["status_code"])
+        self.assertIn("estimated 2 bytes, allowed 1 bytes", json.loads(lines[1])["error_message"])
+
+    def test_streaming_response_media_type(self):
+        """Test that the streaming response is declared as NDJSON."""
+        # Arrange
+        with open(self.samples_dir / "mscons-message-example-request.txt", encoding='utf-8') as f:
+            edifact_data = f.read()
+
+        # Act
+        response = NDJSONStreamingResponse(
+            message_stream=EdifactParser().iter_messages(edifact_data),
+            granularity=NDJSONGranularity.MEASUREMENT
+        )
+
+        # Assert
+        self.assertEqual("application/x-ndjson", response.media_type)
+        self.assertEqual("application/x-ndjson", response.headers["content-type"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,21 +1,53 @@
+import asyncio
+import gzip
+import threading
+import time
 import unittest
-from unittest.mock import patch, MagicMock
+from concurrent.futures import Future
+from unittest.mock import patch, MagicMock, ANY
 
 import pytest
 from fastapi import status
-from starlette.responses import JSONResponse
-
+from starlette.responses import FileResponse, JSONResponse, Response, StreamingResponse
+
+from ediparse.adapters.inbound.rest.impl.archive_streaming_response import (
+    ArchiveNDJSONStreamingResponse, ArchiveZipStreamingResponse
+)
+from ediparse.adapters.inbound.rest.impl.batch_ndjson_response import BatchNDJSONStreamingResponse
+from ediparse.adapters.inbound.rest.impl.compact_json_response import CompactJSONResponse
+from ediparse.adapters.inbound.rest.impl.msgpack_response import MessagePackResponse
+from ediparse.adapters.inbound.rest.impl.ndjson_streaming_response import NDJSONStreamingResponse
 from ediparse.adapters.inbound.rest.impl.parse_edifact_specific_message_routers import ParseEdifactMessageRouter
-from ediparse.infrastructure.libs.edifactparser.exceptions import CONTRLException, EdifactParserException
-
-
-class TestParseEdifactMessageRouter(unittest.TestCase):
+from ediparse.adapters.inbound.rest.impl.parse_metrics import ParseMetrics
+from ediparse.adapters.inbound.rest.impl.streaming_json_response import InterchangeJSONStreamingResponse
+from ediparse.adapters.inbound.rest.impl.parse_jobs import ParseJobTask
+from ediparse.adapters.inbound.rest.impl.request_body_stream import RequestBodyStream
+from ediparse.infrastructure.job_store import Job, JobQueueFullException, JobStatus, JobStore
+from ediparse.infrastructure.libs.edifactparser.exceptions import (
+    CONTRLException, DecompressionRatioExceededException, EdifactParserException,
+    ParseMemoryBudgetExceededException
+)
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget, ParseStage
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange, SegmentBGM
+from ediparse.infrastructure.parse_executor import (
+    ParseExecutor, ParseExecutorBackend, ParseOutputFormat, RenderedInterchange
+)
+from ediparse.infrastructure.parse_capture import ParseCaptureSpool
+from ediparse.infrastructure.parse_profiler import ParseProfiler
+from ediparse.infrastructure.single_flight import SingleFlight
+
+
+class TestParseEdifactMessageRouter(unittest.IsolatedAsyncioTestCase):
     """Test cases for the ParseEdifactMessageRouter class."""
 
     def setUp(self):
         """Set up test fixtures."""
-        self.mock_parser_service = MagicMock()
+        self.mock_parser_service = MagicMock(parse_result_cache=None)
         self.router = ParseEdifactMessageRouter(parser_service=self.mock_parser_service)
+        self.mock_job_store = MagicMock(spec=JobStore)
+        self.job_router = ParseEdifactMessageRouter(
+            parser_service=self.mock_parser_service, job_store=self.mock_job_store
+        )
 
     def test_init_with_parser(self):
         """Test that the router can be initialized with a parser service."""
@@ -38,8 +70,8 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         """Test that parse_string_input returns parsed data on success."""
         # Setup
         mock_perf_counter.side_effect = [1.0, 2.0]  # t1=1.0, t2=2.0
-        mock_parsed_obj = MagicMock()
-        mock_parsed_obj.model_dump.return_value = {"key": "value"}
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{"key":"value"}'
         self.mock_parser_service.parse_message.return_value = mock_parsed_obj
         edifact_input = "test_edifact_data"
         limit_mode = False
@@ -52,8 +84,10 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.body.decode(), '{"key":"value"}')
         self.mock_parser_service.parse_message.assert_called_once_with(message_content=edifact_input,
-                                                                       max_lines_to_parse=-1)
-        mock_parsed_obj.model_dump.assert_called_once()
+                                                                       max_lines_to_parse=-1,
+                                                                       memory_budget=ANY,
+                                                                       stage_timings=None)
+        mock_parsed_obj.to_json_bytes.assert_called_once()
 
     @pytest.mark.asyncio
     @patch('time.perf_counter')
@@ -62,8 +96,8 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         """Test that parse_string_input logs performance metrics."""
         # Setup
         mock_perf_counter.side_effect = [1.0, 3.5]  # t1=1.0, t2=3.5 (2.5s difference)
-        mock_parsed_obj = MagicMock()
-        mock_parsed_obj.model_dump.return_value = {}
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{}'
         self.mock_parser_service.parse_message.return_value = mock_parsed_obj
         limit_mode = False
 
@@ -71,7 +105,10 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         await self.router.parse_string_input(limit_mode, "test_data")
 
         # Verify
-        mock_logger.info.assert_called_once_with("SPEED-TEST: Parsing took 2.50s")
+        logged_messages = [call.args[0] for call in mock_logger.info.call_args_list]
+        self.assertTrue(any(
+            message.startswith("SPEED-TEST: Parsing took 2.50s for job ID: ") for message in logged_messages
+        ), logged_messages)
 
     @pytest.mark.asyncio
     async def test_parse_string_input_contrl_exception(self):
@@ -89,6 +126,145 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.body.decode(), f'{{"error_message":"{error_message}"}}')
 
+    @pytest.mark.asyncio
+    async def test_parse_string_input_records_metrics(self):
+        """Test that the parsing runs and their errors are recorded by the parse metrics."""
+        # Setup
+        parse_metrics = ParseMetrics(parse_executor=MagicMock(pending_tasks=0, max_workers=1))
+        router = ParseEdifactMessageRouter(parser_service=self.mock_parser_service, parse_metrics=parse_metrics)
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{}'
+        self.mock_parser_service.parse_message.return_value = mock_parsed_obj
+
+        # Execute
+        await router.parse_string_input(False, "UNH+1+MSCONS:D:04B:UN:2.4c'")
+        self.mock_parser_service.parse_message.side_effect = CONTRLException("CONTRL error message")
+        await router.parse_string_input(False, "invalid_data")
+
+        # Verify
+        rendered = parse_metrics.render()
+        self.assertIn('ediparse_parse_duration_seconds_count{endpoint="/parse-string",message_type="MSCONS"} 1',
+                      rendered)
+        self.assertIn('ediparse_parse_input_bytes_sum{endpoint="/parse-string",message_type="MSCONS"} 27', rendered)
+        self.assertIn(
+            'ediparse_serialization_duration_seconds_count{endpoint="/parse-string",message_type="unknown"} 1', rendered
+        )
+        self.assertIn('ediparse_parse_errors_total{endpoint="/parse-string",error="contrl"} 1', rendered)
+        self.assertIn("ediparse_parses_in_flight 0", rendered)
+
+    @pytest.mark.asyncio
+    async def test_streamed_and_batch_parsing_runs_record_metrics(self):
+        """Test that the streamed parsing runs and the parsing runs of the batch items are recorded as well."""
+        # Setup
+        parse_metrics = ParseMetrics(parse_executor=MagicMock(pending_tasks=0, max_workers=1))
+        router = ParseEdifactMessageRouter(parser_service=self.mock_parser_service, parse_metrics=parse_metrics)
+        self.mock_parser_service.export_measurements_csv.return_value = iter(["header\r\n", "row\r\n"])
+        self.mock_parser_service.parse_batch.return_value = iter([])
+
+        # Execute
+        response = await router.download_measurements_csv("UNH+1+MSCONS:D:04B:UN:2.4c'")
+        rows = [row async for row in response.body_iterator]
+        await router.parse_batch(False, ["UNH+1+APERAK:D:07B:UN:2.1i'"])
+        observer = self.mock_parser_service.parse_batch.call_args.kwargs["observer"]
+        observer("UNH+1+APERAK:D:07B:UN:2.1i'", 0.1, MemoryBudget(), None)
+
+        # Verify
+        self.assertEqual(["header\r\n", "row\r\n"], rows)
+        rendered = parse_metrics.render()
+        self.assertIn(
+            'ediparse_parse_duration_seconds_count{endpoint="/download-measurements-csv",message_type="MSCONS"} 1',
+            rendered
+        )
+        self.assertIn('ediparse_parse_duration_seconds_count{endpoint="/parse-batch",message_type="APERAK"} 1',
+                      rendered)
+        self.assertIn("ediparse_parses_in_flight 0", rendered)
+
+    @pytest.mark.asyncio
+    async def test_parse_string_input_with_debug_timings(self):
+        """Test that the stage timings are returned via the Server-Timing header if requested."""
+        # Setup
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{}'
+
+        def parse_message(message_content, max_lines_to_parse, memory_budget, stage_timings):
+            if stage_timings is not None:
+                stage_timings.add(ParseStage.CONVERSION, 0.0125, count=65)
+            return mock_parsed_obj
+
+        self.mock_parser_service.parse_message.side_effect = parse_message
+
+        # Execute
+        response = await self.router.parse_string_input(False, "test_edifact_data", debug="timings")
+        response_without_timings = await self.router.parse_string_input(False, "test_edifact_data")
+
+        # Verify
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertRegex(
+            response.headers["Server-Timing"], r'^conversion;dur=12\.500;desc="65 segments", render;dur=\d+\.\d{3}$'
+        )
+        self.assertNotIn("Server-Timing", response_without_timings.headers)
+
+    @pytest.mark.asyncio
+    async def test_parse_string_input_with_parse_profiler(self):
+        """Test that the sampled parsing runs on the threadpool are profiled by the parse profiler."""
+        # Setup
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{}'
+        self.mock_parser_service.parse_message.return_value = mock_parsed_obj
+        parse_profiler = ParseProfiler(sample_rate=1.0)
+        router = ParseEdifactMessageRouter(parser_service=self.mock_parser_service, parse_profiler=parse_profiler)
+
+        # Execute
+        response = await router.parse_string_input(False, "test_edifact_data")
+
+        # Verify
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.mock_parser_service.parse_message.assert_called_once_with(
+            message_content="test_edifact_data", max_lines_to_parse=-1, memory_budget=ANY, stage_timings=None
+        )
+        self.assertEqual(1, parse_profiler.statistics.profiled_runs)
+
+    @pytest.mark.asyncio
+    async def test_parse_string_input_with_parse_capture_spool(self):
+        """Test that slow parsing runs are captured with their options and stage timings, without Server-Timing."""
+        # Setup
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{}'
+
+        def parse_message(message_content, max_lines_to_parse, memory_budget, stage_timings):
+            stage_timings.add(ParseStage.CONVERSION, 0.0125, count=65)
+            return mock_parsed_obj
+
+        self.mock_parser_service.parse_message.side_effect = parse_message
+        mock_capture_spool = MagicMock(spec=ParseCaptureSpool)
+        mock_capture_spool.should_capture.return_value = True
+        router = ParseEdifactMessageRouter(
+            parser_service=self.mock_parser_service, parse_capture_spool=mock_capture_spool
+        )
+
+        # Execute
+        response = await router.parse_string_input(False, "test_edifact_data")
+
+        # Verify
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("Server-Timing", response.headers)
+        mock_capture_spool.capture.assert_called_once_with(
+            edifact_text="test_edifact_data",
+            options={
+                "endpoint": "/parse-string",
+                "max_lines_to_parse": -1,
+                "output_format": "json",
+                "short_keys": False,
+            },
+            parse_seconds=ANY,
+            estimated_bytes=ANY,
+            segment_count=ANY,
+            stage_timings=ANY,
+            message_type=ANY
+        )
+        stage_timings = mock_capture_spool.capture.call_args.kwargs["stage_timings"]
+        self.assertEqual(65, stage_timings.get(ParseStage.CONVERSION).count)
+
     @pytest.mark.asyncio
     async def test_parse_string_input_edifact_parser_exception(self):
         """Test that parse_string_input handles EdifactParserException correctly."""
@@ -105,14 +281,30 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.body.decode(), f'{{"error_message":"{error_message}"}}')
 
+    @pytest.mark.asyncio
+    async def test_parse_string_input_memory_budget_exceeded(self):
+        """Test that parse_string_input maps ParseMemoryBudgetExceededException to status 413."""
+        # Setup
+        exception = ParseMemoryBudgetExceededException(estimated_bytes=2048, max_bytes=1024)
+        self.mock_parser_service.parse_message.side_effect = exception
+        limit_mode = False
+
+        # Execute
+        response = await self.router.parse_string_input(limit_mode, "huge_data")
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertEqual(response.body.decode(), f'{{"error_message":"{exception}"}}')
+
     @pytest.mark.asyncio
     @patch('time.perf_counter')
     async def test_parse_file_success(self, mock_perf_counter):
         """Test that parse_file returns parsed data on success."""
         # Setup
         mock_perf_counter.side_effect = [1.0, 2.0]  # t1=1.0, t2=2.0
-        mock_parsed_obj = MagicMock()
-        mock_parsed_obj.model_dump.return_value = {"key": "value"}
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{"key":"value"}'
         self.mock_parser_service.parse_message.return_value = mock_parsed_obj
         edifact_file = "test_edifact_data"
         limit_mode = False
@@ -125,8 +317,327 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.body.decode(), '{"key":"value"}')
         self.mock_parser_service.parse_message.assert_called_once_with(message_content=edifact_file,
-                                                                       max_lines_to_parse=-1)
-        mock_parsed_obj.model_dump.assert_called_once()
+                                                                       max_lines_to_parse=-1,
+                                                                       memory_budget=ANY,
+                                                                       stage_timings=None)
+        mock_parsed_obj.to_json_bytes.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch('ediparse.adapters.inbound.rest.impl.parse_edifact_specific_message_routers.is_msgpack_available')
+    async def test_parse_string_input_msgpack(self, mock_is_msgpack_available):
+        """Test that parse_string_input returns the parsed data as MessagePack if it is accepted."""
+        # Setup
+        mock_is_msgpack_available.return_value = True
+        self.mock_parser_service.parse_message.return_value = MagicMock(spec=EdifactInterchange)
+
+        # Execute
+        with patch('ediparse.adapters.inbound.rest.impl.msgpack_response.encode_interchange', return_value=b"payload"):
+            response = await self.router.parse_string_input(True, "test_edifact_data", "application/msgpack")
+
+        # Verify
+        self.assertIsInstance(response, MessagePackResponse)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.headers["content-type"], "application/msgpack")
+
+    @pytest.mark.asyncio
+    @patch('ediparse.adapters.inbound.rest.impl.parse_edifact_specific_message_routers.is_msgpack_available')
+    async def test_parse_string_input_msgpack_not_available(self, mock_is_msgpack_available):
+        """Test that parse_string_input refuses MessagePack if the optional msgpack package is not installed."""
+        # Setup
+        mock_is_msgpack_available.return_value = False
+
+        # Execute
+        response = await self.router.parse_string_input(True, "test_edifact_data", "application/msgpack")
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+        self.mock_parser_service.parse_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_parse_string_input_compact(self):
+        """Test that parse_string_input omits empty values in compact mode."""
+        # Setup
+        self.mock_parser_service.parse_message.return_value = SegmentBGM(nachrichtenfunktion_code="9")
+
+        # Execute
+        response = await self.router.parse_string_input(True, "test_edifact_data", None, True)
+
+        # Verify
+        self.assertIsInstance(response, CompactJSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.body.decode(), '{"nachrichtenfunktion_code":"9"}')
+
+    @pytest.mark.asyncio
+    async def test_parse_string_input_compact_short_keys(self):
+        """Test that parse_string_input replaces the field names by their short aliases in compact mode."""
+        # Setup
+        self.mock_parser_service.parse_message.return_value = SegmentBGM(nachrichtenfunktion_code="9")
+
+        # Execute
+        response = await self.router.parse_string_input(True, "test_edifact_data", None, True, True)
+
+        # Verify
+        self.assertIsInstance(response, CompactJSONResponse)
+        self.assertEqual(response.body.decode(), '{"nc":"9"}')
+
+    @pytest.mark.asyncio
+    async def test_parse_file_stream_compact(self):
+        """Test that parse_file streams the compact representation in stream and compact mode."""
+        # Setup
+        self.mock_parser_service.stream_messages.return_value = MagicMock()
+
+        # Execute
+        response = await self.router.parse_file(True, "test_edifact_data", True, None, "message", True, True)
+
+        # Verify
+        self.assertIsInstance(response, InterchangeJSONStreamingResponse)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.mock_parser_service.parse_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_download_parsed_string_input_compact(self):
+        """Test that download_parsed_string_input returns the compact representation as file."""
+        # Setup
+        self.mock_parser_service.parse_message.return_value = SegmentBGM(nachrichtenfunktion_code="9")
+
+        # Execute
+        response = await self.router.download_parsed_string_input("test_edifact_data", True, False)
+
+        # Verify
+        self.assertIsInstance(response, CompactJSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn("attachment", response.headers["content-disposition"])
+        self.assertEqual(response.body.decode(), '{"nachrichtenfunktion_code":"9"}')
+
+    @pytest.mark.asyncio
+    async def test_parse_file_stream(self):
+        """Test that parse_file streams the parsed data in stream mode."""
+        # Setup
+        mock_message_stream = MagicMock()
+        self.mock_parser_service.stream_messages.return_value = mock_message_stream
+        edifact_file = "test_edifact_data"
+        limit_mode = False
+
+        # Execute
+        response = await self.router.parse_file(limit_mode, edifact_file, True)
+
+        # Verify
+        self.assertIsInstance(response, InterchangeJSONStreamingResponse)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.mock_parser_service.stream_messages.assert_called_once_with(message_content=edifact_file,
+                                                                         max_lines_to_parse=-1,
+                                                                         memory_budget=ANY)
+        self.mock_parser_service.parse_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_parse_file_ndjson(self):
+        """Test that parse_file streams the parsed data as NDJSON if it is accepted."""
+        # Setup
+        self.mock_parser_service.stream_messages.return_value = MagicMock()
+        edifact_file = "test_edifact_data"
+
+        # Execute
+        response = await self.router.parse_file(True, edifact_file, False, "application/x-ndjson", "measurement")
+
+        # Verify
+        self.assertIsInstance(response, NDJSONStreamingResponse)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.media_type, "application/x-ndjson")
+        self.mock_parser_service.stream_messages.assert_called_once_with(message_content=edifact_file,
+                                                                         max_lines_to_parse=2442,
+                                                                         memory_budget=ANY)
+        self.mock_parser_service.parse_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_parse_file_ndjson_invalid_granularity(self):
+        """Test that parse_file rejects an unknown NDJSON granularity."""
+        # Execute
+        response = await self.router.parse_file(False, "test_edifact_data", False, "application/x-ndjson", "segment")
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.mock_parser_service.stream_messages.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('ediparse.adapters.inbound.rest.impl.parse_edifact_specific_message_routers.is_msgpack_available')
+    async def test_parse_file_msgpack(self, mock_is_msgpack_available):
+        """Test that parse_file returns the parsed data as MessagePack if it is accepted, even in stream mode."""
+        # Setup
+        mock_is_msgpack_available.return_value = True
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        self.mock_parser_service.parse_message.return_value = mock_parsed_obj
+
+        # Execute
+        with patch('ediparse.adapters.inbound.rest.impl.msgpack_response.encode_interchange',
+                   return_value=b"payload") as mock_encode_interchange:
+            response = await self.router.parse_file(False, "test_edifact_data", True, "application/msgpack")
+
+        # Verify
+        self.assertIsInstance(response, MessagePackResponse)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.body, b"payload")
+        mock_encode_interchange.assert_called_once_with(mock_parsed_obj)
+        self.mock_parser_service.stream_messages.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('ediparse.adapters.inbound.rest.impl.parse_edifact_specific_message_routers.is_msgpack_available')
+    async def test_parse_file_compact_msgpack(self, mock_is_msgpack_available):
+        """Test that parse_file honours the compact mode and the short keys in the MessagePack format."""
+        # Setup
+        mock_is_msgpack_available.return_value = True
+        mock_parse_executor = MagicMock(spec=ParseExecutor)
+        mock_parse_executor.backend = ParseExecutorBackend.THREAD
+        mock_parse_executor.submit.return_value = Future()
+        mock_parse_executor.submit.return_value.set_result(RenderedInterchange(content=b"payload"))
+        router = ParseEdifactMessageRouter(parser_service=self.mock_parser_service, parse_executor=mock_parse_executor)
+
+        # Execute
+        response = await router.parse_file(
+            False, "test_edifact_data", accept="application/msgpack", compact=True, short_keys=True
+        )
+
+        # Verify
+        self.assertIsInstance(response, MessagePackResponse)
+        self.assertEqual(response.body, b"payload")
+        mock_parse_executor.submit.assert_called_once_with(
+            "test_edifact_data",
+            max_lines_to_parse=-1,
+            max_memory_bytes=ANY,
+            output_format=ParseOutputFormat.COMPACT_MSGPACK,
+            short_keys=True,
+            collect_stage_timings=False
+        )
+
+    @pytest.mark.asyncio
+    @patch('ediparse.adapters.inbound.rest.impl.parse_edifact_specific_message_routers.is_msgpack_available')
+    async def test_parse_file_msgpack_not_available(self, mock_is_msgpack_available):
+        """Test that parse_file refuses MessagePack if the optional msgpack package is not installed."""
+        # Setup
+        mock_is_msgpack_available.return_value = False
+
+        # Execute
+        response = await self.router.parse_file(False, "test_edifact_data", False, "application/msgpack")
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+        self.mock_parser_service.parse_message.assert_not_called()
+
+    @staticmethod
+    def __create_request_body_stream(*chunks: bytes) -> RequestBodyStream:
+        async def receive_chunks():
+            for chunk in chunks:
+                yield chunk
+
+        return RequestBodyStream(receive_chunks())
+
+    @pytest.mark.asyncio
+    async def test_parse_file_request_body_stream(self):
+        """Test that parse_file decodes a streamed upload chunk by chunk into the parser while it is received."""
+        # Setup
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{"key":"value"}'
+        received_text = []
+
+        def parse_message(message_content, **kwargs):
+            received_text.extend(message_content)
+            return mock_parsed_obj
+
+        self.mock_parser_service.parse_message.side_effect = parse_message
+        # The second chunk ends within the two bytes of the last umlaut
+        upload = "test_edifact_dätä".encode("utf-8")
+
+        # Execute
+        response = await self.router.parse_file(
+            False, self.__create_request_body_stream(upload[:5], upload[5:18], upload[18:])
+        )
+
+        # Verify
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual("test_edifact_dätä", "".join(received_text))
+
+    @pytest.mark.asyncio
+    async def test_parse_file_empty_request_body_stream(self):
+        """Test that parse_file returns an error if the streamed upload is empty."""
+        # Execute
+        response = await self.router.parse_file(True, self.__create_request_body_stream(b""))
+
+        # Verify
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.body.decode(), '{"error_message":"No file provided"}')
+
+    @pytest.mark.asyncio
+    async def test_parse_file_gzip(self):
+        """Test that parse_file decompresses a gzip upload chunk by chunk into the parser."""
+        # Setup
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{"key":"value"}'
+        self.mock_parser_service.parse_message.return_value = mock_parsed_obj
+        edifact_file = gzip.compress(b"test_edifact_data")
+
+        # Execute
+        response = await self.router.parse_file(
+            True, edifact_file, False, None, "message", False, False, "gzip"
+        )
+
+        # Verify
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        message_content = self.mock_parser_service.parse_message.call_args.kwargs["message_content"]
+        self.assertNotIsInstance(message_content, str)
+        self.assertEqual("test_edifact_data", "".join(message_content))
+
+    @pytest.mark.asyncio
+    async def test_parse_file_gzip_request_body_stream(self):
+        """Test that parse_file spools a compressed streamed upload and decompresses it from the spool file."""
+        # Setup
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{"key":"value"}'
+        received_text = []
+
+        def parse_message(message_content, **kwargs):
+            received_text.extend(message_content)
+            return mock_parsed_obj
+
+        self.mock_parser_service.parse_message.side_effect = parse_message
+        upload = gzip.compress(b"test_edifact_data")
+
+        # Execute
+        response = await self.router.parse_file(
+            False, self.__create_request_body_stream(upload[:2], upload[2:10], upload[10:])
+        )
+
+        # Verify
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual("test_edifact_data", "".join(received_text))
+
+    @pytest.mark.asyncio
+    async def test_parse_file_decompression_ratio_exceeded(self):
+        """Test that parse_file maps DecompressionRatioExceededException to status 413."""
+        # Setup
+        exception = DecompressionRatioExceededException(decompressed_bytes=2048, compressed_bytes=10, max_ratio=100)
+        self.mock_parser_service.parse_message.side_effect = exception
+
+        # Execute
+        response = await self.router.parse_file(True, gzip.compress(b"test_edifact_data"))
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertEqual(response.body.decode(), f'{{"error_message":"{exception}"}}')
+
+    @pytest.mark.asyncio
+    async def test_parse_file_unsupported_content_encoding(self):
+        """Test that parse_file refuses uploads with an unsupported content encoding."""
+        # Execute
+        response = await self.router.parse_file(
+            True, b"test_edifact_data", False, None, "message", False, False, "br"
+        )
+
+        # Verify
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.mock_parser_service.parse_message.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_parse_file_no_file(self):
@@ -181,8 +692,8 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
     async def test_parse_file_bytes(self):
         """Test that parse_file handles bytes content correctly."""
         # Setup
-        mock_parsed_obj = MagicMock()
-        mock_parsed_obj.model_dump.return_value = {"key": "value"}
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{"key":"value"}'
         self.mock_parser_service.parse_message.return_value = mock_parsed_obj
         edifact_file = b"test_edifact_data"
         limit_mode = False
@@ -195,14 +706,16 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.body.decode(), '{"key":"value"}')
         self.mock_parser_service.parse_message.assert_called_once_with(message_content="test_edifact_data",
-                                                                       max_lines_to_parse=-1)
+                                                                       max_lines_to_parse=-1,
+                                                                       memory_budget=ANY,
+                                                                       stage_timings=None)
 
     @pytest.mark.asyncio
     async def test_parse_file_tuple(self):
         """Test that parse_file handles tuple content correctly."""
         # Setup
-        mock_parsed_obj = MagicMock()
-        mock_parsed_obj.model_dump.return_value = {"key": "value"}
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{"key":"value"}'
         self.mock_parser_service.parse_message.return_value = mock_parsed_obj
         edifact_file = ("filename.txt", b"test_edifact_data")
         limit_mode = False
@@ -215,7 +728,9 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.body.decode(), '{"key":"value"}')
         self.mock_parser_service.parse_message.assert_called_once_with(message_content="test_edifact_data",
-                                                                       max_lines_to_parse=-1)
+                                                                       max_lines_to_parse=-1,
+                                                                       memory_budget=ANY,
+                                                                       stage_timings=None)
 
     @pytest.mark.asyncio
     @patch('time.strftime')
@@ -225,8 +740,8 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         # Setup
         mock_perf_counter.side_effect = [1.0, 2.0]  # t1=1.0, t2=2.0
         mock_strftime.return_value = "20230101_120000"
-        mock_parsed_obj = MagicMock()
-        mock_parsed_obj.model_dump.return_value = {"key": "value"}
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{"key":"value"}'
         self.mock_parser_service.parse_message.return_value = mock_parsed_obj
         edifact_input = "test_edifact_data"
 
@@ -240,8 +755,10 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         self.assertEqual(response.headers["Content-Disposition"],
                          "attachment; filename=edifact_message_parsed_20230101_120000.json")
         self.mock_parser_service.parse_message.assert_called_once_with(message_content=edifact_input,
-                                                                       max_lines_to_parse=-1)
-        mock_parsed_obj.model_dump.assert_called_once()
+                                                                       max_lines_to_parse=-1,
+                                                                       memory_budget=ANY,
+                                                                       stage_timings=None)
+        mock_parsed_obj.to_json_bytes.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_download_parsed_string_input_contrl_exception(self):
@@ -281,8 +798,8 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         # Setup
         mock_perf_counter.side_effect = [1.0, 2.0]  # t1=1.0, t2=2.0
         mock_strftime.return_value = "20230101_120000"
-        mock_parsed_obj = MagicMock()
-        mock_parsed_obj.model_dump.return_value = {"key": "value"}
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{"key":"value"}'
         self.mock_parser_service.parse_message.return_value = mock_parsed_obj
         edifact_file = "test_edifact_data"
 
@@ -296,8 +813,59 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         self.assertEqual(response.headers["Content-Disposition"],
                          "attachment; filename=edifact_message_parsed_20230101_120000.json")
         self.mock_parser_service.parse_message.assert_called_once_with(message_content=edifact_file,
-                                                                       max_lines_to_parse=-1)
-        mock_parsed_obj.model_dump.assert_called_once()
+                                                                       max_lines_to_parse=-1,
+                                                                       memory_budget=ANY,
+                                                                       stage_timings=None)
+        mock_parsed_obj.to_json_bytes.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch('time.strftime')
+    async def test_download_parsed_file_stream(self, mock_strftime):
+        """Test that download_parsed_file streams the parsed data as downloadable file in stream mode."""
+        # Setup
+        mock_strftime.return_value = "20230101_120000"
+        self.mock_parser_service.stream_messages.return_value = MagicMock()
+
+        # Execute
+        response = await self.router.download_parsed_file("test_edifact_data", True)
+
+        # Verify
+        self.assertIsInstance(response, InterchangeJSONStreamingResponse)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.headers["Content-Disposition"],
+                         "attachment; filename=edifact_message_parsed_20230101_120000.json")
+
+    @pytest.mark.asyncio
+    @patch('time.strftime')
+    async def test_download_parsed_file_ndjson(self, mock_strftime):
+        """Test that download_parsed_file streams the parsed data as downloadable NDJSON file if it is accepted."""
+        # Setup
+        mock_strftime.return_value = "20230101_120000"
+        self.mock_parser_service.stream_messages.return_value = MagicMock()
+
+        # Execute
+        response = await self.router.download_parsed_file("test_edifact_data", False, "application/x-ndjson")
+
+        # Verify
+        self.assertIsInstance(response, NDJSONStreamingResponse)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.headers["Content-Disposition"],
+                         "attachment; filename=edifact_message_parsed_20230101_120000.ndjson")
+
+    @pytest.mark.asyncio
+    async def test_download_parsed_file_gzip_stream(self):
+        """Test that download_parsed_file streams the messages of a gzip upload while it is decompressed."""
+        # Setup
+        self.mock_parser_service.stream_messages.return_value = MagicMock()
+
+        # Execute
+        response = await self.router.download_parsed_file(gzip.compress(b"test_edifact_data"), True)
+
+        # Verify
+        self.assertIsInstance(response, InterchangeJSONStreamingResponse)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        message_content = self.mock_parser_service.stream_messages.call_args.kwargs["message_content"]
+        self.assertEqual("test_edifact_data", "".join(message_content))
 
     @pytest.mark.asyncio
     async def test_download_parsed_file_no_file(self):
@@ -349,8 +917,8 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
     async def test_download_parsed_file_bytes(self):
         """Test that download_parsed_file handles bytes content correctly."""
         # Setup
-        mock_parsed_obj = MagicMock()
-        mock_parsed_obj.model_dump.return_value = {"key": "value"}
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{"key":"value"}'
         self.mock_parser_service.parse_message.return_value = mock_parsed_obj
         edifact_file = b"test_edifact_data"
 
@@ -362,14 +930,16 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.body.decode(), '{"key":"value"}')
         self.mock_parser_service.parse_message.assert_called_once_with(message_content="test_edifact_data",
-                                                                       max_lines_to_parse=-1)
+                                                                       max_lines_to_parse=-1,
+                                                                       memory_budget=ANY,
+                                                                       stage_timings=None)
 
     @pytest.mark.asyncio
     async def test_download_parsed_file_tuple(self):
         """Test that download_parsed_file handles tuple content correctly."""
         # Setup
-        mock_parsed_obj = MagicMock()
-        mock_parsed_obj.model_dump.return_value = {"key": "value"}
+        mock_parsed_obj = MagicMock(spec=EdifactInterchange)
+        mock_parsed_obj.to_json_bytes.return_value = b'{"key":"value"}'
         self.mock_parser_service.parse_message.return_value = mock_parsed_obj
         edifact_file = ("filename.txt", b"test_edifact_data")
 
@@ -381,7 +951,530 @@ class TestParseEdifactMessageRouter(unittest.TestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.body.decode(), '{"key":"value"}')
         self.mock_parser_service.parse_message.assert_called_once_with(message_content="test_edifact_data",
-                                                                       max_lines_to_parse=-1)
+                                                                       max_lines_to_parse=-1,
+                                                                       memory_budget=ANY,
+                                                                       stage_timings=None)
+
+    @patch('ediparse.adapters.inbound.rest.impl.parse_edifact_specific_message_routers.MAX_PARSE_MEMORY_MB', 2)
+    def test_max_parse_memory_bytes(self):
+        """Test that the configured memory budget is converted from megabytes to bytes."""
+        self.assertEqual(
+            2 * 1024 * 1024, ParseEdifactMessageRouter._ParseEdifactMessageRouter__get_max_parse_memory_bytes()
+        )
+
+    @patch('ediparse.adapters.inbound.rest.impl.parse_edifact_specific_message_routers.MAX_PARSE_MEMORY_MB', 0)
+    def test_max_parse_memory_bytes_disabled(self):
+        """Test that a memory budget of 0 megabytes disables the memory budget."""
+        self.assertIsNone(ParseEdifactMessageRouter._ParseEdifactMessageRouter__get_max_parse_memory_bytes())
+
+    @pytest.mark.asyncio
+    @patch('time.strftime')
+    async def test_download_measurements_csv(self, mock_strftime):
+        """Test that download_measurements_csv streams the exported measurements as downloadable CSV file."""
+        # Setup
+        mock_strftime.return_value = "20230101_120000"
+        self.mock_parser_service.export_measurements_csv.return_value = iter(["header\r\n", "row\r\n"])
+
+        # Execute
+        response = await self.router.download_measurements_csv("test_edifact_data")
+
+        # Verify
+        self.assertIsInstance(response, StreamingResponse)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.headers["content-type"], "text/csv; charset=utf-8")
+        self.assertEqual(response.headers["Content-Disposition"],
+                         "attachment; filename=edifact_message_parsed_20230101_120000.csv")
+        self.mock_parser_service.export_measurements_csv.assert_called_once_with(message_content="test_edifact_data")
+        self.mock_parser_service.parse_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_download_measurements_csv_invalid_input(self):
+        """Test that download_measurements_csv handles an invalid input correctly."""
+        # Setup
+        self.mock_parser_service.export_measurements_csv.side_effect = EdifactParserException("Invalid input")
+
+        # Execute
+        response = await self.router.download_measurements_csv("test_edifact_data")
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @pytest.mark.asyncio
+    async def test_download_measurements_csv_no_file(self):
+        """Test that download_measurements_csv handles no file provided correctly."""
+        # Execute
+        response = await self.router.download_measurements_csv(None)
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.mock_parser_service.export_measurements_csv.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_download_measurements_csv_request_body_stream(self):
+        """Test that download_measurements_csv hands a streamed upload to the export as sequence of text chunks."""
+        # Setup
+        received_text = []
+
+        def export_measurements_csv(message_content):
+            received_text.extend(message_content)
+            return iter(["header\r\n"])
+
+        self.mock_parser_service.export_measurements_csv.side_effect = export_measurements_csv
+
+        # Execute
+        response = await self.router.download_measurements_csv(
+            self.__create_request_body_stream(b"test_edifact_", b"data")
+        )
+
+        # Verify
+        self.assertIsInstance(response, StreamingResponse)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual("test_edifact_data", "".join(received_text))
+
+    @pytest.mark.asyncio
+    async def test_download_measurements_csv_decompression_ratio_exceeded(self):
+        """Test that download_measurements_csv maps DecompressionRatioExceededException to status 413."""
+        # Setup
+        exception = DecompressionRatioExceededException(decompressed_bytes=2048, compressed_bytes=10, max_ratio=100)
+        self.mock_parser_service.export_measurements_csv.side_effect = exception
+
+        # Execute
+        response = await self.router.download_measurements_csv(
+            self.__create_request_body_stream(gzip.compress(b"test_edifact_data"))
+        )
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertEqual(response.body.decode(), f'{{"error_message":"{exception}"}}')
+
+    @pytest.mark.asyncio
+    async def test_parse_batch_json_array(self):
+        """Test that parse_batch parses the payloads of a JSON array as batch and streams the outcomes."""
+        # Setup
+        self.mock_parser_service.parse_batch.return_value = iter([])
+
+        # Execute
+        response = await self.router.parse_batch(True, ["first", "second"])
+
+        # Verify
+        self.assertIsInstance(response, BatchNDJSONStreamingResponse)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.mock_parser_service.parse_batch.assert_called_once_with(message_contents=["first", "second"],
+                                                                     max_lines_to_parse=2442,
+                                                                     max_memory_bytes=ANY,
+                                                                     observer=ANY)
+
+    @pytest.mark.asyncio
+    async def test_parse_batch_ndjson(self):
+        """Test that parse_batch reads one JSON string per NDJSON line and skips blank lines."""
+        # Setup
+        self.mock_parser_service.parse_batch.return_value = iter([])
+
+        # Execute
+        response = await self.router.parse_batch(False, b'"first"\n\n"UNA:+.? \'\\nUNB"\n')
+
+        # Verify
+        self.assertIsInstance(response, BatchNDJSONStreamingResponse)
+        self.mock_parser_service.parse_batch.assert_called_once_with(message_contents=["first", "UNA:+.? '\nUNB"],
+                                                                     max_lines_to_parse=-1,
+                                                                     max_memory_bytes=ANY,
+                                                                     observer=ANY)
+
+    @pytest.mark.asyncio
+    async def test_parse_batch_invalid_ndjson(self):
+        """Test that parse_batch refuses a batch with an invalid NDJSON line."""
+        # Execute
+        response = await self.router.parse_batch(True, b'"first"\n{invalid\n')
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Invalid NDJSON line 2", response.body.decode())
+        self.mock_parser_service.parse_batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_parse_batch_no_string_payload(self):
+        """Test that parse_batch refuses a batch with a payload that is not a string."""
+        # Execute
+        response = await self.router.parse_batch(True, b'["first", 2]')
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.body.decode(), '{"error_message":"The payload at index 1 is not a string."}')
+
+    @pytest.mark.asyncio
+    async def test_parse_batch_no_payloads(self):
+        """Test that parse_batch handles no payloads provided correctly."""
+        # Execute
+        response = await self.router.parse_batch(True, None)
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.body.decode(), '{"error_message":"No payloads provided"}')
+
+    @pytest.mark.asyncio
+    @patch('ediparse.adapters.inbound.rest.impl.parse_edifact_specific_message_routers.MAX_BATCH_SIZE', 1)
+    async def test_parse_batch_too_many_payloads(self):
+        """Test that parse_batch refuses a batch with more payloads than allowed."""
+        # Execute
+        response = await self.router.parse_batch(True, ["first", "second"])
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.mock_parser_service.parse_batch.assert_not_called()
+
+
+    @pytest.mark.asyncio
+    async def test_parse_archive_ndjson(self):
+        """Test that parse_archive parses the files of the uploaded archive and streams the outcomes as NDJSON."""
+        # Setup
+        self.mock_parser_service.parse_archive.return_value = iter([])
+
+        # Execute
+        response = await self.router.parse_archive(True, ("archive.zip", b"PK\x03\x04archive"))
+
+        # Verify
+        self.assertIsInstance(response, ArchiveNDJSONStreamingResponse)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.mock_parser_service.parse_archive.assert_called_once_with(archive=b"PK\x03\x04archive",
+                                                                       max_lines_to_parse=2442,
+                                                                       max_memory_bytes=ANY,
+                                                                       max_decompression_ratio=ANY,
+                                                                       observer=ANY)
+
+    @pytest.mark.asyncio
+    async def test_parse_archive_zip(self):
+        """Test that parse_archive streams a result archive for download if application/zip is accepted."""
+        # Setup
+        self.mock_parser_service.parse_archive.return_value = iter([])
+
+        # Execute
+        response = await self.router.parse_archive(False, b"archive", "application/zip")
+
+        # Verify
+        self.assertIsInstance(response, ArchiveZipStreamingResponse)
+        self.assertIn(".zip", response.headers["content-disposition"])
+        self.mock_parser_service.parse_archive.assert_called_once_with(archive=b"archive",
+                                                                       max_lines_to_parse=-1,
+                                                                       max_memory_bytes=ANY,
+                                                                       max_decompression_ratio=ANY,
+                                                                       observer=ANY)
+
+    @pytest.mark.asyncio
+    async def test_parse_archive_invalid_archive(self):
+        """Test that parse_archive refuses an upload which is not a supported archive."""
+        # Setup
+        self.mock_parser_service.parse_archive.side_effect = EdifactParserException("Unsupported archive format")
+
+        # Execute
+        response = await self.router.parse_archive(True, b"UNA:+.? '")
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.body.decode(), '{"error_message":"Unsupported archive format"}')
+
+    @pytest.mark.asyncio
+    async def test_parse_archive_no_file(self):
+        """Test that parse_archive handles no file provided correctly."""
+        # Execute
+        response = await self.router.parse_archive(True, None)
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.body.decode(), '{"error_message":"No file provided"}')
+        self.mock_parser_service.parse_archive.assert_not_called()
+
+
+    def __create_job(self, job_status: JobStatus) -> Job:
+        job = Job(job_id="job", directory="job")
+        job.status = job_status
+        self.mock_job_store.get.return_value = job
+        return job
+
+    @pytest.mark.asyncio
+    async def test_create_job(self):
+        """Test that create_job spools the upload as job and returns the status of the job."""
+        # Setup
+        self.__create_job(JobStatus.QUEUED)
+        self.mock_job_store.submit.return_value = self.mock_job_store.get.return_value
+
+        # Execute
+        response = await self.job_router.create_job(True, ("mscons.txt", b"test_edifact_data"))
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.headers["location"], "/jobs/job")
+        self.assertIn('"status":"queued"', response.body.decode())
+        self.mock_job_store.submit.assert_called_once_with(b"test_edifact_data", ANY)
+        self.assertIsInstance(self.mock_job_store.submit.call_args[0][1], ParseJobTask)
+
+    @pytest.mark.asyncio
+    async def test_create_job_request_body_stream(self):
+        """Test that create_job hands a streamed upload to the job store, which spools it while it is received."""
+        # Setup
+        self.__create_job(JobStatus.QUEUED)
+        self.mock_job_store.submit.return_value = self.mock_job_store.get.return_value
+        body = self.__create_request_body_stream(b"test_edifact_data")
+
+        # Execute
+        response = await self.job_router.create_job(True, body)
+
+        # Verify
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.mock_job_store.submit.assert_called_once_with(body, ANY)
+
+    @pytest.mark.asyncio
+    async def test_create_job_with_full_queue(self):
+        """Test that create_job refuses the upload if the job queue is full."""
+        # Setup
+        self.mock_job_store.submit.side_effect = JobQueueFullException(max_jobs=2)
+
+        # Execute
+        response = await self.job_router.create_job(True, "test_edifact_data")
+
+        # Verify
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.mock_job_store.submit.assert_called_once_with(b"test_edifact_data", ANY)
+
+    @pytest.mark.asyncio
+    async def test_create_job_no_file(self):
+        """Test that create_job handles no file provided correctly."""
+        # Execute
+        response = await self.job_router.create_job(True, None)
+
+        # Verify
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.body.decode(), '{"error_message":"No file provided"}')
+        self.mock_job_store.submit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_job(self):
+        """Test that get_job returns the status of a job and 404 for unknown jobs."""
+        # Setup
+        self.__create_job(JobStatus.RUNNING)
+
+        # Execute
+        response = await self.job_router.get_job("job")
+        self.mock_job_store.get.return_value = None
+        not_found_response = await self.job_router.get_job("unknown")
+
+        # Verify
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('"status":"running"', response.body.decode())
+        self.assertEqual(not_found_response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @pytest.mark.asyncio
+    async def test_get_job_result(self):
+        """Test that get_job_result serves results kept in memory and results spilled to disk."""
+        # Setup
+        job = self.__create_job(JobStatus.SUCCEEDED)
+        job.result_content = b'{"key":"value"}'
+
+        # Execute
+        response = await self.job_router.get_job_result("job")
+        job.result_path = __file__
+        file_response = await self.job_router.get_job_result("job")
+
+        # Verify
+        self.assertIsInstance(response, Response)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.body, b'{"key":"value"}')
+        self.assertIn("attachment", response.headers["content-disposition"])
+        self.assertIsInstance(file_response, FileResponse)
+        self.assertEqual(file_response.path, __file__)
+
+    @pytest.mark.asyncio
+    async def test_get_job_result_of_unfinished_or_failed_job(self):
+        """Test that get_job_result returns 409 for unfinished jobs and the error of failed jobs."""
+        # Setup
+        job = self.__create_job(JobStatus.RUNNING)
+
+        # Execute
+        running_response = await self.job_router.get_job_result("job")
+        job.status = JobStatus.FAILED
+        job.error = ParseMemoryBudgetExceededException(estimated_bytes=2, max_bytes=1)
+        failed_response = await self.job_router.get_job_result("job")
+
+        # Verify
+        self.assertEqual(running_response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(failed_response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+    @pytest.mark.asyncio
+    async def test_parse_string_input_on_parse_executor(self):
+        """Test that the rendered body handed out by a configured parse executor is sent as it is."""
+        # Setup
+        mock_parse_executor = MagicMock(spec=ParseExecutor)
+        mock_parse_executor.backend = ParseExecutorBackend.THREAD
+        mock_parse_executor.submit.return_value = Future()
+        mock_parse_executor.submit.return_value.set_result(RenderedInterchange(content=b'{"nc":"9"}'))
+        router = ParseEdifactMessageRouter(parser_service=self.mock_parser_service, parse_executor=mock_parse_executor)
+
+        # Execute
+        response = await router.parse_string_input(True, "test_edifact_data", compact=True, short_keys=True)
+
+        # Verify
+        self.assertIsInstance(response, CompactJSONResponse)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.body, b'{"nc":"9"}')
+        mock_parse_executor.submit.assert_called_once_with(
+            "test_edifact_data",
+            max_lines_to_parse=2442,
+            max_memory_bytes=ANY,
+            output_format=ParseOutputFormat.COMPACT_JSON,
+            short_keys=True,
+            collect_stage_timings=False
+        )
+        self.mock_parser_service.parse_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_parse_string_input_on_inline_parse_executor(self):
+        """Test that the parse tasks of the inline backend are submitted on the threadpool, not on the event loop."""
+        # Setup
+        event_loop_thread = threading.get_ident()
+        submitting_threads = []
+
+        def submit(*args, **kwargs):
+            submitting_threads.append(threading.get_ident())
+            future = Future()
+            future.set_result(RenderedInterchange(content=b'{"nc":"9"}'))
+            return future
+
+        mock_parse_executor = MagicMock(spec=ParseExecutor)
+        mock_parse_executor.backend = ParseExecutorBackend.INLINE
+        mock_parse_executor.submit.side_effect = submit
+        router = ParseEdifactMessageRouter(parser_service=self.mock_parser_service, parse_executor=mock_parse_executor)
+
+        # Execute
+        response = await router.parse_string_input(True, "test_edifact_data", compact=True)
+
+        # Verify
+        self.assertEqual(response.body, b'{"nc":"9"}')
+        self.assertEqual(1, len(submitting_threads))
+        self.assertNotEqual(event_loop_thread, submitting_threads[0])
+
+    @pytest.mark.asyncio
+    async def test_parse_string_input_with_message_cache_header(self):
+        """Test that the messages reused from the message cache by the parsing run are returned via a header."""
+        # Setup
+        mock_parse_executor = MagicMock(spec=ParseExecutor)
+        mock_parse_executor.backend = ParseExecutorBackend.THREAD
+        mock_parse_executor.submit.return_value = Future()
+        mock_parse_executor.submit.return_value.set_result(
+            RenderedInterchange(content=b'{"nc":"9"}', reused_messages=3, parsed_messages=1)
+        )
+        router = ParseEdifactMessageRouter(parser_service=self.mock_parser_service, parse_executor=mock_parse_executor)
+
+        # Execute
+        response = await router.parse_string_input(True, "test_edifact_data")
+        download_response = await router.download_parsed_string_input("test_edifact_data")
+
+        # Verify
+        self.assertEqual(response.headers["X-Message-Cache"], "reused=3, parsed=1")
+        self.assertEqual(download_response.headers["X-Message-Cache"], "reused=3, parsed=1")
+        self.assertIn("attachment", download_response.headers["Content-Disposition"])
+
+    @pytest.mark.asyncio
+    async def test_parse_file_on_parse_executor_with_error(self):
+        """Test that the errors raised on a configured parse executor are returned like the ones of the parser."""
+        # Setup
+        mock_parse_executor = MagicMock(spec=ParseExecutor)
+        mock_parse_executor.backend = ParseExecutorBackend.THREAD
+        mock_parse_executor.submit.return_value = Future()
+        mock_parse_executor.submit.return_value.set_exception(
+            ParseMemoryBudgetExceededException(estimated_bytes=2, max_bytes=1)
+        )
+        router = ParseEdifactMessageRouter(parser_service=self.mock_parser_service, parse_executor=mock_parse_executor)
+
+        # Execute
+        response = await router.parse_file(False, gzip.compress(b"test_edifact_data"))
+
+        # Verify
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertEqual(mock_parse_executor.submit.call_args.args[0], "test_edifact_data")
+
+    @pytest.mark.asyncio
+    async def test_parse_string_input_with_parse_result_cache(self):
+        """Test that the parser service renders the result itself while the parse result cache is enabled."""
+        # Setup
+        self.mock_parser_service.parse_result_cache = MagicMock()
+        self.mock_parser_service.render_message.return_value = b'{"nc":"9"}'
+
+        # Execute
+        response = await self.router.parse_string_input(True, "test_edifact_data", compact=True, short_keys=True)
+
+        # Verify
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.body, b'{"nc":"9"}')
+        self.mock_parser_service.render_message.assert_called_once_with(
+            message_content="test_edifact_data",
+            max_lines_to_parse=2442,
+            memory_budget=ANY,
+            output_format=ParseOutputFormat.COMPACT_JSON,
+            short_keys=True,
+            cache_key=self.mock_parser_service.get_result_cache_key.return_value,
+            stage_timings=None
+        )
+        self.mock_parser_service.parse_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_parse_string_input_on_parse_executor_with_parse_result_cache(self):
+        """Test that a cached result is sent without submitting the payload and a new result is cached."""
+        # Setup
+        self.mock_parser_service.parse_result_cache = MagicMock()
+        self.mock_parser_service.get_cached_result.side_effect = [b'{"cached":true}', None]
+        mock_parse_executor = MagicMock(spec=ParseExecutor)
+        mock_parse_executor.backend = ParseExecutorBackend.THREAD
+        mock_parse_executor.submit.return_value = Future()
+        mock_parse_executor.submit.return_value.set_result(RenderedInterchange(content=b'{"cached":false}'))
+        router = ParseEdifactMessageRouter(parser_service=self.mock_parser_service, parse_executor=mock_parse_executor)
+
+        # Execute
+        cached_response = await router.parse_string_input(False, "test_edifact_data")
+        parsed_response = await router.parse_string_input(False, "test_edifact_data")
+
+        # Verify
+        self.assertEqual(cached_response.body, b'{"cached":true}')
+        self.assertEqual(parsed_response.body, b'{"cached":false}')
+        mock_parse_executor.submit.assert_called_once()
+        self.mock_parser_service.get_result_cache_key.assert_called_with(
+            "test_edifact_data", -1, ParseOutputFormat.JSON, False
+        )
+        self.mock_parser_service.cache_result.assert_called_once_with(
+            self.mock_parser_service.get_result_cache_key.return_value, b'{"cached":false}'
+        )
+
+    @pytest.mark.asyncio
+    async def test_parse_string_input_coalesces_identical_requests(self):
+        """Test that identical concurrent requests share the rendered body of one parsing run."""
+        # Setup
+        def render_message(**kwargs):
+            time.sleep(0.05)
+            return b'{"nachrichten":[]}'
+
+        self.mock_parser_service.get_result_cache_key.return_value = "key"
+        self.mock_parser_service.render_message.side_effect = render_message
+        router = ParseEdifactMessageRouter(parser_service=self.mock_parser_service, single_flight=SingleFlight())
+
+        # Execute
+        responses = await asyncio.gather(
+            router.parse_string_input(False, "test_edifact_data"),
+            router.parse_string_input(False, "test_edifact_data")
+        )
+
+        # Verify
+        self.assertEqual([b'{"nachrichten":[]}'] * 2, [response.body for response in responses])
+        self.mock_parser_service.render_message.assert_called_once()
+        self.mock_parser_service.parse_message.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,123 @@
+import gzip
+import io
+import os
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from ediparse.adapters.inbound.rest.impl.parse_jobs import ParseJobTask, render_job_status
+from ediparse.adapters.inbound.rest.impl.parse_metrics import ParseMetrics
+from ediparse.application.services import ParserService
+from ediparse.infrastructure.job_store import Job, JobStatus
+from ediparse.infrastructure.libs.edifactparser.exceptions import (
+    EdifactParserException, ParseMemoryBudgetExceededException
+)
+from ediparse.infrastructure.libs.edifactparser.exporters import to_compact_json_bytes
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+
+
+class TestParseJobs(unittest.TestCase):
+    """Test cases for the task and status rendering of the asynchronous parsing jobs."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.samples_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))))) / "samples"
+        with open(self.samples_dir / "mscons-message-example-request.txt", encoding='utf-8') as f:
+            self.edifact_data = f.read()
+        self.interchange = EdifactParser().parse(self.edifact_data)
+        self.parser_service = ParserService()
+        self.job = Job(job_id="job", directory="job")
+
+    def __run_task(self, task: ParseJobTask, upload: bytes) -> bytes:
+        result_file = io.BytesIO()
+        task(self.job, io.BufferedReader(io.BytesIO(upload)), result_file)
+        return result_file.getvalue()
+
+    def test_task_writes_parsed_interchange(self):
+        """Test that the task writes the same JSON document as the file endpoints and counts the messages."""
+        # Act
+        result = self.__run_task(ParseJobTask(self.parser_service), self.edifact_data.encode("utf-8"))
+
+        # Assert
+        self.assertEqual(self.interchange.to_json_bytes(), result)
+        self.assertEqual(len(self.interchange.unh_unt_nachrichten), self.job.messages_processed)
+
+    def test_task_with_compressed_upload_in_compact_mode(self):
+        """Test that gzip uploads are decompressed and the compact document is written in compact mode."""
+        # Arrange
+        task = ParseJobTask(self.parser_service, max_decompression_ratio=100, compact=True, short_keys=True)
+
+        # Act
+        result = self.__run_task(task, gzip.compress(self.edifact_data.encode("utf-8")))
+
+        # Assert
+        self.assertEqual(to_compact_json_bytes(self.interchange, short_keys=True), result)
+
+    def test_task_records_metrics(self):
+        """Test that the parsing runs of the jobs are recorded in the parse metrics."""
+        # Arrange
+        parse_metrics = ParseMetrics(parse_executor=MagicMock(pending_tasks=0, max_workers=1))
+        task = ParseJobTask(self.parser_service, parse_metrics=parse_metrics)
+
+        # Act
+        self.__run_task(task, self.edifact_data.encode("utf-8"))
+        with self.assertRaises(EdifactParserException):
+            self.__run_task(task, b"invalid")
+
+        # Assert
+        rendered = parse_metrics.render()
+        self.assertIn('ediparse_parse_duration_seconds_count{endpoint="/jobs",message_type="MSCONS"} 1', rendered)
+        self.assertIn('ediparse_parse_errors_total{endpoint="/jobs",error="parser"} 1', rendered)
+
+    def test_task_with_invalid_upload(self):
+        """Test that invalid uploads and exceeded memory budgets are raised."""
+        with self.assertRaises(EdifactParserException):
+            self.__run_task(ParseJobTask(self.parser_service), b"invalid")
+        with self.assertRaises(ParseMemoryBudgetExceededException):
+            self.__run_task(ParseJobTask(self.parser_service, max_memory_bytes=1), self.edifact_data.encode("utf-8"))
+
+    def test_render_job_status(self):
+        """Test that the status and progress of a running job are rendered."""
+        # Arrange
+        self.job.status = JobStatus.RUNNING
+        self.job.created_at = 0
+        self.job.started_at = 1
+        self.job.upload_size = 100
+        self.job.bytes_processed = 120
+        self.job.messages_processed = 3
+
+        # Act
+        job_status = render_job_status(self.job)
+
+        # Assert
+        self.assertEqual({
+            "job_id": "job",
+            "status": "running",
+            "created_at": "1970-01-01T00:00:00+00:00",
+            "started_at": "1970-01-01T00:00:01+00:00",
+            "finished_at": None,
+            "progress": {"bytes_processed": 100, "bytes_total": 100, "messages_processed": 3}
+        }, job_status)
+
+    def test_render_job_status_of_finished_jobs(self):
+        """Test that succeeded jobs are rendered with their result size and failed jobs with their error."""
+        # Arrange
+        self.job.status = JobStatus.SUCCEEDED
+        self.job.result_size = 42
+        failed_job = Job(job_id="failed", directory="failed")
+        failed_job.status = JobStatus.FAILED
+        failed_job.error = ParseMemoryBudgetExceededException(estimated_bytes=2, max_bytes=1)
+
+        # Act
+        job_status = render_job_status(self.job)
+        failed_job_status = render_job_status(failed_job)
+
+        # Assert
+        self.assertEqual(42, job_status["result_size"])
+        self.assertNotIn("error_message", job_status)
+        self.assertEqual(413, failed_job_status["status_code"])
+        self.assertEqual(str(failed_job.error), failed_job_status["error_message"])
+
+
+if __name__ == '__main__':
+    unittest.main()
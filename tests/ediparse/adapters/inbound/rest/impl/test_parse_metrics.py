@@ -0,0 +1,262 @@
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from ediparse.adapters.inbound.rest.impl.parse_metrics import (
+    Counter, Gauge, Histogram, InputTally, MetricsRegistry, ObservedMessageStream, ParseMetrics,
+    detect_message_type, get_error_kind, get_interchange_message_type
+)
+from ediparse.application.services import ParserService
+from ediparse.infrastructure.libs.edifactparser.exceptions import (
+    CONTRLException, EdifactParserException, ParseMemoryBudgetExceededException
+)
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget
+
+SAMPLES_DIR = Path(__file__).resolve().parents[5] / "samples"
+
+
+class TestParseMetrics(unittest.TestCase):
+    """Test cases for the parse metrics and their rendering in the Prometheus text format."""
+
+    def test_detect_message_type(self):
+        """Test that the message type is detected from the head of the input."""
+        self.assertEqual("MSCONS", detect_message_type("UNB+UNOC:3+SENDER'UNH+1+MSCONS:D:04B:UN:2.4c'"))
+        self.assertEqual("APERAK", detect_message_type("UNH+1+APERAK:D:07B:UN:2.1i'"))
+        self.assertEqual("unknown", detect_message_type("UNH+1+XMSCONSX:D:04B:UN:2.4c'"))
+        self.assertEqual("unknown", detect_message_type(" " * 5000 + "UNH+1+MSCONS'"))
+
+    def test_get_interchange_message_type(self):
+        """Test that the message type of a parsed interchange is taken from its first message."""
+        with open(SAMPLES_DIR / "mscons-message-example-request.txt", encoding="utf-8") as f:
+            interchange = EdifactParser().parse(f.read())
+
+        self.assertEqual("MSCONS", get_interchange_message_type(interchange))
+        self.assertEqual("unknown", get_interchange_message_type(b"{}"))
+
+    def test_render_counter_and_gauges(self):
+        """Test that counters and gauges are rendered with their labels, help texts and types."""
+        # Arrange
+        registry = MetricsRegistry()
+        counter = registry.register(Counter("errors_total", "Number of errors", ("endpoint",)))
+        gauge = registry.register(Gauge("in_flight", "Number in flight"))
+        registry.register(Gauge("queue_depth", "Queue depth", function=lambda: 3))
+
+        # Act
+        counter.inc(('/parse-"file"',))
+        counter.inc(('/parse-"file"',), amount=2)
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        # Assert
+        self.assertEqual(
+            "# HELP errors_total Number of errors\n"
+            "# TYPE errors_total counter\n"
+            'errors_total{endpoint="/parse-\\"file\\""} 3\n'
+            "# HELP in_flight Number in flight\n"
+            "# TYPE in_flight gauge\n"
+            "in_flight 1\n"
+            "# HELP queue_depth Queue depth\n"
+            "# TYPE queue_depth gauge\n"
+            "queue_depth 3\n",
+            registry.render()
+        )
+        with self.assertRaises(ValueError):
+            registry.register(Counter("errors_total", "Duplicate"))
+
+    def test_render_histogram(self):
+        """Test that the bucket counts of a histogram are rendered cumulatively, followed by sum and count."""
+        # Arrange
+        histogram = Histogram("duration_seconds", "Duration", ("endpoint",), buckets=(0.1, 1.0))
+
+        # Act
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value, ("/parse-string",))
+
+        # Assert
+        self.assertEqual([
+            "# HELP duration_seconds Duration",
+            "# TYPE duration_seconds histogram",
+            'duration_seconds_bucket{endpoint="/parse-string",le="0.1"} 2',
+            'duration_seconds_bucket{endpoint="/parse-string",le="1"} 3',
+            'duration_seconds_bucket{endpoint="/parse-string",le="+Inf"} 4',
+            'duration_seconds_sum{endpoint="/parse-string"} 2.65',
+            'duration_seconds_count{endpoint="/parse-string"} 4',
+        ], histogram.render())
+        with self.assertRaises(ValueError):
+            Histogram("invalid", "Invalid", buckets=(1.0, 0.1))
+
+    def test_input_tally(self):
+        """Test that the chunks are handed out unchanged while their length and the head are counted."""
+        input_tally = InputTally()
+
+        chunks = list(input_tally.count(["UNH+1+", "MSCONS'"]))
+
+        self.assertEqual(["UNH+1+", "MSCONS'"], chunks)
+        self.assertEqual(13, input_tally.length)
+        self.assertEqual("MSCONS", detect_message_type(input_tally.head))
+
+    def test_input_tally_track(self):
+        """Test that inputs provided as one string are tallied right away and chunks while they are consumed."""
+        text_tally = InputTally()
+        chunks_tally = InputTally()
+
+        text = text_tally.track("UNH+1+MSCONS'")
+        chunks = chunks_tally.track(iter(["UNH+1+", "APERAK'"]))
+
+        self.assertEqual("UNH+1+MSCONS'", text)
+        self.assertEqual((13, "UNH+1+MSCONS'"), (text_tally.length, text_tally.head))
+        self.assertEqual(0, chunks_tally.length)
+        self.assertEqual(["UNH+1+", "APERAK'"], list(chunks))
+        self.assertEqual((13, "APERAK"), (chunks_tally.length, detect_message_type(chunks_tally.head)))
+
+    def test_get_error_kind(self):
+        """Test that the errors of the parsing runs are classified for the error counter."""
+        memory_budget_error = ParseMemoryBudgetExceededException(estimated_bytes=2, max_bytes=1)
+        self.assertEqual("memory_budget", get_error_kind(memory_budget_error))
+        self.assertEqual("contrl", get_error_kind(CONTRLException("invalid")))
+        self.assertEqual("parser", get_error_kind(EdifactParserException("invalid")))
+        self.assertEqual("other", get_error_kind(ValueError("invalid")))
+
+    def test_observe_iteration(self):
+        """Test that a streamed parsing run is in flight while iterated and recorded once exhausted."""
+        # Arrange
+        parse_metrics = ParseMetrics(parse_executor=MagicMock(pending_tasks=0, max_workers=1))
+        input_tally = InputTally()
+        memory_budget = MemoryBudget()
+        memory_budget.segment_count = 42
+        rows = parse_metrics.observe_iteration(
+            iter(["row"] * 3), "/download-measurements-csv", input_tally, memory_budget
+        )
+        list(input_tally.count(["UNH+1+MSCONS'"]))
+
+        # Act
+        first_row = next(rows)
+        in_flight = parse_metrics.in_flight.get()
+        remaining_rows = list(rows)
+
+        # Assert
+        self.assertEqual(["row", "row", "row"], [first_row] + remaining_rows)
+        self.assertEqual(1, in_flight)
+        self.assertEqual(0, parse_metrics.in_flight.get())
+        rendered = parse_metrics.render()
+        self.assertIn(
+            'ediparse_parse_duration_seconds_count{endpoint="/download-measurements-csv",message_type="MSCONS"} 1',
+            rendered
+        )
+        self.assertIn('ediparse_parse_input_bytes_sum{endpoint="/download-measurements-csv",message_type="MSCONS"} 13',
+                      rendered)
+        self.assertIn('ediparse_parse_segments_sum{endpoint="/download-measurements-csv",message_type="MSCONS"} 42',
+                      rendered)
+
+    def test_observe_iteration_with_error(self):
+        """Test that an error of a streamed parsing run is counted and re-raised, and closed runs are not recorded."""
+        # Arrange
+        parse_metrics = ParseMetrics(parse_executor=MagicMock(pending_tasks=0, max_workers=1))
+
+        def fail():
+            yield "row"
+            raise ParseMemoryBudgetExceededException(estimated_bytes=2, max_bytes=1)
+
+        failing_rows = parse_metrics.observe_iteration(fail(), "/download-measurements-csv", InputTally())
+        closed_rows = parse_metrics.observe_iteration(iter(["row"] * 3), "/download-measurements-csv", InputTally())
+
+        # Act
+        with self.assertRaises(ParseMemoryBudgetExceededException):
+            list(failing_rows)
+        next(closed_rows)
+        closed_rows.close()
+
+        # Assert
+        rendered = parse_metrics.render()
+        self.assertIn('ediparse_parse_errors_total{endpoint="/download-measurements-csv",error="memory_budget"} 1',
+                      rendered)
+        self.assertNotIn("ediparse_parse_duration_seconds_count", rendered)
+        self.assertEqual(0, parse_metrics.in_flight.get())
+
+    def test_observe_message_stream(self):
+        """Test that the parsing run of a message stream is recorded once its messages have been handed out."""
+        # Arrange
+        with open(SAMPLES_DIR / "mscons-message-example-request.txt", encoding="utf-8") as f:
+            edifact_text = f.read()
+        parse_metrics = ParseMetrics(parse_executor=MagicMock(pending_tasks=0, max_workers=1))
+        memory_budget = MemoryBudget()
+
+        # Act
+        message_stream = parse_metrics.observe_message_stream(
+            lambda message_content: ParserService().stream_messages(message_content, memory_budget=memory_budget),
+            iter([edifact_text[:100], edifact_text[100:]]), "/parse-file", memory_budget
+        )
+        messages = list(message_stream)
+        with self.assertRaises(EdifactParserException):
+            parse_metrics.observe_message_stream(
+                lambda message_content: ParserService().stream_messages(message_content), "invalid", "/parse-file",
+                MemoryBudget()
+            )
+
+        # Assert
+        self.assertIsInstance(message_stream, ObservedMessageStream)
+        self.assertIsNotNone(message_stream.interchange.unb_nutzdaten_kopfsegment)
+        self.assertGreater(len(messages), 0)
+        rendered = parse_metrics.render()
+        self.assertIn(
+            f'ediparse_parse_input_bytes_sum{{endpoint="/parse-file",message_type="MSCONS"}} {len(edifact_text)}',
+            rendered
+        )
+        self.assertIn(
+            'ediparse_parse_segments_sum{endpoint="/parse-file",message_type="MSCONS"} '
+            f"{memory_budget.segment_count}",
+            rendered
+        )
+        self.assertIn('ediparse_parse_errors_total{endpoint="/parse-file",error="parser"} 1', rendered)
+
+    def test_create_parse_run_observer(self):
+        """Test that the parse run observer records the successful parsing runs and counts the failed ones."""
+        # Arrange
+        parse_metrics = ParseMetrics(parse_executor=MagicMock(pending_tasks=0, max_workers=1))
+        observer = parse_metrics.create_parse_run_observer("/parse-batch")
+        memory_budget = MemoryBudget()
+        memory_budget.segment_count = 7
+        memory_budget.estimated_bytes = 1000
+
+        # Act
+        observer("UNH+1+APERAK'", 0.1, memory_budget, None)
+        observer("invalid", 0.1, memory_budget, CONTRLException("invalid"))
+
+        # Assert
+        rendered = parse_metrics.render()
+        self.assertIn('ediparse_parse_segments_sum{endpoint="/parse-batch",message_type="APERAK"} 7', rendered)
+        self.assertIn('ediparse_parse_estimated_memory_bytes_sum{endpoint="/parse-batch",message_type="APERAK"} 1000',
+                      rendered)
+        self.assertIn('ediparse_parse_errors_total{endpoint="/parse-batch",error="contrl"} 1', rendered)
+
+    def test_parse_metrics(self):
+        """Test that the parse metrics record parsing runs, errors and the queue depth of the parse executor."""
+        # Arrange
+        parse_metrics = ParseMetrics(parse_executor=MagicMock(pending_tasks=5, max_workers=2))
+
+        # Act
+        parse_metrics.observe_parse("/parse-file", "MSCONS", 0.2, 2048, 65, 100000)
+        parse_metrics.observe_serialization("/parse-file", "MSCONS", 0.01)
+        parse_metrics.count_error("/parse-string", "contrl")
+        rendered = parse_metrics.render()
+
+        # Assert
+        self.assertIn('ediparse_parse_duration_seconds_count{endpoint="/parse-file",message_type="MSCONS"} 1', rendered)
+        self.assertIn('ediparse_parse_input_bytes_sum{endpoint="/parse-file",message_type="MSCONS"} 2048', rendered)
+        self.assertIn('ediparse_parse_segments_bucket{endpoint="/parse-file",message_type="MSCONS",le="100"} 1',
+                      rendered)
+        self.assertIn(
+            'ediparse_parse_estimated_memory_bytes_bucket{endpoint="/parse-file",message_type="MSCONS",le="262144"} 1',
+            rendered
+        )
+        self.assertIn('ediparse_serialization_duration_seconds_count{endpoint="/parse-file",message_type="MSCONS"} 1',
+                      rendered)
+        self.assertIn('ediparse_parse_errors_total{endpoint="/parse-string",error="contrl"} 1', rendered)
+        self.assertIn("ediparse_parses_in_flight 0", rendered)
+        self.assertIn("ediparse_parse_queue_depth 3", rendered)
+
+
+if __name__ == '__main__':
+    unittest.main()
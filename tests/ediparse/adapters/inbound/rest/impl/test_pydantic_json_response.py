@@ -0,0 +1,68 @@
+import json
+import os
+import unittest
+from pathlib import Path
+
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+from ediparse.adapters.inbound.rest.impl.pydantic_json_response import PydanticJSONResponse
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+
+
+class _SimpleModel(BaseModel):
+    name: str
+    value: float
+
+
+class TestPydanticJSONResponse(unittest.TestCase):
+    """Test cases for the PydanticJSONResponse class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.samples_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))))) / "samples"
+
+    def test_render_interchange_matches_json_response(self):
+        """Test that a parsed interchange is rendered byte-identical to JSONResponse with model_dump()."""
+        # Arrange
+        with open(self.samples_dir / "mscons-message-example-request.txt", encoding='utf-8') as f:
+            parsed_obj = EdifactParser().parse(f.read())
+
+        # Act
+        response = PydanticJSONResponse(status_code=200, content=parsed_obj)
+
+        # Assert
+        self.assertEqual(JSONResponse(status_code=200, content=parsed_obj.model_dump()).body, response.body)
+        self.assertEqual("application/json", response.media_type)
+
+    def test_render_model_without_to_json_bytes(self):
+        """Test that other pydantic models are rendered with model_dump_json()."""
+        # Act
+        response = PydanticJSONResponse(content=_SimpleModel(name="Zählerstand", value=1.5))
+
+        # Assert
+        self.assertEqual('{"name":"Zählerstand","value":1.5}'.encode("utf-8"), response.body)
+
+    def test_render_dictionary(self):
+        """Test that dictionaries (e.g., error messages) are rendered like JSONResponse does."""
+        # Arrange
+        content = {"error_message": "Ungültige Eingabe"}
+
+        # Act
+        response = PydanticJSONResponse(status_code=400, content=content)
+
+        # Assert
+        self.assertEqual(JSONResponse(status_code=400, content=content).body, response.body)
+        self.assertEqual(content, json.loads(response.body))
+
+    def test_render_rendered_bytes(self):
+        """Test that content already rendered to JSON bytes is sent as it is."""
+        # Act
+        response = PydanticJSONResponse(content=b'{"unb":null}')
+
+        # Assert
+        self.assertEqual(b'{"unb":null}', response.body)
+
+
+if __name__ == "__main__":
+    unittest.main()
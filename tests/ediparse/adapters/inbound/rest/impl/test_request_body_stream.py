@@ -0,0 +1,127 @@
+import asyncio
+import io
+import shutil
+import unittest
+
+import anyio
+import anyio.to_thread
+from fastapi import APIRouter, Body, FastAPI
+from fastapi.testclient import TestClient
+
+from ediparse.adapters.inbound.rest.impl.request_body_stream import RequestBodyStream, use_streamed_request_bodies
+
+
+class TestRequestBodyStream(unittest.TestCase):
+    """Test cases for the RequestBodyStream class."""
+
+    @staticmethod
+    def __create_stream(*chunks: bytes) -> RequestBodyStream:
+        async def receive_chunks():
+            for chunk in chunks:
+                yield chunk
+
+        return RequestBodyStream(receive_chunks())
+
+    @staticmethod
+    def __run_in_worker_thread(function, *args):
+        # The stream is read synchronously in a worker thread, receiving its chunks on the event loop
+        async def run():
+            return await anyio.to_thread.run_sync(function, *args)
+
+        return anyio.run(run)
+
+    def test_peek_keeps_leading_bytes(self):
+        """Test that peeked bytes are not consumed and empty chunks are skipped."""
+        # Arrange
+        stream = self.__create_stream(b"U", b"", b"NB+", b"UNH")
+
+        async def peek_and_read():
+            return await stream.peek(3), await stream.peek(1), await stream.read_all()
+
+        # Act
+        first_bytes, first_byte, body = asyncio.run(peek_and_read())
+
+        # Assert
+        self.assertEqual(b"UNB", first_bytes)
+        self.assertEqual(b"U", first_byte)
+        self.assertEqual(b"UNB+UNH", body)
+
+    def test_peek_of_short_or_empty_body(self):
+        """Test that peeking beyond the end of the body returns the bytes available."""
+        self.assertEqual(b"UN", asyncio.run(self.__create_stream(b"UN").peek(4)))
+        self.assertEqual(b"", asyncio.run(self.__create_stream(b"").peek(1)))
+
+    def test_iter_chunks_in_worker_thread(self):
+        """Test that the chunks are received one after another, starting with the peeked bytes."""
+        # Arrange
+        stream = self.__create_stream(b"UNB+", b"UNH+", b"", b"UNZ")
+
+        async def peek_and_iterate():
+            await stream.peek(2)
+            return await anyio.to_thread.run_sync(lambda: list(stream.iter_chunks()))
+
+        # Act
+        chunks = anyio.run(peek_and_iterate)
+
+        # Assert
+        self.assertEqual([b"UNB+", b"UNH+", b"UNZ"], chunks)
+
+    def test_read_like_file_in_worker_thread(self):
+        """Test that the stream can be copied like a file, also with a buffer smaller than its chunks."""
+        # Arrange
+        stream = self.__create_stream(b"UNB+UNH+", b"UNT+UNZ")
+        target = io.BytesIO()
+
+        # Act
+        self.__run_in_worker_thread(shutil.copyfileobj, stream, target, 3)
+
+        # Assert
+        self.assertEqual(b"UNB+UNH+UNT+UNZ", target.getvalue())
+
+    def test_spool_in_worker_thread(self):
+        """Test that the body is spooled into a seekable file and moved to disk beyond the memory threshold."""
+        # Act
+        spool_file = self.__run_in_worker_thread(self.__create_stream(b"UNB+", b"UNZ").spool, 4)
+
+        # Assert
+        with spool_file:
+            self.assertTrue(spool_file._rolled)
+            self.assertEqual(b"UNB+UNZ", spool_file.read())
+
+    def test_use_streamed_request_bodies(self):
+        """Test that only the routes of the given paths with a body receive it as stream, documented as binary file."""
+        # Arrange
+        router = APIRouter()
+
+        @router.post("/parse-file", status_code=201)
+        async def parse_file(body: bytes = Body(None, description="The file", media_type="application/octet-stream")):
+            return {"type": type(body).__name__, "content": (await body.read_all()).decode()}
+
+        @router.post("/parse-string")
+        async def parse_string(body: bytes = Body(None, media_type="application/octet-stream")):
+            return {"type": type(body).__name__}
+
+        app = FastAPI()
+        app.include_router(router)
+
+        # Act
+        use_streamed_request_bodies(app.router, ["/parse-file"])
+        client = TestClient(app)
+        file_response = client.post("/parse-file", content=b"UNB+UNZ")
+        string_response = client.post(
+            "/parse-string", content=b"UNB+UNZ", headers={"Content-Type": "application/octet-stream"}
+        )
+
+        # Assert
+        self.assertEqual(201, file_response.status_code)
+        self.assertEqual({"type": "RequestBodyStream", "content": "UNB+UNZ"}, file_response.json())
+        self.assertEqual({"type": "bytes"}, string_response.json())
+        request_body = app.openapi()["paths"]["/parse-file"]["post"]["requestBody"]
+        self.assertEqual(
+            {"type": "string", "format": "binary", "description": "The file", "title": "Body"},
+            request_body["content"]["application/octet-stream"]["schema"]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import json
+import os
+import unittest
+from pathlib import Path
+
+from ediparse.adapters.inbound.rest.impl.streaming_json_response import (
+    InterchangeJSONStreamingResponse, iter_interchange_json
+)
+from ediparse.infrastructure.libs.edifactparser.exceptions import CONTRLException
+from ediparse.infrastructure.libs.edifactparser.exporters import to_compact_json_bytes
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+
+
+class FailingMessageStream:
+    """Message stream failing after its first message."""
+
+    def __init__(self, message_stream):
+        self.__message_stream = message_stream
+
+    @property
+    def interchange(self):
+        return self.__message_stream.interchange
+
+    def __iter__(self):
+        yield next(self.__message_stream)
+        raise CONTRLException(message="CONTRL -> L40 -> broken segment")
+
+
+class TestStreamingJSONResponse(unittest.TestCase):
+    """Test cases for the streaming JSON rendering of interchanges."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.samples_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))))) / "samples"
+
+    def __read_sample(self, file_name: str) -> str:
+        with open(self.samples_dir / file_name, encoding='utf-8') as f:
+            return f.read()
+
+    def test_iter_interchange_json_matches_full_rendering(self):
+        """Test that the streamed JSON document is byte-identical to the fully rendered interchange."""
+        for file_name in [
+            "mscons-message-example-request.txt",
+            "mscons-message-example-una-spec-requset.txt",
+            "aperak-message-example-request.txt",
+        ]:
+            with self.subTest(file_name=file_name):
+                # Arrange
+                edifact_data = self.__read_sample(file_name)
+                expected_json = EdifactParser().parse(edifact_data).to_json_bytes()
+
+                # Act
+                streamed_json = b"".join(iter_interchange_json(EdifactParser().iter_messages(edifact_data)))
+
+                # Assert
+                self.assertEqual(expected_json, streamed_json)
+
+    def test_iter_interchange_json_matches_compact_rendering(self):
+        """Test that the streamed compact JSON document is byte-identical to the fully rendered compact one."""
+        for short_keys in [False, True]:
+            with self.subTest(short_keys=short_keys):
+                # Arrange
+                edifact_data = self.__read_sample("mscons-message-example-request.txt")
+                expected_json = to_compact_json_bytes(EdifactParser().parse(edifact_data), short_keys=short_keys)
+
+                # Act
+                streamed_json = b"".join(iter_interchange_json(
+                    EdifactParser().iter_messages(edifact_data), compact=True, short_keys=short_keys
+                ))
+
+                # Assert
+                self.assertEqual(expected_json, streamed_json)
+
+    def test_iter_interchange_json_writes_one_chunk_per_message(self):
+        """Test that each message is written as soon as it has been parsed."""
+        # Arrange
+        edifact_data = self.__read_sample("mscons-message-example-request.txt")
+
+        # Act
+        chunks = list(iter_interchange_json(EdifactParser().iter_messages(edifact_data)))
+
+        # Assert
+        # Header, two messages and trailer
+        self.assertEqual(4, len(chunks))
+        self.assertTrue(chunks[0].startswith(b'{"una_service_string_advice":'))
+        self.assertTrue(chunks[0].endswith(b'"unh_unt_nachrichten":['))
+        self.assertIn("unh_nachrichtenkopfsegment", json.loads(chunks[1]))
+        self.assertTrue(chunks[3].startswith(b'],"unz_nutzdaten_endsegment":'))
+
+    def test_iter_interchange_json_reports_errors(self):
+        """Test that a parsing error after the first message ends the document with an error member if reported."""
+        # Arrange
+        edifact_data = self.__read_sample("mscons-message-example-request.txt")
+
+        # Act
+        streamed_json = b"".join(iter_interchange_json(
+            FailingMessageStream(EdifactParser().iter_messages(edifact_data)), report_errors=True
+        ))
+
+        # Assert
+        document = json.loads(streamed_json)
+        self.assertEqual(1, len(document["unh_unt_nachrichten"]))
+        self.assertEqual(400, document["status_code"])
+        self.assertEqual("CONTRL -> L40 -> broken segment", document["error_message"])
+        with self.assertRaises(CONTRLException):
+            b"".join(iter_interchange_json(FailingMessageStream(EdifactParser().iter_messages(edifact_data))))
+
+    def test_streaming_response_media_type(self):
+        """Test that the streaming response is declared as JSON."""
+        # Arrange
+        edifact_data = self.__read_sample("aperak-message-example-request.txt")
+
+        # Act
+        response = InterchangeJSONStreamingResponse(
+            message_stream=EdifactParser().iter_messages(edifact_data), status_code=201
+        )
+
+        # Assert
+        self.assertEqual(201, response.status_code)
+        self.assertEqual("application/json", response.media_type)
+
+
+if __name__ == "__main__":
+    unittest.main()
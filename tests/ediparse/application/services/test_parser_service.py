@@ -2,7 +2,13 @@ import unittest
 from unittest.mock import MagicMock
 
 from ediparse.application.services.parser_service import ParserService
+from ediparse.application.usecases.export_measurements_usecase import ExportMeasurementsUseCase
+from ediparse.application.usecases.parse_archive_usecase import ParseArchiveUseCase
+from ediparse.application.usecases.parse_batch_usecase import ParseBatchUseCase
 from ediparse.application.usecases.parse_message_usecase import ParseMessageUseCase
+from ediparse.application.usecases.stream_messages_usecase import StreamMessagesUseCase
+from ediparse.infrastructure.parse_executor import ParseOutputFormat
+from ediparse.infrastructure.parse_result_cache import ParseResultCache
 
 
 class TestParserService(unittest.TestCase):
@@ -11,7 +17,17 @@ class TestParserService(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.mock_parse_message_usecase = MagicMock(spec=ParseMessageUseCase)
-        self.parser_service = ParserService(parse_message_usecase=self.mock_parse_message_usecase)
+        self.mock_stream_messages_usecase = MagicMock(spec=StreamMessagesUseCase)
+        self.mock_export_measurements_usecase = MagicMock(spec=ExportMeasurementsUseCase)
+        self.mock_parse_batch_usecase = MagicMock(spec=ParseBatchUseCase)
+        self.mock_parse_archive_usecase = MagicMock(spec=ParseArchiveUseCase)
+        self.parser_service = ParserService(
+            parse_message_usecase=self.mock_parse_message_usecase,
+            stream_messages_usecase=self.mock_stream_messages_usecase,
+            export_measurements_usecase=self.mock_export_measurements_usecase,
+            parse_batch_usecase=self.mock_parse_batch_usecase,
+            parse_archive_usecase=self.mock_parse_archive_usecase
+        )
 
     def test_init_with_parse_message_usecase(self):
         """Test that the service can be initialized with a parse message usecase."""
@@ -45,9 +61,148 @@ class TestParserService(unittest.TestCase):
         self.assertEqual(result, expected_result)
         self.mock_parse_message_usecase.execute.assert_called_once_with(
             edifact_specific_message_content=message_content,
-            max_lines_to_parse=max_lines_to_parse
+            max_lines_to_parse=max_lines_to_parse,
+            memory_budget=None,
+            stage_timings=None
+        )
+
+    def test_parse_message_with_memory_budget(self):
+        """Test that parse_message passes the memory budget to the parse message usecase."""
+        # Setup
+        memory_budget = MagicMock()
+
+        # Execute
+        self.parser_service.parse_message(message_content="test_message_content", memory_budget=memory_budget)
+
+        # Verify
+        self.mock_parse_message_usecase.execute.assert_called_once_with(
+            edifact_specific_message_content="test_message_content",
+            max_lines_to_parse=-1,
+            memory_budget=memory_budget,
+            stage_timings=None
+        )
+
+    def test_stream_messages(self):
+        """Test that stream_messages calls the stream messages usecase's execute method with the correct arguments."""
+        # Setup
+        memory_budget = MagicMock()
+        expected_result = MagicMock()
+        self.mock_stream_messages_usecase.execute.return_value = expected_result
+
+        # Execute
+        result = self.parser_service.stream_messages(message_content="test_message_content",
+                                                     max_lines_to_parse=10,
+                                                     memory_budget=memory_budget)
+
+        # Verify
+        self.assertEqual(result, expected_result)
+        self.mock_stream_messages_usecase.execute.assert_called_once_with(
+            edifact_specific_message_content="test_message_content",
+            max_lines_to_parse=10,
+            memory_budget=memory_budget
         )
 
+    def test_export_measurements_csv(self):
+        """Test that export_measurements_csv calls the export measurements usecase's execute method."""
+        # Setup
+        expected_result = iter(["header\r\n"])
+        self.mock_export_measurements_usecase.execute.return_value = expected_result
+
+        # Execute
+        result = self.parser_service.export_measurements_csv(message_content="test_message_content")
+
+        # Verify
+        self.assertEqual(result, expected_result)
+        self.mock_export_measurements_usecase.execute.assert_called_once_with(
+            edifact_specific_message_content="test_message_content"
+        )
+
+    def test_parse_batch(self):
+        """Test that parse_batch calls the parse batch usecase's execute method with the correct arguments."""
+        # Setup
+        expected_result = iter([])
+        self.mock_parse_batch_usecase.execute.return_value = expected_result
+
+        # Execute
+        observer = MagicMock()
+        result = self.parser_service.parse_batch(message_contents=["first", "second"], max_lines_to_parse=10,
+                                                 max_memory_bytes=1024, observer=observer)
+
+        # Verify
+        self.assertEqual(result, expected_result)
+        self.mock_parse_batch_usecase.execute.assert_called_once_with(
+            edifact_specific_message_contents=["first", "second"],
+            max_lines_to_parse=10,
+            max_memory_bytes=1024,
+            observer=observer
+        )
+
+    def test_parse_archive(self):
+        """Test that parse_archive calls the parse archive usecase's execute method with the correct arguments."""
+        # Setup
+        expected_result = iter([])
+        self.mock_parse_archive_usecase.execute.return_value = expected_result
+
+        # Execute
+        observer = MagicMock()
+        result = self.parser_service.parse_archive(archive=b"archive", max_lines_to_parse=10,
+                                                   max_memory_bytes=1024, max_decompression_ratio=100,
+                                                   observer=observer)
+
+        # Verify
+        self.assertEqual(result, expected_result)
+        self.mock_parse_archive_usecase.execute.assert_called_once_with(
+            archive=b"archive",
+            max_lines_to_parse=10,
+            max_memory_bytes=1024,
+            max_decompression_ratio=100,
+            observer=observer
+        )
+
+
+    def test_render_message_with_parse_result_cache(self):
+        """Test that render_message renders the parsed message once and answers the repeated message from the cache."""
+        # Setup
+        parse_result_cache = ParseResultCache(max_bytes=1024)
+        parser_service = ParserService(
+            parse_message_usecase=self.mock_parse_message_usecase,
+            parse_result_cache=parse_result_cache
+        )
+        self.mock_parse_message_usecase.execute.return_value.to_json_bytes.return_value = b'{"nachrichten":[]}'
+
+        # Execute
+        first_result = parser_service.render_message(iter(["UNA", "UNB"]))
+        second_result = parser_service.render_message("UNAUNB")
+        compact_result_cached = parser_service.get_cached_result(
+            parser_service.get_result_cache_key("UNAUNB", -1, ParseOutputFormat.COMPACT_JSON, False)
+        )
+
+        # Verify
+        self.assertEqual(first_result, b'{"nachrichten":[]}')
+        self.assertEqual(second_result, b'{"nachrichten":[]}')
+        self.assertIsNone(compact_result_cached)
+        self.mock_parse_message_usecase.execute.assert_called_once_with(
+            edifact_specific_message_content="UNAUNB", max_lines_to_parse=-1, memory_budget=None, stage_timings=None
+        )
+        self.assertEqual(parse_result_cache.statistics.hits, 1)
+        self.assertEqual(parse_result_cache.statistics.misses, 2)
+
+    def test_render_message_without_parse_result_cache(self):
+        """Test that render_message parses every message while caching is disabled."""
+        # Setup
+        self.parser_service.parse_result_cache = None
+        self.mock_parse_message_usecase.execute.return_value.to_json_bytes.return_value = b'{}'
+
+        # Execute
+        self.parser_service.render_message("UNB")
+        self.parser_service.render_message("UNB")
+        cache_key = self.parser_service.get_result_cache_key("UNB", -1, ParseOutputFormat.JSON, False)
+        self.parser_service.cache_result(cache_key, b'{}')
+
+        # Verify
+        self.assertEqual(self.mock_parse_message_usecase.execute.call_count, 2)
+        self.assertIsNone(self.parser_service.get_cached_result(cache_key))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from unittest.mock import patch
+
+from ediparse.application.usecases.export_measurements_usecase import ExportMeasurementsUseCase
+from ediparse.domain.ports.inbound import MeasurementExportPort
+
+
+class TestExportMeasurementsUseCase(unittest.TestCase):
+    """Test cases for the ExportMeasurementsUseCase class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.export_measurements_usecase = ExportMeasurementsUseCase()
+
+    @patch('ediparse.application.usecases.export_measurements_usecase.iter_measurement_csv')
+    def test_execute(self, mock_iter_measurement_csv):
+        """Test that execute calls the CSV exporter with the message content."""
+        # Setup
+        expected_result = iter(["header\r\n"])
+        mock_iter_measurement_csv.return_value = expected_result
+
+        # Execute
+        result = self.export_measurements_usecase.execute(edifact_specific_message_content="test_message_content")
+
+        # Verify
+        self.assertEqual(result, expected_result)
+        mock_iter_measurement_csv.assert_called_once_with(edifact_text="test_message_content")
+
+    def test_implements_measurement_export_port(self):
+        """Test that ExportMeasurementsUseCase implements the MeasurementExportPort interface."""
+        self.assertIsInstance(self.export_measurements_usecase, MeasurementExportPort)
+
+
+if __name__ == "__main__":
+    unittest.main()
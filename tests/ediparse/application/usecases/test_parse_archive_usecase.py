@@ -0,0 +1,109 @@
+import io
+import os
+import unittest
+import zipfile
+from unittest.mock import MagicMock, patch
+
+from ediparse.application.usecases.parse_archive_usecase import ParseArchiveUseCase
+from ediparse.domain.ports.inbound import MessageArchiveParserPort
+from ediparse.infrastructure.libs.edifactparser.exceptions import (
+    DecompressionRatioExceededException, EdifactParserException
+)
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange
+from ediparse.infrastructure.parser_pool import ParserPool
+
+
+class TestParseArchiveUseCase(unittest.TestCase):
+    """Test cases for the ParseArchiveUseCase class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a parser pool shared by the test cases."""
+        cls.parser_pool = ParserPool(size=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Shut down the shared parser pool."""
+        cls.parser_pool.shutdown()
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.samples_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))), "samples")
+        with open(os.path.join(self.samples_dir, "mscons-message-example-request.txt"), encoding="utf-8") as f:
+            self.edifact_data = f.read()
+        self.parse_archive_usecase = ParseArchiveUseCase(parser_pool=self.parser_pool)
+
+    @staticmethod
+    def __create_zip(files: dict[str, bytes]) -> bytes:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for file_name, content in files.items():
+                archive.writestr(file_name, content)
+        return buffer.getvalue()
+
+    def test_implements_port(self):
+        """Test that the usecase implements the MessageArchiveParserPort interface."""
+        self.assertIsInstance(self.parse_archive_usecase, MessageArchiveParserPort)
+
+    def test_execute(self):
+        """Test that execute parses every file and keys its outcome by the name of the file."""
+        # Arrange
+        archive = self.__create_zip({
+            "2024-01/first.txt": self.edifact_data.encode("utf-8"),
+            "invalid.txt": b"invalid",
+            "2024-01/second.txt": self.edifact_data.encode("utf-8")
+        })
+
+        # Act
+        outcomes = {outcome.name: outcome for outcome in self.parse_archive_usecase.execute(archive=archive)}
+
+        # Assert
+        self.assertEqual({"2024-01/first.txt", "invalid.txt", "2024-01/second.txt"}, set(outcomes))
+        self.assertIsInstance(outcomes["2024-01/first.txt"].value, EdifactInterchange)
+        self.assertIsInstance(outcomes["invalid.txt"].error, EdifactParserException)
+        self.assertEqual(
+            outcomes["2024-01/first.txt"].value.to_json_bytes(), outcomes["2024-01/second.txt"].value.to_json_bytes()
+        )
+
+    def test_execute_with_limits(self):
+        """Test that the line limit and the memory budget are applied to each file."""
+        # Arrange
+        archive = self.__create_zip({"mscons.txt": self.edifact_data.encode("utf-8")})
+
+        # Act
+        outcomes = list(self.parse_archive_usecase.execute(
+            archive=archive,
+            max_lines_to_parse=2,
+            max_memory_bytes=1
+        ))
+
+        # Assert
+        self.assertIsNotNone(outcomes[0].error)
+
+    def test_execute_invalid_archive(self):
+        """Test that an input which is not an archive is refused right away."""
+        with self.assertRaises(EdifactParserException):
+            self.parse_archive_usecase.execute(archive=self.edifact_data.encode("utf-8"))
+
+    def test_execute_ratio_exceeded(self):
+        """Test that reading the archive is aborted once the files expand beyond the allowed ratio."""
+        # Arrange
+        archive = self.__create_zip({"large.txt": b"A" * 1_000_000})
+
+        # Act & Assert
+        with self.assertRaises(DecompressionRatioExceededException):
+            list(self.parse_archive_usecase.execute(archive=archive, max_decompression_ratio=10))
+
+    def test_execute_uses_default_pool(self):
+        """Test that the default parser pool is used if no pool is provided."""
+        with patch('ediparse.application.usecases.parse_archive_usecase.get_default_parser_pool') as mock_get_pool:
+            mock_get_pool.return_value = MagicMock(spec=ParserPool)
+            mock_get_pool.return_value.map_unordered.return_value = iter([])
+
+            list(ParseArchiveUseCase().execute(archive=self.__create_zip({"mscons.txt": b"content"})))
+
+            mock_get_pool.return_value.map_unordered.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
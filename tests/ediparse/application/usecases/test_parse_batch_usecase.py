@@ -0,0 +1,90 @@
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ediparse.application.usecases.parse_batch_usecase import ParseBatchUseCase
+from ediparse.domain.ports.inbound import MessageBatchParserPort
+from ediparse.infrastructure.libs.edifactparser.exceptions import EdifactParserException
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange
+from ediparse.infrastructure.parser_pool import ParserPool
+
+
+class TestParseBatchUseCase(unittest.TestCase):
+    """Test cases for the ParseBatchUseCase class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a parser pool shared by the test cases."""
+        cls.parser_pool = ParserPool(size=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Shut down the shared parser pool."""
+        cls.parser_pool.shutdown()
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.samples_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))), "samples")
+        with open(os.path.join(self.samples_dir, "mscons-message-example-request.txt"), encoding="utf-8") as f:
+            self.edifact_data = f.read()
+        self.parse_batch_usecase = ParseBatchUseCase(parser_pool=self.parser_pool)
+
+    def test_implements_port(self):
+        """Test that the usecase implements the MessageBatchParserPort interface."""
+        self.assertIsInstance(self.parse_batch_usecase, MessageBatchParserPort)
+
+    def test_execute(self):
+        """Test that execute parses every item and reports the errors of failing items in input order."""
+        # Act
+        outcomes = list(self.parse_batch_usecase.execute(
+            edifact_specific_message_contents=[self.edifact_data, "invalid", self.edifact_data]
+        ))
+
+        # Assert
+        self.assertEqual([0, 1, 2], [outcome.index for outcome in outcomes])
+        self.assertIsInstance(outcomes[0].value, EdifactInterchange)
+        self.assertIsInstance(outcomes[1].error, EdifactParserException)
+        self.assertIsInstance(outcomes[2].value, EdifactInterchange)
+        self.assertEqual(outcomes[0].value.to_json_bytes(), outcomes[2].value.to_json_bytes())
+
+    def test_execute_reports_parsing_runs(self):
+        """Test that the parsing run of each item is reported to the observer with its outcome."""
+        # Arrange
+        observer = MagicMock()
+
+        # Act
+        list(self.parse_batch_usecase.execute(
+            edifact_specific_message_contents=[self.edifact_data, "invalid"], observer=observer
+        ))
+
+        # Assert
+        reported_runs = {call.args[0]: call.args for call in observer.call_args_list}
+        self.assertEqual({self.edifact_data, "invalid"}, set(reported_runs))
+        self.assertIsNone(reported_runs[self.edifact_data][3])
+        self.assertGreater(reported_runs[self.edifact_data][2].segment_count, 0)
+        self.assertIsInstance(reported_runs["invalid"][3], EdifactParserException)
+
+    def test_execute_with_limits(self):
+        """Test that the line limit and the memory budget are applied to each item."""
+        # Act
+        outcomes = list(self.parse_batch_usecase.execute(
+            edifact_specific_message_contents=[self.edifact_data],
+            max_lines_to_parse=2,
+            max_memory_bytes=1
+        ))
+
+        # Assert
+        self.assertIsNotNone(outcomes[0].error)
+
+    def test_execute_uses_default_pool(self):
+        """Test that the default parser pool is used if no pool is provided."""
+        with patch('ediparse.application.usecases.parse_batch_usecase.get_default_parser_pool') as mock_get_pool:
+            mock_get_pool.return_value = MagicMock(spec=ParserPool)
+
+            ParseBatchUseCase().execute(edifact_specific_message_contents=["content"])
+
+            mock_get_pool.return_value.map_ordered.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
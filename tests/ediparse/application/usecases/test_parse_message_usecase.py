@@ -48,7 +48,49 @@ class TestParseMessageUseCase(unittest.TestCase):
         self.assertEqual(result, expected_result)
         self.mock_parser.parse.assert_called_once_with(
             edifact_text=message_content,
-            max_lines_to_parse=max_lines_to_parse
+            max_lines_to_parse=max_lines_to_parse,
+            memory_budget=None,
+            stage_timings=None
+        )
+
+    def test_execute_with_chunks(self):
+        """Test that execute calls the parser's parse_chunks method for content given as text chunks."""
+        # Setup
+        message_chunks = iter(["test_message", "_content"])
+        expected_result = MagicMock()
+        self.mock_parser.parse_chunks.return_value = expected_result
+
+        # Execute
+        result = self.parse_message_usecase.execute(edifact_specific_message_content=message_chunks)
+
+        # Verify
+        self.assertEqual(result, expected_result)
+        self.mock_parser.parse_chunks.assert_called_once_with(
+            edifact_chunks=message_chunks,
+            max_lines_to_parse=-1,
+            memory_budget=None,
+            stage_timings=None
+        )
+        self.mock_parser.parse.assert_not_called()
+
+    def test_execute_with_memory_budget(self):
+        """Test that execute passes the memory budget to the parser."""
+        # Setup
+        memory_budget = MagicMock()
+
+        # Execute
+        self.parse_message_usecase.execute(
+            edifact_specific_message_content="test_message_content",
+            memory_budget=memory_budget,
+            stage_timings=None
+        )
+
+        # Verify
+        self.mock_parser.parse.assert_called_once_with(
+            edifact_text="test_message_content",
+            max_lines_to_parse=-1,
+            memory_budget=memory_budget,
+            stage_timings=None
         )
 
     def test_implements_message_parser_port(self):
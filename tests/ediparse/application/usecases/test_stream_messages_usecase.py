@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ediparse.application.usecases.stream_messages_usecase import StreamMessagesUseCase
+from ediparse.domain.ports.inbound import MessageStreamParserPort
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+
+
+class TestStreamMessagesUseCase(unittest.TestCase):
+    """Test cases for the StreamMessagesUseCase class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_parser = MagicMock(spec=EdifactParser)
+        self.stream_messages_usecase = StreamMessagesUseCase(parser=self.mock_parser)
+
+    def test_init_with_parser(self):
+        """Test that the usecase can be initialized with a parser."""
+        self.assertEqual(self.stream_messages_usecase._StreamMessagesUseCase__parser, self.mock_parser)
+
+    def test_init_without_parser(self):
+        """Test that the usecase creates a new parser on the first execution if none is provided."""
+        with patch('ediparse.application.usecases.stream_messages_usecase.EdifactParser') as mock_parser_class:
+            mock_parser_instance = MagicMock(spec=EdifactParser)
+            mock_parser_class.return_value = mock_parser_instance
+
+            stream_messages_usecase = StreamMessagesUseCase()
+            mock_parser_class.assert_not_called()
+
+            stream_messages_usecase.execute("test_message_content")
+            stream_messages_usecase.execute("test_message_content")
+
+            self.assertEqual(stream_messages_usecase._StreamMessagesUseCase__parser, mock_parser_instance)
+            mock_parser_class.assert_called_once()
+
+    def test_execute(self):
+        """Test that execute calls the parser's iter_messages method with the correct arguments."""
+        # Setup
+        message_content = "test_message_content"
+        memory_budget = MagicMock()
+        expected_result = MagicMock()
+        self.mock_parser.iter_messages.return_value = expected_result
+
+        # Execute
+        result = self.stream_messages_usecase.execute(
+            edifact_specific_message_content=message_content,
+            max_lines_to_parse=10,
+            memory_budget=memory_budget
+        )
+
+        # Verify
+        self.assertEqual(result, expected_result)
+        self.mock_parser.iter_messages.assert_called_once_with(
+            edifact_text=message_content,
+            max_lines_to_parse=10,
+            memory_budget=memory_budget
+        )
+
+    def test_execute_with_chunks(self):
+        """Test that execute calls the parser's iter_messages_from_chunks method for content given as text chunks."""
+        # Setup
+        message_chunks = iter(["test_message", "_content"])
+        expected_result = MagicMock()
+        self.mock_parser.iter_messages_from_chunks.return_value = expected_result
+
+        # Execute
+        result = self.stream_messages_usecase.execute(edifact_specific_message_content=message_chunks)
+
+        # Verify
+        self.assertEqual(result, expected_result)
+        self.mock_parser.iter_messages_from_chunks.assert_called_once_with(
+            edifact_chunks=message_chunks,
+            max_lines_to_parse=-1,
+            memory_budget=None
+        )
+        self.mock_parser.iter_messages.assert_not_called()
+
+    def test_implements_message_stream_parser_port(self):
+        """Test that StreamMessagesUseCase implements the MessageStreamParserPort interface."""
+        self.assertIsInstance(self.stream_messages_usecase, MessageStreamParserPort)
+
+
+if __name__ == "__main__":
+    unittest.main()
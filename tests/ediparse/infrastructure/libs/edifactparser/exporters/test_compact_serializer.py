@@ -0,0 +1,142 @@
+import json
+import os
+import unittest
+from pathlib import Path
+
+from ediparse.infrastructure.libs.edifactparser.exporters import (
+    expand_short_keys, get_compact_key, get_short_aliases, iter_model_classes, to_compact_data,
+    to_compact_json_bytes
+)
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import (
+    EdifactInterchange, SegmentBGM, DokumentenNachrichtenname
+)
+
+
+class TestCompactSerializer(unittest.TestCase):
+    """Test cases for the compact JSON serialization."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.samples_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))))) / "samples"
+        with open(self.samples_dir / "mscons-message-example-request.txt", encoding='utf-8') as f:
+            self.interchange = EdifactParser().parse(f.read())
+
+    def __assert_no_empty_values(self, value):
+        if isinstance(value, dict):
+            self.assertTrue(value)
+            for item in value.values():
+                self.assertIsNotNone(item)
+                self.__assert_no_empty_values(item)
+        elif isinstance(value, list):
+            self.assertTrue(value)
+            for item in value:
+                self.__assert_no_empty_values(item)
+
+    def test_to_compact_data_drops_empty_values(self):
+        """Test that None values, empty lists and empty nested models are omitted."""
+        # Arrange
+        segment = SegmentBGM(
+            dokumenten_nachrichtenname=DokumentenNachrichtenname(),
+            nachrichtenfunktion_code="9"
+        )
+
+        # Act
+        compact_data = to_compact_data(segment)
+
+        # Assert
+        self.assertEqual({"nachrichtenfunktion_code": "9"}, compact_data)
+
+    def test_to_compact_data_of_empty_model(self):
+        """Test that an empty model is converted to None and serialized as empty object."""
+        # Act & Assert
+        self.assertIsNone(to_compact_data(SegmentBGM()))
+        self.assertEqual(b"{}", to_compact_json_bytes(SegmentBGM()))
+
+    def test_to_compact_json_bytes_keeps_all_values(self):
+        """Test that the compact document contains no empty values and is a subset of the full document."""
+        # Act
+        compact_document = json.loads(to_compact_json_bytes(self.interchange))
+        full_document = json.loads(self.interchange.to_json_bytes())
+
+        # Assert
+        self.__assert_no_empty_values(compact_document)
+        self.assertEqual(
+            full_document["unh_unt_nachrichten"][0]["bgm_beginn_der_nachricht"]
+            ["dokumenten_nachrichten_identifikation"]["dokumentennummer"],
+            compact_document["unh_unt_nachrichten"][0]["bgm_beginn_der_nachricht"]
+            ["dokumenten_nachrichten_identifikation"]["dokumentennummer"]
+        )
+        self.assertNotIn("message_type", compact_document["unh_unt_nachrichten"][0])
+
+    def test_to_compact_json_bytes_with_short_keys(self):
+        """Test that the short keys replace the field names and reduce the payload size."""
+        # Act
+        compact_json = to_compact_json_bytes(self.interchange)
+        short_keys_json = to_compact_json_bytes(self.interchange, short_keys=True)
+
+        # Assert
+        short_keys_document = json.loads(short_keys_json)
+        messages_key = get_compact_key(EdifactInterchange, "unh_unt_nachrichten", True)
+        self.assertIn(messages_key, short_keys_document)
+        self.assertNotIn("unh_unt_nachrichten", short_keys_document)
+        self.assertLess(len(short_keys_json), len(compact_json))
+        self.assertLess(len(compact_json), len(self.interchange.to_json_bytes()))
+
+    def test_to_compact_json_bytes_of_lazily_parsed_interchange(self):
+        """Test that the lazy segments are decoded and rendered like the eagerly parsed ones."""
+        # Arrange
+        with open(self.samples_dir / "mscons-message-example-request.txt", encoding='utf-8') as f:
+            lazy_interchange = EdifactParser(lazy_decoding=True).parse(f.read())
+
+        # Act & Assert
+        for short_keys in [False, True]:
+            with self.subTest(short_keys=short_keys):
+                self.assertEqual(
+                    to_compact_json_bytes(self.interchange, short_keys=short_keys),
+                    to_compact_json_bytes(lazy_interchange, short_keys=short_keys)
+                )
+
+    def test_expand_short_keys(self):
+        """Test that the short keys are replaced by the field names of the compact representation again."""
+        # Arrange
+        short_keys_data = to_compact_data(self.interchange, short_keys=True)
+        messages_key = get_compact_key(EdifactInterchange, "unh_unt_nachrichten", True)
+        for message_data, message in zip(short_keys_data[messages_key], self.interchange.unh_unt_nachrichten):
+            message_data["message_type"] = message.message_type.value
+
+        # Act
+        expanded_data = expand_short_keys(short_keys_data, EdifactInterchange)
+
+        # Assert
+        for message_data in expanded_data["unh_unt_nachrichten"]:
+            del message_data["message_type"]
+        self.assertEqual(to_compact_data(self.interchange), expanded_data)
+
+    def test_short_aliases_are_unique_per_model(self):
+        """Test that the short aliases of every model are unique and cover all fields."""
+        # Act
+        model_classes = iter_model_classes()
+
+        # Assert
+        self.assertIn(EdifactInterchange, model_classes)
+        self.assertIn(SegmentBGM, model_classes)
+        for model_class in model_classes:
+            with self.subTest(model_class=model_class.__name__):
+                aliases = get_short_aliases(model_class)
+                self.assertEqual(list(model_class.model_fields), list(aliases))
+                self.assertEqual(len(aliases), len(set(aliases.values())))
+
+    def test_short_alias_derivation(self):
+        """Test the derivation rules of the short aliases."""
+        # Act
+        aliases = get_short_aliases(SegmentBGM)
+
+        # Assert
+        self.assertEqual("dn", aliases["dokumenten_nachrichtenname"])
+        self.assertEqual("nc", aliases["nachrichtenfunktion_code"])
+        self.assertEqual("nachrichtenfunktion_code", get_compact_key(SegmentBGM, "nachrichtenfunktion_code", False))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+import csv
+import io
+import os
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ediparse.infrastructure.libs.edifactparser.exceptions import EdifactParserException
+from ediparse.infrastructure.libs.edifactparser.exporters import (
+    CSV_COLUMNS, iter_measurement_csv, iter_measurement_csv_from_chunks, iter_measurement_rows,
+    iter_measurement_rows_from_chunks, write_measurement_csv
+)
+
+
+class TestCsvExporter(unittest.TestCase):
+    """Test cases for the streaming CSV export of MSCONS measurements."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.samples_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))))) / "samples"
+
+    def __read_sample(self, file_name: str) -> str:
+        with open(self.samples_dir / file_name, encoding='utf-8') as f:
+            return f.read()
+
+    def test_iter_measurement_rows(self):
+        """Test that each measurement is exported with its sender, recipient, location, product and period."""
+        # Arrange
+        edifact_data = self.__read_sample("mscons-message-example-request.txt")
+
+        # Act
+        rows = list(iter_measurement_rows(edifact_data))
+
+        # Assert
+        self.assertEqual(4, len(rows))
+        self.assertEqual(
+            ["9920455302123", "4012345678901", "11XUENBSOLS----X", "1-1:1.29.1",
+             "202101012300+00", "202101312315+00", "220", "4250.465", "D54", ""],
+            rows[0]
+        )
+        self.assertEqual("202101312315+00", rows[1][CSV_COLUMNS.index("beginn_messperiode")])
+        self.assertEqual("", rows[2][CSV_COLUMNS.index("produkt_leistungsnummer")])
+
+    def test_iter_measurement_rows_with_una_decimal_mark(self):
+        """Test that values using the decimal mark of the UNA segment are exported with '.' as decimal mark."""
+        # Arrange
+        edifact_data = self.__read_sample("mscons-message-example-una-spec-requset.txt")
+
+        # Act
+        rows = list(iter_measurement_rows(edifact_data))
+
+        # Assert
+        self.assertEqual(["4250.465"] * 4, [row[CSV_COLUMNS.index("menge")] for row in rows])
+
+    def test_iter_measurement_rows_with_status(self):
+        """Test that the status codes of a measurement are joined into a single column."""
+        # Arrange
+        edifact_data = self.__read_sample("mscons-message-example-request.txt").replace(
+            "QTY+220:4250.465:D54'", "QTY+220:4250.465:D54'STS+Z33++Z83'STS+Z34++Z81'", 1
+        )
+
+        # Act
+        rows = list(iter_measurement_rows(edifact_data))
+
+        # Assert
+        self.assertEqual("Z33::Z83|Z34::Z81", rows[0][CSV_COLUMNS.index("statusangaben")])
+        self.assertEqual("202101312315+00", rows[0][CSV_COLUMNS.index("ende_messperiode")])
+        self.assertEqual("", rows[1][CSV_COLUMNS.index("statusangaben")])
+
+    def test_iter_measurement_rows_without_measurements(self):
+        """Test that messages without measurements (e.g., APERAK) yield no rows."""
+        # Arrange
+        edifact_data = self.__read_sample("aperak-message-example-request.txt")
+
+        # Act
+        rows = list(iter_measurement_rows(edifact_data))
+
+        # Assert
+        self.assertEqual([], rows)
+
+    def test_iter_measurement_rows_validates_input_immediately(self):
+        """Test that an invalid input is refused before the rows are consumed."""
+        for edifact_data in [None, "", "UNB+UNOC:3'"]:
+            with self.subTest(edifact_data=edifact_data):
+                with self.assertRaises(EdifactParserException):
+                    iter_measurement_rows(edifact_data)
+
+    def test_iter_measurement_rows_from_chunks(self):
+        """Test that the rows of a chunked interchange equal the rows of the joined interchange."""
+        # Arrange
+        edifact_data = self.__read_sample("mscons-message-example-request.txt")
+        chunks = [edifact_data[index:index + 7] for index in range(0, len(edifact_data), 7)]
+
+        # Act
+        rows = list(iter_measurement_rows_from_chunks(iter(chunks)))
+
+        # Assert
+        self.assertEqual(list(iter_measurement_rows(edifact_data)), rows)
+
+    def test_iter_measurement_rows_from_chunks_with_invalid_input(self):
+        """Test that an invalid chunked input is refused, at the latest while the rows are consumed."""
+        for edifact_chunks in [None, [], ["UNB+UNO", "C:3'"]]:
+            with self.subTest(edifact_chunks=edifact_chunks):
+                with self.assertRaises(EdifactParserException):
+                    list(iter_measurement_rows_from_chunks(edifact_chunks))
+
+    def test_iter_measurement_rows_does_not_build_models(self):
+        """Test that the export scans the raw segments without dumping any model."""
+        # Arrange
+        edifact_data = self.__read_sample("mscons-message-example-request.txt")
+
+        # Act
+        with patch('pydantic.BaseModel.model_dump') as mock_model_dump:
+            rows = list(iter_measurement_rows(edifact_data))
+
+        # Assert
+        self.assertEqual(4, len(rows))
+        mock_model_dump.assert_not_called()
+
+    def test_iter_measurement_csv(self):
+        """Test that the CSV lines start with the header line followed by one line per measurement."""
+        # Arrange
+        edifact_data = self.__read_sample("mscons-message-example-request.txt")
+
+        # Act
+        lines = list(iter_measurement_csv(edifact_data, delimiter=";"))
+
+        # Assert
+        self.assertEqual(5, len(lines))
+        parsed_rows = list(csv.reader(io.StringIO("".join(lines)), delimiter=";"))
+        self.assertEqual(CSV_COLUMNS, parsed_rows[0])
+        self.assertEqual("1-1:1.29.1", parsed_rows[1][CSV_COLUMNS.index("produkt_leistungsnummer")])
+
+    def test_iter_measurement_csv_from_chunks(self):
+        """Test that the CSV lines of a chunked interchange equal the CSV lines of the joined interchange."""
+        # Arrange
+        edifact_data = self.__read_sample("mscons-message-example-request.txt")
+
+        # Act
+        lines = list(iter_measurement_csv_from_chunks(edifact_data.splitlines(keepends=True)))
+
+        # Assert
+        self.assertEqual(list(iter_measurement_csv(edifact_data)), lines)
+
+    def test_write_measurement_csv(self):
+        """Test that the CSV lines are written to the output and the number of rows is returned."""
+        # Arrange
+        edifact_data = self.__read_sample("mscons-message-example-simple-request.txt")
+        output = io.StringIO(newline="")
+
+        # Act
+        amount_of_rows = write_measurement_csv(edifact_data, output)
+
+        # Assert
+        self.assertEqual(2, amount_of_rows)
+        self.assertEqual(3, len(output.getvalue().splitlines()))
+
+
+if __name__ == '__main__':
+    unittest.main()
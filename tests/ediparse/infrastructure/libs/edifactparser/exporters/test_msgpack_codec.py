@@ -0,0 +1,107 @@
+import importlib.util
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ediparse.infrastructure.libs.edifactparser.exporters import (
+    MSGPACK_SCHEMA_VERSION, decode_interchange, encode_interchange, is_msgpack_available
+)
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+
+MSGPACK_INSTALLED = importlib.util.find_spec("msgpack") is not None
+
+
+class TestMsgpackCodec(unittest.TestCase):
+    """Test cases for the MessagePack encoding of parsed interchanges."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.samples_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))))) / "samples"
+
+    def __read_sample(self, file_name: str) -> str:
+        with open(self.samples_dir / file_name, encoding='utf-8') as f:
+            return f.read()
+
+    @unittest.skipUnless(MSGPACK_INSTALLED, "The optional msgpack package is not installed")
+    def test_encode_decode_round_trip(self):
+        """Test that a decoded payload equals the encoded interchange."""
+        for file_name in [
+            "mscons-message-example-request.txt",
+            "aperak-message-example-request.txt",
+        ]:
+            with self.subTest(file_name=file_name):
+                # Arrange
+                interchange = EdifactParser(lazy_decoding=True).parse(self.__read_sample(file_name))
+
+                # Act
+                payload = encode_interchange(interchange)
+                decoded_interchange = decode_interchange(payload)
+
+                # Assert
+                self.assertEqual(interchange, decoded_interchange)
+                self.assertLess(len(payload), len(interchange.to_json_bytes()))
+
+    @unittest.skipUnless(MSGPACK_INSTALLED, "The optional msgpack package is not installed")
+    def test_encode_decode_compact_round_trip(self):
+        """Test that a decoded compact payload, with and without short keys, equals the encoded interchange."""
+        for file_name in [
+            "mscons-message-example-request.txt",
+            "aperak-message-example-request.txt",
+        ]:
+            for short_keys in [False, True]:
+                with self.subTest(file_name=file_name, short_keys=short_keys):
+                    # Arrange
+                    interchange = EdifactParser(lazy_decoding=True).parse(self.__read_sample(file_name))
+
+                    # Act
+                    payload = encode_interchange(interchange, compact=True, short_keys=short_keys)
+                    decoded_interchange = decode_interchange(payload)
+
+                    # Assert
+                    self.assertEqual(interchange, decoded_interchange)
+                    self.assertLess(len(payload), len(encode_interchange(interchange)))
+
+    @unittest.skipUnless(MSGPACK_INSTALLED, "The optional msgpack package is not installed")
+    def test_decode_schema_version_1(self):
+        """Test that payloads of the previous schema version, which has no short keys, are still decoded."""
+        # Arrange
+        import msgpack
+        interchange = EdifactParser().parse(self.__read_sample("aperak-message-example-request.txt"))
+        data = msgpack.unpackb(encode_interchange(interchange), raw=False)
+        del data["short_keys"]
+        data["schema_version"] = 1
+
+        # Act
+        decoded_interchange = decode_interchange(msgpack.packb(data))
+
+        # Assert
+        self.assertEqual(interchange, decoded_interchange)
+
+    @unittest.skipUnless(MSGPACK_INSTALLED, "The optional msgpack package is not installed")
+    def test_decode_rejects_unknown_schema_version(self):
+        """Test that payloads of another schema version are rejected."""
+        # Arrange
+        import msgpack
+        payload = msgpack.packb({"schema_version": MSGPACK_SCHEMA_VERSION + 1, "interchange": {}})
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            decode_interchange(payload)
+
+    def test_missing_msgpack_package(self):
+        """Test that a helpful ImportError is raised if the optional msgpack package is not installed."""
+        # Arrange
+        interchange = EdifactParser().parse(self.__read_sample("aperak-message-example-request.txt"))
+
+        with patch.dict(sys.modules, {"msgpack": None}):
+            # Act & Assert
+            self.assertFalse(is_msgpack_available())
+            with self.assertRaises(ImportError) as context:
+                encode_interchange(interchange)
+            self.assertIn("EDIParse[msgpack]", str(context.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import io
+import json
+import os
+import unittest
+from pathlib import Path
+
+from ediparse.infrastructure.libs.edifactparser.exporters import (
+    NDJSONGranularity, iter_ndjson_lines, iter_measurement_records, write_ndjson
+)
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+
+
+class TestNDJSONExporter(unittest.TestCase):
+    """Test cases for the NDJSON export of parsed messages."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.samples_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))))) / "samples"
+
+    def __read_sample(self, file_name: str) -> str:
+        with open(self.samples_dir / file_name, encoding='utf-8') as f:
+            return f.read()
+
+    def test_message_granularity_writes_one_line_per_message(self):
+        """Test that each message is rendered as one JSON line."""
+        # Arrange
+        edifact_data = self.__read_sample("mscons-message-example-request.txt")
+        expected_messages = EdifactParser().parse(edifact_data).model_dump()["unh_unt_nachrichten"]
+
+        # Act
+        lines = list(iter_ndjson_lines(EdifactParser().iter_messages(edifact_data)))
+
+        # Assert
+        self.assertEqual(2, len(lines))
+        for line, expected_message in zip(lines, expected_messages):
+            self.assertTrue(line.endswith(b"\n"))
+            self.assertNotIn(b"\n", line[:-1])
+            self.assertEqual(expected_message, json.loads(line))
+
+    def test_message_granularity_with_lazy_decoding(self):
+        """Test that lazily decoded messages are rendered with their full content."""
+        # Arrange
+        edifact_data = self.__read_sample("aperak-message-example-request.txt")
+        expected_messages = EdifactParser().parse(edifact_data).model_dump()["unh_unt_nachrichten"]
+
+        # Act
+        lines = list(iter_ndjson_lines(EdifactParser(lazy_decoding=True).iter_messages(edifact_data)))
+
+        # Assert
+        self.assertEqual(expected_messages, [json.loads(line) for line in lines])
+
+    def test_measurement_granularity_denormalizes_measurements(self):
+        """Test that each MSCONS measurement is rendered with its location, product, period and status."""
+        # Arrange
+        edifact_data = self.__read_sample("mscons-message-example-request.txt").replace(
+            "QTY+220:4250.465:D54'", "QTY+220:4250.465:D54'STS+Z33++Z83'", 1
+        )
+
+        # Act
+        lines = list(iter_ndjson_lines(EdifactParser().iter_messages(edifact_data), NDJSONGranularity.MEASUREMENT))
+
+        # Assert
+        self.assertEqual(4, len(lines))
+        first_measurement = json.loads(lines[0])
+        self.assertEqual("1", first_measurement["nachrichten_referenznummer"])
+        self.assertEqual("MSI5422", first_measurement["dokumentennummer"])
+        self.assertEqual("237", first_measurement["ortsangabe_qualifier"])
+        self.assertEqual("11XUENBSOLS----X", first_measurement["ortsangabe_code"])
+        self.assertEqual("1", first_measurement["positionsnummer"])
+        self.assertEqual("1-1:1.29.1", first_measurement["produkt_leistungsnummer"])
+        self.assertEqual("SRW", first_measurement["art_der_produkt_leistungsnummer_code"])
+        self.assertEqual(4250.465, first_measurement["menge"])
+        self.assertEqual("D54", first_measurement["masseinheit_code"])
+        self.assertEqual("202101012300+00", first_measurement["beginn_messperiode"])
+        self.assertEqual("202101312315+00", first_measurement["ende_messperiode"])
+        self.assertEqual(
+            [{"statuskategorie_code": "Z33", "status_code": None, "statusanlass_code": "Z83"}],
+            first_measurement["statusangaben"]
+        )
+        self.assertEqual([], json.loads(lines[1])["statusangaben"])
+
+    def test_measurement_granularity_skips_messages_without_measurements(self):
+        """Test that messages other than MSCONS messages yield no measurement records."""
+        # Arrange
+        edifact_data = self.__read_sample("aperak-message-example-request.txt")
+
+        # Act
+        records = list(iter_measurement_records(EdifactParser().iter_messages(edifact_data)))
+
+        # Assert
+        self.assertEqual([], records)
+
+    def test_write_ndjson_appends_lines(self):
+        """Test that the output of several exports can be appended to the same file."""
+        # Arrange
+        edifact_data = self.__read_sample("mscons-message-example-request.txt")
+        output = io.BytesIO()
+
+        # Act
+        first_amount = write_ndjson(EdifactParser().iter_messages(edifact_data), output)
+        second_amount = write_ndjson(EdifactParser().iter_messages(edifact_data), output)
+
+        # Assert
+        self.assertEqual(2, first_amount)
+        self.assertEqual(2, second_amount)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(4, len(lines))
+        self.assertEqual(json.loads(lines[0]), json.loads(lines[2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
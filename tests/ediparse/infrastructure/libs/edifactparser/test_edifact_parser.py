@@ -3,8 +3,11 @@ import os
 import unittest
 from pathlib import Path
 
-from ediparse.infrastructure.libs.edifactparser.exceptions import EdifactParserException
+from ediparse.infrastructure.libs.edifactparser.exceptions import (
+    EdifactParserException, ParseMemoryBudgetExceededException
+)
 from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget, MessageCache, ParseStage, StageTimings
 
 
 class TestEdifactParser(unittest.TestCase):
@@ -139,6 +142,142 @@ class TestEdifactParser(unittest.TestCase):
         # Verify the full content matches the expected response
         self.assertEqual(expected_response, parsed_dict)
 
+    def test_parse_mscons_sample_file_with_memory_budget(self):
+        """Test that the parser accounts all parsed segments against the memory budget."""
+        # Arrange
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+        memory_budget = MemoryBudget(max_bytes=1024 * 1024)
+
+        # Act
+        parsed_object = self.parser.parse(edifact_data, memory_budget=memory_budget)
+
+        # Assert
+        self.assertEqual(len(parsed_object.unh_unt_nachrichten), 2)
+        self.assertGreater(memory_budget.segment_count, 0)
+        self.assertGreater(memory_budget.estimated_bytes, len(edifact_data))
+
+    def test_parse_mscons_sample_file_exceeding_memory_budget(self):
+        """Test that the parser refuses an input whose estimated memory exceeds the memory budget."""
+        # Arrange
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+        memory_budget = MemoryBudget(max_bytes=len(edifact_data))
+
+        # Act & Assert
+        with self.assertRaises(ParseMemoryBudgetExceededException):
+            self.parser.parse(edifact_data, memory_budget=memory_budget)
+        # The input is refused before any segment has been parsed
+        self.assertEqual(0, memory_budget.segment_count)
+
+
+    def test_iter_messages_mscons_sample_file(self):
+        """Test that the parser hands out the messages one at a time and releases them from the interchange."""
+        # Arrange
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+        with open(self.mscons_sample_file_path_response, encoding='utf-8') as f:
+            expected_response = json.load(f)
+
+        # Act
+        message_stream = self.parser.iter_messages(edifact_data)
+        messages = []
+        for message in message_stream:
+            # Only the envelope of the interchange is held while the messages are handed out
+            self.assertEqual([], message_stream.interchange.unh_unt_nachrichten)
+            messages.append(message.model_dump())
+
+        # Assert
+        self.assertEqual(expected_response["unh_unt_nachrichten"], messages)
+        self.assertEqual(
+            expected_response["unb_nutzdaten_kopfsegment"],
+            message_stream.interchange.unb_nutzdaten_kopfsegment.model_dump()
+        )
+        self.assertEqual(
+            expected_response["unz_nutzdaten_endsegment"],
+            message_stream.interchange.unz_nutzdaten_endsegment.model_dump()
+        )
+
+    def test_iter_messages_validates_input_up_front(self):
+        """Test that invalid inputs are refused before the first message is requested."""
+        # Act & Assert
+        with self.assertRaises(EdifactParserException):
+            self.parser.iter_messages("")
+
+    def test_iter_messages_releases_memory_budget(self):
+        """Test that the segments of handed out messages are released from the memory budget."""
+        # Arrange
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+        memory_budget = MemoryBudget()
+
+        # Act
+        for _ in self.parser.iter_messages(edifact_data, memory_budget=memory_budget):
+            pass
+
+        # Assert
+        self.assertGreater(memory_budget.segment_count, 0)
+        self.assertLess(
+            memory_budget.estimated_bytes,
+            len(edifact_data) * MemoryBudget.ESTIMATED_BYTES_PER_INPUT_CHARACTER
+            + memory_budget.segment_count * MemoryBudget.ESTIMATED_BYTES_PER_SEGMENT
+        )
+
+    def test_parse_chunks_equals_parse(self):
+        """Test that parsing the input in chunks gives the same result as parsing it at once."""
+        for file_path in [
+            self.mscons_sample_file_path_request,
+            self.mscons_sample_file_path_request_with_una_spec,
+            self.aperak_sample_file_path_request,
+        ]:
+            # Arrange
+            with open(file_path, encoding='utf-8') as f:
+                edifact_data = f.read()
+            expected_json = EdifactParser().parse(edifact_data).to_json_bytes()
+
+            for chunk_size in [1, 10, 1000]:
+                with self.subTest(file_name=file_path.name, chunk_size=chunk_size):
+                    chunks = (edifact_data[i:i + chunk_size] for i in range(0, len(edifact_data), chunk_size))
+
+                    # Act
+                    parsed_object = EdifactParser().parse_chunks(chunks)
+
+                    # Assert
+                    self.assertEqual(expected_json, parsed_object.to_json_bytes())
+
+    def test_iter_messages_from_chunks_mscons_sample_file(self):
+        """Test that the messages of a chunked input are handed out one at a time."""
+        # Arrange
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+        with open(self.mscons_sample_file_path_response, encoding='utf-8') as f:
+            expected_response = json.load(f)
+        chunks = (edifact_data[i:i + 100] for i in range(0, len(edifact_data), 100))
+
+        # Act
+        message_stream = self.parser.iter_messages_from_chunks(chunks)
+        messages = [message.model_dump() for message in message_stream]
+
+        # Assert
+        self.assertEqual(expected_response["unh_unt_nachrichten"], messages)
+        self.assertEqual(
+            expected_response["unz_nutzdaten_endsegment"],
+            message_stream.interchange.unz_nutzdaten_endsegment.model_dump()
+        )
+
+    def test_parse_chunks_invalid_input(self):
+        """Test that chunked inputs without message type or with too many segments are refused."""
+        # Arrange
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+
+        # Act & Assert
+        with self.assertRaises(EdifactParserException):
+            self.parser.parse_chunks(["UNB+UNOC:3", "+SENDER'", "UNZ+0'"])
+        with self.assertRaises(EdifactParserException):
+            self.parser.parse_chunks([edifact_data], max_lines_to_parse=10)
+        with self.assertRaises(EdifactParserException):
+            self.parser.parse_chunks(None)
 
     def test_parse_mscons_sample_file_with_una_spec(self):
         """Test that the parser can parse a MSCONS file with a UNA segment specifying custom delimiters."""
@@ -164,5 +303,128 @@ class TestEdifactParser(unittest.TestCase):
         self.assertEqual("'", parsed_object.una_service_string_advice.segment_terminator)
 
 
+    def test_parse_with_message_cache_reuses_unchanged_messages(self):
+        """Test that a corrected resubmission only parses its changed message and gives the same result."""
+        # Arrange
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+        last_quantity = edifact_data.rindex("4250.465")
+        corrected_edifact_data = edifact_data[:last_quantity] + "4250.466" + edifact_data[last_quantity + 8:]
+        expected_json = EdifactParser().parse(corrected_edifact_data).to_json_bytes()
+        message_cache = MessageCache(max_segments=1000)
+        parser = EdifactParser(message_cache=message_cache)
+        parser.parse(edifact_data)
+        memory_budget = MemoryBudget()
+
+        # Act
+        parsed_object = parser.parse(corrected_edifact_data, memory_budget=memory_budget)
+
+        # Assert
+        self.assertEqual(expected_json, parsed_object.to_json_bytes())
+        self.assertEqual((1, 3), (message_cache.statistics.reused_messages, message_cache.statistics.parsed_messages))
+        self.assertEqual((1, 1), (memory_budget.reused_messages, memory_budget.parsed_messages))
+        # The segments of the reused message are accounted as if they had been parsed
+        expected_memory_budget = MemoryBudget()
+        EdifactParser().parse(corrected_edifact_data, memory_budget=expected_memory_budget)
+        self.assertEqual(expected_memory_budget.segment_count, memory_budget.segment_count)
+
+    def test_parse_with_message_cache_hands_out_copies(self):
+        """Test that modifying a parsed interchange does not modify the results of later parsing runs."""
+        # Arrange
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+        parser = EdifactParser(message_cache=MessageCache(max_segments=1000))
+        first_interchange = parser.parse(edifact_data)
+        expected_json = first_interchange.to_json_bytes()
+
+        # Act
+        first_interchange.unh_unt_nachrichten[0].unh_nachrichtenkopfsegment = None
+        second_interchange = parser.parse(edifact_data)
+        third_interchange = parser.parse(edifact_data)
+
+        # Assert
+        self.assertEqual(expected_json, second_interchange.to_json_bytes())
+        self.assertIsNot(second_interchange.unh_unt_nachrichten[0], third_interchange.unh_unt_nachrichten[0])
+
+    def test_iter_messages_with_message_cache(self):
+        """Test that the reused messages are handed out one at a time like parsed ones."""
+        # Arrange
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+        with open(self.mscons_sample_file_path_response, encoding='utf-8') as f:
+            expected_response = json.load(f)
+        message_cache = MessageCache(max_segments=1000)
+        parser = EdifactParser(message_cache=message_cache)
+        parser.parse(edifact_data)
+
+        # Act
+        message_stream = parser.iter_messages(edifact_data)
+        messages = [message.model_dump() for message in message_stream]
+
+        # Assert
+        self.assertEqual(expected_response["unh_unt_nachrichten"], messages)
+        self.assertEqual([], message_stream.interchange.unh_unt_nachrichten)
+        self.assertEqual(2, message_cache.statistics.reused_messages)
+
+    def test_parse_with_lazy_decoding_skips_message_cache(self):
+        """Test that lazily decoded messages are neither reused nor cached."""
+        # Arrange
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+        message_cache = MessageCache(max_segments=1000)
+        parser = EdifactParser(lazy_decoding=True, message_cache=message_cache)
+
+        # Act
+        parser.parse(edifact_data)
+        parser.parse(edifact_data)
+
+        # Assert
+        self.assertEqual((0, 0, 0), (
+            message_cache.statistics.reused_messages,
+            message_cache.statistics.parsed_messages,
+            message_cache.statistics.entries
+        ))
+
+    def test_parse_with_stage_timings(self):
+        """Test that the parser times its stages, counting the segments of the per-segment stages."""
+        # Arrange
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+        memory_budget = MemoryBudget()
+        stage_timings = StageTimings()
+
+        # Act
+        parsed_object = self.parser.parse(edifact_data, memory_budget=memory_budget, stage_timings=stage_timings)
+
+        # Assert
+        self.assertEqual(EdifactParser().parse(edifact_data).to_json_bytes(), parsed_object.to_json_bytes())
+        self.assertEqual(
+            [ParseStage.UNA, ParseStage.MESSAGE_TYPE, ParseStage.SPLIT, ParseStage.TOKENIZE,
+             ParseStage.GROUP_RESOLUTION, ParseStage.CONVERSION],
+            [stage for stage, _ in stage_timings.items()]
+        )
+        self.assertEqual(memory_budget.segment_count, stage_timings.get(ParseStage.CONVERSION).count)
+        self.assertEqual(
+            stage_timings.get(ParseStage.TOKENIZE).count, stage_timings.get(ParseStage.GROUP_RESOLUTION).count
+        )
+        self.assertTrue(all(timing.seconds >= 0 for _, timing in stage_timings.items()))
+
+    def test_parse_chunks_with_stage_timings(self):
+        """Test that the chunked input is split while it is tokenized, so no split stage is timed."""
+        # Arrange
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+        stage_timings = StageTimings()
+        chunks = (edifact_data[i:i + 100] for i in range(0, len(edifact_data), 100))
+
+        # Act
+        self.parser.parse_chunks(chunks, stage_timings=stage_timings)
+
+        # Assert
+        self.assertEqual(0, stage_timings.get(ParseStage.SPLIT).count)
+        self.assertGreater(stage_timings.get(ParseStage.TOKENIZE).count, 0)
+        self.assertGreater(stage_timings.get(ParseStage.CONVERSION).count, 0)
+
+
 if __name__ == '__main__':
     unittest.main()
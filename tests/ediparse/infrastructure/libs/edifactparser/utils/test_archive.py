@@ -0,0 +1,121 @@
+import io
+import os
+import tarfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from ediparse.infrastructure.libs.edifactparser.exceptions import (
+    DecompressionRatioExceededException, EdifactParserException
+)
+from ediparse.infrastructure.libs.edifactparser.utils.archive import (
+    ArchiveEntry, ArchiveFormat, detect_archive_format, iter_archive_entries
+)
+
+
+class _UnseekableReader(io.RawIOBase):
+    """Binary reader hiding the seekability of the wrapped file object, like a network stream."""
+
+    def __init__(self, data: bytes):
+        super().__init__()
+        self.__raw = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.__raw.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class TestArchive(unittest.TestCase):
+    """Test cases for the sequential reading of the files of archives."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.samples_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))))) / "samples"
+        with open(self.samples_dir / "mscons-message-example-request.txt", encoding='utf-8') as f:
+            self.edifact_data = f.read()
+        self.files = {"2024-01/mscons.txt": self.edifact_data.encode("utf-8"), "aperak.txt": b"UNA:+.? '"}
+
+    @staticmethod
+    def __create_zip(files: dict[str, bytes]) -> bytes:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("2024-01/", b"")
+            for file_name, content in files.items():
+                archive.writestr(file_name, content)
+        return buffer.getvalue()
+
+    @staticmethod
+    def __create_tar(files: dict[str, bytes], mode: str = "w:gz") -> bytes:
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode=mode) as archive:
+            directory = tarfile.TarInfo("2024-01")
+            directory.type = tarfile.DIRTYPE
+            archive.addfile(directory)
+            for file_name, content in files.items():
+                member = tarfile.TarInfo(file_name)
+                member.size = len(content)
+                archive.addfile(member, io.BytesIO(content))
+        return buffer.getvalue()
+
+    def test_detect_archive_format(self):
+        """Test that the archive format is detected from the leading bytes without consuming them."""
+        archive_file = io.BytesIO(self.__create_zip(self.files))
+
+        self.assertEqual(ArchiveFormat.ZIP, detect_archive_format(archive_file))
+        self.assertEqual(0, archive_file.tell())
+        self.assertEqual(ArchiveFormat.TAR, detect_archive_format(io.BytesIO(self.__create_tar(self.files))))
+
+    def test_iter_archive_entries_zip(self):
+        """Test that the files of a zip archive are read in archive order, skipping directories."""
+        # Act
+        entries = list(iter_archive_entries(self.__create_zip(self.files)))
+
+        # Assert
+        self.assertEqual([ArchiveEntry(name, content) for name, content in self.files.items()], entries)
+        self.assertEqual(self.edifact_data, entries[0].decode())
+
+    def test_iter_archive_entries_tar(self):
+        """Test that the files of plain and compressed tar archives are read, also from unseekable streams."""
+        expected_entries = [ArchiveEntry(name, content) for name, content in self.files.items()]
+        for mode in ("w", "w:gz", "w:bz2", "w:xz"):
+            with self.subTest(mode=mode):
+                data = self.__create_tar(self.files, mode=mode)
+
+                self.assertEqual(expected_entries, list(iter_archive_entries(data)))
+                self.assertEqual(expected_entries, list(iter_archive_entries(_UnseekableReader(data))))
+
+    def test_iter_archive_entries_invalid_archive(self):
+        """Test that unsupported and corrupt archives are refused right away."""
+        with self.assertRaises(EdifactParserException):
+            iter_archive_entries(self.edifact_data.encode("utf-8"))
+        with self.assertRaises(EdifactParserException):
+            iter_archive_entries(b"PK\x03\x04corrupt")
+
+    def test_iter_archive_entries_ratio_exceeded(self):
+        """Test that reading is aborted once the files expand beyond the allowed ratio."""
+        # Arrange
+        files = {"first.txt": b"A" * 1_000_000, "second.txt": b"B" * 1_000_000}
+
+        zip_data = self.__create_zip(files)
+        tar_data = self.__create_tar(files)
+
+        # Act & Assert
+        for archive in (zip_data, tar_data, _UnseekableReader(tar_data)):
+            with self.assertRaises(DecompressionRatioExceededException):
+                list(iter_archive_entries(archive, max_ratio=10))
+
+        # A ratio of 0 disables the check
+        self.assertEqual(2, len(list(iter_archive_entries(zip_data, max_ratio=0))))
+        self.assertEqual(2, len(list(iter_archive_entries(tar_data, max_ratio=0))))
+
+    def test_decode_falls_back_to_iso_8859_1(self):
+        """Test that files which are not UTF-8 encoded are decoded as ISO-8859-1."""
+        self.assertEqual("Müller", ArchiveEntry("file.txt", "Müller".encode("iso-8859-1")).decode())
+
+
+if __name__ == '__main__':
+    unittest.main()
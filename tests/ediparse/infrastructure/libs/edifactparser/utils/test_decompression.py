@@ -0,0 +1,144 @@
+import gzip
+import io
+import os
+import unittest
+import zipfile
+from pathlib import Path
+
+from ediparse.infrastructure.libs.edifactparser.exceptions import (
+    DecompressionRatioExceededException, EdifactParserException
+)
+from ediparse.infrastructure.libs.edifactparser.utils.decompression import (
+    CompressionFormat, detect_compression_format, iter_decoded_text, iter_decompressed_chunks, iter_decompressed_text
+)
+
+
+class TestDecompression(unittest.TestCase):
+    """Test cases for the incremental decompression of compressed inputs."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.samples_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))))) / "samples"
+        with open(self.samples_dir / "mscons-message-example-request.txt", encoding='utf-8') as f:
+            self.edifact_data = f.read()
+
+    @staticmethod
+    def __create_zip(files: dict[str, bytes]) -> bytes:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for file_name, content in files.items():
+                archive.writestr(file_name, content)
+        return buffer.getvalue()
+
+    def test_detect_compression_format(self):
+        """Test that the compression format is detected from the Content-Encoding or the leading bytes."""
+        gzip_data = gzip.compress(b"UNA:+.? '")
+        zip_data = self.__create_zip({"mscons.txt": b"UNA:+.? '"})
+
+        self.assertEqual(CompressionFormat.GZIP, detect_compression_format(gzip_data))
+        self.assertEqual(CompressionFormat.GZIP, detect_compression_format(b"data", content_encoding="gzip"))
+        self.assertEqual(CompressionFormat.ZIP, detect_compression_format(zip_data))
+        self.assertIsNone(detect_compression_format(b"UNA:+.? '"))
+        self.assertIsNone(detect_compression_format(b"UNA:+.? '", content_encoding="identity"))
+        with self.assertRaises(EdifactParserException):
+            detect_compression_format(b"data", content_encoding="br")
+
+    def test_iter_decompressed_text_gzip(self):
+        """Test that a gzip input is decompressed and decoded in chunks."""
+        # Arrange
+        data = gzip.compress(self.edifact_data.encode("utf-8"))
+
+        # Act
+        chunks = list(iter_decompressed_text(data, CompressionFormat.GZIP, chunk_size=100))
+
+        # Assert
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(self.edifact_data, "".join(chunks))
+
+    def test_iter_decompressed_text_gzip_with_several_members(self):
+        """Test that all members of a gzip input are decompressed."""
+        # Arrange
+        data = gzip.compress(b"first,") + gzip.compress(b"second")
+
+        # Act
+        text = "".join(iter_decompressed_text(data, CompressionFormat.GZIP))
+
+        # Assert
+        self.assertEqual("first,second", text)
+
+    def test_iter_decompressed_text_zip(self):
+        """Test that the only file of a zip archive is decompressed and decoded in chunks."""
+        # Arrange
+        data = self.__create_zip({"mscons.txt": self.edifact_data.encode("utf-8")})
+
+        # Act
+        text = "".join(iter_decompressed_text(data, CompressionFormat.ZIP, chunk_size=100))
+
+        # Assert
+        self.assertEqual(self.edifact_data, text)
+
+    def test_iter_decompressed_text_from_file(self):
+        """Test that compressed inputs are read chunk by chunk from a seekable binary file."""
+        for compression_format, data in [
+            (CompressionFormat.GZIP, gzip.compress(b"first,") + gzip.compress(self.edifact_data.encode("utf-8"))),
+            (CompressionFormat.ZIP, self.__create_zip({"mscons.txt": ("first," + self.edifact_data).encode("utf-8")})),
+        ]:
+            with self.subTest(compression_format=compression_format):
+                # Act
+                text = "".join(iter_decompressed_text(io.BytesIO(data), compression_format, chunk_size=100))
+
+                # Assert
+                self.assertEqual("first," + self.edifact_data, text)
+
+    def test_iter_decompressed_chunks_zip_with_several_files(self):
+        """Test that zip archives with more than one file are refused right away."""
+        # Arrange
+        data = self.__create_zip({"first.txt": b"first", "second.txt": b"second"})
+
+        # Act & Assert
+        with self.assertRaises(EdifactParserException):
+            iter_decompressed_chunks(data, CompressionFormat.ZIP)
+
+    def test_iter_decompressed_chunks_invalid_input(self):
+        """Test that corrupt or incomplete inputs are refused."""
+        # Arrange
+        data = gzip.compress(self.edifact_data.encode("utf-8"))
+
+        # Act & Assert
+        with self.assertRaises(EdifactParserException):
+            list(iter_decompressed_chunks(data[:len(data) // 2], CompressionFormat.GZIP))
+        with self.assertRaises(EdifactParserException):
+            list(iter_decompressed_chunks(b"\x1f\x8bcorrupt", CompressionFormat.GZIP))
+        with self.assertRaises(EdifactParserException):
+            iter_decompressed_chunks(b"PK\x03\x04corrupt", CompressionFormat.ZIP)
+
+    def test_iter_decompressed_chunks_ratio_exceeded(self):
+        """Test that the decompression is aborted once the allowed ratio is exceeded."""
+        # Arrange
+        data = gzip.compress(b"A" * 1_000_000)
+
+        # Act & Assert
+        with self.assertRaises(DecompressionRatioExceededException) as context:
+            list(iter_decompressed_chunks(data, CompressionFormat.GZIP, max_ratio=10, chunk_size=1024))
+        self.assertLessEqual(context.exception.decompressed_bytes, 10 * len(data) + 1024)
+        self.assertEqual(len(data), context.exception.compressed_bytes)
+
+        # A ratio of 0 disables the check
+        self.assertEqual(1_000_000, sum(len(chunk) for chunk in iter_decompressed_chunks(
+            data, CompressionFormat.GZIP, max_ratio=0
+        )))
+
+    def test_iter_decoded_text(self):
+        """Test that multibyte characters spanning chunks are decoded and non-UTF-8 inputs fall back to ISO-8859-1."""
+        # Arrange
+        utf8_data = "Zählpunkt".encode("utf-8")
+        latin1_data = "Zählpunkt".encode("iso-8859-1")
+
+        # Act & Assert
+        self.assertEqual("Zählpunkt", "".join(iter_decoded_text(iter([utf8_data[:2], utf8_data[2:]]))))
+        self.assertEqual("Zählpunkt", "".join(iter_decoded_text(iter([latin1_data[:2], latin1_data[2:]]))))
+        self.assertEqual("Z\xc3", "".join(iter_decoded_text(iter([utf8_data[:2]]))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -125,6 +125,15 @@ class TestEdifactSyntaxHelper(unittest.TestCase):
         expected = ["UNOC", "3"]
         self.assertEqual(expected, self.parser.split_components(test_data, None))
 
+    def test_get_segment_type(self):
+        """Test get_segment_type method with context."""
+        # Test with valid context
+        self.assertEqual("UNB", self.parser.get_segment_type("UNB*UNOC;3*SENDER;ZZ", self.context))
+
+        # Test with None context
+        self.assertEqual("QTY", self.parser.get_segment_type("QTY+220:4250.000:KWH", None))
+        self.assertEqual("UNT", self.parser.get_segment_type("UNT", None))
+
     def test_escape_split(self):
         """Test __escape_split method through split_elements."""
         # Test with escaped delimiters
@@ -166,6 +175,22 @@ class TestEdifactSyntaxHelper(unittest.TestCase):
         self.assertEqual("UNT+5+12345", result[2])
         self.assertEqual("", result[3])  # Empty string at the end
 
+    def test_iter_segments_across_chunk_boundaries(self):
+        """Test that iter_segments splits chunks like split_segments splits the joined input."""
+        test_data = "UNB+UNOC:3+SENDER:ZZ+RECIPIENT:ZZ+230101:1200+12345'FTX+AAO+++?'42?' ist fehlerhaft'UNT+5+12345'"
+        expected = self.parser.split_segments(test_data, None)
+        for chunk_size in [1, 2, 5, 57, len(test_data)]:
+            with self.subTest(chunk_size=chunk_size):
+                chunks = [test_data[i:i + chunk_size] for i in range(0, len(test_data), chunk_size)]
+                self.assertEqual(expected, list(self.parser.iter_segments(chunks, None)))
+
+        # Release character at the end of a chunk, escaping the terminator at the start of the next one
+        result = list(self.parser.iter_segments(["FTX*AAO***?", "'42'UNT*5'"], self.context))
+        self.assertEqual(["FTX*AAO***?'42", "UNT*5", ""], result)
+
+        # No chunks at all
+        self.assertEqual([""], list(self.parser.iter_segments([], None)))
+
     def setUp_segment_types(self):
         """Set up segment types for testing."""
         return [segment_type.value for segment_type in SegmentType]
@@ -0,0 +1,53 @@
+import unittest
+
+from ediparse.infrastructure.libs.edifactparser.exceptions import ParseMemoryBudgetExceededException
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget
+
+
+class TestMemoryBudget(unittest.TestCase):
+    """Test case for the MemoryBudget class."""
+
+    def test_unlimited_budget_only_accounts(self):
+        """Test that a budget without limit accounts the estimate but never raises."""
+        # Arrange
+        memory_budget = MemoryBudget()
+
+        # Act
+        memory_budget.reserve_input(input_length=10_000_000, amount_of_segments=100_000)
+        for _ in range(3):
+            memory_budget.account_segment()
+
+        # Assert
+        self.assertEqual(3, memory_budget.segment_count)
+        self.assertEqual(
+            10_000_000 * MemoryBudget.ESTIMATED_BYTES_PER_INPUT_CHARACTER
+            + 3 * MemoryBudget.ESTIMATED_BYTES_PER_SEGMENT,
+            memory_budget.estimated_bytes
+        )
+
+    def test_reserve_input_refuses_projected_overrun(self):
+        """Test that the projected size of the whole parsing run is checked up front."""
+        # Arrange
+        memory_budget = MemoryBudget(max_bytes=10 * MemoryBudget.ESTIMATED_BYTES_PER_SEGMENT)
+
+        # Act & Assert
+        with self.assertRaises(ParseMemoryBudgetExceededException) as context:
+            memory_budget.reserve_input(input_length=100, amount_of_segments=10)
+        self.assertEqual(10 * MemoryBudget.ESTIMATED_BYTES_PER_SEGMENT, context.exception.max_bytes)
+        self.assertGreater(context.exception.estimated_bytes, context.exception.max_bytes)
+
+    def test_account_segment_raises_once_budget_is_exceeded(self):
+        """Test that the running estimate is checked for every accounted segment."""
+        # Arrange
+        memory_budget = MemoryBudget(max_bytes=2 * MemoryBudget.ESTIMATED_BYTES_PER_SEGMENT)
+        memory_budget.account_segment()
+        memory_budget.account_segment()
+
+        # Act & Assert
+        with self.assertRaises(ParseMemoryBudgetExceededException):
+            memory_budget.account_segment()
+        self.assertEqual(3, memory_budget.segment_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
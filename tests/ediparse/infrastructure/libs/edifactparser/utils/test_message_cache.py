@@ -0,0 +1,92 @@
+import unittest
+
+from ediparse.infrastructure.libs.edifactparser.mods.mscons.context import MSCONSParsingContext
+from ediparse.infrastructure.libs.edifactparser.utils import MessageCache
+from ediparse.infrastructure.libs.edifactparser.utils.message_cache import CachedMessage
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import EdifactInterchange, SegmentUNA
+
+
+class TestMessageCache(unittest.TestCase):
+    """Test cases for the MessageCache class and its keys."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.context = MSCONSParsingContext()
+
+    def test_make_key(self):
+        """Test that the key depends on the segments of the span and on the delimiters of the interchange."""
+        # Arrange
+        segment_lines = ["UNH+1+MSCONS:D:04B:UN:2.4c", "UNT+2+1"]
+        key = MessageCache.make_key(segment_lines, self.context)
+        other_context = MSCONSParsingContext(interchange=EdifactInterchange(
+            una_service_string_advice=SegmentUNA(
+                component_separator=":", element_separator="+", decimal_mark=",",
+                release_character="?", reserved=" ", segment_terminator="~"
+            )
+        ))
+
+        # Act & Assert
+        self.assertEqual(key, MessageCache.make_key(list(segment_lines), self.context))
+        self.assertNotEqual(key, MessageCache.make_key(["UNH+1+MSCONS:D:04B:UN:2.4c", "UNT+2+2"], self.context))
+        self.assertNotEqual(key, MessageCache.make_key(["UNH+1+MSCONS:D:04B:UN:2.4cUNT+2+1"], self.context))
+        self.assertNotEqual(key, MessageCache.make_key(segment_lines, other_context))
+
+    def test_init_without_size(self):
+        """Test that a cache without any size is refused."""
+        with self.assertRaises(ValueError):
+            MessageCache(max_segments=0)
+
+    def test_get_and_put_with_lru_eviction(self):
+        """Test that the least recently used messages are evicted beyond the segment limit."""
+        # Arrange
+        cache = MessageCache(max_segments=10)
+        messages = {
+            key: CachedMessage(message=[key], segment_count=4, segment_group=None) for key in [b"a", b"b", b"c"]
+        }
+
+        # Act
+        cache.put(b"a", messages[b"a"])
+        cache.put(b"b", messages[b"b"])
+        self.assertEqual(messages[b"a"], cache.get(b"a"))
+        cache.put(b"c", messages[b"c"])
+        cache.put(b"too-large", CachedMessage(message=[], segment_count=11, segment_group=None))
+
+        # Assert
+        self.assertIsNone(cache.get(b"b"))
+        self.assertIsNone(cache.get(b"too-large"))
+        self.assertEqual(messages[b"c"], cache.get(b"c"))
+        statistics = cache.statistics
+        self.assertEqual((2, 2), (statistics.reused_messages, statistics.parsed_messages))
+        self.assertEqual((2, 8), (statistics.entries, statistics.segments))
+
+    def test_get_hands_out_copies(self):
+        """Test that modifying a stored or a handed out message does not modify the cached one."""
+        # Arrange
+        cache = MessageCache(max_segments=10)
+        message = ["UNH"]
+        cache.put(b"a", CachedMessage(message=message, segment_count=1, segment_group=None))
+
+        # Act
+        message.append("modified")
+        cache.get(b"a").message.append("modified")
+
+        # Assert
+        self.assertEqual(["UNH"], cache.get(b"a").message)
+        self.assertIsNot(cache.get(b"a").message, cache.get(b"a").message)
+
+    def test_clear(self):
+        """Test that clear removes all cached messages."""
+        # Arrange
+        cache = MessageCache(max_segments=10)
+        cache.put(b"a", CachedMessage(message=[b"a"], segment_count=4, segment_group=None))
+
+        # Act
+        cache.clear()
+
+        # Assert
+        self.assertIsNone(cache.get(b"a"))
+        self.assertEqual((0, 0), (cache.statistics.entries, cache.statistics.segments))
+
+
+if __name__ == '__main__':
+    unittest.main()
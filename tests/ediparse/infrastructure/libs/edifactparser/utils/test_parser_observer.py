@@ -0,0 +1,167 @@
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from ediparse.infrastructure.libs.edifactparser.exceptions import EdifactParserException
+from ediparse.infrastructure.libs.edifactparser.handlers import SegmentHandlerFactory
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.utils import (
+    ConverterTimingObserver, EdifactSyntaxHelper, MessageCache, ParserObserver, SegmentTypeCounter
+)
+
+SAMPLES_DIR = Path(__file__).resolve().parents[5] / "samples"
+
+
+class RecordingObserver(ParserObserver):
+    """Observer recording the notifications it receives."""
+
+    def __init__(self):
+        self.events = []
+
+    def on_segment_start(self, segment_type, segment_group):
+        self.events.append(("start", segment_type, segment_group))
+
+    def on_segment_end(self, segment_type, segment_group, handler):
+        self.events.append(("end", segment_type, segment_group))
+
+    def on_message_end(self, message):
+        self.events.append(("message", message))
+
+    def on_error(self, error, segment_type, line_number):
+        self.events.append(("error", segment_type, line_number, error))
+
+
+class TestParserObserver(unittest.TestCase):
+    """Test cases for the notifications of the parser observers and the built-in observers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        with open(SAMPLES_DIR / "mscons-message-example-request.txt", encoding="utf-8") as f:
+            self.edifact_data = f.read()
+
+    def test_observer_is_notified_around_each_segment(self):
+        """Test that each handled segment is surrounded by start and end, followed by the end of its message."""
+        # Arrange
+        observer = RecordingObserver()
+        parser = EdifactParser(observers=[observer])
+
+        # Act
+        interchange = parser.parse(self.edifact_data)
+
+        # Assert
+        starts = [event for event in observer.events if event[0] == "start"]
+        ends = [event for event in observer.events if event[0] == "end"]
+        self.assertEqual([event[1:] for event in starts], [event[1:] for event in ends])
+        self.assertEqual(("start", "UNB", None), observer.events[0])
+        self.assertEqual(
+            interchange.unh_unt_nachrichten, [event[1] for event in observer.events if event[0] == "message"]
+        )
+        unt_end = observer.events.index(("end", "UNT", None))
+        self.assertEqual("message", observer.events[unt_end + 1][0])
+
+    def test_observer_is_notified_of_reused_messages(self):
+        """Test that messages reused from the message cache are passed to on_message_end without segment events."""
+        # Arrange
+        observer = RecordingObserver()
+        parser = EdifactParser(message_cache=MessageCache(max_segments=1000))
+        parser.parse(self.edifact_data)
+        parser.add_observer(observer)
+
+        # Act
+        parser.parse(self.edifact_data)
+
+        # Assert
+        self.assertEqual(["start", "end", "message", "message", "start", "end"], [
+            event[0] for event in observer.events
+        ])
+
+    def test_observer_is_notified_of_errors(self):
+        """Test that a failing segment handler is reported to the observer before its exception is raised."""
+        # Arrange
+        observer = RecordingObserver()
+        handler_factory = SegmentHandlerFactory(EdifactSyntaxHelper())
+        failing_handler = MagicMock()
+        failing_handler.handle.side_effect = EdifactParserException("Invalid DTM segment")
+        original_get_handler = handler_factory.get_handler
+        handler_factory.get_handler = lambda segment_type, context: (
+            failing_handler if segment_type == "DTM" else original_get_handler(segment_type, context)
+        )
+        parser = EdifactParser(handler_factory=handler_factory, observers=[observer])
+
+        # Act
+        with self.assertRaises(EdifactParserException):
+            parser.parse(self.edifact_data)
+
+        # Assert
+        event, segment_type, line_number, error = observer.events[-1]
+        self.assertEqual(("error", "DTM"), (event, segment_type))
+        self.assertGreater(line_number, 0)
+        self.assertEqual("Invalid DTM segment", str(error))
+
+    def test_remove_observer(self):
+        """Test that a removed observer is not notified anymore."""
+        # Arrange
+        observer = RecordingObserver()
+        parser = EdifactParser(observers=[observer])
+
+        # Act
+        parser.remove_observer(observer)
+        parser.parse(self.edifact_data)
+
+        # Assert
+        self.assertEqual([], observer.events)
+
+    def test_segment_type_counter(self):
+        """Test that the segments are counted per segment type and segment group across parsing runs."""
+        # Arrange
+        counter = SegmentTypeCounter()
+        parser = EdifactParser(observers=[counter])
+
+        # Act
+        for _ in range(2):
+            parser.parse(self.edifact_data)
+
+        # Assert
+        counts = counter.counts
+        self.assertEqual(2, counts["UNB"])
+        self.assertEqual(4, counts["UNH"])
+        self.assertEqual(counts["DTM"], sum(
+            count for (segment_type, _), count in counter.counts_by_group.items() if segment_type == "DTM"
+        ))
+        self.assertEqual(4, counter.messages)
+        self.assertEqual({}, counter.errors)
+        counter.reset()
+        self.assertEqual(({}, 0), (counter.counts, counter.messages))
+
+    def test_converter_timing_observer(self):
+        """Test that the durations are recorded per converter, shared by the parsers of several threads."""
+        # Arrange
+        observer = ConverterTimingObserver()
+        threads = [
+            threading.Thread(target=EdifactParser(observers=[observer]).parse, args=(self.edifact_data,))
+            for _ in range(4)
+        ]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        timings = observer.timings
+        self.assertIn("UNBSegmentConverter", timings)
+        self.assertIn("MSCONSDTMSegmentConverter", timings)
+        self.assertEqual(4, timings["UNBSegmentConverter"].count)
+        total_seconds = [timing.total_seconds for timing in timings.values()]
+        self.assertEqual(sorted(total_seconds, reverse=True), total_seconds)
+        for timing in timings.values():
+            self.assertEqual(timing.count, sum(timing.bucket_counts))
+            self.assertEqual(len(observer.buckets) + 1, len(timing.bucket_counts))
+        with self.assertRaises(ValueError):
+            ConverterTimingObserver(buckets=(0.1, 0.01))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import pickle
+import unittest
+
+from ediparse.infrastructure.libs.edifactparser.utils import ParseStage, StageTimings
+from ediparse.infrastructure.libs.edifactparser.utils.stage_timings import StageTiming, measure_stage
+
+
+class TestStageTimings(unittest.TestCase):
+    """Test cases for the StageTimings class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.stage_timings = StageTimings()
+
+    def test_add_accumulates_in_order_of_first_entry(self):
+        """Test that the durations and passes of a stage are accumulated and the stages keep their order."""
+        # Act
+        self.stage_timings.add(ParseStage.TOKENIZE, 0.25)
+        self.stage_timings.add(ParseStage.SPLIT, 0.5)
+        self.stage_timings.add(ParseStage.TOKENIZE, 0.5, count=2)
+
+        # Assert
+        self.assertEqual([
+            (ParseStage.TOKENIZE, StageTiming(seconds=0.75, count=3)),
+            (ParseStage.SPLIT, StageTiming(seconds=0.5, count=1)),
+        ], list(self.stage_timings.items()))
+        self.assertEqual(StageTiming(seconds=0.0, count=0), self.stage_timings.get(ParseStage.RENDER))
+
+    def test_measure_times_block_even_if_it_raises(self):
+        """Test that a block is timed as one pass, also if it raises an exception."""
+        with self.assertRaises(ValueError):
+            with self.stage_timings.measure(ParseStage.UNA):
+                raise ValueError("invalid")
+
+        self.assertEqual(1, self.stage_timings.get(ParseStage.UNA).count)
+
+    def test_measure_iterator_counts_items(self):
+        """Test that each produced item is counted as one pass, while the end of the iterator is not."""
+        # Act
+        items = list(self.stage_timings.measure_iterator(ParseStage.TOKENIZE, iter(["UNB", None, "UNZ"])))
+
+        # Assert
+        self.assertEqual(["UNB", None, "UNZ"], items)
+        self.assertEqual(3, self.stage_timings.get(ParseStage.TOKENIZE).count)
+
+    def test_merge_and_pickle(self):
+        """Test that timings survive pickling (e.g. from a worker process) and are merged stage by stage."""
+        # Arrange
+        other = StageTimings()
+        other.add(ParseStage.CONVERSION, 1.0, count=10)
+        other.add(ParseStage.RENDER, 0.5)
+        self.stage_timings.add(ParseStage.READ, 0.125)
+        self.stage_timings.add(ParseStage.RENDER, 0.25)
+
+        # Act
+        self.stage_timings.merge(pickle.loads(pickle.dumps(other)))
+
+        # Assert
+        self.assertEqual([
+            (ParseStage.READ, StageTiming(seconds=0.125, count=1)),
+            (ParseStage.RENDER, StageTiming(seconds=0.75, count=2)),
+            (ParseStage.CONVERSION, StageTiming(seconds=1.0, count=10)),
+        ], list(self.stage_timings.items()))
+
+    def test_measure_stage_without_timings(self):
+        """Test that nothing is timed if no timings are recorded."""
+        with measure_stage(None, ParseStage.UNA):
+            pass
+        with measure_stage(self.stage_timings, ParseStage.UNA):
+            pass
+
+        self.assertEqual(1, self.stage_timings.get(ParseStage.UNA).count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import json
+import os
+import pickle
+import unittest
+from pathlib import Path
+
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.wrappers.segments import (
+    LazySegment, SegmentBGM, create_lazy_segment, DokumentenNachrichtenname
+)
+
+
+class TestLazySegments(unittest.TestCase):
+    """Test case for the lazily decoded segments."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.samples_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))))) / "samples"
+        self.mscons_sample_file_path_request = self.samples_dir / "mscons-message-example-request.txt"
+        self.mscons_sample_file_path_response = self.samples_dir / "mscons-message-example-response.json"
+        self.decoder_calls = 0
+
+    def __create_bgm_segment(self) -> SegmentBGM:
+        def decoder() -> SegmentBGM:
+            self.decoder_calls += 1
+            return SegmentBGM(
+                dokumenten_nachrichtenname=DokumentenNachrichtenname(dokumentenname_code="7"),
+                nachrichtenfunktion_code="9"
+            )
+        return create_lazy_segment(SegmentBGM, decoder)
+
+    def test_lazy_segment_is_instance_of_segment_class(self):
+        """Test that a lazy segment behaves like an instance of its segment class."""
+        # Act
+        segment = self.__create_bgm_segment()
+
+        # Assert
+        self.assertIsInstance(segment, SegmentBGM)
+        self.assertIsInstance(segment, LazySegment)
+        self.assertFalse(segment.is_decoded)
+        self.assertEqual(0, self.decoder_calls)
+
+    def test_field_access_decodes_segment_once(self):
+        """Test that the first field access decodes the segment and the result is cached."""
+        # Arrange
+        segment = self.__create_bgm_segment()
+
+        # Act
+        function_code = segment.nachrichtenfunktion_code
+        document_name_code = segment.dokumenten_nachrichtenname.dokumentenname_code
+
+        # Assert
+        self.assertEqual("9", function_code)
+        self.assertEqual("7", document_name_code)
+        self.assertTrue(segment.is_decoded)
+        self.assertEqual(1, self.decoder_calls)
+
+    def test_assignment_is_not_overwritten_by_decoding(self):
+        """Test that assigning a field of an undecoded segment keeps the assigned value."""
+        # Arrange
+        segment = self.__create_bgm_segment()
+
+        # Act
+        segment.nachrichtenfunktion_code = "1"
+
+        # Assert
+        self.assertEqual("1", segment.nachrichtenfunktion_code)
+        self.assertEqual("7", segment.dokumenten_nachrichtenname.dokumentenname_code)
+
+    def test_model_dump_decodes_segment(self):
+        """Test that dumping a lazy segment returns the decoded fields."""
+        # Arrange
+        segment = self.__create_bgm_segment()
+
+        # Act
+        dumped = segment.model_dump()
+
+        # Assert
+        self.assertEqual("9", dumped["nachrichtenfunktion_code"])
+        self.assertTrue(segment.is_decoded)
+
+    def test_equality_and_pickle(self):
+        """Test that a lazy segment equals its eager counterpart and is pickled as a plain segment."""
+        # Arrange
+        segment = self.__create_bgm_segment()
+        eager_segment = self.__create_bgm_segment().to_eager_segment()
+
+        # Act
+        unpickled_segment = pickle.loads(pickle.dumps(segment))
+
+        # Assert
+        self.assertEqual(eager_segment, segment)
+        self.assertIs(SegmentBGM, type(unpickled_segment))
+        self.assertEqual(eager_segment, unpickled_segment)
+
+    def test_parse_with_lazy_decoding_defers_conversion(self):
+        """Test that the parser creates undecoded segments when lazy decoding is enabled."""
+        # Arrange
+        parser = EdifactParser(lazy_decoding=True)
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+
+        # Act
+        parsed_object = parser.parse(edifact_data)
+        message = parsed_object.unh_unt_nachrichten[0]
+
+        # Assert
+        self.assertIsInstance(message.bgm_beginn_der_nachricht, LazySegment)
+        self.assertFalse(message.bgm_beginn_der_nachricht.is_decoded)
+        self.assertEqual("MSI5422", message.bgm_beginn_der_nachricht
+                         .dokumenten_nachrichten_identifikation.dokumentennummer)
+        self.assertTrue(message.bgm_beginn_der_nachricht.is_decoded)
+        self.assertEqual(2, parsed_object.unz_nutzdaten_endsegment.datenaustauschzaehler)
+
+    def test_parse_with_lazy_decoding_defers_tokenizing(self):
+        """Test that the parser only keeps the raw segment line of a lazy segment until it is decoded."""
+        # Arrange
+        parser = EdifactParser(lazy_decoding=True)
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+
+        # Act
+        parsed_object = parser.parse(edifact_data)
+        segments = [message.bgm_beginn_der_nachricht for message in parsed_object.unh_unt_nachrichten]
+
+        # Assert
+        self.assertEqual(
+            "BGM+7+MSI5422+9",
+            segments[0].__pydantic_private__["_lazy_decoder_args"][1]
+        )
+        # The decoder is shared by all lazy segments of the same type within the parsing run
+        self.assertIs(
+            segments[0].__pydantic_private__["_lazy_decoder"],
+            segments[1].__pydantic_private__["_lazy_decoder"]
+        )
+
+    def test_parse_with_lazy_decoding_full_content(self):
+        """Test that a lazily parsed interchange serializes to the same content as an eager one."""
+        # Arrange
+        parser = EdifactParser(lazy_decoding=True)
+        with open(self.mscons_sample_file_path_request, encoding='utf-8') as f:
+            edifact_data = f.read()
+        with open(self.mscons_sample_file_path_response, encoding='utf-8') as f:
+            expected_response = json.load(f)
+
+        # Act
+        parsed_object = parser.parse(edifact_data)
+
+        # Assert
+        self.assertEqual(expected_response, parsed_object.model_dump())
+        self.assertEqual(expected_response, json.loads(parsed_object.to_json()))
+
+
+if __name__ == '__main__':
+    unittest.main()
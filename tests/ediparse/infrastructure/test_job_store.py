@@ -0,0 +1,181 @@
+import io
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from ediparse.infrastructure import job_store
+from ediparse.infrastructure.job_store import (
+    JobQueueFullException, JobStatus, JobStore, get_default_job_store, shutdown_default_job_store
+)
+from ediparse.infrastructure.libs.edifactparser.exceptions import EdifactParserException
+
+
+class TestJobStore(unittest.TestCase):
+    """Test cases for the JobStore class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.spool_dir = tempfile.mkdtemp()
+        self.store = JobStore(spool_dir=self.spool_dir, max_workers=1, max_queued_jobs=1, retention_seconds=60,
+                              result_memory_threshold_bytes=10)
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.store.shutdown()
+        os.rmdir(self.spool_dir)
+
+    @staticmethod
+    def __wait_until_finished(job, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not job.is_finished and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return job
+
+    @staticmethod
+    def __copy_task(job, upload_file, result_file):
+        for chunk in iter(lambda: upload_file.read(4), b""):
+            result_file.write(chunk.upper())
+            job.messages_processed += 1
+
+    def test_init_with_invalid_workers(self):
+        """Test that a store without workers is refused."""
+        with self.assertRaises(ValueError):
+            JobStore(spool_dir=self.spool_dir, max_workers=0)
+
+    def test_submit_keeps_small_result_in_memory(self):
+        """Test that a job runs the task on the spooled upload and keeps a small result in memory."""
+        # Act
+        job = self.__wait_until_finished(self.store.submit(b"unb", self.__copy_task))
+
+        # Assert
+        self.assertEqual(JobStatus.SUCCEEDED, job.status)
+        self.assertEqual(b"UNB", job.result_content)
+        self.assertIsNone(job.result_path)
+        self.assertEqual(3, job.upload_size)
+        self.assertEqual(3, job.bytes_processed)
+        self.assertEqual(1, job.messages_processed)
+        self.assertLessEqual(job.created_at, job.started_at)
+        self.assertLessEqual(job.started_at, job.finished_at)
+        self.assertFalse(os.path.exists(job.upload_path))
+
+    def test_submit_spills_large_result_to_disk(self):
+        """Test that a result beyond the memory threshold is written to a file of the job."""
+        # Act
+        job = self.__wait_until_finished(self.store.submit(io.BytesIO(b"unb+unh+unt+unz"), self.__copy_task))
+
+        # Assert
+        self.assertEqual(JobStatus.SUCCEEDED, job.status)
+        self.assertIsNone(job.result_content)
+        self.assertEqual(15, job.result_size)
+        with open(job.result_path, "rb") as result_file:
+            self.assertEqual(b"UNB+UNH+UNT+UNZ", result_file.read())
+
+    def test_submit_failing_task(self):
+        """Test that the error of a failing task is kept and a partially written result is removed."""
+        # Arrange
+        def task(job, upload_file, result_file):
+            result_file.write(b"x" * 100)
+            raise EdifactParserException("Invalid upload")
+
+        # Act
+        job = self.__wait_until_finished(self.store.submit(b"invalid", task))
+
+        # Assert
+        self.assertEqual(JobStatus.FAILED, job.status)
+        self.assertIsInstance(job.error, EdifactParserException)
+        self.assertIsNone(job.result_path)
+        self.assertEqual([], os.listdir(job.directory))
+
+    def test_submit_with_full_queue(self):
+        """Test that jobs beyond the running and queued ones are refused."""
+        # Arrange
+        released = threading.Event()
+        blocking_task = lambda job, upload_file, result_file: released.wait(timeout=5)  # noqa: E731
+        running_job = self.store.submit(b"first", blocking_task)
+        queued_job = self.store.submit(b"second", blocking_task)
+
+        # Act & Assert
+        with self.assertRaises(JobQueueFullException):
+            self.store.submit(b"third", blocking_task)
+        self.assertEqual(JobStatus.QUEUED, queued_job.status)
+
+        # Once the jobs have finished, further jobs are accepted again
+        released.set()
+        self.assertEqual(JobStatus.SUCCEEDED, self.__wait_until_finished(running_job).status)
+        self.assertEqual(JobStatus.SUCCEEDED, self.__wait_until_finished(queued_job).status)
+        self.assertIsNotNone(self.store.submit(b"third", blocking_task))
+
+    def test_get(self):
+        """Test that a job is found by its id and unknown ids are not."""
+        # Act
+        job = self.store.submit(b"unb", self.__copy_task)
+
+        # Assert
+        self.assertIs(job, self.store.get(job.id))
+        self.assertIsNone(self.store.get("unknown"))
+
+    def test_cleanup_expired_jobs(self):
+        """Test that finished jobs are removed with their files once their retention period has passed."""
+        # Arrange
+        job = self.__wait_until_finished(self.store.submit(b"unb+unh+unt+unz", self.__copy_task))
+
+        # Act
+        removed_before_expiry = self.store.cleanup_expired_jobs(now=job.finished_at + 30)
+        removed_after_expiry = self.store.cleanup_expired_jobs(now=job.finished_at + 61)
+
+        # Assert
+        self.assertEqual(0, removed_before_expiry)
+        self.assertEqual(1, removed_after_expiry)
+        self.assertIsNone(self.store.get(job.id))
+        self.assertFalse(os.path.exists(job.directory))
+
+    def test_cleanup_expired_jobs_skips_finishing_job(self):
+        """Test that a job whose status is final but whose finish time is not set yet is kept by the cleanup."""
+        # Arrange
+        released = threading.Event()
+        job = self.store.submit(b"unb", lambda job, upload_file, result_file: released.wait(timeout=5))
+        job.status = JobStatus.SUCCEEDED
+
+        # Act
+        found_job = self.store.get(job.id)
+        removed_jobs = self.store.cleanup_expired_jobs(now=time.time() + 3600)
+
+        # Assert
+        self.assertIs(job, found_job)
+        self.assertEqual(0, removed_jobs)
+        released.set()
+        self.store.shutdown()
+        self.assertIsNotNone(job.finished_at)
+
+    def test_shutdown_removes_directory(self):
+        """Test that the directory of the store is removed when the store is shut down."""
+        # Arrange
+        store = JobStore(spool_dir=self.spool_dir, max_workers=1)
+        self.__wait_until_finished(store.submit(b"unb", self.__copy_task))
+
+        # Act
+        store.shutdown()
+
+        # Assert
+        self.assertFalse(os.path.exists(store.directory))
+
+    def test_get_default_job_store(self):
+        """Test that the default job store is created once, shared afterwards and shut down on request."""
+        with patch.object(job_store, "_default_job_store", None), \
+                patch.object(job_store, "JobStore") as mock_job_store_class:
+            first_store = get_default_job_store()
+            second_store = get_default_job_store()
+            shutdown_default_job_store()
+
+            self.assertIsNone(job_store._default_job_store)
+
+        self.assertIs(first_store, second_store)
+        mock_job_store_class.assert_called_once_with()
+        first_store.shutdown.assert_called_once_with(wait=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ediparse.infrastructure import parse_capture
+from ediparse.infrastructure.libs.edifactparser.utils import ParseStage, StageTimings
+from ediparse.infrastructure.parse_capture import (
+    CAPTURE_FILE_NAME, INPUT_FILE_NAME, ParseCaptureSpool, get_default_parse_capture_spool, iter_capture_directories,
+    redact_partner_ids
+)
+
+SAMPLES_DIR = Path(__file__).resolve().parents[2] / "samples"
+OPTIONS = {"endpoint": "/parse-string", "max_lines_to_parse": -1, "output_format": "json", "short_keys": False}
+
+
+class TestParseCapture(unittest.TestCase):
+    """Test cases for the ParseCaptureSpool class and the redaction of partner ids."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.capture_dir = Path(self.temp_dir.name) / "captures"
+        with open(SAMPLES_DIR / "mscons-message-example-request.txt", encoding="utf-8") as f:
+            self.edifact_data = f.read()
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_should_capture(self):
+        """Test that parsing runs are captured if they exceed the latency or the memory threshold."""
+        spool = ParseCaptureSpool(self.capture_dir, min_seconds=1.0, min_memory_bytes=1000)
+        spool_without_memory_threshold = ParseCaptureSpool(self.capture_dir, min_seconds=1.0)
+
+        self.assertTrue(spool.should_capture(1.0, 0))
+        self.assertTrue(spool.should_capture(0.1, 1000))
+        self.assertFalse(spool.should_capture(0.1, 999))
+        self.assertFalse(spool_without_memory_threshold.should_capture(0.1, 10 ** 9))
+
+    def test_capture_writes_input_and_metadata(self):
+        """Test that a capture holds the input, the options, the measurements and the stage timings."""
+        # Arrange
+        spool = ParseCaptureSpool(self.capture_dir, min_seconds=1.0)
+        stage_timings = StageTimings()
+        stage_timings.add(ParseStage.CONVERSION, 1.5, count=65)
+
+        # Act
+        capture_directory = spool.capture(
+            self.edifact_data, OPTIONS, parse_seconds=2.0, estimated_bytes=4096, segment_count=65,
+            stage_timings=stage_timings, message_type="MSCONS"
+        )
+
+        # Assert
+        self.assertEqual([capture_directory], list(iter_capture_directories(self.capture_dir)))
+        self.assertEqual(self.edifact_data, (capture_directory / INPUT_FILE_NAME).read_text(encoding="utf-8"))
+        metadata = json.loads((capture_directory / CAPTURE_FILE_NAME).read_text(encoding="utf-8"))
+        self.assertEqual(OPTIONS, metadata["options"])
+        self.assertEqual((2.0, 4096, 65, "MSCONS", False), (
+            metadata["parse_seconds"], metadata["estimated_bytes"], metadata["segment_count"],
+            metadata["message_type"], metadata["redacted"]
+        ))
+        self.assertEqual({"conversion": {"seconds": 1.5, "count": 65}}, metadata["stage_timings"])
+
+    def test_capture_removes_oldest_captures_beyond_size_limit(self):
+        """Test that the oldest captures are removed beyond the size limit and oversized captures are skipped."""
+        # Arrange
+        spool = ParseCaptureSpool(self.capture_dir, min_seconds=1.0, max_bytes=3 * len(self.edifact_data))
+
+        # Act
+        capture_directories = [
+            spool.capture(self.edifact_data, OPTIONS, parse_seconds=2.0, estimated_bytes=0, segment_count=0)
+            for _ in range(4)
+        ]
+        oversized_capture = spool.capture(
+            self.edifact_data * 4, OPTIONS, parse_seconds=2.0, estimated_bytes=0, segment_count=0
+        )
+
+        # Assert
+        self.assertIsNone(oversized_capture)
+        self.assertEqual(capture_directories[-2:], sorted(iter_capture_directories(self.capture_dir)))
+
+    def test_capture_with_redaction(self):
+        """Test that the partner ids of the UNB and NAD segments are replaced by stable pseudonyms of equal length."""
+        # Arrange
+        spool = ParseCaptureSpool(self.capture_dir, min_seconds=1.0, redact=True)
+
+        # Act
+        capture_directory = spool.capture(
+            self.edifact_data, OPTIONS, parse_seconds=2.0, estimated_bytes=0, segment_count=0
+        )
+
+        # Assert
+        redacted_data = (capture_directory / INPUT_FILE_NAME).read_text(encoding="utf-8")
+        self.assertEqual(len(self.edifact_data), len(redacted_data))
+        for partner_id in ("4012345678901", "4012345678902", "9920455302123"):
+            self.assertIn(partner_id, self.edifact_data)
+            self.assertNotIn(partner_id, redacted_data)
+        unb_segment = redacted_data.splitlines()[1]
+        self.assertRegex(unb_segment, r"^UNB\+UNOC:3\+\d{13}:14\+\d{13}:15\+200426:1151\+ABC4711\+\+TL\+\+\+\+1'$")
+        self.assertTrue(json.loads((capture_directory / CAPTURE_FILE_NAME).read_text(encoding="utf-8"))["redacted"])
+
+    def test_redact_partner_ids_with_una_delimiters(self):
+        """Test that the delimiters of the UNA segment and released delimiters are respected."""
+        edifact_text = "UNA|*.? 'UNB*UNOC|3*SEN?*DER|14*RECIPIENT|500'NAD*MS*9900000000000||293'NAD*DP'UNZ*1'"
+
+        redacted_text = redact_partner_ids(edifact_text, lambda partner_id: "X" * len(partner_id))
+
+        self.assertEqual(
+            "UNA|*.? 'UNB*UNOC|3*XXXXXXXX|14*XXXXXXXXX|500'NAD*MS*XXXXXXXXXXXXX||293'NAD*DP'UNZ*1'", redacted_text
+        )
+
+    def test_get_default_parse_capture_spool(self):
+        """Test that the default spool is only created if a capture directory is configured."""
+        with patch.object(parse_capture, "PARSE_CAPTURE_DIR", ""):
+            self.assertIsNone(get_default_parse_capture_spool())
+        with patch.object(parse_capture, "PARSE_CAPTURE_DIR", str(self.capture_dir)), \
+                patch.object(parse_capture, "PARSE_CAPTURE_MIN_MEMORY_MB", 0), \
+                patch.object(parse_capture, "_default_parse_capture_spool", None):
+            default_spool = get_default_parse_capture_spool()
+            self.assertIs(default_spool, get_default_parse_capture_spool())
+            self.assertIsNone(default_spool.min_memory_bytes)
+            self.assertTrue(self.capture_dir.is_dir())
+
+
+if __name__ == '__main__':
+    unittest.main()
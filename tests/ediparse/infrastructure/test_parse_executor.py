@@ -0,0 +1,198 @@
+import os
+import pickle
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ediparse.infrastructure import parse_executor
+from ediparse.infrastructure.libs.edifactparser.exceptions import (
+    DecompressionRatioExceededException, EdifactParserException, ParseMemoryBudgetExceededException
+)
+from ediparse.infrastructure.libs.edifactparser.exporters import (
+    decode_interchange, is_msgpack_available, to_compact_json_bytes
+)
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.utils import ParseStage
+from ediparse.infrastructure.parse_executor import (
+    ParseExecutor, ParseExecutorBackend, ParseOutputFormat, RenderedInterchange, get_default_parse_executor,
+    render_interchange, shutdown_default_parse_executor
+)
+from ediparse.infrastructure.parser_pool import ParserPool
+
+
+class TestParseExecutor(unittest.TestCase):
+    """Test cases for the ParseExecutor class and the rendering of its parse tasks."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.samples_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))) / "samples"
+        with open(self.samples_dir / "mscons-message-example-request.txt", encoding='utf-8') as f:
+            self.edifact_data = f.read()
+        self.parser = EdifactParser()
+        self.interchange = self.parser.parse(self.edifact_data)
+
+    def test_render_interchange_in_output_formats(self):
+        """Test that the interchange is rendered like the response classes render the parsed model."""
+        # Act
+        rendered_json = render_interchange(self.parser, self.edifact_data)
+        rendered_compact_json = render_interchange(
+            self.parser, self.edifact_data, output_format=ParseOutputFormat.COMPACT_JSON, short_keys=True
+        )
+
+        # Assert
+        self.assertEqual(self.interchange.to_json_bytes(), rendered_json.content)
+        self.assertEqual(to_compact_json_bytes(self.interchange, short_keys=True), rendered_compact_json.content)
+        self.assertGreater(rendered_json.estimated_bytes, 0)
+        self.assertGreater(rendered_json.segment_count, 0)
+
+    def test_render_interchange_with_stage_timings(self):
+        """Test that the stage timings are only handed out if they are requested."""
+        # Act
+        rendered = render_interchange(self.parser, self.edifact_data, collect_stage_timings=True)
+        rendered_without_timings = render_interchange(self.parser, self.edifact_data)
+
+        # Assert
+        self.assertEqual(rendered.segment_count, rendered.stage_timings.get(ParseStage.CONVERSION).count)
+        self.assertEqual(rendered.render_seconds, rendered.stage_timings.get(ParseStage.RENDER).seconds)
+        self.assertIsNone(rendered_without_timings.stage_timings)
+
+    @unittest.skipUnless(is_msgpack_available(), "The optional msgpack package is not installed")
+    def test_render_interchange_as_msgpack(self):
+        """Test that the interchange is rendered as MessagePack payload."""
+        # Act
+        rendered = render_interchange(self.parser, self.edifact_data, output_format=ParseOutputFormat.MSGPACK)
+
+        # Assert
+        self.assertEqual(self.interchange.to_json_bytes(), decode_interchange(rendered.content).to_json_bytes())
+
+    @unittest.skipUnless(is_msgpack_available(), "The optional msgpack package is not installed")
+    def test_render_interchange_as_compact_msgpack(self):
+        """Test that the interchange is rendered as compact MessagePack payload with short keys."""
+        # Act
+        rendered = render_interchange(
+            self.parser, self.edifact_data, output_format=ParseOutputFormat.COMPACT_MSGPACK, short_keys=True
+        )
+        rendered_msgpack = render_interchange(self.parser, self.edifact_data, output_format=ParseOutputFormat.MSGPACK)
+
+        # Assert
+        self.assertEqual(self.interchange.to_json_bytes(), decode_interchange(rendered.content).to_json_bytes())
+        self.assertLess(len(rendered.content), len(rendered_msgpack.content))
+
+    def test_render_interchange_with_exceeded_memory_budget(self):
+        """Test that a parsing run exceeding the memory budget is aborted."""
+        with self.assertRaises(ParseMemoryBudgetExceededException):
+            render_interchange(self.parser, self.edifact_data, max_memory_bytes=1)
+
+    def test_init_with_invalid_workers(self):
+        """Test that an executor without workers is refused."""
+        with self.assertRaises(ValueError):
+            ParseExecutor(ParseExecutorBackend.INLINE, max_workers=0)
+
+    def test_submit_inline(self):
+        """Test that the inline backend runs the task right away and keeps the raised exceptions in the future."""
+        # Arrange
+        executor = ParseExecutor(ParseExecutorBackend.INLINE)
+
+        # Act
+        future = executor.submit(self.edifact_data)
+        failed_future = executor.submit("invalid")
+
+        # Assert
+        self.assertTrue(future.done())
+        self.assertEqual(self.interchange.to_json_bytes(), future.result().content)
+        self.assertIsInstance(failed_future.exception(), EdifactParserException)
+        self.assertEqual(1, executor.max_workers)
+
+    def test_submit_thread(self):
+        """Test that the thread backend runs the task on the parsers of the given pool."""
+        # Arrange
+        parser_pool = ParserPool(size=2)
+        executor = ParseExecutor(ParseExecutorBackend.THREAD, parser_pool=parser_pool)
+
+        # Act
+        try:
+            rendered = executor.submit(self.edifact_data, output_format=ParseOutputFormat.COMPACT_JSON).result()
+        finally:
+            executor.shutdown()
+            parser_pool.shutdown()
+
+        # Assert
+        self.assertEqual(to_compact_json_bytes(self.interchange), rendered.content)
+        self.assertEqual(2, executor.max_workers)
+        self.assertEqual(0, executor.pending_tasks)
+
+    def test_pending_tasks(self):
+        """Test that the submitted tasks are counted as pending until they have finished."""
+        # Arrange
+        parser_pool = ParserPool(size=1)
+        executor = ParseExecutor(ParseExecutorBackend.THREAD, parser_pool=parser_pool)
+        release = threading.Event()
+        blocker = parser_pool.submit(lambda parser: release.wait())
+
+        # Act
+        try:
+            futures = [executor.submit(self.edifact_data) for _ in range(2)]
+            pending_tasks = executor.pending_tasks
+            release.set()
+            for future in futures:
+                future.result()
+            blocker.result()
+        finally:
+            executor.shutdown()
+            parser_pool.shutdown()
+
+        # Assert
+        self.assertEqual(2, pending_tasks)
+        self.assertEqual(0, executor.pending_tasks)
+
+    def test_submit_process(self):
+        """Test that the process backend runs the task on warm worker processes and hands out the exceptions."""
+        # Arrange
+        executor = ParseExecutor(ParseExecutorBackend.PROCESS, max_workers=1)
+
+        # Act
+        try:
+            executor.warm_up()
+            rendered = executor.submit(self.edifact_data).result()
+            exception = executor.submit(self.edifact_data, max_memory_bytes=1).exception()
+        finally:
+            executor.shutdown()
+
+        # Assert
+        self.assertIsInstance(rendered, RenderedInterchange)
+        self.assertEqual(self.interchange.to_json_bytes(), rendered.content)
+        self.assertIsInstance(exception, ParseMemoryBudgetExceededException)
+        self.assertEqual(1, exception.max_bytes)
+
+    def test_exceptions_survive_pickling(self):
+        """Test that the exceptions raised in worker processes keep their message and fields."""
+        exceptions = [
+            EdifactParserException("Invalid segment", "UNB"),
+            ParseMemoryBudgetExceededException(estimated_bytes=2, max_bytes=1),
+            DecompressionRatioExceededException(decompressed_bytes=300, compressed_bytes=1, max_ratio=100)
+        ]
+        for exception in exceptions:
+            with self.subTest(exception=type(exception).__name__):
+                unpickled_exception = pickle.loads(pickle.dumps(exception))
+
+                self.assertEqual(str(exception), str(unpickled_exception))
+                self.assertEqual(exception.__dict__, unpickled_exception.__dict__)
+
+    def test_get_default_parse_executor(self):
+        """Test that the default parse executor is created once, shared afterwards and shut down on request."""
+        with patch.object(parse_executor, "_default_parse_executor", None), \
+                patch.object(parse_executor, "ParseExecutor") as mock_parse_executor_class:
+            first_executor = get_default_parse_executor()
+            second_executor = get_default_parse_executor()
+            shutdown_default_parse_executor()
+
+            self.assertIsNone(parse_executor._default_parse_executor)
+
+        self.assertIs(first_executor, second_executor)
+        mock_parse_executor_class.assert_called_once_with()
+        first_executor.shutdown.assert_called_once_with(wait=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import marshal
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ediparse.infrastructure import parse_profiler
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.parse_profiler import ParseProfiler, ProfilerStatistics, get_default_parse_profiler
+
+SAMPLES_DIR = Path(__file__).resolve().parents[2] / "samples"
+
+
+def busy_wait(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+    return "done"
+
+
+class TestParseProfiler(unittest.TestCase):
+    """Test cases for the ParseProfiler class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        with open(SAMPLES_DIR / "mscons-message-example-request.txt", encoding="utf-8") as f:
+            self.edifact_data = f.read()
+
+    def test_profile_aggregates_sampled_runs(self):
+        """Test that the sampled runs are profiled and their statistics and stacks aggregated across runs."""
+        # Arrange
+        profiler = ParseProfiler(sample_rate=1.0, stack_interval=0.001)
+        parser = EdifactParser()
+
+        # Act
+        for _ in range(2):
+            interchange = profiler.profile(parser.parse, self.edifact_data)
+        result = profiler.profile(busy_wait, seconds=0.05)
+
+        # Assert
+        self.assertIsNotNone(interchange)
+        self.assertEqual("done", result)
+        statistics = profiler.statistics
+        self.assertEqual((3, 0), (statistics.profiled_runs, statistics.skipped_runs))
+        self.assertGreater(statistics.stack_samples, 0)
+        stats = marshal.loads(profiler.dump_stats())
+        parse_calls = [
+            value[1] for (file, _, name), value in stats.items()
+            if file.endswith("edifactparser/parser.py") and name == "parse"
+        ]
+        self.assertEqual([2], parse_calls)
+        self.assertIn("busy_wait", profiler.render_stats(sort_key="tottime", limit=10))
+        for line in profiler.render_collapsed_stacks().splitlines():
+            stack, count = line.rsplit(" ", 1)
+            self.assertTrue(stack.split(";")[0].endswith(":busy_wait") or "EdifactParser.parse" in stack)
+            self.assertGreater(int(count), 0)
+
+    def test_profile_skips_unsampled_runs(self):
+        """Test that runs are only profiled if the drawn random number is below the sample rate."""
+        # Arrange
+        profiler = ParseProfiler(sample_rate=0.25, random_function=iter([0.5, 0.1]).__next__)
+
+        # Act
+        profiler.profile(busy_wait, 0)
+        profiler.profile(busy_wait, 0)
+
+        # Assert
+        self.assertEqual(1, profiler.statistics.profiled_runs)
+
+    def test_profile_profiles_one_run_at_a_time(self):
+        """Test that runs sampled while another one is profiled are run without profiling."""
+        # Arrange
+        profiler = ParseProfiler(sample_rate=1.0)
+        started = threading.Event()
+        finish = threading.Event()
+
+        def blocking_run():
+            started.set()
+            finish.wait(5)
+
+        thread = threading.Thread(target=profiler.profile, args=(blocking_run,))
+        thread.start()
+        started.wait(5)
+
+        # Act
+        result = profiler.profile(busy_wait, 0)
+        finish.set()
+        thread.join()
+
+        # Assert
+        self.assertEqual("done", result)
+        statistics = profiler.statistics
+        self.assertEqual((1, 1), (statistics.profiled_runs, statistics.skipped_runs))
+
+    def test_reset_and_empty_profiles(self):
+        """Test that a reset profiler hands out empty profiles, and that invalid settings are refused."""
+        # Arrange
+        profiler = ParseProfiler(sample_rate=1.0)
+        profiler.profile(busy_wait, 0.01)
+
+        # Act
+        profiler.reset()
+
+        # Assert
+        self.assertEqual(ProfilerStatistics(0, 0, 0), profiler.statistics)
+        self.assertEqual({}, marshal.loads(profiler.dump_stats()))
+        self.assertEqual("", profiler.render_stats())
+        self.assertEqual("", profiler.render_collapsed_stacks())
+        with self.assertRaises(ValueError):
+            ParseProfiler(sample_rate=1.5)
+        with self.assertRaises(ValueError):
+            ParseProfiler(sample_rate=0.5, stack_interval=0)
+
+    def test_get_default_parse_profiler(self):
+        """Test that the default profiler is only created if a sample rate is configured."""
+        with patch.object(parse_profiler, "PARSE_PROFILE_SAMPLE_RATE", 0):
+            self.assertIsNone(get_default_parse_profiler())
+        with patch.object(parse_profiler, "PARSE_PROFILE_SAMPLE_RATE", 0.1), \
+                patch.object(parse_profiler, "_default_parse_profiler", None):
+            default_profiler = get_default_parse_profiler()
+            self.assertIs(default_profiler, get_default_parse_profiler())
+            self.assertEqual(0.1, default_profiler.sample_rate)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from ediparse.infrastructure import parse_result_cache
+from ediparse.infrastructure.parse_result_cache import (
+    ParseResultCache, get_default_message_cache, get_default_parse_result_cache, make_cache_key
+)
+
+
+class TestParseResultCache(unittest.TestCase):
+    """Test cases for the ParseResultCache class and its keys."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def test_make_cache_key(self):
+        """Test that the key depends on the payload and on every option the result depends on."""
+        key = make_cache_key("UNB+UNOC:3", -1, "json", False)
+
+        self.assertEqual(key, make_cache_key("UNB+UNOC:3", -1, "json", False))
+        self.assertEqual(40, len(key))
+        self.assertNotEqual(key, make_cache_key("UNB+UNOC:4", -1, "json", False))
+        self.assertNotEqual(key, make_cache_key("UNB+UNOC:3", 2442, "json", False))
+        self.assertNotEqual(key, make_cache_key("UNB+UNOC:3", -1, "compact_json", False))
+        self.assertNotEqual(key, make_cache_key("UNB+UNOC:3", -1, "json", True))
+
+    def test_init_without_size(self):
+        """Test that a cache without any size is refused."""
+        with self.assertRaises(ValueError):
+            ParseResultCache(max_bytes=0)
+
+    def test_get_and_put_with_lru_eviction(self):
+        """Test that the least recently used results are evicted beyond the size limit and counted as misses."""
+        # Arrange
+        cache = ParseResultCache(max_bytes=10, directory=None)
+
+        # Act
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        self.assertEqual(b"aaaa", cache.get("a"))
+        cache.put("c", b"cccc")
+        cache.put("too-large", b"x" * 11)
+
+        # Assert
+        self.assertEqual(b"aaaa", cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNone(cache.get("too-large"))
+        self.assertEqual(b"cccc", cache.get("c"))
+        statistics = cache.statistics
+        self.assertEqual((3, 0, 2), (statistics.hits, statistics.disk_hits, statistics.misses))
+        self.assertEqual((2, 8), (statistics.entries, statistics.size_bytes))
+
+    def test_disk_tier(self):
+        """Test that evicted results are moved to disk, answered from there and kept across restarts."""
+        # Arrange
+        cache = ParseResultCache(max_bytes=4, directory=self.temp_dir.name, disk_max_bytes=8)
+
+        # Act
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        cache.put("c", b"cccc")
+        cache.put("d", b"dddd")
+        restarted_cache = ParseResultCache(max_bytes=4, directory=self.temp_dir.name, disk_max_bytes=8)
+
+        # Assert
+        self.assertEqual(["b.bin", "c.bin"], sorted(os.listdir(self.temp_dir.name)))
+        self.assertIsNone(restarted_cache.get("a"))
+        self.assertEqual(b"bbbb", restarted_cache.get("b"))
+        self.assertEqual(1, restarted_cache.statistics.disk_hits)
+        self.assertEqual(b"cccc", cache.get("c"))
+        self.assertEqual(b"dddd", cache.get("d"))
+
+    def test_clear(self):
+        """Test that clear removes the results from memory and disk."""
+        # Arrange
+        cache = ParseResultCache(max_bytes=4, directory=self.temp_dir.name)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+
+        # Act
+        cache.clear()
+
+        # Assert
+        self.assertEqual([], os.listdir(self.temp_dir.name))
+        self.assertEqual((0, 0), (cache.statistics.entries, cache.statistics.disk_entries))
+
+    def test_get_default_parse_result_cache(self):
+        """Test that the default cache is shared and not created while caching is disabled."""
+        with patch.object(parse_result_cache, "PARSE_CACHE_MAX_MB", 1), \
+                patch.object(parse_result_cache, "_default_parse_result_cache", None), \
+                patch.object(parse_result_cache, "ParseResultCache") as mock_parse_result_cache_class:
+            self.assertIs(get_default_parse_result_cache(), get_default_parse_result_cache())
+            mock_parse_result_cache_class.assert_called_once_with()
+        with patch.object(parse_result_cache, "PARSE_CACHE_MAX_MB", 0):
+            self.assertIsNone(get_default_parse_result_cache())
+
+    def test_get_default_message_cache(self):
+        """Test that the default message cache is shared and not created while it is disabled."""
+        with patch.object(parse_result_cache, "MESSAGE_CACHE_MAX_SEGMENTS", 100), \
+                patch.object(parse_result_cache, "_default_message_cache", None):
+            message_cache = get_default_message_cache()
+            self.assertIs(message_cache, get_default_message_cache())
+            self.assertEqual(100, message_cache.max_segments)
+        with patch.object(parse_result_cache, "MESSAGE_CACHE_MAX_SEGMENTS", 0):
+            self.assertIsNone(get_default_message_cache())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ediparse.infrastructure import parser_pool
+from ediparse.infrastructure.libs.edifactparser.exceptions import EdifactParserException
+from ediparse.infrastructure.libs.edifactparser.parser import EdifactParser
+from ediparse.infrastructure.libs.edifactparser.utils import MemoryBudget
+from ediparse.infrastructure.parser_pool import ParserPool, PoolTaskResult, get_default_parser_pool, run_observed
+
+
+class TestParserPool(unittest.TestCase):
+    """Test cases for the ParserPool class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.parser_factory = MagicMock(side_effect=lambda: MagicMock(spec=EdifactParser))
+        self.pool = ParserPool(size=2, parser_factory=self.parser_factory)
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.pool.shutdown()
+
+    def test_init_creates_parsers_up_front(self):
+        """Test that all parsers of the pool are created when the pool is created."""
+        self.assertEqual(2, self.pool.size)
+        self.assertEqual(2, self.parser_factory.call_count)
+
+    def test_init_with_invalid_size(self):
+        """Test that a pool without parsers is refused."""
+        with self.assertRaises(ValueError):
+            ParserPool(size=0, parser_factory=self.parser_factory)
+
+    def test_acquire_returns_parser_to_pool(self):
+        """Test that a borrowed parser is handed out again after it has been returned."""
+        # Act
+        with self.pool.acquire() as first_parser:
+            with self.pool.acquire() as second_parser:
+                pass
+        with self.pool.acquire() as third_parser:
+            pass
+
+        # Assert
+        self.assertIsNot(first_parser, second_parser)
+        self.assertIn(third_parser, (first_parser, second_parser))
+
+    def test_submit(self):
+        """Test that a submitted task is called with a parser of the pool and the given arguments."""
+        # Act
+        result = self.pool.submit(lambda parser, value: (parser, value), "item").result()
+
+        # Assert
+        self.assertIsInstance(result[0], EdifactParser)
+        self.assertEqual("item", result[1])
+
+    def test_map_ordered_keeps_input_order(self):
+        """Test that the outcomes are handed out in input order, including the errors of failing items."""
+        # Arrange
+        def task(parser, item):
+            if item == "invalid":
+                raise EdifactParserException("Invalid item")
+            return item.upper()
+
+        # Act
+        outcomes = list(self.pool.map_ordered(task, ["a", "invalid", "c", "d", "e", "f"]))
+
+        # Assert
+        self.assertEqual([0, 1, 2, 3, 4, 5], [outcome.index for outcome in outcomes])
+        self.assertEqual(["A", None, "C", "D", "E", "F"], [outcome.value for outcome in outcomes])
+        self.assertIsInstance(outcomes[1].error, EdifactParserException)
+        self.assertEqual(PoolTaskResult(index=0, value="A"), outcomes[0])
+
+    def test_map_ordered_runs_items_concurrently(self):
+        """Test that the items are parsed concurrently with one parser per worker thread."""
+        # Arrange
+        barrier = threading.Barrier(2, timeout=5)
+
+        def task(parser, item):
+            barrier.wait()
+            return parser
+
+        # Act
+        outcomes = list(self.pool.map_ordered(task, ["a", "b"]))
+
+        # Assert
+        self.assertEqual([None, None], [outcome.error for outcome in outcomes])
+        self.assertIsNot(outcomes[0].value, outcomes[1].value)
+
+    def test_map_ordered_consumes_items_lazily(self):
+        """Test that at most twice as many items as parsers are taken from the input ahead of the consumer."""
+        # Arrange
+        taken_items = []
+
+        def items():
+            for item in range(100):
+                taken_items.append(item)
+                yield item
+
+        # Act
+        first_outcome = next(self.pool.map_ordered(lambda parser, item: item, items()))
+
+        # Assert
+        self.assertEqual(0, first_outcome.value)
+        self.assertEqual(4, len(taken_items))
+
+    def test_map_unordered_hands_out_outcomes_in_completion_order(self):
+        """Test that a slow item does not hold back the outcomes of the items completed after it."""
+        # Arrange
+        slow_item_released = threading.Event()
+
+        def task(parser, item):
+            if item == "slow":
+                slow_item_released.wait(timeout=5)
+            if item == "invalid":
+                raise EdifactParserException("Invalid item")
+            return item.upper()
+
+        # Act
+        outcomes = []
+        for outcome in self.pool.map_unordered(task, ["slow", "b", "invalid"]):
+            outcomes.append(outcome)
+            if len(outcomes) == 2:
+                slow_item_released.set()
+
+        # Assert
+        self.assertEqual({0, 1, 2}, {outcome.index for outcome in outcomes})
+        self.assertEqual(0, outcomes[-1].index)
+        self.assertEqual("SLOW", outcomes[-1].value)
+        self.assertIsInstance(next(outcome for outcome in outcomes if outcome.index == 2).error, EdifactParserException)
+
+    def test_map_unordered_consumes_items_lazily(self):
+        """Test that at most twice as many items as parsers are taken from the input ahead of the consumer."""
+        # Arrange
+        taken_items = []
+
+        def items():
+            for item in range(100):
+                taken_items.append(item)
+                yield item
+
+        # Act
+        next(self.pool.map_unordered(lambda parser, item: item, items()))
+
+        # Assert
+        self.assertEqual(4, len(taken_items))
+
+    def test_run_observed(self):
+        """Test that the parsing runs are reported to the observer with their outcome and re-raise their errors."""
+        # Arrange
+        observer = MagicMock()
+        memory_budget = MemoryBudget()
+        error = EdifactParserException("invalid")
+
+        def fail():
+            raise error
+
+        # Act
+        result = run_observed(lambda: "parsed", "UNH'", memory_budget, observer)
+        with self.assertRaises(EdifactParserException):
+            run_observed(fail, "invalid", memory_budget, observer)
+
+        # Assert
+        self.assertEqual("parsed", result)
+        self.assertEqual(2, observer.call_count)
+        text, duration_seconds, observed_budget, observed_error = observer.call_args_list[0].args
+        self.assertEqual(("UNH'", None), (text, observed_error))
+        self.assertGreaterEqual(duration_seconds, 0)
+        self.assertIs(memory_budget, observed_budget)
+        self.assertEqual("invalid", observer.call_args_list[1].args[0])
+        self.assertIs(error, observer.call_args_list[1].args[3])
+        self.assertEqual("parsed", run_observed(lambda: "parsed", "UNH'", memory_budget))
+
+    def test_get_default_parser_pool(self):
+        """Test that the default parser pool is created once and shared afterwards."""
+        with patch.object(parser_pool, "_default_parser_pool", None), \
+                patch.object(parser_pool, "ParserPool") as mock_parser_pool_class:
+            first_pool = get_default_parser_pool()
+            second_pool = get_default_parser_pool()
+
+        self.assertIs(first_pool, second_pool)
+        mock_parser_pool_class.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
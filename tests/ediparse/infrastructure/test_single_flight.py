@@ -0,0 +1,112 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from ediparse.infrastructure import single_flight
+from ediparse.infrastructure.single_flight import SingleFlight, get_default_single_flight
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test cases for the SingleFlight class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.single_flight = SingleFlight()
+        self.computations = []
+
+    def __create_computation(self, result, delay=0.01):
+        async def compute():
+            self.computations.append(result)
+            await asyncio.sleep(delay)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return compute
+
+    def test_run_coalesces_concurrent_calls(self):
+        """Test that concurrent calls of the same key share one computation, while other keys compute their own."""
+        async def run():
+            return await asyncio.gather(
+                self.single_flight.run("a", self.__create_computation(b"first")),
+                self.single_flight.run("a", self.__create_computation(b"second")),
+                self.single_flight.run("b", self.__create_computation(b"third"))
+            )
+
+        # Act
+        results = asyncio.run(run())
+
+        # Assert
+        self.assertEqual([b"first", b"first", b"third"], results)
+        self.assertEqual([b"first", b"third"], self.computations)
+        self.assertEqual(1, self.single_flight.coalesced_calls)
+        self.assertEqual(0, self.single_flight.in_flight)
+
+    def test_run_after_finished_computation(self):
+        """Test that a call arriving after the computation has finished starts a new computation."""
+        async def run():
+            await self.single_flight.run("a", self.__create_computation(b"first"))
+            return await self.single_flight.run("a", self.__create_computation(b"second"))
+
+        self.assertEqual(b"second", asyncio.run(run()))
+
+    def test_run_raises_error_to_all_callers(self):
+        """Test that the exception of the computation is raised to every waiting caller."""
+        async def run():
+            return await asyncio.gather(
+                self.single_flight.run("a", self.__create_computation(ValueError("invalid"))),
+                self.single_flight.run("a", self.__create_computation(b"never")),
+                return_exceptions=True
+            )
+
+        # Act
+        results = asyncio.run(run())
+
+        # Assert
+        self.assertEqual(["invalid", "invalid"], [str(result) for result in results])
+        self.assertEqual(1, len(self.computations))
+
+    def test_cancelled_caller_does_not_cancel_computation_for_others(self):
+        """Test that a cancelled caller only stops waiting, while the remaining caller gets the result."""
+        async def run():
+            first = asyncio.create_task(self.single_flight.run("a", self.__create_computation(b"first")))
+            second = asyncio.create_task(self.single_flight.run("a", self.__create_computation(b"second")))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await asyncio.gather(first, second, return_exceptions=True)
+
+        # Act
+        first_result, second_result = asyncio.run(run())
+
+        # Assert
+        self.assertIsInstance(first_result, asyncio.CancelledError)
+        self.assertEqual(b"first", second_result)
+
+    def test_last_cancelled_caller_cancels_computation(self):
+        """Test that the computation is cancelled once no caller waits for it and a new call starts over."""
+        async def run():
+            caller = asyncio.create_task(self.single_flight.run("a", self.__create_computation(b"first", delay=10)))
+            await asyncio.sleep(0)
+            caller.cancel()
+            await asyncio.gather(caller, return_exceptions=True)
+            in_flight = self.single_flight.in_flight
+            return in_flight, await self.single_flight.run("a", self.__create_computation(b"second"))
+
+        # Act
+        in_flight, result = asyncio.run(run())
+
+        # Assert
+        self.assertEqual(0, in_flight)
+        self.assertEqual(b"second", result)
+
+    def test_get_default_single_flight(self):
+        """Test that the default single-flight is shared and not created while the coalescing is disabled."""
+        with patch.object(single_flight, "PARSE_SINGLE_FLIGHT", True), \
+                patch.object(single_flight, "_default_single_flight", None):
+            self.assertIs(get_default_single_flight(), get_default_single_flight())
+        with patch.object(single_flight, "PARSE_SINGLE_FLIGHT", False):
+            self.assertIsNone(get_default_single_flight())
+
+
+if __name__ == '__main__':
+    unittest.main()